@@ -4,8 +4,9 @@ Backtest API Routes
 Provides REST endpoints for running backtests using TradingAgents backtesting framework.
 """
 
+import json
 import logging
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from datetime import datetime
 from typing import Dict, Any
 import traceback
@@ -149,12 +150,17 @@ def validate_backtest_request(data: Dict[str, Any]) -> tuple[bool, str]:
         if not isinstance(max_pos, (int, float)) or max_pos <= 0 or max_pos > 100:
             return False, "maxPositionSizePct must be between 0 and 100"
     
+    if 'eventInterval' in config:
+        interval = config['eventInterval']
+        if not isinstance(interval, int) or isinstance(interval, bool) or interval < 1:
+            return False, "eventInterval must be a positive integer"
+    
     return True, ""
 
 
-def run_backtest_engine(ticker: str, start_date: str, end_date: str, config: Dict[str, Any]) -> Dict[str, Any]:
+def create_backtest_engine(ticker: str, start_date: str, end_date: str, config: Dict[str, Any]):
     """
-    Run backtest using TradingAgents backtesting framework.
+    Create a backtest engine for an API request.
     
     Args:
         ticker: Stock ticker symbol
@@ -163,74 +169,108 @@ def run_backtest_engine(ticker: str, start_date: str, end_date: str, config: Dic
         config: Backtest configuration
         
     Returns:
-        Backtest results dictionary
+        BacktestEngine ready to run
     """
     try:
         from tradingagents.backtesting import BacktestConfig, BacktestEngine
+    except ImportError as e:
+        logger.error(f"Failed to import backtesting framework: {e}")
+        raise Exception("Backtesting framework is not available. Please ensure it is properly installed.")
+    
+    # Create backtest configuration
+    backtest_config = BacktestConfig(
+        initial_balance=config.get('initialBalance', 10000.0),
+        commission_rate=config.get('commissionRate', 0.001),
+        slippage=config.get('slippage', 0.001),
+        risk_per_trade_pct=config.get('riskPerTradePct', 2.0),
+        max_position_size_pct=config.get('maxPositionSizePct', 20.0),
+        start_date=start_date,
+        end_date=end_date,
+        data_interval='daily',
+        event_interval=config.get('eventInterval', 1)
+    )
+    
+    logger.info(f"Initializing backtest engine for {ticker} from {start_date} to {end_date}")
+    
+    # Initialize backtest engine (without TradingAgents graph for now)
+    return BacktestEngine(
+        config=backtest_config,
+        trading_graph=None  # Can integrate TradingAgentsGraph later
+    )
+
+
+def format_backtest_results(ticker: str, start_date: str, end_date: str, backtest_results) -> Dict[str, Any]:
+    """
+    Convert BacktestResults to the API response format.
+    
+    Args:
+        ticker: Stock ticker symbol
+        start_date: Start date (ISO format)
+        end_date: End date (ISO format)
+        backtest_results: BacktestResults from the engine
         
-        # Create backtest configuration
-        backtest_config = BacktestConfig(
-            initial_balance=config.get('initialBalance', 10000.0),
-            commission_rate=config.get('commissionRate', 0.001),
-            slippage=config.get('slippage', 0.001),
-            risk_per_trade_pct=config.get('riskPerTradePct', 2.0),
-            max_position_size_pct=config.get('maxPositionSizePct', 20.0),
-            start_date=start_date,
-            end_date=end_date,
-            data_interval='daily'
-        )
-        
-        logger.info(f"Initializing backtest engine for {ticker} from {start_date} to {end_date}")
+    Returns:
+        Backtest results dictionary
+    """
+    results = {
+        'ticker': ticker,
+        'period': {
+            'start': start_date,
+            'end': end_date
+        },
+        'totalReturn': backtest_results.total_return_pct,
+        'winRate': backtest_results.win_rate,
+        'sharpeRatio': backtest_results.sharpe_ratio,
+        'maxDrawdown': backtest_results.max_drawdown,
+        'trades': [],
+        'equityCurve': []
+    }
+    
+    # Convert trades to API format
+    for trade in backtest_results.trades:
+        results['trades'].append({
+            'date': trade.get('date', ''),
+            'action': trade.get('action', 'HOLD'),
+            'price': trade.get('price', 0.0),
+            'quantity': trade.get('quantity', 0),
+            'pnl': trade.get('pnl', 0.0)
+        })
+    
+    # Convert equity history to API format
+    for point in backtest_results.equity_history:
+        if isinstance(point, dict):
+            results['equityCurve'].append({
+                'date': point.get('date', ''),
+                'value': point.get('total_equity', 0.0)
+            })
+    
+    return results
+
+
+def run_backtest_engine(ticker: str, start_date: str, end_date: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run backtest using TradingAgents backtesting framework.
+    
+    Args:
+        ticker: Stock ticker symbol
+        start_date: Start date (ISO format)
+        end_date: End date (ISO format)
+        config: Backtest configuration
         
-        # Initialize backtest engine (without TradingAgents graph for now)
-        engine = BacktestEngine(
-            config=backtest_config,
-            trading_graph=None  # Can integrate TradingAgentsGraph later
-        )
+    Returns:
+        Backtest results dictionary
+    """
+    try:
+        engine = create_backtest_engine(ticker, start_date, end_date, config)
         
         # Run backtest
         logger.info(f"Running backtest for {ticker}")
         backtest_results = engine.run_backtest(ticker)
         
-        # Format results for API response
-        results = {
-            'ticker': ticker,
-            'period': {
-                'start': start_date,
-                'end': end_date
-            },
-            'totalReturn': backtest_results.total_return_pct,
-            'winRate': backtest_results.win_rate,
-            'sharpeRatio': backtest_results.sharpe_ratio,
-            'maxDrawdown': backtest_results.max_drawdown,
-            'trades': [],
-            'equityCurve': []
-        }
-        
-        # Convert trades to API format
-        for trade in backtest_results.trades:
-            results['trades'].append({
-                'date': trade.get('date', ''),
-                'action': trade.get('action', 'HOLD'),
-                'price': trade.get('price', 0.0),
-                'quantity': trade.get('quantity', 0),
-                'pnl': trade.get('pnl', 0.0)
-            })
-        
-        # Convert equity history to API format
-        for point in backtest_results.equity_history:
-            if isinstance(point, dict):
-                results['equityCurve'].append({
-                    'date': point.get('date', ''),
-                    'value': point.get('total_equity', 0.0)
-                })
-        
+        results = format_backtest_results(ticker, start_date, end_date, backtest_results)
         logger.info(f"Backtest completed for {ticker}: {results['totalReturn']:.2f}% return")
         return results
         
-    except ImportError as e:
-        logger.error(f"Failed to import backtesting framework: {e}")
-        raise Exception("Backtesting framework is not available. Please ensure it is properly installed.")
     except Exception as e:
         logger.error(f"Error running backtest: {e}")
         logger.error(traceback.format_exc())
@@ -315,6 +355,65 @@ def backtest():
         )
 
 
+@backtest_bp.route('/backtest/stream', methods=['POST'])
+def backtest_stream():
+    """
+    Run a backtest and stream its progress as Server-Sent Events.
+    
+    Request Body: Same as /backtest endpoint; config.eventInterval sets how
+    many bars pass between progress events (default 1).
+    
+    Returns:
+        text/event-stream of "started", "progress", "trade" and "completed"
+        (or "failed") events while the backtest runs, followed by a
+        "results" event carrying the same results object as /backtest
+        
+    Example Event:
+        event: progress
+        data: {"type": "progress", "ticker": "AAPL", "data": {"date": "2023-03-01",
+               "equity": 10250.0, "completed_days": 40, "total_days": 124, ...}, ...}
+    """
+    from tradingagents.backtesting.events import EventStream, format_sse
+    
+    data = request.get_json(silent=True)
+    is_valid, error_message = validate_backtest_request(data)
+    if not is_valid:
+        logger.warning(f"Invalid backtest stream request: {error_message}")
+        return create_error_response(error_message, 400)
+    
+    ticker = data['ticker']
+    start_date = data['startDate']
+    end_date = data['endDate']
+    
+    try:
+        engine = create_backtest_engine(ticker, start_date, end_date, data['config'])
+    except Exception as e:
+        logger.error(f"Failed to create backtest engine for {ticker}: {e}")
+        return create_error_response(f"Backtest failed: {str(e)}", 500)
+    
+    logger.info(f"Streaming backtest for {ticker} from {start_date} to {end_date}")
+    
+    def generate():
+        stream = EventStream(engine)
+        for event in stream.run("run_backtest", ticker):
+            yield format_sse(event)
+        
+        if stream.error is None:
+            results = format_backtest_results(ticker, start_date, end_date, stream.result)
+            payload = {'success': True, 'results': results}
+        else:
+            logger.error(f"Streamed backtest failed for {ticker}: {stream.error}")
+            payload = {'success': False, 'error': f"Backtest failed: {stream.error}"}
+        payload['timestamp'] = datetime.now().isoformat()
+        yield f"event: results\ndata: {json.dumps(payload, default=str)}\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 @backtest_bp.route('/backtest/validate', methods=['POST'])
 def validate_backtest_request_endpoint():
     """
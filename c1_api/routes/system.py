@@ -114,6 +114,58 @@ def get_metrics():
         }), 500
 
 
+@system_bp.route('/metrics/vendors', methods=['GET'])
+def get_vendor_metrics():
+    """
+    Get data vendor health, result cache and rate limit statistics.
+
+    Returns:
+        JSON response with per-vendor circuit state and latency
+
+    Example Response:
+        {
+            "vendors": {
+                "alpha_vantage": {
+                    "state": "open",
+                    "error_rate": 0.4,
+                    "latency_p50": 0.82,
+                    "latency_p95": 2.1,
+                    "rate_limited_until": 1705314660.0,
+                    ...
+                }
+            },
+            "cache": {"hit_rate": 0.63, ...},
+            "rate_limits": {"rejected": 3, "buckets": {"fmp": {"per_day": {"limit": 250, "tokens": 212.4}}}, ...},
+            "timestamp": "2024-01-15T10:30:00Z"
+        }
+    """
+    try:
+        from tradingagents.dataflows.vendor_health import get_health_registry
+        from tradingagents.dataflows.result_cache import get_result_cache
+        from tradingagents.dataflows.rate_limiter import get_rate_limiter
+
+        health = get_health_registry()
+        cache = get_result_cache()
+        limiter = get_rate_limiter()
+
+        response = {
+            'vendors': health.snapshot() if health is not None else {},
+            'cache': cache.stats() if cache is not None else {},
+            'rate_limits': limiter.stats() if limiter is not None else {},
+            'timestamp': datetime.now().isoformat()
+        }
+
+        logger.debug("Vendor metrics retrieved successfully")
+        return jsonify(response), 200
+
+    except Exception as e:
+        logger.error(f"Error retrieving vendor metrics: {e}", exc_info=True)
+        return jsonify({
+            'error': 'Failed to retrieve vendor metrics',
+            'timestamp': datetime.now().isoformat()
+        }), 500
+
+
 @system_bp.before_app_request
 def track_request():
     """Track incoming requests for metrics."""
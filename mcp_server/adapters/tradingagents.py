@@ -8,7 +8,7 @@ and the TradingAgents multi-agent analysis system.
 import logging
 import sys
 import os
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
 
 # Add tradingagents to path if needed
@@ -139,7 +139,8 @@ class TradingAgentsAdapter:
         ticker: str,
         start_date: str,
         end_date: str,
-        strategy_config: Dict[str, Any]
+        strategy_config: Dict[str, Any],
+        event_listener: Optional[Callable] = None
     ) -> Dict[str, Any]:
         """
         Run strategy backtest
@@ -149,6 +150,8 @@ class TradingAgentsAdapter:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             strategy_config: Strategy configuration
+            event_listener: Optional callback receiving BacktestEvent objects
+                (called on the executor thread)
             
         Returns:
             Backtest results dictionary
@@ -181,6 +184,8 @@ class TradingAgentsAdapter:
                 trading_graph=None,  # Can integrate TradingAgentsGraph later
                 data_manager=data_manager
             )
+            if event_listener is not None:
+                engine.add_listener(event_listener)
             
             # Run backtest in executor (it's synchronous)
             import asyncio
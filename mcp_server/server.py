@@ -3,8 +3,9 @@ Main MCP Server implementation
 """
 
 import asyncio
+import inspect
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 from dataclasses import dataclass
 import sys
 import json
@@ -128,6 +129,43 @@ class MCPServer:
             )
             return response.to_dict()
     
+    def _progress_callback(
+        self,
+        request: MCPRequest,
+        tool: Tool
+    ) -> Optional[Callable[[Dict[str, Any]], Awaitable[None]]]:
+        """
+        Build a callback that sends notifications/progress for a tools/call request
+        
+        Only created when the client sent a progressToken in params._meta and the
+        tool handler accepts a progress_callback argument.
+        
+        Args:
+            request: tools/call request
+            tool: Tool being called
+            
+        Returns:
+            Async callback taking progress params, or None
+        """
+        meta = request.params.get("_meta") or {}
+        token = meta.get("progressToken")
+        if token is None or self.transport is None:
+            return None
+        try:
+            if "progress_callback" not in inspect.signature(tool.handler).parameters:
+                return None
+        except (TypeError, ValueError):
+            return None
+        
+        async def send_progress(params: Dict[str, Any]) -> None:
+            await self.transport.send_message({
+                "jsonrpc": "2.0",
+                "method": "notifications/progress",
+                "params": {"progressToken": token, **params}
+            })
+        
+        return send_progress
+    
     async def _handle_list_tools(self, request: MCPRequest) -> MCPResponse:
         """Handle tools/list request"""
         tools_list = [
@@ -158,6 +196,10 @@ class MCPServer:
         
         tool = self.tools[tool_name]
         
+        progress_callback = self._progress_callback(request, tool)
+        if progress_callback is not None:
+            arguments = {**arguments, "progress_callback": progress_callback}
+        
         try:
             # Call the tool handler
             result = await tool.handler(**arguments)
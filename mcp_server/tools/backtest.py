@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from ..adapters.tradingagents import TradingAgentsAdapter
 from ..protocol.schemas import Tool, ToolResult
@@ -110,12 +110,46 @@ class BacktestStrategyTool:
             input_schema=self.INPUT_SCHEMA
         )
     
+    @staticmethod
+    def _event_listener(
+        progress_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]]
+    ) -> Optional[Callable]:
+        """
+        Forward backtest events from the engine thread to an async progress callback.
+        
+        Progress events are thinned to about one per percent of the run; trade,
+        start and end events are always forwarded.
+        
+        Args:
+            progress_callback: Async callback taking MCP progress params
+            
+        Returns:
+            Engine listener, or None when no callback is given
+        """
+        if progress_callback is None:
+            return None
+        
+        from tradingagents.backtesting.events import mcp_progress_params
+        
+        loop = asyncio.get_running_loop()
+        
+        def listener(event):
+            if event.type == "progress":
+                step = max(event.data["total_days"] // 100, 1)
+                done = event.data["completed_days"]
+                if done % step != 0 and done != event.data["total_days"]:
+                    return
+            asyncio.run_coroutine_threadsafe(progress_callback(mcp_progress_params(event)), loop)
+        
+        return listener
+    
     async def execute(
         self,
         ticker: str,
         start_date: str,
         end_date: str,
-        strategy_config: Optional[Dict[str, Any]] = None
+        strategy_config: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
     ) -> ToolResult:
         """
         Execute backtest.
@@ -125,6 +159,8 @@ class BacktestStrategyTool:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
             strategy_config: Optional strategy configuration
+            progress_callback: Optional async callback receiving MCP progress
+                params (progress, total, message) while the backtest runs
             
         Returns:
             ToolResult with backtest data or error
@@ -191,7 +227,8 @@ class BacktestStrategyTool:
                         ticker=ticker,
                         start_date=start_date,
                         end_date=end_date,
-                        strategy_config=strategy_config
+                        strategy_config=strategy_config,
+                        event_listener=self._event_listener(progress_callback)
                     ),
                     timeout=300.0  # 5 minute timeout for backtests
                 )
@@ -26,6 +26,10 @@ setup(
         "rich>=13.0.0",
         "questionary>=2.0.1",
     ],
+    extras_require={
+        # Parquet engine for tradingagents.backtesting.ResultsStore
+        "results": ["pyarrow>=12.0.0"],
+    },
     python_requires=">=3.10",
     entry_points={
         "console_scripts": [
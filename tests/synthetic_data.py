@@ -0,0 +1,93 @@
+"""
+Offline fixtures for backtesting tests.
+
+Provides synthetic price data and stub trading graphs so tests run without
+network access or LLM calls. Prices come from the benchmark suite's generator
+(tradingagents.backtesting.benchmark), so tests and benchmarks share one
+synthetic market.
+
+Wall-clock checks are marked with perf_test and only run when RUN_PERF_TESTS
+is set, so the default suite stays deterministic on loaded CI machines.
+"""
+import os
+import threading
+import time
+import unittest
+
+import pandas as pd
+
+from tradingagents.backtesting import benchmark
+
+perf_test = unittest.skipUnless(os.environ.get("RUN_PERF_TESTS"), "timing check; set RUN_PERF_TESTS=1 to run")
+
+
+def make_ohlcv(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    Deterministic random-walk OHLCV frame over business days, end date inclusive.
+
+    The walk is anchored at a fixed origin, so overlapping ranges return
+    identical prices for the same dates. Driftless, so prices stay near 100
+    for any test period.
+    """
+    end = (pd.Timestamp(end_date) + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+    return benchmark.generate_ohlcv(ticker, start_date, end, drift=0.0, volatility=0.01)
+
+
+class SyntheticDataManager(benchmark.SyntheticDataManager):
+    """Benchmark data manager that also counts how often bars are fetched."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetch_count = 0
+
+    def _fetch_from_mcp(self, ticker, start_date, end_date, interval):
+        self.fetch_count += 1
+        return make_ohlcv(ticker, start_date, end_date)
+
+
+class CountingGraph:
+    """Stub trading graph that alternates BUY/SELL and counts invocations."""
+
+    def __init__(self, model="stub-model"):
+        self.config = {'llm_provider': 'stub', 'deep_think_llm': model, 'quick_think_llm': model}
+        self.selected_analysts = ['market']
+        self.calls = 0
+
+    def run_historical(self, ticker, trade_date, historical_data):
+        self.calls += 1
+        decision = "BUY" if len(historical_data) % 2 else "SELL"
+        return {"final_decision": {"decision": decision}}
+
+
+class Overlap:
+    """Counts calls in flight across any number of graphs."""
+
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+
+class SlowGraph(CountingGraph):
+    """CountingGraph with a fixed per-call latency, like a remote LLM, that records call overlap."""
+
+    def __init__(self, overlap=None, latency=0.02):
+        super().__init__()
+        self.overlap = overlap or Overlap()
+        self.latency = latency
+        self.active = 0  # Calls in flight on this instance
+        self.max_active = 0
+
+    def run_historical(self, ticker, trade_date, historical_data):
+        with self.overlap.lock:
+            self.overlap.calls += 1
+            self.overlap.active += 1
+            self.overlap.max_active = max(self.overlap.max_active, self.overlap.active)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self.overlap.lock:
+            self.overlap.active -= 1
+            self.active -= 1
+            return super().run_historical(ticker, trade_date, historical_data)
@@ -0,0 +1,58 @@
+"""
+Tests for the array-backed SimulatedAccount.
+"""
+import sys
+import os
+import unittest
+
+import numpy as np
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting.account import SimulatedAccount, Trade
+
+
+class TestSimulatedAccount(unittest.TestCase):
+    """Equity bookkeeping and trade records."""
+
+    def test_equity_history_grows_past_capacity(self):
+        account = SimulatedAccount(10000, expected_bars=2)
+        dates = [f"2023-01-{day:02d}" for day in range(2, 12)]
+        for i, date in enumerate(dates):
+            account.record_equity(date, {}, total_equity=10000 + 100 * i)
+
+        curve = account.get_equity_curve()
+        self.assertEqual(len(curve), len(dates))
+        self.assertEqual(curve.index[-1].strftime('%Y-%m-%d'), dates[-1])
+        self.assertAlmostEqual(curve['daily_return'].iloc[1], 0.01)
+        self.assertEqual(account.equity_history[3]['total_equity'], 10300)
+
+    def test_equity_curve_is_a_view(self):
+        account = SimulatedAccount(10000)
+        account.reserve(5)
+        for date in ["2023-01-03", "2023-01-04", "2023-01-05"]:
+            account.record_equity(date, {})
+
+        curve = account.get_equity_curve()
+        self.assertTrue(np.shares_memory(curve['total_equity'].to_numpy(), account._values))
+
+    def test_trade_history_and_positions(self):
+        account = SimulatedAccount(10000)
+        self.assertTrue(account.buy("AAPL", 10, 100.0, "2023-01-03", commission=1.0))
+        self.assertTrue(account.buy("AAPL", 10, 120.0, "2023-01-04"))
+        position = account.get_position("AAPL")
+        self.assertEqual(position.shares, 20)
+        self.assertAlmostEqual(position.avg_cost, 110.0)
+
+        self.assertTrue(account.sell("AAPL", 20, 130.0, "2023-01-05", commission=2.0))
+        self.assertIsNone(account.get_position("AAPL"))
+
+        history = account.get_trade_history()
+        self.assertEqual(list(history['action']), ["BUY", "BUY", "SELL"])
+        self.assertEqual(list(history['net_amount']), [-1001.0, -1200.0, 2598.0])
+        self.assertFalse(hasattr(Trade("AAPL", "BUY", 1, 1.0, "2023-01-03"), '__dict__'))
+
+
+if __name__ == "__main__":
+    unittest.main()
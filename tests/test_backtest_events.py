@@ -0,0 +1,116 @@
+"""
+Tests for push-based backtest events.
+"""
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine, EventStream
+from tradingagents.backtesting.events import format_sse, mcp_progress_params
+from synthetic_data import SyntheticDataManager, CountingGraph
+
+
+class TestBacktestEvents(unittest.TestCase):
+    """Listeners must see every bar's progress and every fill, in order."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _engine(self, **overrides):
+        config = BacktestConfig(
+            start_date="2023-01-01",
+            end_date="2023-06-30",
+            benchmark=None,
+            use_decision_cache=False,
+            checkpoint_interval=0,
+            **overrides
+        )
+        return BacktestEngine(config, CountingGraph(), self.data_manager)
+
+    def test_event_sequence(self):
+        engine = self._engine()
+        events = []
+        engine.add_listener(events.append)
+
+        results = engine.run_backtest("AAPL")
+
+        types = [e.type for e in events]
+        self.assertEqual(types[0], 'started')
+        self.assertEqual(types[-1], 'completed')
+        self.assertEqual(types.count('progress'), engine.total_days)
+        self.assertEqual(types.count('trade'), len(results.trades))
+        self.assertEqual(events[-2].data['completed_days'], engine.total_days)
+        self.assertAlmostEqual(events[-1].data['final_balance'], results.final_balance)
+
+        trades = [e.data for e in events if e.type == 'trade']
+        self.assertEqual([t['action'] for t in trades], [t['action'] for t in results.trades])
+
+    def test_event_interval_and_failing_listener(self):
+        engine = self._engine(event_interval=10)
+        events = []
+        engine.add_listener(lambda event: 1 / 0)
+        engine.add_listener(events.append)
+
+        engine.run_backtest("AAPL")
+
+        progress = [e.data['completed_days'] for e in events if e.type == 'progress']
+        expected = list(range(10, engine.total_days + 1, 10))
+        if expected[-1] != engine.total_days:
+            expected.append(engine.total_days)
+        self.assertEqual(progress, expected)
+
+    def test_failed_event(self):
+        engine = self._engine()
+        events = []
+        engine.add_listener(events.append)
+
+        with self.assertRaises(ValueError):
+            engine.run_backtest("AAPL", "2023-07-01", "2023-06-01")  # No bars
+
+        self.assertEqual([e.type for e in events], ['failed'])
+
+    def test_event_stream(self):
+        engine = self._engine()
+        stream = EventStream(engine)
+
+        bars = len(self.data_manager.get_historical_data("AAPL", "2023-01-01", "2023-06-30"))
+        signals = np.resize(["BUY", "HOLD", "SELL"], bars)
+
+        events = list(stream.run("run_signal_backtest", "AAPL", signals))
+
+        self.assertEqual([e.type for e in events], ['started', 'completed'])
+        self.assertIsNone(stream.error)
+        self.assertEqual(events[-1].data['total_trades'], stream.result.total_trades)
+        self.assertEqual(engine.listeners, [])
+
+    def test_adapters(self):
+        engine = self._engine(event_interval=50)
+        events = []
+        engine.add_listener(events.append)
+        engine.run_backtest("AAPL")
+
+        progress = next(e for e in events if e.type == 'progress')
+        message = format_sse(progress)
+        self.assertTrue(message.startswith("event: progress\ndata: "))
+        self.assertTrue(message.endswith("\n\n"))
+        self.assertEqual(json.loads(message.split("data: ", 1)[1])['data']['completed_days'], 50)
+
+        params = mcp_progress_params(progress)
+        self.assertEqual((params['progress'], params['total']), (50, engine.total_days))
+        self.assertEqual(mcp_progress_params(events[-1])['progress'], engine.total_days)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Tests for the offline benchmark suite.
+"""
+import sys
+import os
+import json
+import unittest
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting.benchmark import (
+    BacktestBenchmark,
+    StubTradingGraph,
+    compare_benchmarks,
+    generate_ohlcv,
+)
+
+
+class TestBenchmark(unittest.TestCase):
+    """The suite must run offline and produce a comparable JSON report."""
+
+    def test_synthetic_data_is_deterministic(self):
+        full = generate_ohlcv("SYN000", "2000-01-03", "2001-01-01")
+        part = generate_ohlcv("SYN000", "2000-06-01", "2000-07-01")
+        self.assertTrue(full.loc[part.index, 'close'].equals(part['close']))
+        self.assertTrue((full['high'] >= full['low']).all())
+
+    def test_stub_graph_trades(self):
+        data = generate_ohlcv("SYN000", "2000-01-03", "2000-06-01")
+        graph = StubTradingGraph()
+        decisions = {graph.run_historical("SYN000", str(d.date()), data.loc[:d])["final_decision"]["decision"]
+                     for d in data.index}
+        self.assertEqual(decisions, {"HOLD", "BUY", "SELL"})
+
+    def test_report_is_json_and_comparable(self):
+        report = BacktestBenchmark(bars=120, tickers=2, repeats=1, include_visualizer=False).run()
+        report = json.loads(json.dumps(report))
+
+        self.assertEqual(
+            set(report['stages']),
+            {'data_load', 'backtest_loop', 'portfolio_loop', 'account', 'performance_analyzer'}
+        )
+        self.assertEqual(report['stages']['backtest_loop']['bars'], 120)
+        self.assertGreater(report['stages']['backtest_loop']['peak_memory_mb'], 0)
+
+        comparison = compare_benchmarks(report, report)
+        self.assertFalse(any(c['regression'] for c in comparison))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Tests for backtest checkpoint and resume.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine
+from tradingagents.backtesting.checkpoint import CheckpointStore
+from synthetic_data import SyntheticDataManager, CountingGraph
+
+
+def crashing_graph(crash_after):
+    """CountingGraph (same fingerprint) that is interrupted after a fixed number of calls."""
+    graph = CountingGraph()
+    run_historical = graph.run_historical
+
+    def interrupted(ticker, trade_date, historical_data):
+        if graph.calls == crash_after:
+            raise KeyboardInterrupt
+        return run_historical(ticker, trade_date, historical_data)
+
+    graph.run_historical = interrupted
+    return graph
+
+
+class TestCheckpointResume(unittest.TestCase):
+    """A resumed run must match an uninterrupted one without redoing finished bars."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        self.config = BacktestConfig(
+            initial_balance=10000,
+            start_date="2023-01-01",
+            end_date="2023-12-31",
+            risk_per_trade_pct=20.0,
+            use_decision_cache=False,
+            checkpoint_interval=10,
+            checkpoint_dir=os.path.join(self.tmp_dir, "checkpoints")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_resume_after_crash(self):
+        expected = BacktestEngine(self.config, CountingGraph(), self.data_manager).run_backtest("AAPL")
+        total_days = len(expected.equity_history)
+        self.assertGreater(total_days, 240)
+
+        with self.assertRaises(KeyboardInterrupt):
+            BacktestEngine(self.config, crashing_graph(crash_after=240), self.data_manager).run_backtest("AAPL")
+        self.assertEqual(sorted(f.split('.', 1)[1] for f in os.listdir(self.config.checkpoint_dir)),
+                         ['journal', 'json.gz'])
+
+        graph = CountingGraph()
+        engine = BacktestEngine(self.config, graph, self.data_manager)
+        results = engine.run_backtest("AAPL", resume=True)
+
+        self.assertEqual(graph.calls, total_days - 240)
+        self.assertEqual(results.final_balance, expected.final_balance)
+        self.assertEqual(results.trades, expected.trades)
+        self.assertEqual(results.equity_history, expected.equity_history)
+        self.assertAlmostEqual(results.sharpe_ratio, expected.sharpe_ratio, places=12)
+        self.assertEqual(len(engine.decisions), total_days)
+        # Completed runs clean up after themselves
+        self.assertEqual(os.listdir(self.config.checkpoint_dir), [])
+
+    def test_resume_without_checkpoint_starts_fresh(self):
+        graph = CountingGraph()
+        results = BacktestEngine(self.config, graph, self.data_manager).run_backtest("AAPL", resume=True)
+        self.assertEqual(graph.calls, len(results.equity_history))
+
+    def test_checkpoint_ignored_for_different_config(self):
+        with self.assertRaises(KeyboardInterrupt):
+            BacktestEngine(self.config, crashing_graph(crash_after=100), self.data_manager).run_backtest("AAPL")
+
+        config = self.config.copy()
+        config.risk_per_trade_pct = 5.0
+        graph = CountingGraph()
+        results = BacktestEngine(config, graph, self.data_manager).run_backtest("AAPL", resume=True)
+        self.assertEqual(graph.calls, len(results.equity_history))
+
+    def test_mismatched_checkpoint_is_replaced(self):
+        expected = BacktestEngine(self.config, CountingGraph(), self.data_manager).run_backtest("AAPL")
+        with self.assertRaises(KeyboardInterrupt):
+            BacktestEngine(self.config, crashing_graph(crash_after=240), self.data_manager).run_backtest("AAPL")
+
+        # Point the header at a bar the loaded data does not have
+        run_key = os.listdir(self.config.checkpoint_dir)[0].split('.', 1)[0]
+        store = CheckpointStore(self.config.checkpoint_dir)
+        state = store.load(run_key)
+        del state['deltas']
+        store.save(run_key, {**state, 'last_date': '1999-01-04'})
+
+        # The rejected checkpoint is discarded, so the restarted run journals from scratch
+        with self.assertRaises(KeyboardInterrupt):
+            BacktestEngine(self.config, crashing_graph(crash_after=100), self.data_manager).run_backtest(
+                "AAPL", resume=True)
+        self.assertEqual(len(CheckpointStore(self.config.checkpoint_dir).load(run_key)['deltas']), 10)
+
+        graph = CountingGraph()
+        results = BacktestEngine(self.config, graph, self.data_manager).run_backtest("AAPL", resume=True)
+        self.assertEqual(graph.calls, len(expected.equity_history) - 100)
+        self.assertEqual(results.trades, expected.trades)
+        self.assertEqual(results.equity_history, expected.equity_history)
+
+    def test_saves_are_incremental(self):
+        engine = BacktestEngine(self.config, CountingGraph(), self.data_manager)
+        store = engine.checkpoint_store
+        saves = []
+        save = store.save
+
+        def recording_save(run_key, state, delta=None):
+            saves.append((len(state['account']['positions']), len(delta['equity_dates']), len(delta['decisions'])))
+            save(run_key, state, delta)
+
+        store.save = recording_save
+        results = engine.run_backtest("AAPL")
+
+        self.assertEqual(len(saves), len(results.equity_history) // 10)
+        self.assertEqual({rows for _, rows, _ in saves}, {10})
+        self.assertEqual({decisions for _, _, decisions in saves}, {10})
+
+    def test_uncommitted_journal_tail_is_ignored(self):
+        store = CheckpointStore(self.config.checkpoint_dir)
+        store.save("run", {'bar_index': 1}, delta={'rows': [1]})
+        with open(store._journal_path("run"), 'ab') as f:
+            f.write(b'{"rows": [2')  # Crash before the header was rewritten
+
+        resumed = CheckpointStore(self.config.checkpoint_dir)
+        self.assertEqual(resumed.load("run")['deltas'], [{'rows': [1]}])
+        resumed.save("run", {'bar_index': 2}, delta={'rows': [2]})
+
+        state = CheckpointStore(self.config.checkpoint_dir).load("run")
+        self.assertEqual(state['bar_index'], 2)
+        self.assertEqual(state['deltas'], [{'rows': [1]}, {'rows': [2]}])
+
+        # A fresh run with the same key starts a new journal
+        fresh = CheckpointStore(self.config.checkpoint_dir)
+        fresh.save("run", {'bar_index': 1}, delta={'rows': [9]})
+        self.assertEqual(fresh.load("run")['deltas'], [{'rows': [9]}])
+
+        fresh.delete("run")
+        self.assertEqual(os.listdir(self.config.checkpoint_dir), [])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
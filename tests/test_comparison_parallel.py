@@ -0,0 +1,70 @@
+"""
+Tests for concurrent StrategyComparator runs.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, StrategyComparator
+from synthetic_data import SyntheticDataManager, CountingGraph, SlowGraph
+
+
+class TestParallelComparison(unittest.TestCase):
+    """Concurrent comparisons must report the same results as sequential ones."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.base = BacktestConfig(
+            initial_balance=10000,
+            start_date="2023-01-01",
+            end_date="2023-06-30",
+            benchmark="SPY",
+            decision_cache_dir=os.path.join(self.tmp_dir, "decisions")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _comparator(self, name):
+        data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, name))
+        comparator = StrategyComparator(data_manager)
+        for risk in [1.0, 2.0, 5.0, 10.0, 15.0]:
+            config = self.base.copy()
+            config.risk_per_trade_pct = risk
+            comparator.add_strategy(config, name=f"{risk}% Risk")
+        return comparator, data_manager
+
+    def test_threaded_comparison_matches_sequential(self):
+        sequential, _ = self._comparator("seq")
+        parallel, data_manager = self._comparator("par")
+
+        expected = sequential.run_comparison("AAPL", trading_graph=CountingGraph())
+        graph = SlowGraph(latency=0.001)  # Not thread-safe, like TradingAgentsGraph
+        report = parallel.run_comparison("AAPL", trading_graph=graph, max_workers=4)
+
+        self.assertEqual(list(report['Strategy']), list(expected['Strategy']))
+        self.assertEqual(list(report['Final Balance']), list(expected['Final Balance']))
+        self.assertGreater(graph.calls, 0)
+        self.assertEqual(graph.max_active, 1)  # Configs never call the shared graph at once
+        self.assertEqual(data_manager.fetch_count, 2)  # Ticker and SPY benchmark, once each
+
+    def test_streaming_results(self):
+        comparator, data_manager = self._comparator("stream")
+        seen = []
+        for config_index, result in comparator.iter_comparison("AAPL", max_workers=3):
+            seen.append(config_index)
+            # Partial reports can be rendered while the pool is still running
+            self.assertEqual(len(comparator.generate_comparison_report()), len(seen))
+
+        self.assertEqual(sorted(seen), list(range(5)))
+        self.assertEqual(comparator.result_indices, list(range(5)))
+        self.assertEqual(data_manager.fetch_count, 2)  # Ticker and SPY benchmark, once each
+
+
+if __name__ == "__main__":
+    unittest.main()
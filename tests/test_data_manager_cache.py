@@ -0,0 +1,86 @@
+"""
+Tests for the range-superset OHLCV cache in HistoricalDataManager.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synthetic_data import SyntheticDataManager, make_ohlcv
+
+
+class RecordingDataManager(SyntheticDataManager):
+    """Records every range fetched from the data source."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetched_ranges = []
+
+    def _fetch_from_mcp(self, ticker, start_date, end_date, interval):
+        self.fetched_ranges.append((start_date, end_date))
+        return super()._fetch_from_mcp(ticker, start_date, end_date, interval)
+
+
+class TestRangeSupersetCache(unittest.TestCase):
+    """Canonical per-(ticker, interval) store behaviour."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.manager = RecordingDataManager(cache_dir=self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_sub_range_is_served_from_cache(self):
+        self.manager.get_historical_data("AAPL", "2023-01-01", "2023-12-31")
+        window = self.manager.get_historical_data("AAPL", "2023-03-01", "2023-04-01")
+
+        self.assertEqual(len(self.manager.fetched_ranges), 1)
+        self.assertEqual(window.index.min(), pd.Timestamp("2023-03-01"))
+        self.assertLess(window.index.max(), pd.Timestamp("2023-04-01"))
+
+    def test_only_missing_head_and_tail_are_fetched(self):
+        self.manager.get_historical_data("AAPL", "2023-03-01", "2023-06-01")
+        data = self.manager.get_historical_data("AAPL", "2023-01-01", "2023-09-01")
+
+        self.assertEqual(self.manager.fetched_ranges, [
+            ("2023-03-01", "2023-06-01"),
+            ("2023-01-01", "2023-03-01"),
+            ("2023-06-01", "2023-09-01"),
+        ])
+        self.assertFalse(data.index.duplicated().any())
+        self.assertTrue(data.index.is_monotonic_increasing)
+        self.assertEqual(len(data), len(pd.bdate_range("2023-01-01", "2023-08-31")))
+
+    def test_store_persists_across_instances(self):
+        self.manager.get_historical_data("AAPL", "2023-01-01", "2023-12-31")
+
+        fresh = RecordingDataManager(cache_dir=self.tmp_dir)
+        data = fresh.get_historical_data("AAPL", "2023-02-01", "2023-02-28")
+        self.assertEqual(fresh.fetched_ranges, [])
+        self.assertFalse(data.empty)
+        self.assertEqual(len([f for f in os.listdir(self.tmp_dir) if f.endswith('.parquet')]), 1)
+
+    def test_timezone_aware_index(self):
+        class TzDataManager(RecordingDataManager):
+            def _fetch_from_mcp(self, ticker, start_date, end_date, interval):
+                self.fetched_ranges.append((start_date, end_date))
+                data = make_ohlcv(ticker, start_date, end_date)
+                data.index = data.index.tz_localize("America/New_York")
+                return data
+
+        manager = TzDataManager(cache_dir=os.path.join(self.tmp_dir, "tz"))
+        manager.get_historical_data("AAPL", "2023-01-01", "2023-06-30")
+        window = manager.get_historical_data("AAPL", "2023-02-01", "2023-03-01")
+        self.assertEqual(len(manager.fetched_ranges), 1)
+        self.assertEqual(window.index.min().strftime('%Y-%m-%d'), "2023-02-01")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Tests for the agent decision cache used by BacktestEngine.
+
+Runs offline against synthetic price data and a stub trading graph.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine, DecisionCache
+from synthetic_data import SyntheticDataManager, CountingGraph
+
+
+class TestDecisionCache(unittest.TestCase):
+    """Decision cache behaviour."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        self.config = BacktestConfig(
+            initial_balance=10000,
+            start_date="2023-01-01",
+            end_date="2023-03-31",
+            decision_cache_dir=os.path.join(self.tmp_dir, "decisions")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_rerun_replays_cached_decisions(self):
+        graph = CountingGraph()
+        first = BacktestEngine(self.config, graph, self.data_manager).run_backtest("AAPL")
+        calls_after_first = graph.calls
+        self.assertGreater(calls_after_first, 0)
+
+        # Different trading costs must still hit the cache
+        config = self.config.copy()
+        config.commission_rate = 0.005
+        engine = BacktestEngine(config, graph, self.data_manager)
+        second = engine.run_backtest("AAPL")
+
+        self.assertEqual(graph.calls, calls_after_first)
+        self.assertEqual(engine.decision_cache.get_stats()['misses'], 0)
+        self.assertEqual(len(first.trades), len(second.trades))
+
+    def test_model_change_invalidates_cache(self):
+        BacktestEngine(self.config, CountingGraph(), self.data_manager).run_backtest("AAPL")
+
+        other_graph = CountingGraph(model="other-model")
+        BacktestEngine(self.config, other_graph, self.data_manager).run_backtest("AAPL")
+        self.assertGreater(other_graph.calls, 0)
+
+    def test_interval_change_invalidates_cache(self):
+        graph = CountingGraph()
+        BacktestEngine(self.config, graph, self.data_manager).run_backtest("AAPL")
+        daily_calls = graph.calls
+
+        config = self.config.copy()
+        config.data_interval = "weekly"
+        engine = BacktestEngine(config, graph, self.data_manager)
+        results = engine.run_backtest("AAPL")
+
+        # Weekly dates are a subset of the daily ones, but none replay daily decisions
+        self.assertEqual(graph.calls - daily_calls, len(results.equity_history))
+        self.assertEqual(engine.decision_cache.get_stats()['hits'], 0)
+
+    def test_cache_can_be_disabled(self):
+        config = self.config.copy()
+        config.use_decision_cache = False
+        graph = CountingGraph()
+        engine = BacktestEngine(config, graph, self.data_manager)
+        engine.run_backtest("AAPL")
+        engine_again = BacktestEngine(config, graph, self.data_manager)
+        engine_again.run_backtest("AAPL")
+
+        self.assertIsNone(engine.decision_cache)
+        self.assertEqual(graph.calls, 2 * engine.total_days)
+
+    def test_put_get_round_trip(self):
+        cache = DecisionCache(os.path.join(self.tmp_dir, "decisions"))
+        fingerprint = DecisionCache.graph_fingerprint(CountingGraph())
+        cache.put(fingerprint, "MSFT", "2023-01-03", {"final_decision": {"decision": "BUY"}})
+
+        fresh = DecisionCache(os.path.join(self.tmp_dir, "decisions"))
+        self.assertEqual(fresh.get(fingerprint, "MSFT", "2023-01-03"),
+                         {"final_decision": {"decision": "BUY"}})
+        self.assertEqual(fresh.get_cached_dates(fingerprint, "MSFT"), ["2023-01-03"])
+        self.assertIsNone(fresh.get(fingerprint, "MSFT", "2023-01-04"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for the pooled vendor HTTP client.
+"""
+import sys
+import os
+import asyncio
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.dataflows import http_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep connections open
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.clients.add(self.client_address)
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+        if self.path.startswith("/flaky") and hits == 1:
+            self._reply(503, {"error": "unavailable"})
+        elif self.path.startswith("/limited"):
+            self._reply(429, {"error": "quota"})
+        else:
+            self._reply(200, {"path": self.path})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply(200, json.loads(self.rfile.read(length)))
+
+    def log_message(self, *args):
+        pass
+
+
+class TestHttpClient(unittest.TestCase):
+    """Requests to a host must share connections and retry transient failures only."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.lock = threading.Lock()
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        http_client.close_sessions()
+        self.server.clients = set()
+        self.server.hits = {}
+
+    def tearDown(self):
+        http_client.close_sessions()
+
+    def test_keep_alive(self):
+        for i in range(5):
+            response = http_client.get(f"{self.base}/quote/{i}", params={"apikey": "x"})
+            response.raise_for_status()
+
+        self.assertEqual(len(self.server.clients), 1)
+        self.assertIs(http_client.get_session(self.base + "/other"), http_client.get_session(self.base))
+        self.assertEqual(http_client.post(self.base + "/webhook", json={"a": 1}).json(), {"a": 1})
+
+    def test_retries(self):
+        self.assertEqual(http_client.get(self.base + "/flaky").status_code, 200)
+        self.assertEqual(self.server.hits["/flaky"], 2)
+
+        # Quota errors are returned as-is, never retried
+        self.assertEqual(http_client.get(self.base + "/limited").status_code, 429)
+        self.assertEqual(self.server.hits["/limited"], 1)
+
+    def test_async_request(self):
+        async def fetch():
+            responses = await asyncio.gather(*[http_client.async_get(f"{self.base}/news/{i}") for i in range(3)])
+            await http_client.aclose()
+            return responses
+
+        responses = asyncio.run(fetch())
+        self.assertEqual([r.json()["path"] for r in responses], ["/news/0", "/news/1", "/news/2"])
+        self.assertEqual(http_client.default_timeout(), (5, 15))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""
+Tests for the intraday engine over memory-mapped bar arrays.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, IntradayEngine, IntradayStrategy, BarArrays
+from tradingagents.backtesting.intraday import session_layout
+from synthetic_data import SyntheticDataManager, perf_test
+
+
+def _minute_frame(start: str, end: str, step_minutes: int = 1, seed: int = 0) -> pd.DataFrame:
+    """Bars from 04:00 to 20:00 New York time on business days (pre- and post-market included)."""
+    days = pd.bdate_range(start, end).values.astype('datetime64[m]')
+    minutes = np.arange(4 * 60, 20 * 60, step_minutes).astype('timedelta64[m]')
+    index = pd.DatetimeIndex((days[:, None] + minutes[None, :]).ravel()).tz_localize("America/New_York")
+    close = 100 * np.cumprod(1 + np.random.default_rng(seed).normal(0, 0.0005, len(index)))
+    return pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1.0}, index=index)
+
+
+def _crossover(bars: BarArrays) -> np.ndarray:
+    close = pd.Series(np.asarray(bars.close))
+    above = (close.rolling(5).mean() > close.rolling(20).mean()).to_numpy(dtype=np.int8)
+    return np.diff(above, prepend=0)
+
+
+class RecordingStrategy(IntradayStrategy):
+    """Replays precomputed codes and records the hooks it receives."""
+
+    def __init__(self, codes):
+        self.codes = codes
+        self.session_starts = []
+        self.session_ends = []
+        self.positions_at_open = []
+
+    def on_session_start(self, i, bars):
+        self.session_starts.append(i)
+
+    def on_bar(self, i, bars, position):
+        if self.session_starts and self.session_starts[-1] == i:
+            self.positions_at_open.append(position)
+        return self.codes[i]
+
+    def on_session_end(self, i, bars):
+        self.session_ends.append(i)
+
+
+class TestIntradayEngine(unittest.TestCase):
+    """Session handling, flattening and both strategy paths must agree."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config = BacktestConfig(benchmark=None, initial_balance=100000.0,
+                                     risk_per_trade_pct=50.0, max_position_size_pct=50.0)
+        frame = _minute_frame("2023-01-09", "2023-01-20", step_minutes=5)
+        BarArrays.from_frame(frame).save(os.path.join(self.tmp_dir, "bars"))
+        self.bars = BarArrays.load(os.path.join(self.tmp_dir, "bars"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_bar_store_roundtrip(self):
+        self.assertIsInstance(self.bars.close, np.memmap)
+        self.assertEqual(self.bars.timestamp.dtype, np.int64)
+        self.assertTrue((np.diff(self.bars.timestamp) > 0).all())
+        first = self.bars.index("America/New_York")[0]
+        self.assertEqual(first, pd.Timestamp("2023-01-09 04:00"))
+
+        window = self.bars.between("2023-01-10", "2023-01-11")
+        self.assertEqual(window.index("UTC")[0].date(), pd.Timestamp("2023-01-10").date())
+
+    def test_session_layout(self):
+        layout = session_layout(self.bars, "NYSE")
+        local = self.bars.index("America/New_York")
+
+        # 9 sessions: 2023-01-16 (Martin Luther King Jr. Day) is a holiday
+        self.assertEqual(len(layout['session_first']), 9)
+        self.assertFalse(layout['tradable'][local.normalize() == pd.Timestamp("2023-01-16")].any())
+        self.assertTrue((local[layout['session_first']].strftime('%H:%M') == "09:30").all())
+        self.assertTrue((local[layout['session_last']].strftime('%H:%M') == "15:55").all())
+        self.assertEqual(layout['tradable'].sum(), 9 * 78)
+
+        extended = session_layout(self.bars, "NYSE", regular_hours_only=False)
+        self.assertEqual(extended['tradable'].sum(), 9 * 192)
+
+    def test_flatten_eod(self):
+        engine = IntradayEngine(self.config, calendar="NYSE")
+        codes = np.zeros(len(self.bars), dtype=np.int8)
+        codes[session_layout(self.bars)['session_first']] = 1  # Buy every open, never sell
+
+        results = engine.run_intraday_backtest("AAPL", codes, bars=self.bars)
+
+        trades = pd.DataFrame(results.trades)
+        self.assertEqual((trades['action'] == 'BUY').sum(), 9)
+        self.assertEqual((trades['action'] == 'SELL').sum(), 9)
+        self.assertTrue((trades['date'].dt.strftime('%H:%M')[trades['action'] == 'SELL'] == "15:55").all())
+        self.assertEqual(len(results.equity_history), 9)
+
+        held = IntradayEngine(BacktestConfig(**{**self.config.to_dict(), 'flatten_eod': False}), calendar="NYSE")
+        held_trades = held.run_intraday_backtest("AAPL", codes, bars=self.bars).trades
+        self.assertEqual({t['action'] for t in held_trades}, {'BUY'})
+
+    def test_event_driven_matches_vectorized(self):
+        codes = _crossover(self.bars)
+        vector_engine = IntradayEngine(self.config, calendar="NYSE")
+        vector = vector_engine.run_intraday_backtest("AAPL", _crossover, bars=self.bars)
+
+        engine = IntradayEngine(self.config, calendar="NYSE")
+        strategy = RecordingStrategy(codes)
+        events = engine.run_intraday_backtest("AAPL", strategy, bars=self.bars)
+
+        self.assertGreater(vector.total_trades, 18)
+        self.assertEqual(events.total_trades, vector.total_trades)
+        self.assertAlmostEqual(events.final_balance, vector.final_balance, places=6)
+        np.testing.assert_allclose(engine.bar_equity, vector_engine.bar_equity)
+        self.assertEqual(len(strategy.session_starts), 9)
+        self.assertEqual(len(strategy.session_ends), 9)
+        self.assertEqual(strategy.positions_at_open, [0.0] * 9)
+
+    def test_load_bars_is_stored_once(self):
+        data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        engine = IntradayEngine(self.config, data_manager=data_manager,
+                                bar_store_dir=os.path.join(self.tmp_dir, "store"))
+
+        bars = engine.load_bars("AAPL", "2023-01-02", "2023-02-01")
+        again = engine.load_bars("AAPL", "2023-01-02", "2023-02-01")
+
+        self.assertEqual(data_manager.fetch_count, 1)
+        self.assertIsInstance(again.close, np.memmap)
+        np.testing.assert_array_equal(bars.timestamp, again.timestamp)
+
+    def _run_million_bars(self):
+        frame = _minute_frame("2020-01-01", "2023-12-31", seed=1)
+        BarArrays.from_frame(frame).save(os.path.join(self.tmp_dir, "minutes"))
+        bars = BarArrays.load(os.path.join(self.tmp_dir, "minutes"))
+        codes = _crossover(bars)
+        engine = IntradayEngine(self.config, calendar="NYSE")
+
+        start = time.perf_counter()
+        results = engine.run_intraday_backtest("AAPL", codes, bars=bars)
+        return bars, results, time.perf_counter() - start
+
+    def test_million_bar_run(self):
+        bars, results, _ = self._run_million_bars()
+
+        self.assertIsInstance(bars.close, np.memmap)
+        self.assertGreater(len(bars), 1_000_000)
+        self.assertGreater(results.total_trades, 1000)
+
+    @perf_test
+    def test_million_bars_per_second(self):
+        _, _, elapsed = self._run_million_bars()
+        self.assertLess(elapsed, 5.0)
+
+if __name__ == '__main__':
+    unittest.main()
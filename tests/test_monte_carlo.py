@@ -0,0 +1,96 @@
+"""
+Tests for the Monte Carlo bootstrap.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestResults, MonteCarloAnalyzer, StrategyComparator
+from tradingagents.backtesting.monte_carlo import block_bootstrap_indices, simulate_paths
+from synthetic_data import SyntheticDataManager, CountingGraph, perf_test
+
+
+def _results(days, seed=0):
+    equity = 10000 * np.cumprod(1 + np.random.default_rng(seed).normal(0.0005, 0.01, days))
+    return BacktestResults("TEST", "2019-01-01", "2023-12-31", 10000, float(equity[-1]),
+                           equity_history=[{'total_equity': e} for e in equity])
+
+
+class TestMonteCarlo(unittest.TestCase):
+    """Vectorized paths must match a per-path reference."""
+
+    def test_blocks_are_contiguous(self):
+        indices = block_bootstrap_indices(np.random.default_rng(0), 100, 50, 7)
+        self.assertEqual(indices.shape, (50, 100))
+        self.assertTrue((np.diff(indices[:, :7], axis=1) == 1).all())
+        self.assertLess(indices.max(), 100)
+
+    def test_paths_match_reference(self):
+        returns = np.random.default_rng(1).normal(0, 0.02, (5, 300))
+        metrics = simulate_paths(returns.copy(), 1000.0, 252)
+
+        for i, path in enumerate(returns):
+            equity = 1000.0 * np.cumprod(1 + path)
+            peaks = np.maximum.accumulate(np.r_[1000.0, equity])[1:]
+            self.assertAlmostEqual(metrics['final_equity'][i], equity[-1])
+            self.assertAlmostEqual(metrics['max_drawdown_pct'][i], ((equity - peaks) / peaks).min() * 100)
+            self.assertAlmostEqual(metrics['sharpe_ratio'][i], path.mean() / path.std(ddof=1) * np.sqrt(252))
+
+    def test_chunked_matches_single_matrix(self):
+        results = _results(500)
+        chunked = MonteCarloAnalyzer(results, 3000, chunk_size=700, seed=4).run()
+        whole = MonteCarloAnalyzer(results, 3000, chunk_size=None, seed=4).run()
+        for metric, values in whole.items():
+            np.testing.assert_allclose(chunked[metric], values)
+
+    def test_confidence_intervals(self):
+        summary = MonteCarloAnalyzer(_results(500), 2000, seed=2).confidence_intervals(confidence_levels=(0.9, 0.95))
+        equity = summary['final_equity']
+        self.assertLess(equity['ci_95_lower'], equity['ci_90_lower'])
+        self.assertLess(equity['ci_90_lower'], equity['median'])
+        self.assertLess(equity['median'], equity['ci_90_upper'])
+        self.assertLessEqual(summary['max_drawdown_pct']['ci_95_upper'], 0)
+        self.assertTrue(0 <= summary['probability_of_loss'] <= 1)
+
+    def test_ten_thousand_five_year_paths(self):
+        metrics = MonteCarloAnalyzer(_results(5 * 252), 10000, chunk_size=3000, seed=3).run()
+        for values in metrics.values():
+            self.assertEqual(values.shape, (10000,))
+            self.assertTrue(np.isfinite(values).all())
+
+    @perf_test
+    def test_ten_thousand_five_year_paths_under_a_second(self):
+        analyzer = MonteCarloAnalyzer(_results(5 * 252), 10000, seed=3)
+        started = time.perf_counter()
+        analyzer.run()
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+    def test_comparison_report(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            comparator = StrategyComparator(SyntheticDataManager(cache_dir=os.path.join(tmp_dir, "data")))
+            for risk in [5.0, 20.0]:
+                comparator.add_strategy(BacktestConfig(
+                    initial_balance=10000, start_date="2023-01-01", end_date="2023-12-31",
+                    risk_per_trade_pct=risk, decision_cache_dir=os.path.join(tmp_dir, "decisions"),
+                    checkpoint_dir=os.path.join(tmp_dir, "checkpoints")
+                ))
+            comparator.run_comparison("AAPL", trading_graph=CountingGraph())
+            report = comparator.generate_monte_carlo_report(num_simulations=500, method="trades", seed=0)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self.assertEqual(list(report['Strategy']), ['Config 1', 'Config 2'])
+        self.assertTrue((report['Final Equity 95% Low'] <= report['Final Equity 95% High']).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Tests for the parameter optimizer.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine, ParameterOptimizer
+from tradingagents.backtesting.optimizer import pareto_front_mask
+from synthetic_data import SyntheticDataManager, CountingGraph, perf_test
+
+
+class TestParameterOptimizer(unittest.TestCase):
+    """Optimizer scores must match single backtests and pruning must drop most candidates."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config = BacktestConfig(
+            start_date="2019-01-01",
+            end_date="2023-12-31",
+            benchmark=None,
+            decision_cache_dir=os.path.join(self.tmp_dir, "decisions"),
+            checkpoint_interval=0
+        )
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        closes = self.data_manager.get_historical_data("AAPL", "2019-01-01", "2023-12-31")['close']
+        # Mean-reversion signals so return and drawdown depend on sizing
+        moves = closes.pct_change().fillna(0)
+        self.signals = np.where(moves < -0.01, "BUY", np.where(moves > 0.01, "SELL", "HOLD"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_pareto_front(self):
+        returns = np.array([10.0, 8.0, 12.0, 5.0, 12.0])
+        drawdowns = np.array([-5.0, -3.0, -9.0, -6.0, -10.0])
+        np.testing.assert_array_equal(pareto_front_mask(returns, drawdowns), [True, True, True, False, False])
+
+    def test_grid_matches_signal_backtest(self):
+        optimizer = ParameterOptimizer(self.config, self.data_manager)
+        grid = {'risk_per_trade_pct': [5.0, 20.0, 50.0], 'commission_rate': [0.0, 0.002]}
+
+        df = optimizer.grid_search("AAPL", grid, signals=self.signals, rungs=1)
+
+        self.assertEqual(len(df), 6)
+        best = optimizer.best_config()
+        result = BacktestEngine(best, data_manager=self.data_manager).run_signal_backtest("AAPL", self.signals)
+        self.assertAlmostEqual(df['total_return_pct'].iloc[0], result.total_return_pct, places=9)
+        self.assertAlmostEqual(df['sharpe_ratio'].iloc[0], result.sharpe_ratio, places=9)
+        self.assertTrue(optimizer.pareto_front()['on_pareto_front'].all())
+
+    def test_signals_from_graph(self):
+        optimizer = ParameterOptimizer(self.config, self.data_manager)
+        graph = CountingGraph()
+
+        df = optimizer.grid_search("AAPL", {'risk_per_trade_pct': [1.0, 10.0]},
+                                   trading_graph=graph, rungs=1)
+
+        expected = BacktestEngine(self.config, graph, self.data_manager).run_backtest("AAPL")
+        row = df[df['risk_per_trade_pct'] == self.config.risk_per_trade_pct].iloc[0]
+        self.assertAlmostEqual(row['total_return_pct'], expected.total_return_pct, places=6)
+
+    def _halving_search(self):
+        optimizer = ParameterOptimizer(self.config, self.data_manager)
+        space = {
+            'risk_per_trade_pct': (1.0, 100.0),
+            'max_position_size_pct': (10.0, 100.0),
+            'commission_rate': (0.0, 0.005),
+            'slippage': [0.0, 0.001, 0.002],
+        }
+
+        start = time.perf_counter()
+        df = optimizer.random_search("AAPL", space, n_iter=1000, seed=0, signals=self.signals,
+                                     rungs=3, eta=3, max_workers=2)
+        return df, time.perf_counter() - start
+
+    def test_successive_halving_prunes(self):
+        df, _ = self._halving_search()
+
+        self.assertEqual(len(df), 1000)
+        full = df['bars'] == df['bars'].max()
+        self.assertLess(full.sum(), 400)
+        self.assertTrue(full.iloc[:full.sum()].all())  # Full-period rows rank first
+
+    @perf_test
+    def test_successive_halving_is_fast(self):
+        _, elapsed = self._halving_search()
+        self.assertLess(elapsed, 60.0)
+
+    def test_rejects_untunable_fields(self):
+        optimizer = ParameterOptimizer(self.config, self.data_manager)
+        with self.assertRaises(ValueError):
+            optimizer.grid_search("AAPL", {'data_interval': ['daily']}, signals=self.signals)
+
+
+if __name__ == '__main__':
+    unittest.main()
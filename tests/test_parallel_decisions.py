@@ -0,0 +1,103 @@
+"""
+Tests for concurrent agent decision generation.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine
+from tradingagents.backtesting.parallel import ProviderRateLimiter
+from synthetic_data import SyntheticDataManager, Overlap, SlowGraph
+
+
+class TestParallelDecisions(unittest.TestCase):
+    """Two-phase runs must match the bar-by-bar loop."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        self.config = BacktestConfig(
+            initial_balance=10000,
+            start_date="2023-01-01",
+            end_date="2023-04-30",
+            risk_per_trade_pct=20.0,
+            use_decision_cache=False,
+            checkpoint_interval=0
+        )
+        self.parallel_config = self.config.copy()
+        self.parallel_config.decision_workers = 8
+        self.expected = BacktestEngine(self.config, SlowGraph(Overlap(), latency=0),
+                                       self.data_manager).run_backtest("AAPL")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_graph_per_worker(self):
+        overlap = Overlap()
+        graphs = []
+
+        def factory():
+            graphs.append(SlowGraph(overlap))
+            return graphs[-1]
+
+        engine = BacktestEngine(self.parallel_config, SlowGraph(overlap), self.data_manager, graph_factory=factory)
+        results = engine.run_backtest("AAPL")
+
+        self.assertEqual(results.trades, self.expected.trades)
+        self.assertEqual(results.equity_history, self.expected.equity_history)
+        self.assertEqual(overlap.calls, len(self.expected.equity_history))
+        self.assertEqual(engine.trading_graph.calls, 0)
+        self.assertLessEqual(len(graphs), 8)
+        self.assertLessEqual(overlap.max_active, 8)
+        self.assertGreater(overlap.max_active, 1)
+        self.assertTrue(all(graph.max_active <= 1 for graph in graphs))
+
+    def test_shared_graph_is_serialized(self):
+        overlap = Overlap()
+        graph = SlowGraph(overlap, latency=0.002)
+        results = BacktestEngine(self.parallel_config, graph, self.data_manager).run_backtest("AAPL")
+
+        self.assertEqual(results.trades, self.expected.trades)
+        self.assertEqual(graph.calls, len(self.expected.equity_history))
+        self.assertEqual(overlap.max_active, 1)
+
+        # A graph that declares itself thread-safe is shared without the lock
+        overlap = Overlap()
+        graph = SlowGraph(overlap)
+        graph.thread_safe = True
+        results = BacktestEngine(self.parallel_config, graph, self.data_manager).run_backtest("AAPL")
+
+        self.assertEqual(results.equity_history, self.expected.equity_history)
+        self.assertGreater(overlap.max_active, 1)
+
+    def test_rate_limiter_spaces_requests(self):
+        limiter = ProviderRateLimiter({'openai': 600})
+        with mock.patch('tradingagents.backtesting.parallel.time') as clock:
+            clock.monotonic.return_value = 100.0
+            threads = [threading.Thread(target=limiter.acquire, args=('openai',)) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            # One request starts at once, the others wait for 0.1s slots
+            waits = sorted(call.args[0] for call in clock.sleep.call_args_list)
+            self.assertEqual(len(waits), 4)
+            for wait, expected in zip(waits, [0.1, 0.2, 0.3, 0.4]):
+                self.assertAlmostEqual(wait, expected)
+
+            # Unlimited providers pass straight through
+            clock.sleep.reset_mock()
+            for _ in range(100):
+                limiter.acquire('anthropic')
+            clock.sleep.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
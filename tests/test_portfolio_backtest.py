@@ -0,0 +1,81 @@
+"""
+Tests for multi-ticker portfolio backtesting.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine
+from synthetic_data import SyntheticDataManager, CountingGraph
+
+
+class TestPortfolioBacktest(unittest.TestCase):
+    """Portfolio mode over an aligned price panel."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        self.config = BacktestConfig(
+            initial_balance=100000,
+            start_date="2023-01-01",
+            end_date="2023-06-30",
+            risk_per_trade_pct=40.0,
+            max_position_size_pct=40.0,
+            decision_cache_dir=os.path.join(self.tmp_dir, "decisions")
+        )
+        self.tickers = ["AAPL", "MSFT", "NVDA", "GOOGL"]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_price_panel_alignment(self):
+        panel = self.data_manager.get_price_panel(self.tickers, "2023-01-01", "2023-03-31")
+        self.assertEqual(list(panel.columns.get_level_values('ticker').unique()), self.tickers)
+        self.assertEqual(panel['MSFT']['close'].notna().sum(), len(panel))
+        self.assertEqual(self.data_manager.fetch_count, len(self.tickers))
+
+    def test_simultaneous_buys_share_cash(self):
+        index = pd.bdate_range("2023-01-01", "2023-06-30")
+        signals = pd.DataFrame("HOLD", index=index, columns=self.tickers)
+        signals.iloc[3] = "BUY"
+        signals.iloc[60, 1] = "SELL"
+
+        engine = BacktestEngine(self.config, data_manager=self.data_manager)
+        results = engine.run_portfolio_backtest(self.tickers, signals=signals)
+
+        buys = [t for t in results.trades if t['action'] == "BUY"]
+        self.assertEqual(len(buys), len(self.tickers))
+        spent = sum(t['gross_amount'] + t['commission'] + t['slippage'] for t in buys)
+        self.assertLessEqual(spent, self.config.initial_balance)
+        self.assertGreater(spent, 0.95 * self.config.initial_balance)
+        for trade in results.trades:
+            self.assertAlmostEqual(trade['commission'], trade['gross_amount'] * self.config.commission_rate)
+            self.assertAlmostEqual(trade['slippage'], trade['gross_amount'] * self.config.slippage)
+        self.assertEqual([t['ticker'] for t in results.trades if t['action'] == "SELL"], ["MSFT"])
+
+        # Equity after the buys reflects all four positions
+        day = results.equity_history[10]
+        self.assertLess(day['cash_balance'], 0.05 * self.config.initial_balance)
+        self.assertNotAlmostEqual(day['total_equity'], day['cash_balance'])
+
+    def test_trading_graph_drives_every_ticker(self):
+        graph = CountingGraph()
+        engine = BacktestEngine(self.config, graph, self.data_manager)
+        results = engine.run_portfolio_backtest(self.tickers)
+
+        self.assertEqual(graph.calls, engine.total_days * len(self.tickers))
+        self.assertEqual(results.ticker, ",".join(self.tickers))
+        self.assertEqual(len(results.equity_history), engine.total_days)
+        self.assertTrue(np.isfinite(results.final_balance))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for the per-vendor token-bucket rate limiter.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from multiprocessing import get_context
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.dataflows.rate_limiter import VendorRateLimiter
+
+
+def _acquire_many(state_dir, attempts):
+    limiter = VendorRateLimiter(state_dir=state_dir, limits={"fmp": {"per_minute": None, "per_day": 30}})
+    return sum(limiter.acquire("fmp", max_wait=0) for _ in range(attempts))
+
+
+class TestVendorRateLimiter(unittest.TestCase):
+    """Buckets must refill at their rate, persist, and be shared across threads and processes."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_limits_and_redirect(self):
+        limiter = VendorRateLimiter(state_dir=None, limits={"fmp": {"per_minute": 3}})
+
+        self.assertEqual([limiter.acquire("fmp", max_wait=0) for _ in range(4)], [True, True, True, False])
+        self.assertTrue(limiter.acquire("openai", max_wait=0))  # No limits configured
+        self.assertAlmostEqual(limiter.available_in("fmp"), 20.0, delta=0.5)
+        self.assertEqual(limiter.stats()["rejected"], 1)
+
+        # A call costing more than the bucket holds is never possible right away
+        self.assertFalse(limiter.acquire("fmp", tokens=3, max_wait=0))
+
+    def test_queueing(self):
+        limiter = VendorRateLimiter(state_dir=None, limits={"newsdata": {"per_second": 5, "per_minute": None}})
+        for _ in range(5):
+            self.assertTrue(limiter.acquire("newsdata", max_wait=0))
+
+        start = time.perf_counter()
+        self.assertTrue(limiter.acquire("newsdata", max_wait=1.0))
+        self.assertGreater(time.perf_counter() - start, 0.15)
+        self.assertEqual(limiter.stats()["queued"], 1)
+
+    def test_every_window_applies(self):
+        limiter = VendorRateLimiter(state_dir=None, limits={"alpha_vantage": {"per_second": 100}})
+        results = [limiter.acquire("alpha_vantage", max_wait=0) for _ in range(7)]
+
+        # per_minute 5 (default) binds before per_second 100
+        self.assertEqual(results.count(True), 5)
+        buckets = limiter.stats()["buckets"]["alpha_vantage"]
+        self.assertEqual(set(buckets), {"per_second", "per_minute", "per_day"})
+        self.assertAlmostEqual(buckets["per_day"]["tokens"], 20, places=1)
+
+        with self.assertRaises(ValueError):
+            VendorRateLimiter(limits={"fmp": {"per_hour": 10}})
+
+    def test_persistence_and_drain(self):
+        limiter = VendorRateLimiter(state_dir=self.tmp_dir)
+        for _ in range(10):
+            limiter.acquire("fmp", tokens=3, max_wait=0)
+
+        restarted = VendorRateLimiter(state_dir=self.tmp_dir)
+        self.assertAlmostEqual(restarted.stats()["buckets"]["fmp"]["per_day"]["tokens"], 220, places=0)
+
+        restarted.drain("fmp", "per_day")
+        self.assertFalse(limiter.acquire("fmp", max_wait=0))
+        self.assertGreater(limiter.available_in("fmp"), 300)
+
+    def test_shared_across_threads_and_processes(self):
+        limiter = VendorRateLimiter(state_dir=self.tmp_dir, limits={"fmp": {"per_minute": None, "per_day": 30}})
+        granted = []
+
+        def worker():
+            granted.append(sum(limiter.acquire("fmp", max_wait=0) for _ in range(5)))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sum(granted), 20)
+
+        with get_context("spawn").Pool(4) as pool:
+            from_processes = pool.starmap(_acquire_many, [(self.tmp_dir, 10)] * 4)
+        self.assertEqual(sum(from_processes), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for benchmark-relative metrics.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine, PerformanceAnalyzer
+from tradingagents.backtesting.relative_performance import calculate_relative_metrics
+from synthetic_data import SyntheticDataManager, CountingGraph, make_ohlcv
+
+
+class TestRelativeMetrics(unittest.TestCase):
+    """Vectorized metrics must match a straightforward pandas computation."""
+
+    def setUp(self):
+        self.benchmark = make_ohlcv("SPY", "2023-01-01", "2023-12-31")['close']
+
+    def test_levered_benchmark(self):
+        bench_returns = self.benchmark.pct_change().fillna(0)
+        equity = 10000 * (1 + 2 * bench_returns).cumprod()
+        metrics = calculate_relative_metrics(equity, self.benchmark)
+
+        self.assertAlmostEqual(metrics['beta'], 2.0, places=9)
+        self.assertAlmostEqual(metrics['correlation'], 1.0, places=9)
+
+    def test_matches_pandas_reference(self):
+        rng = np.random.default_rng(5)
+        # Strategy trades on a calendar that skips some benchmark sessions
+        index = self.benchmark.index[::2]
+        equity = pd.Series(10000 * np.cumprod(1 + rng.normal(0.001, 0.02, len(index))), index=index)
+        metrics = calculate_relative_metrics(equity, self.benchmark)
+
+        frame = pd.DataFrame({'s': equity, 'b': self.benchmark.reindex(index)}).pct_change().dropna()
+        beta = frame['s'].cov(frame['b']) / frame['b'].var()
+        active = frame['s'] - frame['b']
+        self.assertAlmostEqual(metrics['beta'], beta, places=9)
+        self.assertAlmostEqual(metrics['alpha'], (frame['s'].mean() - beta * frame['b'].mean()) * 252 * 100, places=9)
+        self.assertAlmostEqual(metrics['tracking_error'], active.std() * np.sqrt(252) * 100, places=9)
+        self.assertAlmostEqual(metrics['information_ratio'], active.mean() / active.std() * np.sqrt(252), places=9)
+        bench_total = (self.benchmark.reindex(index).iloc[-1] / self.benchmark.reindex(index).iloc[0] - 1) * 100
+        self.assertAlmostEqual(metrics['benchmark_return_pct'], bench_total, places=9)
+
+    def test_engine_fills_results_and_shares_benchmark(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            data_manager = SyntheticDataManager(cache_dir=os.path.join(tmp_dir, "data"))
+            config = BacktestConfig(
+                initial_balance=10000,
+                start_date="2023-01-01",
+                end_date="2023-12-31",
+                benchmark="SPY",
+                decision_cache_dir=os.path.join(tmp_dir, "decisions"),
+                checkpoint_dir=os.path.join(tmp_dir, "checkpoints")
+            )
+            results = BacktestEngine(config, CountingGraph(), data_manager).run_backtest("AAPL")
+            benchmark = data_manager.get_benchmark_series("SPY", "2023-01-01", "2023-12-31")
+            fetches = data_manager.fetch_count
+
+            config.risk_per_trade_pct = 5.0
+            BacktestEngine(config, CountingGraph(), data_manager).run_backtest("AAPL")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self.assertIs(data_manager.get_benchmark_series("SPY", "2023-01-01", "2023-12-31"), benchmark)
+        self.assertEqual(data_manager.fetch_count, fetches)
+        self.assertFalse(benchmark.to_numpy().flags.writeable)
+
+        expected = calculate_relative_metrics(pd.Series(
+            [e['total_equity'] for e in results.equity_history],
+            index=pd.to_datetime([e['date'] for e in results.equity_history])
+        ), benchmark)
+        self.assertAlmostEqual(results.beta, expected['beta'])
+        self.assertNotEqual(results.beta, 0.0)
+        self.assertEqual(PerformanceAnalyzer(results).get_summary()['benchmark']['benchmark'], "SPY")
+
+    def test_benchmark_is_opt_in(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            data_manager = SyntheticDataManager(cache_dir=os.path.join(tmp_dir, "data"))
+            config = BacktestConfig(
+                initial_balance=10000,
+                start_date="2023-01-01",
+                end_date="2023-12-31",
+                use_decision_cache=False,
+                checkpoint_interval=0
+            )
+            results = BacktestEngine(config, CountingGraph(), data_manager).run_backtest("AAPL")
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self.assertEqual(data_manager.fetch_count, 1)  # AAPL only
+        self.assertEqual(data_manager.benchmark_cache, {})
+        self.assertEqual(results.beta, 0.0)
+        self.assertIsNone(PerformanceAnalyzer(results).get_summary()['benchmark']['benchmark'])
+
+
+if __name__ == "__main__":
+    unittest.main()
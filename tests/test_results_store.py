@@ -0,0 +1,81 @@
+"""
+Tests for the columnar results store.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine, ResultsStore
+from synthetic_data import SyntheticDataManager, CountingGraph
+
+
+class TestResultsStore(unittest.TestCase):
+    """Stored runs must round-trip and be queryable from the index."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        self.store = ResultsStore(os.path.join(self.tmp_dir, "store"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _run(self, ticker, risk):
+        config = BacktestConfig(
+            start_date="2023-01-01",
+            end_date="2023-06-30",
+            risk_per_trade_pct=risk,
+            benchmark=None,
+            decision_cache_dir=os.path.join(self.tmp_dir, "decisions"),
+            checkpoint_interval=0
+        )
+        return BacktestEngine(config, CountingGraph(), self.data_manager).run_backtest(ticker)
+
+    def test_round_trip(self):
+        results = self._run("AAPL", 10.0)
+        run_id = self.store.save(results)
+
+        loaded = self.store.load(run_id)
+
+        self.assertEqual(loaded.final_balance, results.final_balance)
+        self.assertEqual(loaded.total_trades, results.total_trades)
+        self.assertEqual(loaded.config, results.config)
+        self.assertEqual(len(loaded.equity_history), len(results.equity_history))
+        pd.testing.assert_series_equal(
+            self.store.load_equity(run_id)['total_equity'],
+            pd.DataFrame(results.equity_history)['total_equity']
+        )
+        self.assertEqual(list(self.store.load_trades(run_id)['action']), [t['action'] for t in results.trades])
+
+    def test_best_sharpe_query(self):
+        runs = [self._run(ticker, risk) for ticker in ("NVDA", "AAPL") for risk in (1.0, 10.0, 50.0)]
+        for results in runs:
+            self.store.save(results)
+        self.store.save(runs[0])  # Saving the same run again replaces it
+
+        nvda = self.store.query(ticker="NVDA")
+        best = self.store.best("NVDA", metric="sharpe_ratio", since="2000-01-01")
+
+        self.assertEqual(len(nvda), 3)
+        self.assertEqual(len(self.store.query()), 6)
+        self.assertEqual(best['sharpe_ratio'], max(r.sharpe_ratio for r in runs[:3]))
+        self.assertIsNone(self.store.best("NVDA", since="2999-01-01"))
+
+    def test_delete(self):
+        run_id = self.store.save(self._run("AAPL", 10.0))
+        self.store.delete(run_id)
+
+        self.assertTrue(self.store.query().empty)
+        with self.assertRaises(KeyError):
+            self.store.load(run_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
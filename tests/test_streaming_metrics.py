@@ -0,0 +1,68 @@
+"""
+Tests for streaming performance metrics.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine, PerformanceAnalyzer, StreamingMetrics
+from synthetic_data import SyntheticDataManager, CountingGraph
+
+
+class TestStreamingMetrics(unittest.TestCase):
+    """Online metrics must agree with PerformanceAnalyzer."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        self.config = BacktestConfig(
+            initial_balance=10000,
+            start_date="2023-01-01",
+            end_date="2023-12-31",
+            risk_per_trade_pct=20.0,
+            decision_cache_dir=os.path.join(self.tmp_dir, "decisions")
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_matches_performance_analyzer(self):
+        engine = BacktestEngine(self.config, CountingGraph(), self.data_manager)
+        results = engine.run_backtest("AAPL")
+        risk = PerformanceAnalyzer(results).calculate_risk_metrics()
+
+        self.assertAlmostEqual(results.sharpe_ratio, risk['sharpe_ratio'], places=9)
+        self.assertAlmostEqual(results.sortino_ratio, risk['sortino_ratio'], places=9)
+        self.assertAlmostEqual(results.volatility, risk['volatility'], places=9)
+        self.assertAlmostEqual(results.max_drawdown, risk['max_drawdown_pct'], places=9)
+        self.assertAlmostEqual(engine.metrics.calmar_ratio, risk['calmar_ratio'], places=9)
+        self.assertLess(results.max_drawdown, 0)
+
+        progress = engine.get_progress()
+        self.assertEqual(progress['metrics']['sharpe_ratio'], results.sharpe_ratio)
+
+    def test_batch_update_matches_per_bar(self):
+        rng = np.random.default_rng(3)
+        equity = 10000 * np.cumprod(1 + rng.normal(0, 0.02, 500))
+
+        per_bar = StreamingMetrics(10000)
+        for value in equity:
+            per_bar.update(value)
+
+        batched = StreamingMetrics(10000)
+        batched.update_batch(equity[:123])
+        batched.update_batch(equity[123:])
+
+        for key, value in per_bar.snapshot().items():
+            self.assertAlmostEqual(batched.snapshot()[key], value, places=9, msg=key)
+
+
+if __name__ == "__main__":
+    unittest.main()
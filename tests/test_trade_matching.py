@@ -0,0 +1,147 @@
+"""
+Tests for FIFO round-trip trade matching.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine, PerformanceAnalyzer
+from tradingagents.backtesting.trade_matching import match_fifo, round_trips_from_trades
+from synthetic_data import SyntheticDataManager, CountingGraph, perf_test
+
+
+def _reference_fifo(trades):
+    """Plain per-lot FIFO matching used as the oracle."""
+    lots = {}
+    trips = []
+    for ticker, action, shares, price, cost, date in trades:
+        book = lots.setdefault(ticker, [])
+        if action == "BUY":
+            book.append([shares, price, cost / shares, date])
+            continue
+        remaining = shares
+        while remaining > 1e-12 and book:
+            lot = book[0]
+            qty = min(lot[0], remaining)
+            pnl = qty * (price - lot[1]) - qty * lot[2] - cost * qty / shares
+            trips.append((ticker, qty, pnl, (date - lot[3]).days))
+            lot[0] -= qty
+            remaining -= qty
+            if lot[0] <= 1e-12:
+                book.pop(0)
+    return trips
+
+
+class TestTradeMatching(unittest.TestCase):
+    """Vectorized matching must agree with a per-lot FIFO loop."""
+
+    def _random_log(self, n, seed=0):
+        rng = np.random.default_rng(seed)
+        held = {}
+        start = pd.Timestamp("2020-01-01")
+        trades = []
+        for i in range(n):
+            ticker = ["AAPL", "MSFT", "SPY"][rng.integers(3)]
+            position = held.get(ticker, 0)
+            if position > 0 and rng.random() < 0.45:
+                shares = int(rng.integers(1, position + 1))
+                action = "SELL"
+                held[ticker] = position - shares
+            else:
+                shares = int(rng.integers(1, 50))
+                action = "BUY"
+                held[ticker] = position + shares
+            price = float(rng.uniform(50, 150))
+            trades.append((ticker, action, shares, price, float(rng.uniform(0, 2)), start + pd.Timedelta(days=i)))
+        return trades
+
+    def test_matches_reference_loop(self):
+        trades = self._random_log(2000)
+        columns = list(zip(*trades))
+        result = match_fifo(*columns[:5], np.array(columns[5], dtype='datetime64[ns]'))
+        expected = _reference_fifo(trades)
+
+        # Both walk sells in log order per ticker, so sort to compare across tickers
+        got = sorted(zip(result['ticker'], result['shares'], result['pnl'], result['holding_days']))
+        expected = sorted(expected)
+        self.assertEqual(len(got), len(expected))
+        for (t1, q1, p1, d1), (t2, q2, p2, d2) in zip(got, expected):
+            self.assertEqual(t1, t2)
+            self.assertAlmostEqual(q1, q2)
+            self.assertAlmostEqual(p1, p2, places=6)
+            self.assertEqual(d1, d2)
+
+    def test_partial_lots_and_open_position(self):
+        trades_df = pd.DataFrame({
+            'date': pd.to_datetime(["2023-01-02", "2023-01-05", "2023-01-10", "2023-01-20"]),
+            'ticker': ["AAPL"] * 4,
+            'action': ["BUY", "BUY", "SELL", "SELL"],
+            'shares': [10, 10, 15, 2],
+            'price': [100.0, 110.0, 120.0, 90.0],
+            'commission': [0.0] * 4,
+            'slippage': [0.0] * 4,
+        })
+        trips = round_trips_from_trades(trades_df)
+
+        self.assertEqual(list(trips['shares']), [10, 5, 2])
+        self.assertEqual(list(trips['pnl']), [200.0, 50.0, -40.0])
+        self.assertEqual(list(trips['holding_days']), [8.0, 5.0, 15.0])
+        self.assertAlmostEqual(trips['return_pct'].iloc[2], -40.0 / 220.0 * 100)
+
+    def _match_large_log(self):
+        n = 200_000
+        rng = np.random.default_rng(1)
+        actions = np.where(np.arange(n) % 2 == 0, "BUY", "SELL")
+        tickers = np.repeat(np.array(["AAPL", "MSFT"]), n // 2)
+        prices = rng.uniform(50, 150, n)
+        dates = np.datetime64("2000-01-01") + np.arange(n).astype('timedelta64[D]')
+
+        started = time.perf_counter()
+        result = match_fifo(tickers, actions, np.full(n, 10.0), prices, np.zeros(n), dates)
+        return prices, result, time.perf_counter() - started
+
+    def test_large_log(self):
+        prices, result, _ = self._match_large_log()
+
+        # Every BUY closes against the SELL right after it
+        np.testing.assert_allclose(result['pnl'], 10.0 * (prices[1::2] - prices[::2]))
+
+    @perf_test
+    def test_large_log_is_fast(self):
+        _, _, elapsed = self._match_large_log()
+        self.assertLess(elapsed, 2.0)
+
+    def test_analyzer_and_results_use_round_trips(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            config = BacktestConfig(
+                initial_balance=10000,
+                start_date="2023-01-01",
+                end_date="2023-06-30",
+                decision_cache_dir=os.path.join(tmp_dir, "decisions")
+            )
+            data_manager = SyntheticDataManager(cache_dir=os.path.join(tmp_dir, "data"))
+            results = BacktestEngine(config, CountingGraph(), data_manager).run_backtest("AAPL")
+            stats = PerformanceAnalyzer(results).calculate_trade_statistics()
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self.assertGreater(stats['total_trades'], 0)
+        self.assertGreater(stats['avg_holding_period'], 0)
+        self.assertEqual(results.winning_trades, stats['winning_trades'])
+        self.assertAlmostEqual(results.avg_holding_days, stats['avg_holding_period'])
+        if stats['winning_trades']:
+            self.assertGreater(stats['avg_win_pct'], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
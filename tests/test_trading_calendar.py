@@ -0,0 +1,122 @@
+"""
+Tests for exchange calendars and calendar-based data validation.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import HistoricalDataManager
+from tradingagents.backtesting.trading_calendar import get_calendar, calendar_for_ticker
+from synthetic_data import perf_test
+
+
+def _frame(index):
+    close = np.linspace(100, 110, len(index))
+    return pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1000}, index=index)
+
+
+class TestTradingCalendar(unittest.TestCase):
+    """Sessions must follow the NYSE holiday schedule and validation must be exact."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = HistoricalDataManager(cache_dir=self.tmp_dir)
+        self.nyse = get_calendar("NYSE")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_nyse_sessions(self):
+        self.assertEqual(len(self.nyse.sessions("2023-01-01", "2023-12-31")), 250)
+        self.assertEqual(len(self.nyse.sessions("2022-01-01", "2022-12-31")), 251)
+        closed = ["2023-01-02", "2023-01-16", "2023-04-07", "2023-06-19", "2023-07-04",
+                  "2023-11-23", "2023-12-25", "2012-10-29", "2021-12-24"]
+        self.assertFalse(self.nyse.is_session(closed).any())
+        # Saturday New Year's Day 2022 is not observed on Friday Dec 31
+        self.assertTrue(self.nyse.is_session(["2021-12-31"]).all())
+        self.assertEqual(len(get_calendar("crypto").sessions("2023-01-01", "2023-12-31")), 365)
+
+    def test_calendar_for_ticker(self):
+        self.assertEqual(calendar_for_ticker("AAPL"), "NYSE")
+        self.assertEqual(calendar_for_ticker("BTC-USD"), "crypto")
+        self.assertEqual(calendar_for_ticker("ETHUSDT"), "crypto")
+        self.assertEqual(calendar_for_ticker("sol/usdc"), "crypto")
+        # Bare symbols are listed equities too (Solitron, Interlink Electronics)
+        self.assertEqual(calendar_for_ticker("SOL"), "NYSE")
+        self.assertEqual(calendar_for_ticker("LINK"), "NYSE")
+        self.assertEqual(calendar_for_ticker("BRK-B"), "NYSE")
+
+        # Equity bars for SOL have no weekend gaps; an explicit calendar still selects crypto
+        data = _frame(self.nyse.sessions("2023-01-03", "2023-01-31"))
+        self.assertEqual(self.data_manager.validate_data(data, "2023-01-03", "2023-01-31", ticker="SOL"),
+                         (True, []))
+        self.assertFalse(self.data_manager.validate_data(data, "2023-01-03", "2023-01-31",
+                                                         ticker="SOL", calendar="crypto")[0])
+
+    def test_missing_sessions_are_exact(self):
+        sessions = self.nyse.sessions("2023-01-01", "2023-06-30")
+        data = _frame(sessions.delete([10, 11, 50]))
+
+        valid, issues = self.data_manager.validate_data(data, "2023-01-03", "2023-06-30", ticker="AAPL")
+
+        self.assertFalse(valid)
+        self.assertEqual(len(issues), 1)
+        self.assertIn("Missing 3 NYSE trading sessions", issues[0])
+        missing = self.data_manager.get_missing_sessions(data, "2023-01-03", "2023-06-30")
+        self.assertTrue(missing.equals(pd.DatetimeIndex(sessions[[10, 11, 50]])))
+
+        valid, issues = self.data_manager.validate_data(_frame(sessions), "2023-01-03", "2023-06-30", ticker="AAPL")
+        self.assertTrue(valid, issues)
+
+    def test_intraday_and_weekly(self):
+        sessions = self.nyse.sessions("2023-01-01", "2023-03-31")
+        intraday = pd.DatetimeIndex([d + pd.Timedelta(hours=h) for d in sessions for h in (10, 14)])
+        self.assertEqual(len(self.nyse.missing_sessions(intraday, "2023-01-03", "2023-03-31", "intraday")), 0)
+
+        weekly = pd.date_range("2023-01-06", "2023-03-31", freq="W-FRI").delete(3)
+        missing = self.nyse.missing_sessions(weekly, "2023-01-03", "2023-03-31", "weekly")
+        self.assertEqual(list(missing.strftime('%Y-%m-%d')), ["2023-01-23"])
+
+    def _validate_universe(self):
+        sessions = self.nyse.sessions("2019-01-01", "2023-12-29")
+        universe = {f"T{i}": _frame(sessions) for i in range(500)}
+
+        start = time.perf_counter()
+        for ticker, data in universe.items():
+            self.assertTrue(self.data_manager.validate_data(data, "2019-01-02", "2023-12-29", ticker=ticker)[0])
+        return universe, time.perf_counter() - start
+
+    def test_universe_validation_is_memoized(self):
+        with mock.patch.object(self.nyse, 'missing_sessions', wraps=self.nyse.missing_sessions) as missing:
+            universe, _ = self._validate_universe()
+            self.assertEqual(missing.call_count, 500)
+
+            for ticker, data in universe.items():
+                self.assertTrue(self.data_manager.validate_data(data, "2019-01-02", "2023-12-29", ticker=ticker)[0])
+
+        # The second pass is served from the memo without touching the calendar
+        self.assertEqual(missing.call_count, 500)
+        self.assertEqual(len(self.data_manager.validation_cache), 500)
+
+    @perf_test
+    def test_universe_validation_is_fast(self):
+        _, elapsed = self._validate_universe()
+        self.assertLess(elapsed, 10.0)
+
+    def test_trading_dates_skip_holidays(self):
+        dates = self.data_manager.get_trading_dates("2023-07-01", "2023-07-07")
+        self.assertEqual(dates, ["2023-07-03", "2023-07-05", "2023-07-06", "2023-07-07"])
+
+
+if __name__ == '__main__':
+    unittest.main()
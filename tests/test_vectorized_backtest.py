@@ -0,0 +1,96 @@
+"""
+Tests for the vectorized signal-array backtest mode.
+
+Checks that BacktestEngine.run_signal_backtest reproduces the event loop.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, BacktestEngine
+from synthetic_data import SyntheticDataManager
+
+
+class ScriptedGraph:
+    """Stub trading graph that replays a fixed signal per date."""
+
+    def __init__(self, signals: pd.Series):
+        self.signals = signals
+
+    def run_historical(self, ticker, trade_date, historical_data):
+        return {"final_decision": {"decision": self.signals.get(pd.Timestamp(trade_date), "HOLD")}}
+
+
+class TestVectorizedBacktest(unittest.TestCase):
+    """Vectorized mode parity with the event loop."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, "data"))
+        self.config = BacktestConfig(
+            initial_balance=10000,
+            start_date="2023-01-01",
+            end_date="2023-06-30",
+            risk_per_trade_pct=10.0,
+            use_decision_cache=False
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _random_signals(self, seed=7) -> pd.Series:
+        index = pd.bdate_range("2023-01-01", "2023-06-30")
+        rng = np.random.default_rng(seed)
+        return pd.Series(rng.choice(["BUY", "SELL", "HOLD", "HOLD"], len(index)), index=index)
+
+    def test_matches_event_loop(self):
+        signals = self._random_signals()
+
+        loop = BacktestEngine(self.config, ScriptedGraph(signals), self.data_manager).run_backtest("AAPL")
+        fast = BacktestEngine(self.config, data_manager=self.data_manager).run_signal_backtest("AAPL", signals)
+
+        self.assertEqual(len(loop.trades), len(fast.trades))
+        self.assertAlmostEqual(loop.final_balance, fast.final_balance, places=6)
+        self.assertEqual([t['action'] for t in loop.trades], [t['action'] for t in fast.trades])
+        np.testing.assert_allclose(
+            [e['total_equity'] for e in loop.equity_history],
+            [e['total_equity'] for e in fast.equity_history]
+        )
+        self.assertEqual(loop.equity_history[10]['date'], fast.equity_history[10]['date'])
+
+    def test_accepts_code_arrays(self):
+        engine = BacktestEngine(self.config, data_manager=self.data_manager)
+        n_bars = len(self.data_manager.get_historical_data("AAPL", "2023-01-01", "2023-06-30"))
+        codes = np.zeros(n_bars)
+        codes[5], codes[50] = 1, -1
+
+        results = engine.run_signal_backtest("AAPL", codes)
+        self.assertEqual([t['action'] for t in results.trades], ["BUY", "SELL"])
+
+        with self.assertRaises(ValueError):
+            engine.run_signal_backtest("AAPL", codes[:-1])
+
+    def test_target_weights(self):
+        engine = BacktestEngine(self.config, data_manager=self.data_manager)
+        weights = pd.Series({pd.Timestamp("2023-02-01"): 0.5, pd.Timestamp("2023-04-03"): 0.0})
+
+        results = engine.run_signal_backtest("AAPL", weights, signal_type="weight")
+        self.assertEqual([t['action'] for t in results.trades], ["BUY", "SELL"])
+
+        buy = results.trades[0]
+        invested = buy['gross_amount'] / self.config.initial_balance
+        self.assertGreater(invested, 0.45)
+        self.assertLessEqual(invested, 0.5)
+        self.assertEqual(results.equity_history[-1]['total_equity'], results.final_balance)
+
+
+if __name__ == "__main__":
+    unittest.main()
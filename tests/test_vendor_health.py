@@ -0,0 +1,102 @@
+"""
+Tests for the vendor health registry used by route_to_vendor.
+"""
+import sys
+import os
+import time
+import threading
+import unittest
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.dataflows.vendor_health import VendorHealthRegistry, OPEN, HALF_OPEN, CLOSED
+
+
+class TestVendorHealthRegistry(unittest.TestCase):
+    """Circuits must open on repeated failures and fallbacks must follow observed health."""
+
+    def setUp(self):
+        self.health = VendorHealthRegistry(window=10, failure_threshold=3, cooldown_seconds=0.1)
+
+    def test_circuit_lifecycle(self):
+        for _ in range(2):
+            self.health.record_failure("fmp", 0.1, error="Error: timeout")
+        self.assertFalse(self.health.is_open("fmp"))
+
+        self.health.record_failure("fmp", 0.1, error="Error: timeout")
+        self.assertTrue(self.health.is_open("fmp"))
+        self.assertEqual(self.health.snapshot()["fmp"]["state"], OPEN)
+
+        time.sleep(0.15)
+        self.assertFalse(self.health.is_open("fmp"))
+        self.assertEqual(self.health.snapshot()["fmp"]["state"], HALF_OPEN)
+
+        # A failed call while half-open re-opens at once
+        self.health.record_failure("fmp", 0.1)
+        self.assertTrue(self.health.is_open("fmp"))
+
+        time.sleep(0.15)
+        self.health.record_success("fmp", 0.05)
+        self.assertEqual(self.health.snapshot()["fmp"]["state"], CLOSED)
+        self.assertEqual(self.health.snapshot()["fmp"]["consecutive_failures"], 0)
+
+    def test_rate_limit_opens_until_reset(self):
+        reset_at = time.time() + 30
+        self.health.record_failure("alpha_vantage", 0.2, rate_limited=True, reset_at=reset_at)
+
+        snapshot = self.health.snapshot()["alpha_vantage"]
+        self.assertEqual(snapshot["state"], OPEN)
+        self.assertEqual(snapshot["rate_limited_until"], reset_at)
+        self.assertEqual(snapshot["open_until"], reset_at)
+
+    def test_order(self):
+        vendors = ["alpha_vantage", "yfinance", "google", "openai"]
+        for _ in range(5):
+            self.health.record_success("openai", 0.1)
+            self.health.record_success("google", 0.5)
+        self.health.record_failure("yfinance", 0.1)
+        self.health.record_success("yfinance", 0.1)
+        self.health.record_failure("alpha_vantage", 0.1, rate_limited=True)
+
+        # The primary keeps its place unless its circuit is open
+        self.assertEqual(self.health.order(vendors, ["yfinance"]), ["yfinance", "openai", "google"])
+        self.assertEqual(self.health.order(vendors, ["alpha_vantage"]), ["openai", "google", "yfinance"])
+
+        # With every circuit open, all vendors are still returned as a last resort
+        self.assertEqual(self.health.order(["alpha_vantage"], ["alpha_vantage"]), ["alpha_vantage"])
+
+    def test_snapshot_percentiles(self):
+        for latency in range(1, 21):
+            self.health.record_success("google", latency / 10)
+        self.health.record_failure("google", 3.0, error="Error: 503")
+
+        snapshot = self.health.snapshot()["google"]
+        self.assertEqual(snapshot["total_calls"], 21)
+        self.assertEqual(snapshot["total_failures"], 1)
+        self.assertAlmostEqual(snapshot["error_rate"], 0.1)  # Window of 10 calls
+        self.assertAlmostEqual(snapshot["latency_p50"], 1.6)
+        self.assertAlmostEqual(snapshot["latency_p99"], 3.0)
+        self.assertEqual(snapshot["last_error"], "Error: 503")
+
+    def test_thread_safety(self):
+        def worker(n):
+            for i in range(100):
+                if i % 2:
+                    self.health.record_success(f"v{n % 2}", 0.01)
+                else:
+                    self.health.record_failure(f"v{n % 2}", 0.01)
+                self.health.order(["v0", "v1"], [])
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        snapshot = self.health.snapshot()
+        self.assertEqual(snapshot["v0"]["total_calls"] + snapshot["v1"]["total_calls"], 800)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+"""
+Tests for hedged vendor routing.
+"""
+import sys
+import os
+import threading
+import time
+import unittest
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.rate_limiter import VendorRateLimiter
+from tradingagents.dataflows.result_cache import VendorResultCache
+from tradingagents.dataflows.vendor_calls import call_vendor, race_vendors, may_speculate
+
+ARGS = ("AAPL", "2024-01-01", "2024-01-05")
+SETTINGS = {"latency_budget_seconds": 0.02, "max_parallel": 2, "never_speculative": []}
+
+
+class FakeVendors:
+    """Vendor calls with scripted answers; "slow" vendors block until released."""
+
+    def __init__(self, answers, slow=()):
+        self.answers = answers
+        self.slow = set(slow)
+        self.release = threading.Event()
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, vendor):
+        with self._lock:
+            self.calls.append(vendor)
+        if vendor in self.slow:
+            self.release.wait(5)
+        answer = self.answers[vendor]
+        if isinstance(answer, Exception):
+            return []
+        return [answer]
+
+
+class TestHedgedRouting(unittest.TestCase):
+    """Races must return the first result with data and respect vendor quotas."""
+
+    def setUp(self):
+        self.saved = {key: get_config().get(key) for key in ("vendor_health", "vendor_rate_limits")}
+        set_config({"vendor_health": {"enabled": False}, "vendor_rate_limits": {"enabled": False}})
+
+    def tearDown(self):
+        set_config(self.saved)
+
+    def test_slow_primary_loses_to_backup(self):
+        vendors = FakeVendors({"newsdata": "late headlines", "google": "headlines"}, slow=["newsdata"])
+        try:
+            result = race_vendors("get_news", ["newsdata", "google"], vendors, SETTINGS)
+            self.assertEqual(result, ("google", ["headlines"], 2))
+            self.assertFalse(vendors.release.is_set())  # Returned while the primary was still running
+        finally:
+            vendors.release.set()
+
+    def test_winner_is_cached(self):
+        release = threading.Event()
+
+        def slow_news(ticker, start, end):
+            release.wait(5)
+            return f"newsdata headlines for {ticker}"
+
+        def fast_news(ticker, start, end):
+            return f"google headlines for {ticker}"
+
+        cache = VendorResultCache(cache_dir=None)
+        impls = {"newsdata": slow_news, "google": fast_news}
+        call = lambda vendor: call_vendor("get_news", vendor, impls[vendor], ARGS, {}, cache)
+        try:
+            vendor, results, _ = race_vendors("get_news", ["newsdata", "google"], call, SETTINGS)
+        finally:
+            release.set()
+
+        self.assertEqual(vendor, "google")
+        self.assertEqual(cache.get("get_news", "google", ARGS, {}), (True, results[0]))
+
+        # The loser finishes in the background and only fills the cache
+        deadline = time.monotonic() + 5
+        while not cache.get("get_news", "newsdata", ARGS, {})[0] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(cache.get("get_news", "newsdata", ARGS, {}), (True, "newsdata headlines for AAPL"))
+
+    def test_every_vendor_failing(self):
+        vendors = FakeVendors({
+            "newsdata": RuntimeError("timeout"),
+            "newsapi": "Error: NEWSAPI_KEY not set",
+            "google": RuntimeError("blocked"),
+        })
+        self.assertEqual(race_vendors("get_news", ["newsdata", "newsapi", "google"], vendors, SETTINGS),
+                         (None, [], 3))
+        self.assertEqual(vendors.calls, ["newsdata", "newsapi", "google"])
+
+        # Empty answers lose to data, but are returned if nobody has any
+        vendors = FakeVendors({"newsdata": "No news found for 'AAPL'", "google": "headlines"})
+        self.assertEqual(race_vendors("get_news", ["newsdata", "google"], vendors, SETTINGS)[:2],
+                         ("google", ["headlines"]))
+        vendors = FakeVendors({"newsdata": "No news found for 'AAPL'", "google": ""})
+        self.assertEqual(race_vendors("get_news", ["newsdata", "google"], vendors, SETTINGS)[:2],
+                         ("newsdata", ["No news found for 'AAPL'"]))
+
+    def test_speculative_calls_respect_quota(self):
+        limiter = VendorRateLimiter(state_dir=None, limits={"fmp": {"per_minute": 4, "per_day": None}})
+        answers = {"yfinance": "fundamentals", "fmp": "fmp fundamentals", "openai": "openai fundamentals"}
+
+        # A full bucket may be raced
+        self.assertTrue(may_speculate("fmp", SETTINGS, limiter))
+        vendors = FakeVendors(answers, slow=["yfinance"])
+        try:
+            self.assertEqual(race_vendors("get_fundamentals", ["yfinance", "fmp"], vendors, SETTINGS, limiter)[0],
+                             "fmp")
+        finally:
+            vendors.release.set()
+
+        # Below the headroom the quota is kept for failure fallbacks
+        for _ in range(3):
+            limiter.acquire("fmp", max_wait=0)
+        self.assertFalse(may_speculate("fmp", SETTINGS, limiter))
+        vendors = FakeVendors(answers, slow=["yfinance"])
+        threading.Timer(0.2, vendors.release.set).start()
+        self.assertEqual(race_vendors("get_fundamentals", ["yfinance", "fmp"], vendors, SETTINGS, limiter),
+                         ("yfinance", ["fundamentals"], 1))
+        self.assertEqual(vendors.calls, ["yfinance"])
+
+        answers["yfinance"] = RuntimeError("timeout")
+        vendors = FakeVendors(answers)
+        self.assertEqual(race_vendors("get_fundamentals", ["yfinance", "fmp"], vendors, SETTINGS, limiter)[0],
+                         "fmp")
+
+        # never_speculative vendors are only failure fallbacks
+        settings = {**SETTINGS, "never_speculative": ["openai"]}
+        vendors = FakeVendors({**answers, "yfinance": "fundamentals"}, slow=["yfinance"])
+        threading.Timer(0.2, vendors.release.set).start()
+        self.assertEqual(race_vendors("get_fundamentals", ["yfinance", "openai"], vendors, settings)[0],
+                         "yfinance")
+        self.assertEqual(vendors.calls, ["yfinance"])
+
+
+if __name__ == '__main__':
+    unittest.main()
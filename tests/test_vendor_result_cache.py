@@ -0,0 +1,120 @@
+"""
+Tests for the vendor result cache used by route_to_vendor.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date, timedelta
+
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.dataflows.result_cache import VendorResultCache, is_error_result, is_empty_result
+
+
+class TestVendorResultCache(unittest.TestCase):
+    """Keys must normalize equivalent calls and tiers must honour per-method TTLs."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = VendorResultCache(cache_dir=self.tmp_dir, max_entries=4)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_normalized_keys(self):
+        self.cache.put("get_fundamentals", "fmp", ("aapl ", "2024-01-05"), {}, "profile")
+
+        self.assertEqual(self.cache.get("get_fundamentals", "fmp", ("AAPL", "2024-01-05"), {}), (True, "profile"))
+        self.assertEqual(self.cache.get("get_fundamentals", "fmp", ("AAPL", date(2024, 1, 5)), {}), (True, "profile"))
+        self.assertFalse(self.cache.get("get_fundamentals", "alpha_vantage", ("AAPL", "2024-01-05"), {})[0])
+        self.assertFalse(self.cache.get("get_fundamentals", "fmp", ("MSFT", "2024-01-05"), {})[0])
+
+    def test_ttls(self):
+        today = date.today().isoformat()
+        past = (date.today() - timedelta(days=30)).isoformat()
+
+        self.assertIsNone(self.cache.ttl_for("get_stock_data", ("AAPL", "2020-01-01", past), {}))
+        self.assertEqual(self.cache.ttl_for("get_stock_data", ("AAPL", "2020-01-01", today), {}), 60)
+        self.assertIsNone(self.cache.ttl_for("get_indicators", (), {"symbol": "AAPL", "curr_date": past}))
+        self.assertEqual(self.cache.ttl_for("get_fundamentals", ("AAPL", past), {}), 86400)
+
+        short = VendorResultCache(cache_dir=None, ttls={"get_news": 0.05, "get_global_news": 0})
+        short.put("get_news", "newsdata", ("AAPL", past, today), {}, "headlines")
+        self.assertTrue(short.get("get_news", "newsdata", ("AAPL", past, today), {})[0])
+        time.sleep(0.1)
+        self.assertFalse(short.get("get_news", "newsdata", ("AAPL", past, today), {})[0])
+        self.assertFalse(short.put("get_global_news", "openai", (today, 7, 5), {}, "macro"))
+
+    def test_errors_are_not_cached(self):
+        self.assertTrue(is_error_result("Error: FMP_API_KEY not set"))
+        self.assertFalse(self.cache.put("get_fundamentals", "fmp", ("AAPL", "2024-01-05"), {},
+                                        "Error fetching data from FMP: timeout"))
+        self.assertFalse(self.cache.get("get_fundamentals", "fmp", ("AAPL", "2024-01-05"), {})[0])
+
+    def test_empty_results_are_not_cached(self):
+        for value in ["", "  \n", [], pd.DataFrame(),
+                      "No news found for 'AAPL' between 2024-01-01 and 2024-01-05",
+                      "No data found for symbol 'ZZZZ' between 2020-01-01 and 2020-02-01",
+                      "No balance sheet data found for symbol 'AAPL'"]:
+            self.assertTrue(is_empty_result(value), value)
+            # Past windows are otherwise cached forever
+            self.assertFalse(self.cache.put("get_stock_data", "yfinance", ("ZZZZ", "2020-01-01", "2020-02-01"),
+                                            {}, value))
+        self.assertFalse(self.cache.get("get_stock_data", "yfinance", ("ZZZZ", "2020-01-01", "2020-02-01"), {})[0])
+
+        for value in ["Notable headlines: No news found is not the answer", "date,close\n2020-01-02,75.1",
+                      pd.DataFrame({"close": [1.0]}), 0]:
+            self.assertFalse(is_empty_result(value), value)
+
+    def test_lru_and_disk_tiers(self):
+        for i in range(6):
+            self.cache.put("get_balance_sheet", "fmp", (f"T{i}", "quarterly", "2024-01-05"), {}, f"sheet {i}")
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["memory_entries"], 4)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["disk_entries"], 6)
+
+        # Evicted from memory, served (and promoted) from disk
+        self.assertEqual(self.cache.get("get_balance_sheet", "fmp", ("T0", "quarterly", "2024-01-05"), {}),
+                         (True, "sheet 0"))
+        # A new process sees the same disk tier
+        other = VendorResultCache(cache_dir=self.tmp_dir)
+        self.assertEqual(other.get("get_balance_sheet", "fmp", ("T5", "quarterly", "2024-01-05"), {}),
+                         (True, "sheet 5"))
+
+        stats = self.cache.stats()
+        self.assertEqual((stats["disk_hits"], stats["memory_hits"]), (1, 0))
+        self.assertEqual(stats["by_method"]["get_balance_sheet"], {"hits": 1, "misses": 0})
+
+        self.cache.invalidate(method="get_balance_sheet")
+        self.assertFalse(self.cache.get("get_balance_sheet", "fmp", ("T5", "quarterly", "2024-01-05"), {})[0])
+        self.assertEqual(self.cache.stats()["disk_entries"], 0)
+
+    def test_thread_safety(self):
+        def worker(n):
+            for i in range(50):
+                key = (f"T{i % 8}", "2024-01-05")
+                if not self.cache.get("get_fundamentals", "fmp", key, {})[0]:
+                    self.cache.put("get_fundamentals", "fmp", key, {}, f"fundamentals {i % 8}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 400)
+        self.assertLessEqual(stats["memory_entries"], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
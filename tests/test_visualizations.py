@@ -0,0 +1,98 @@
+"""
+Tests for headless chart rendering and LTTB downsampling.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestResults, PerformanceAnalyzer
+from tradingagents.backtesting import visualizations
+from tradingagents.backtesting.visualizations import lttb_downsample
+
+
+def _results(points, freq="min"):
+    dates = pd.date_range("2000-01-03", periods=points, freq=freq)
+    equity = 10000 * np.cumprod(1 + np.random.default_rng(0).normal(0, 0.001, points))
+    trades = [
+        {'date': str(dates[i]), 'ticker': 'TEST', 'action': action, 'shares': 10,
+         'price': float(equity[i] / 100), 'commission': 1.0, 'slippage': 0.0}
+        for i, action in zip(range(0, 40, 4), ['BUY', 'SELL'] * 5)
+    ]
+    return BacktestResults("TEST", str(dates[0].date()), str(dates[-1].date()), 10000, float(equity[-1]),
+                           trades=trades,
+                           equity_history=[{'date': d, 'total_equity': e} for d, e in zip(dates, equity)])
+
+
+@unittest.skipUnless(visualizations.MATPLOTLIB_AVAILABLE, "matplotlib not installed")
+class TestVisualizations(unittest.TestCase):
+    """Charts must render headlessly and downsample very long equity curves."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_lttb_keeps_endpoints_and_extremes(self):
+        x = np.arange(10000, dtype=np.float64)
+        y = np.sin(x / 500)
+        y[4321] = 50.0
+        y[7654] = -50.0
+
+        keep = lttb_downsample(x, y, 200)
+
+        self.assertEqual(len(keep), 200)
+        self.assertEqual(keep[0], 0)
+        self.assertEqual(keep[-1], 9999)
+        self.assertTrue((np.diff(keep) > 0).all())
+        self.assertIn(4321, keep)
+        self.assertIn(7654, keep)
+
+    def test_lttb_short_series_unchanged(self):
+        keep = lttb_downsample(np.arange(10.0), np.arange(10.0), 100)
+        np.testing.assert_array_equal(keep, np.arange(10))
+
+    def test_large_dashboard_is_downsampled(self):
+        generator = visualizations.VisualizationGenerator(PerformanceAnalyzer(_results(1_000_000)), fast=True)
+        path = os.path.join(self.tmp_dir, "dashboard.png")
+
+        fig = generator.create_dashboard(filepath=path, show=False)
+
+        self.assertTrue(os.path.getsize(path) > 0)
+        self.assertLessEqual(len(fig.axes[0].lines[0].get_xdata()), generator.max_points)
+
+    def test_fast_output_is_opt_in(self):
+        from matplotlib.image import imread
+        analyzer = PerformanceAnalyzer(_results(500, freq="D"))
+        default_path = os.path.join(self.tmp_dir, "default.png")
+        fast_path = os.path.join(self.tmp_dir, "fast.png")
+
+        visualizations.VisualizationGenerator(analyzer).plot_equity_curve(filepath=default_path, show=False)
+        visualizations.VisualizationGenerator(analyzer, fast=True).plot_equity_curve(filepath=fast_path, show=False)
+
+        # Defaults keep 300 dpi with a tight bounding box; fast saves the whole 150 dpi figure
+        default_height, default_width = imread(default_path).shape[:2]
+        self.assertGreater(default_width, 12 * 150)
+        self.assertNotEqual((default_width, default_height), (12 * 300, 6 * 300))
+        self.assertEqual(imread(fast_path).shape[:2], (6 * 150, 12 * 150))
+
+    def test_parallel_save_all_charts(self):
+        generator = visualizations.VisualizationGenerator(PerformanceAnalyzer(_results(5000, freq="h")), dpi=60)
+
+        written = generator.save_all_charts(self.tmp_dir, max_workers=2)
+
+        self.assertEqual(len(written), len(visualizations.CHART_KINDS))
+        for path in written:
+            self.assertTrue(os.path.getsize(path) > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
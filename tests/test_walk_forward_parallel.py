@@ -0,0 +1,75 @@
+"""
+Tests for parallel walk-forward execution.
+"""
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tradingagents.backtesting import BacktestConfig, WalkForwardAnalyzer
+from synthetic_data import SyntheticDataManager, CountingGraph, SlowGraph
+
+
+class TestParallelWalkForward(unittest.TestCase):
+    """Parallel windows must match the sequential run, in window order."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config = BacktestConfig(
+            initial_balance=10000,
+            risk_per_trade_pct=10.0,
+            decision_cache_dir=os.path.join(self.tmp_dir, "decisions")
+        )
+        self.args = ("AAPL", "2022-01-01", "2023-06-30")
+        self.kwargs = dict(train_days=120, test_days=60)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _analyzer(self, name, trading_graph=None):
+        data_manager = SyntheticDataManager(cache_dir=os.path.join(self.tmp_dir, name))
+        return WalkForwardAnalyzer(self.config, trading_graph, data_manager), data_manager
+
+    def _summary(self, results):
+        return [
+            (r.start_date, r.end_date, round(r.final_balance, 6))
+            for r in results.in_sample_results + results.out_of_sample_results
+        ]
+
+    def test_process_pool_matches_sequential(self):
+        sequential, _ = self._analyzer("seq")
+        parallel, data_manager = self._analyzer("par")
+
+        expected = sequential.run_walk_forward(*self.args, **self.kwargs)
+        results = parallel.run_walk_forward(*self.args, **self.kwargs, max_workers=4)
+
+        self.assertGreater(len(expected.in_sample_results), 2)
+        self.assertEqual(self._summary(results), self._summary(expected))
+        self.assertEqual(data_manager.fetch_count, 1)  # Ticker only: no benchmark configured
+
+    def test_thread_pool_with_trading_graph(self):
+        sequential, _ = self._analyzer("seq", CountingGraph())
+        parallel, data_manager = self._analyzer("par", CountingGraph())
+
+        expected = sequential.run_walk_forward(*self.args, **self.kwargs)
+        results = parallel.run_walk_forward(*self.args, **self.kwargs, max_workers=4)
+
+        self.assertEqual(self._summary(results), self._summary(expected))
+        self.assertEqual(results.performance_degradation, expected.performance_degradation)
+        self.assertEqual(data_manager.fetch_count, 1)  # Ticker only: no benchmark configured
+
+    def test_windows_never_share_graph_calls(self):
+        graph = SlowGraph(latency=0.001)
+        analyzer, _ = self._analyzer("par", graph)
+        analyzer.run_walk_forward(*self.args, **self.kwargs, max_workers=4)
+
+        self.assertGreater(graph.calls, 0)
+        self.assertEqual(graph.max_active, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,8 +9,16 @@ and measure performance metrics.
 from tradingagents.backtesting.config import BacktestConfig, BacktestResults, WalkForwardResults
 from tradingagents.backtesting.backtest_engine import BacktestEngine
 from tradingagents.backtesting.data_manager import HistoricalDataManager
+from tradingagents.backtesting.decision_cache import DecisionCache
+from tradingagents.backtesting.checkpoint import CheckpointStore
+from tradingagents.backtesting.results_store import ResultsStore
+from tradingagents.backtesting.events import BacktestEvent, EventStream
+from tradingagents.backtesting.intraday import IntradayEngine, IntradayStrategy, BarArrays
 from tradingagents.backtesting.performance_analyzer import PerformanceAnalyzer
+from tradingagents.backtesting.streaming_metrics import StreamingMetrics
+from tradingagents.backtesting.monte_carlo import MonteCarloAnalyzer
 from tradingagents.backtesting.visualizations import VisualizationGenerator
+from tradingagents.backtesting.optimizer import ParameterOptimizer
 from tradingagents.backtesting.comparison import (
     StrategyComparator,
     compare_risk_levels,
@@ -28,8 +36,19 @@ __all__ = [
     'WalkForwardResults',
     'BacktestEngine',
     'HistoricalDataManager',
+    'DecisionCache',
+    'CheckpointStore',
+    'ResultsStore',
+    'BacktestEvent',
+    'EventStream',
+    'IntradayEngine',
+    'IntradayStrategy',
+    'BarArrays',
     'PerformanceAnalyzer',
+    'StreamingMetrics',
+    'MonteCarloAnalyzer',
     'VisualizationGenerator',
+    'ParameterOptimizer',
     'StrategyComparator',
     'compare_risk_levels',
     'compare_position_sizing_methods',
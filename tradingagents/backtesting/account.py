@@ -5,12 +5,13 @@ Manages positions, cash balance, and equity tracking for backtesting.
 import logging
 from typing import Dict, List, Optional
 from dataclasses import dataclass
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents a position in a security."""
     ticker: str
@@ -32,7 +33,7 @@ class Position:
         return self.market_value - self.cost_basis
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """Represents a completed trade."""
     ticker: str
@@ -56,14 +57,89 @@ class Trade:
 
 
 class SimulatedAccount:
-    """Simulated trading account for backtesting."""
+    """
+    Simulated trading account for backtesting.
     
-    def __init__(self, initial_balance: float):
+    Equity history is kept in preallocated NumPy columns (date, cash, equity,
+    daily return) that grow geometrically, and is exposed as pandas without
+    copying the values.
+    """
+    
+    EQUITY_COLUMNS = ['cash_balance', 'total_equity', 'daily_return']
+    
+    def __init__(self, initial_balance: float, expected_bars: int = 256):
         self.initial_balance = initial_balance
         self.cash_balance = initial_balance
         self.positions: Dict[str, Position] = {}
         self.trades: List[Trade] = []
-        self.equity_history: List[Dict] = []
+        
+        self._num_records = 0
+        self._dates = np.empty(max(expected_bars, 1), dtype='datetime64[ns]')
+        self._values = np.empty((max(expected_bars, 1), len(self.EQUITY_COLUMNS)), dtype=np.float64)
+    
+    def reserve(self, num_bars: int):
+        """Ensure capacity for num_bars equity records without reallocation."""
+        if num_bars > len(self._dates):
+            self._resize(num_bars)
+    
+    def _resize(self, capacity: int):
+        dates = np.empty(capacity, dtype='datetime64[ns]')
+        values = np.empty((capacity, len(self.EQUITY_COLUMNS)), dtype=np.float64)
+        dates[:self._num_records] = self._dates[:self._num_records]
+        values[:self._num_records] = self._values[:self._num_records]
+        self._dates, self._values = dates, values
+    
+    @property
+    def num_equity_records(self) -> int:
+        """Number of equity snapshots recorded so far."""
+        return self._num_records
+    
+    def get_state(self, equity_from: int = 0, trades_from: int = 0) -> Dict:
+        """
+        Snapshot of the account state (JSON-serializable).
+        
+        Args:
+            equity_from: Only include equity records from this index on
+            trades_from: Only include trades from this index on
+        
+        Returns:
+            Dictionary accepted by restore_state() (with the defaults, the full state)
+        """
+        n = self._num_records
+        return {
+            'initial_balance': self.initial_balance,
+            'cash_balance': self.cash_balance,
+            'positions': [
+                [p.ticker, p.shares, p.avg_cost, p.entry_date, p.current_price]
+                for p in self.positions.values()
+            ],
+            'trades': [
+                [t.ticker, t.action, t.shares, t.price, t.date, t.commission, t.slippage]
+                for t in self.trades[trades_from:]
+            ],
+            'equity_dates': self._dates[equity_from:n].astype(np.int64).tolist(),
+            'equity_values': self._values[equity_from:n].tolist()
+        }
+    
+    def restore_state(self, state: Dict):
+        """
+        Replace the account state with a snapshot from get_state().
+        
+        Args:
+            state: Account snapshot
+        """
+        self.initial_balance = state['initial_balance']
+        self.cash_balance = state['cash_balance']
+        self.positions = {row[0]: Position(*row) for row in state['positions']}
+        self.trades = [Trade(*row) for row in state['trades']]
+        
+        n = len(state['equity_dates'])
+        self._num_records = 0
+        self._resize(max(n, len(self._dates)))
+        if n:
+            self._dates[:n] = np.asarray(state['equity_dates'], dtype=np.int64).astype('datetime64[ns]')
+            self._values[:n] = np.asarray(state['equity_values'], dtype=np.float64)
+        self._num_records = n
     
     def get_position(self, ticker: str) -> Optional[Position]:
         return self.positions.get(ticker)
@@ -96,18 +172,12 @@ class SimulatedAccount:
         total_cost = gross_cost + commission + slippage
         self.cash_balance -= total_cost
         
-        if ticker in self.positions:
-            existing = self.positions[ticker]
+        existing = self.positions.get(ticker)
+        if existing is not None:
             total_shares = existing.shares + shares
-            total_cost_basis = existing.cost_basis + gross_cost
-            avg_cost = total_cost_basis / total_shares
-            self.positions[ticker] = Position(
-                ticker=ticker,
-                shares=total_shares,
-                avg_cost=avg_cost,
-                entry_date=existing.entry_date,
-                current_price=price
-            )
+            existing.avg_cost = (existing.cost_basis + gross_cost) / total_shares
+            existing.shares = total_shares
+            existing.current_price = price
         else:
             self.positions[ticker] = Position(
                 ticker=ticker,
@@ -117,8 +187,7 @@ class SimulatedAccount:
                 current_price=price
             )
         
-        trade = Trade(ticker, "BUY", shares, price, date, commission, slippage)
-        self.trades.append(trade)
+        self.trades.append(Trade(ticker, "BUY", shares, price, date, commission, slippage))
         return True
     
     def sell(self, ticker: str, shares: float, price: float, date: str,
@@ -135,60 +204,74 @@ class SimulatedAccount:
         if remaining_shares <= 0:
             del self.positions[ticker]
         else:
-            self.positions[ticker] = Position(
-                ticker=ticker,
-                shares=remaining_shares,
-                avg_cost=position.avg_cost,
-                entry_date=position.entry_date,
-                current_price=price
-            )
+            position.shares = remaining_shares
+            position.current_price = price
         
-        trade = Trade(ticker, "SELL", shares, price, date, commission, slippage)
-        self.trades.append(trade)
+        self.trades.append(Trade(ticker, "SELL", shares, price, date, commission, slippage))
         return True
     
-    def record_equity(self, date: str, current_prices: Dict[str, float]):
-        total_equity = self.get_total_equity(current_prices)
+    def record_equity(self, date: str, current_prices: Dict[str, float],
+                      total_equity: Optional[float] = None) -> float:
+        if total_equity is None:
+            total_equity = self.get_total_equity(current_prices)
         
-        equity_record = {
-            'date': date,
-            'cash_balance': self.cash_balance,
-            'total_equity': total_equity,
-            'positions': {},
-            'daily_return': 0.0
-        }
+        n = self._num_records
+        if n == len(self._dates):
+            self._resize(2 * n)
         
-        if len(self.equity_history) > 0:
-            prev_equity = self.equity_history[-1]['total_equity']
+        daily_return = 0.0
+        if n > 0:
+            prev_equity = self._values[n - 1, 1]
             if prev_equity > 0:
-                equity_record['daily_return'] = (total_equity - prev_equity) / prev_equity
+                daily_return = (total_equity - prev_equity) / prev_equity
         
-        self.equity_history.append(equity_record)
+        self._dates[n] = np.datetime64(date, 'ns')
+        row = self._values[n]
+        row[0] = self.cash_balance
+        row[1] = total_equity
+        row[2] = daily_return
+        self._num_records = n + 1
+        return total_equity
+    
+    @property
+    def equity_history(self) -> List[Dict]:
+        """Equity records as a list of dicts (built on demand)."""
+        return [
+            {'date': pd.Timestamp(d).strftime('%Y-%m-%d'), 'cash_balance': c, 'total_equity': e, 'daily_return': r}
+            for d, (c, e, r) in zip(self._dates[:self._num_records], self._values[:self._num_records].tolist())
+        ]
     
     def get_equity_curve(self) -> pd.DataFrame:
-        if not self.equity_history:
+        if self._num_records == 0:
             return pd.DataFrame()
-        df = pd.DataFrame(self.equity_history)
-        df['date'] = pd.to_datetime(df['date'])
-        df.set_index('date', inplace=True)
-        return df
+        n = self._num_records
+        # Column data is a view onto the preallocated buffer
+        return pd.DataFrame(
+            self._values[:n],
+            columns=self.EQUITY_COLUMNS,
+            index=pd.DatetimeIndex(self._dates[:n], name='date'),
+            copy=False
+        )
     
     def get_trade_history(self) -> pd.DataFrame:
         if not self.trades:
             return pd.DataFrame()
-        trade_data = []
-        for trade in self.trades:
-            trade_data.append({
-                'date': trade.date,
-                'ticker': trade.ticker,
-                'action': trade.action,
-                'shares': trade.shares,
-                'price': trade.price,
-                'gross_amount': trade.gross_amount,
-                'commission': trade.commission,
-                'slippage': trade.slippage,
-                'net_amount': trade.net_amount
-            })
-        df = pd.DataFrame(trade_data)
-        df['date'] = pd.to_datetime(df['date'])
-        return df
+        trades = self.trades
+        shares = np.fromiter((t.shares for t in trades), dtype=np.float64, count=len(trades))
+        price = np.fromiter((t.price for t in trades), dtype=np.float64, count=len(trades))
+        commission = np.fromiter((t.commission for t in trades), dtype=np.float64, count=len(trades))
+        slippage = np.fromiter((t.slippage for t in trades), dtype=np.float64, count=len(trades))
+        action = np.array([t.action for t in trades])
+        gross = shares * price
+        costs = commission + slippage
+        return pd.DataFrame({
+            'date': pd.to_datetime([t.date for t in trades]),
+            'ticker': [t.ticker for t in trades],
+            'action': action,
+            'shares': shares,
+            'price': price,
+            'gross_amount': gross,
+            'commission': commission,
+            'slippage': slippage,
+            'net_amount': np.where(action == "BUY", -(gross + costs), gross - costs)
+        })
@@ -3,33 +3,190 @@ Backtest Engine
 Main orchestrator for running backtests with TradingAgents.
 """
 import logging
-from typing import Optional, Dict
+import threading
+import weakref
+from contextlib import nullcontext
+from dataclasses import asdict
+from typing import Optional, Dict, List, Union, Sequence, Any, Callable
 from datetime import timedelta
+from concurrent.futures import as_completed
+import numpy as np
 import pandas as pd
 from tradingagents.backtesting.config import BacktestConfig, BacktestResults
 from tradingagents.backtesting.data_manager import HistoricalDataManager
 from tradingagents.backtesting.account import SimulatedAccount
-from tradingagents.backtesting.trade_executor import TradeExecutor
+from tradingagents.backtesting.trade_executor import TradeExecutor, TradeSignal
+from tradingagents.backtesting.decision_cache import DecisionCache
+from tradingagents.backtesting.checkpoint import CheckpointStore
+from tradingagents.backtesting.parallel import ProviderRateLimiter, create_pool
+from tradingagents.backtesting.streaming_metrics import StreamingMetrics
+from tradingagents.backtesting.events import BacktestEvent, BacktestListener
+from tradingagents.backtesting.trade_matching import round_trips_from_trades
+from tradingagents.backtesting.relative_performance import calculate_relative_metrics
+from tradingagents.backtesting import vectorized
 
 logger = logging.getLogger(__name__)
 
+# One lock per trading graph, shared by every engine using it: walk-forward
+# windows and comparison configs run engines side by side on the same graph
+_graph_locks: "weakref.WeakKeyDictionary[Any, threading.Lock]" = weakref.WeakKeyDictionary()
+_graph_locks_guard = threading.Lock()
+_unreferenceable_graph_lock = threading.Lock()
+
+
+def _lock_for_graph(graph) -> threading.Lock:
+    """Lock serializing calls to a graph that is not thread-safe."""
+    with _graph_locks_guard:
+        try:
+            lock = _graph_locks.get(graph)
+            if lock is None:
+                lock = _graph_locks[graph] = threading.Lock()
+            return lock
+        except TypeError:  # Not weak-referenceable
+            return _unreferenceable_graph_lock
+
 
 class BacktestEngine:
-    """Main backtesting engine."""
+    """
+    Main backtesting engine.
+    
+    TradingAgentsGraph keeps per-run state on the instance (ticker,
+    curr_state, log_states_dict), so one graph must not run two analyses at
+    once. With config.decision_workers > 1, pass graph_factory to give every
+    worker thread its own graph. Without one, calls to the shared graph are
+    serialized unless the graph sets `thread_safe = True`, also across engines
+    sharing the graph (parallel walk-forward windows or comparison configs).
+    """
     
     def __init__(self, config: BacktestConfig, trading_graph=None,
-                 data_manager: Optional[HistoricalDataManager] = None):
+                 data_manager: Optional[HistoricalDataManager] = None,
+                 decision_cache: Optional[DecisionCache] = None,
+                 checkpoint_store: Optional[CheckpointStore] = None,
+                 graph_factory: Optional[Callable[[], Any]] = None):
         self.config = config
         self.trading_graph = trading_graph
+        self.graph_factory = graph_factory  # Builds a graph equivalent to trading_graph, one per decision worker
+        self._graph_lock = _lock_for_graph(trading_graph) if trading_graph is not None else threading.Lock()
+        self._worker_state = threading.local()
         self.data_manager = data_manager or HistoricalDataManager()
+        self.decision_cache = decision_cache
+        if self.decision_cache is None and trading_graph is not None and config.use_decision_cache:
+            self.decision_cache = DecisionCache(config.decision_cache_dir)
+        self._graph_fingerprint = (
+            DecisionCache.graph_fingerprint(trading_graph, config.data_interval)
+            if trading_graph is not None else None
+        )
+        self.checkpoint_store = checkpoint_store
+        if self.checkpoint_store is None and trading_graph is not None and config.checkpoint_interval > 0:
+            self.checkpoint_store = CheckpointStore(config.checkpoint_dir)
         self.account = SimulatedAccount(config.initial_balance)
         self.executor = TradeExecutor(config, self.account)
+        self.metrics = StreamingMetrics(config.initial_balance)
+        graph_config = getattr(trading_graph, 'config', None)
+        self._llm_provider = graph_config.get('llm_provider', 'default') if isinstance(graph_config, dict) else 'default'
+        self.rate_limiter = ProviderRateLimiter(config.llm_rate_limits) if config.llm_rate_limits else None
+        self.decisions: Dict[str, str] = {}
+        self._checkpoint_marks = (0, 0)  # (equity records, trades) already in the checkpoint
         self.current_date = None
         self.total_days = 0
         self.completed_days = 0
+        self.listeners: List[BacktestListener] = []
+    
+    def add_listener(self, listener: BacktestListener):
+        """
+        Register a callback that receives a BacktestEvent for run start,
+        progress (every config.event_interval bars), each trade fill and
+        completion or failure.
+        
+        Listeners run synchronously on the backtest thread, so they should
+        hand events off (see events.EventStream) rather than block. Listener
+        exceptions are logged and do not affect the run.
+        
+        Args:
+            listener: Callable taking a BacktestEvent
+        """
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener: BacktestListener):
+        """Unregister a listener added with add_listener()."""
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    def _emit(self, event_type: str, ticker: str, data: Dict[str, Any]):
+        event = BacktestEvent(event_type, ticker, data)
+        for listener in list(self.listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.warning(f"Backtest listener failed on {event_type} event: {e}")
+    
+    def _emit_started(self, ticker: str, start_date: str, end_date: str, start_index: int = 0):
+        if self.listeners:
+            self._emit('started', ticker, {
+                'start_date': start_date,
+                'end_date': end_date,
+                'total_days': self.total_days,
+                'completed_days': start_index
+            })
+    
+    def _emit_bar_events(self, ticker: str, equity: float, trades_before: int):
+        """Trade events for this bar's fills, then a progress event every config.event_interval bars."""
+        for trade in self.account.trades[trades_before:]:
+            self._emit('trade', ticker, {
+                **asdict(trade),
+                'cash_balance': self.account.cash_balance,
+                'completed_days': self.completed_days,
+                'total_days': self.total_days
+            })
+        
+        if self.completed_days % self.config.event_interval == 0 or self.completed_days == self.total_days:
+            self._emit('progress', ticker, {
+                'date': self.current_date,
+                'equity': equity,
+                'cash_balance': self.account.cash_balance,
+                'completed_days': self.completed_days,
+                'total_days': self.total_days,
+                'progress_pct': (self.completed_days / self.total_days) * 100,
+                'metrics': self.metrics.snapshot()
+            })
+    
+    def _emit_finished(self, ticker: str, results: Optional[BacktestResults] = None,
+                       error: Optional[Exception] = None):
+        if not self.listeners:
+            return
+        data = {'completed_days': self.completed_days, 'total_days': self.total_days}
+        if error is not None:
+            self._emit('failed', ticker, {**data, 'error': str(error)})
+        else:
+            self._emit('completed', ticker, {
+                **data,
+                'final_balance': results.final_balance,
+                'total_return_pct': results.total_return_pct,
+                'sharpe_ratio': results.sharpe_ratio,
+                'max_drawdown': results.max_drawdown,
+                'total_trades': results.total_trades
+            })
     
     def run_backtest(self, ticker: str, start_date: Optional[str] = None,
-                    end_date: Optional[str] = None) -> BacktestResults:
+                    end_date: Optional[str] = None, resume: bool = False) -> BacktestResults:
+        """
+        Run an agent-driven backtest bar by bar.
+        
+        With a trading graph, progress is checkpointed every
+        config.checkpoint_interval bars and the checkpoint is removed once the
+        run completes. With config.decision_workers > 1 the agent decisions for
+        all bars are generated concurrently first (they only depend on price
+        history), then the account is simulated sequentially over them.
+        
+        Args:
+            ticker: Stock symbol
+            start_date: Start date (uses config if None)
+            end_date: End date (uses config if None)
+            resume: Continue from the last checkpoint of this run, if one exists
+        
+        Returns:
+            BacktestResults
+        """
         start_date = start_date or self.config.start_date
         end_date = end_date or self.config.end_date
         
@@ -43,16 +200,167 @@ class BacktestEngine:
             if data.empty:
                 raise ValueError(f"No data available for {ticker}")
             
-            self._run_backtest_loop(ticker, data)
+            run_key = None
+            start_index = 0
+            self._checkpoint_marks = (0, 0)
+            if self.checkpoint_store is not None:
+                run_key = self._checkpoint_key(ticker, start_date, end_date)
+                if resume:
+                    start_index = self._restore_checkpoint(run_key, data)
+            
+            prefetched = None
+            if self.trading_graph and self.config.decision_workers > 1:
+                prefetched = self._prefetch_decisions(ticker, data, data.index[start_index:])
+            
+            self.total_days = len(data)
+            self._emit_started(ticker, start_date, end_date, start_index)
+            self._run_backtest_loop(ticker, data, start_index, run_key, prefetched)
             results = self._generate_results(ticker, start_date, end_date)
             
+            if run_key is not None:
+                self.checkpoint_store.delete(run_key)
+            
             logger.info(f"Backtest completed. Final equity: ${results.final_balance:,.2f}")
+            self._emit_finished(ticker, results)
             return results
             
         except Exception as e:
             logger.error(f"Backtest failed: {e}")
+            self._emit_finished(ticker, error=e)
             raise
     
+    def run_signal_backtest(self, ticker: str,
+                            signals: Union[pd.Series, Sequence, np.ndarray],
+                            start_date: Optional[str] = None,
+                            end_date: Optional[str] = None,
+                            signal_type: str = "signal") -> BacktestResults:
+        """
+        Run a vectorized backtest from precomputed signals.
+        
+        Skips the per-bar loop and the trading graph entirely: positions, cash,
+        costs and equity are simulated with NumPy arrays in one pass.
+        
+        Args:
+            ticker: Stock symbol
+            signals: Series indexed by date, or array with one entry per bar.
+                For signal_type="signal", BUY/SELL/HOLD strings or 1/-1/0 codes
+                sized like the event loop. For signal_type="weight", target
+                portfolio weights in [0, 1].
+            start_date: Start date (uses config if None)
+            end_date: End date (uses config if None)
+            signal_type: "signal" or "weight"
+        
+        Returns:
+            BacktestResults with the same layout as run_backtest()
+        """
+        start_date = start_date or self.config.start_date
+        end_date = end_date or self.config.end_date
+        
+        if not start_date or not end_date:
+            raise ValueError("Start and end dates must be provided")
+        if signal_type not in ("signal", "weight"):
+            raise ValueError("signal_type must be 'signal' or 'weight'")
+        
+        try:
+            data = self._load_data(ticker, start_date, end_date)
+            if data.empty:
+                raise ValueError(f"No data available for {ticker}")
+            
+            self.total_days = len(data)
+            self._emit_started(ticker, start_date, end_date)
+            
+            close = data['close'].to_numpy(dtype=float)
+            if signal_type == "signal":
+                sim = vectorized.simulate_signals(
+                    close, vectorized.encode_signals(signals, data.index),
+                    self.config.initial_balance, self.config.commission_rate, self.config.slippage,
+                    self.config.risk_per_trade_pct, self.config.max_position_size_pct
+                )
+            else:
+                sim = vectorized.simulate_target_weights(
+                    close, vectorized.align_weights(signals, data.index),
+                    self.config.initial_balance, self.config.commission_rate, self.config.slippage
+                )
+            
+            self.completed_days = len(data)
+            self.current_date = data.index[-1].strftime('%Y-%m-%d')
+            self.metrics.update_batch(sim['equity'])
+            
+            trades_df, equity_df = vectorized.simulation_to_frames(sim, ticker, data.index, close)
+            results = self._build_results(ticker, start_date, end_date, trades_df, equity_df)
+            self._emit_finished(ticker, results)
+            return results
+            
+        except Exception as e:
+            self._emit_finished(ticker, error=e)
+            raise
+    
+    def run_portfolio_backtest(self, tickers: List[str], start_date: Optional[str] = None,
+                               end_date: Optional[str] = None,
+                               signals: Optional[pd.DataFrame] = None) -> BacktestResults:
+        """
+        Run one backtest over a whole watchlist sharing a single account.
+        
+        All tickers are loaded once into an aligned date x ticker panel and stepped
+        together each bar. Equity is marked with one dot product over the share
+        vector, and simultaneous BUY signals split the available cash.
+        
+        Args:
+            tickers: Stock symbols
+            start_date: Start date (uses config if None)
+            end_date: End date (uses config if None)
+            signals: Optional DataFrame of BUY/SELL/HOLD signals (date x ticker).
+                If omitted, the trading graph is asked for each ticker and bar.
+        
+        Returns:
+            BacktestResults for the combined portfolio (ticker is the
+            comma-joined watchlist; each trade records its own ticker)
+        """
+        start_date = start_date or self.config.start_date
+        end_date = end_date or self.config.end_date
+        
+        if not start_date or not end_date:
+            raise ValueError("Start and end dates must be provided")
+        if not tickers:
+            raise ValueError("At least one ticker must be provided")
+        
+        logger.info(f"Starting portfolio backtest for {len(tickers)} tickers from {start_date} to {end_date}")
+        
+        try:
+            panel = self._load_panel(tickers, start_date, end_date)
+            if panel.empty:
+                raise ValueError(f"No data available for {', '.join(tickers)}")
+            
+            tickers = [t for t in tickers if t in panel.columns.get_level_values('ticker')]
+            self.total_days = len(panel)
+            self._emit_started(",".join(tickers), start_date, end_date)
+            self._run_portfolio_loop(tickers, panel, signals)
+            results = self._generate_results(",".join(tickers), start_date, end_date)
+            
+            logger.info(f"Portfolio backtest completed. Final equity: ${results.final_balance:,.2f}")
+            self._emit_finished(results.ticker, results)
+            return results
+            
+        except Exception as e:
+            logger.error(f"Portfolio backtest failed: {e}")
+            self._emit_finished(",".join(tickers), error=e)
+            raise
+    
+    def _load_panel(self, tickers: List[str], start_date: str, end_date: str) -> pd.DataFrame:
+        buffer_days = 100
+        buffer_start = (pd.to_datetime(start_date) - timedelta(days=buffer_days)).strftime('%Y-%m-%d')
+        
+        panel = self.data_manager.get_price_panel(
+            tickers=tickers,
+            start_date=buffer_start,
+            end_date=end_date,
+            interval=self.config.data_interval
+        )
+        if panel.empty:
+            return panel
+        
+        return panel[start_date:end_date].copy()
+    
     def _load_data(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
         buffer_days = 100
         buffer_start = (pd.to_datetime(start_date) - timedelta(days=buffer_days)).strftime('%Y-%m-%d')
@@ -67,51 +375,266 @@ class BacktestEngine:
         backtest_data = data[start_date:end_date].copy()
         return backtest_data
     
-    def _run_backtest_loop(self, ticker: str, data: pd.DataFrame):
+    def _prefetch_decisions(self, ticker: str, data: pd.DataFrame,
+                            dates: pd.DatetimeIndex) -> Dict[pd.Timestamp, Optional[Dict]]:
+        """
+        Generate agent decisions for many bars concurrently.
+        
+        Args:
+            ticker: Stock symbol
+            data: Full price history of the run
+            dates: Bars to decide on
+        
+        Returns:
+            Agent result (or None) keyed by bar date
+        """
+        workers = min(self.config.decision_workers, max(len(dates), 1))
+        logger.info(f"Generating {len(dates)} agent decisions on {workers} workers...")
+        if workers > 1 and self.graph_factory is None and not getattr(self.trading_graph, 'thread_safe', False):
+            logger.warning("No graph_factory given: calls to the shared trading graph are serialized, "
+                           "only cache lookups run concurrently")
+        
+        decisions = {}
+        with create_pool(workers, self.data_manager, use_processes=False) as pool:
+            futures = {pool.submit(self._run_worker_analysis, ticker, date, data): date for date in dates}
+            for done, future in enumerate(as_completed(futures), 1):
+                decisions[futures[future]] = future.result()
+                if done % 50 == 0:
+                    logger.info(f"Decisions: {done}/{len(dates)}")
+        
+        return decisions
+    
+    def _run_worker_analysis(self, ticker: str, date: pd.Timestamp, data: pd.DataFrame) -> Optional[Dict]:
+        """_run_agent_analysis on a decision worker, with the thread's own graph when graph_factory is set."""
+        if self.graph_factory is not None and getattr(self._worker_state, 'graph', None) is None:
+            self._worker_state.graph = self.graph_factory()
+        return self._run_agent_analysis(ticker, date, data)
+    
+    def _run_backtest_loop(self, ticker: str, data: pd.DataFrame,
+                           start_index: int = 0, run_key: Optional[str] = None,
+                           prefetched: Optional[Dict[pd.Timestamp, Optional[Dict]]] = None):
         dates = data.index
         self.total_days = len(dates)
-        self.completed_days = 0
+        self.completed_days = start_index
+        self.account.reserve(self.total_days)
         
-        logger.info(f"Processing {self.total_days} trading days...")
+        if start_index:
+            logger.info(f"Resuming at day {start_index + 1} of {self.total_days}...")
+        else:
+            logger.info(f"Processing {self.total_days} trading days...")
         
-        for i, date in enumerate(dates):
+        for date in dates[start_index:]:
             self.current_date = date.strftime('%Y-%m-%d')
             current_data = data.loc[date]
             current_price = current_data['close']
             
             current_prices = {ticker: current_price}
-            self.account.record_equity(self.current_date, current_prices)
+            equity = self.account.record_equity(self.current_date, current_prices)
+            self.metrics.update(equity)
+            trades_before = len(self.account.trades)
             
             if self.trading_graph:
                 try:
-                    agent_result = self._run_agent_analysis(ticker, date, data)
+                    if prefetched is not None:
+                        agent_result = prefetched.get(date)
+                    else:
+                        agent_result = self._run_agent_analysis(ticker, date, data)
                     if agent_result:
+                        self.decisions[self.current_date] = self.signal_from_decision(agent_result)
                         self._process_agent_decision(ticker, agent_result, current_price)
                 except Exception as e:
                     logger.warning(f"Agent analysis failed on {self.current_date}: {e}")
             
             self.completed_days += 1
+            if self.listeners:
+                self._emit_bar_events(ticker, equity, trades_before)
+            if run_key is not None and self.completed_days % self.config.checkpoint_interval == 0:
+                self._save_checkpoint(run_key)
             if self.completed_days % 50 == 0:
                 progress = (self.completed_days / self.total_days) * 100
-                logger.info(f"Progress: {progress:.1f}% ({self.completed_days}/{self.total_days} days)")
+                logger.info(f"Progress: {progress:.1f}% ({self.completed_days}/{self.total_days} days) - "
+                            f"Sharpe: {self.metrics.sharpe_ratio:.2f}, Drawdown: {self.metrics.current_drawdown_pct:.2f}%")
         
         logger.info("Backtest simulation completed")
     
+    def _checkpoint_key(self, ticker: str, start_date: str, end_date: str) -> str:
+        return CheckpointStore.run_key(ticker, start_date, end_date, self.config.simulation_dict(),
+                                       self._graph_fingerprint)
+    
+    def _save_checkpoint(self, run_key: str):
+        """Save the fixed-size engine state plus the rows added since the last checkpoint."""
+        equity_from, trades_from = self._checkpoint_marks
+        account = self.account.get_state(equity_from, trades_from)
+        new_dates = pd.to_datetime(account['equity_dates']).strftime('%Y-%m-%d')
+        delta = {
+            'trades': account.pop('trades'),
+            'equity_dates': account.pop('equity_dates'),
+            'equity_values': account.pop('equity_values'),
+            'decisions': {d: self.decisions[d] for d in new_dates if d in self.decisions}
+        }
+        self.checkpoint_store.save(run_key, {
+            'bar_index': self.completed_days,
+            'last_date': self.current_date,
+            'account': account,
+            'metrics': self.metrics.get_state()
+        }, delta=delta)
+        self._checkpoint_marks = (self.account.num_equity_records, len(self.account.trades))
+    
+    def _restore_checkpoint(self, run_key: str, data: pd.DataFrame) -> int:
+        """
+        Load engine state from the run's checkpoint.
+        
+        Returns:
+            Index of the first bar still to be processed (0 if nothing was restored)
+        """
+        state = self.checkpoint_store.load(run_key)
+        if state is None:
+            logger.info("No checkpoint found, starting from the first bar")
+            return 0
+        
+        bar_index = state['bar_index']
+        if bar_index > len(data) or data.index[bar_index - 1].strftime('%Y-%m-%d') != state['last_date']:
+            logger.warning("Checkpoint does not match the loaded data, starting from the first bar")
+            # Drop it so the next save starts a fresh journal instead of appending to stale deltas
+            self.checkpoint_store.delete(run_key)
+            return 0
+        
+        account = {**state['account'], 'trades': [], 'equity_dates': [], 'equity_values': []}
+        decisions = {}
+        for delta in state['deltas']:
+            account['trades'].extend(delta['trades'])
+            account['equity_dates'].extend(delta['equity_dates'])
+            account['equity_values'].extend(delta['equity_values'])
+            decisions.update(delta['decisions'])
+        
+        self.account.restore_state(account)
+        self.metrics.restore_state(state['metrics'])
+        self.decisions = decisions
+        self.current_date = state['last_date']
+        self._checkpoint_marks = (self.account.num_equity_records, len(self.account.trades))
+        logger.info(f"Restored checkpoint at {state['last_date']} ({bar_index} bars done)")
+        return bar_index
+    
+    def _run_portfolio_loop(self, tickers: List[str], panel: pd.DataFrame,
+                            signals: Optional[pd.DataFrame] = None):
+        dates = panel.index
+        self.total_days = len(dates)
+        self.completed_days = 0
+        self.account.reserve(self.total_days)
+        
+        closes = panel.xs('close', axis=1, level='field')[tickers].ffill().to_numpy(dtype=float)
+        shares = np.zeros(len(tickers))
+        
+        codes = None
+        ticker_frames = {}
+        if signals is not None:
+            codes = np.column_stack([
+                vectorized.encode_signals(signals[t], dates) if t in signals.columns
+                else np.zeros(len(dates), dtype=np.int8)
+                for t in tickers
+            ])
+        elif self.trading_graph:
+            ticker_frames = {t: panel[t].dropna(how='all') for t in tickers}
+        
+        logger.info(f"Processing {self.total_days} trading days across {len(tickers)} tickers...")
+        
+        for i, date in enumerate(dates):
+            self.current_date = date.strftime('%Y-%m-%d')
+            prices = closes[i]
+            priced = ~np.isnan(prices)
+            
+            equity = self.account.cash_balance + float(np.dot(shares[priced], prices[priced]))
+            self.account.record_equity(self.current_date, {}, total_equity=equity)
+            self.metrics.update(equity)
+            trades_before = len(self.account.trades)
+            
+            if codes is not None:
+                bar_codes = codes[i]
+            elif self.trading_graph:
+                bar_codes = np.zeros(len(tickers), dtype=np.int8)
+                for j in np.flatnonzero(priced):
+                    try:
+                        agent_result = self._run_agent_analysis(tickers[j], date, ticker_frames[tickers[j]])
+                        bar_codes[j] = vectorized.SIGNAL_CODES[self.signal_from_decision(agent_result)]
+                    except Exception as e:
+                        logger.warning(f"Agent analysis failed for {tickers[j]} on {self.current_date}: {e}")
+            else:
+                bar_codes = None
+            
+            if bar_codes is not None:
+                self._allocate_portfolio_signals(tickers, bar_codes, prices, shares)
+            
+            self.completed_days += 1
+            if self.listeners:
+                self._emit_bar_events(",".join(tickers), equity, trades_before)
+            if self.completed_days % 50 == 0:
+                progress = (self.completed_days / self.total_days) * 100
+                logger.info(f"Progress: {progress:.1f}% ({self.completed_days}/{self.total_days} days) - "
+                            f"Sharpe: {self.metrics.sharpe_ratio:.2f}, Drawdown: {self.metrics.current_drawdown_pct:.2f}%")
+        
+        logger.info("Portfolio simulation completed")
+    
+    def _allocate_portfolio_signals(self, tickers: List[str], bar_codes: np.ndarray,
+                                    prices: np.ndarray, shares: np.ndarray):
+        """Execute one bar's signals: sells first, then buys sharing the freed cash."""
+        tradable = ~np.isnan(prices)
+        
+        for j in np.flatnonzero((bar_codes < 0) & tradable & (shares > 0)):
+            price = prices[j]
+            if self.executor.execute_order(tickers[j], TradeSignal.SELL, shares[j], price, self.current_date):
+                shares[j] = 0.0
+        
+        buys = np.flatnonzero((bar_codes > 0) & tradable)
+        if len(buys) == 0:
+            return
+        
+        cash = self.account.cash_balance
+        size_frac = min(self.config.risk_per_trade_pct, self.config.max_position_size_pct) / 100.0
+        cost_rate = 1 + self.config.commission_rate + self.config.slippage
+        budget = cash * size_frac
+        # Scale every buy down evenly when the combined allocation exceeds cash
+        if budget * len(buys) * cost_rate > cash:
+            budget = cash / (len(buys) * cost_rate)
+        
+        for j in buys:
+            price = prices[j]
+            qty = int(budget / price)
+            if qty <= 0:
+                continue
+            if self.executor.execute_order(tickers[j], TradeSignal.BUY, qty, price, self.current_date):
+                shares[j] += qty
+    
     def _run_agent_analysis(self, ticker: str, date: pd.Timestamp, data: pd.DataFrame) -> Optional[Dict]:
+        trade_date = date.strftime('%Y-%m-%d')
+        
+        if self.decision_cache is not None:
+            cached = self.decision_cache.get(self._graph_fingerprint, ticker, trade_date)
+            if cached is not None:
+                return cached
+        
         try:
             historical_data = data.loc[:date]
             
-            if hasattr(self.trading_graph, 'run_historical'):
-                result = self.trading_graph.run_historical(
-                    ticker=ticker,
-                    trade_date=date.strftime('%Y-%m-%d'),
-                    historical_data=historical_data
-                )
-            else:
-                result = self.trading_graph.run(
-                    ticker=ticker,
-                    timeframe=self.config.data_interval
-                )
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self._llm_provider)
+            
+            graph = getattr(self._worker_state, 'graph', None) or self.trading_graph
+            shared = graph is self.trading_graph and not getattr(graph, 'thread_safe', False)
+            with self._graph_lock if shared else nullcontext():
+                if hasattr(graph, 'run_historical'):
+                    result = graph.run_historical(
+                        ticker=ticker,
+                        trade_date=trade_date,
+                        historical_data=historical_data
+                    )
+                else:
+                    result = graph.run(
+                        ticker=ticker,
+                        timeframe=self.config.data_interval
+                    )
+            
+            if result and self.decision_cache is not None:
+                self.decision_cache.put(self._graph_fingerprint, ticker, trade_date, result)
             
             return result
         except Exception as e:
@@ -119,32 +642,50 @@ class BacktestEngine:
             return None
     
     def _process_agent_decision(self, ticker: str, agent_result: Dict, current_price: float):
-        final_decision = agent_result.get("final_decision", {})
-        if not final_decision:
+        if not agent_result.get("final_decision"):
             return
         
-        decision_text = final_decision.get("decision", "").upper()
-        signal = "HOLD"
-        
-        if "APPROVE" in decision_text or "BUY" in decision_text:
-            signal = "BUY"
-        elif "REJECT" in decision_text or "SELL" in decision_text:
-            position = self.account.get_position(ticker)
-            if position:
-                signal = "SELL"
+        signal = self.signal_from_decision(agent_result)
+        if signal == "SELL" and not self.account.get_position(ticker):
+            signal = "HOLD"
         
         self.executor.execute_signal(ticker, signal, current_price, self.current_date, 1.0)
     
+    @staticmethod
+    def signal_from_decision(agent_result: Optional[Dict]) -> str:
+        """
+        Map an agent result to a BUY/SELL/HOLD signal.
+        
+        Args:
+            agent_result: Result dict from the trading graph (or decision cache)
+        
+        Returns:
+            "BUY", "SELL" or "HOLD"
+        """
+        final_decision = (agent_result or {}).get("final_decision", {})
+        if not final_decision:
+            return "HOLD"
+        
+        decision_text = final_decision.get("decision", "").upper()
+        if "APPROVE" in decision_text or "BUY" in decision_text:
+            return "BUY"
+        if "REJECT" in decision_text or "SELL" in decision_text:
+            return "SELL"
+        return "HOLD"
+    
     def _generate_results(self, ticker: str, start_date: str, end_date: str) -> BacktestResults:
+        trades_df = self.account.get_trade_history()
+        equity_df = self.account.get_equity_curve()
+        return self._build_results(ticker, start_date, end_date, trades_df, equity_df)
+    
+    def _build_results(self, ticker: str, start_date: str, end_date: str,
+                       trades_df: pd.DataFrame, equity_df: pd.DataFrame) -> BacktestResults:
         summary = {
             'initial_balance': self.config.initial_balance,
-            'current_equity': self.account.equity_history[-1]['total_equity'] if self.account.equity_history else self.config.initial_balance,
-            'total_trades': len(self.account.trades)
+            'current_equity': float(equity_df['total_equity'].iloc[-1]) if not equity_df.empty else self.config.initial_balance,
+            'total_trades': len(trades_df)
         }
         
-        trades_df = self.account.get_trade_history()
-        equity_df = self.account.get_equity_curve()
-        
         trades_list = trades_df.to_dict('records') if not trades_df.empty else []
         equity_list = equity_df.reset_index().to_dict('records') if not equity_df.empty else []
         
@@ -159,11 +700,59 @@ class BacktestEngine:
             config=self.config,
             total_return=summary['current_equity'] - self.config.initial_balance,
             total_return_pct=((summary['current_equity'] - self.config.initial_balance) / self.config.initial_balance) * 100,
+            cagr=self.metrics.cagr,
+            sharpe_ratio=self.metrics.sharpe_ratio,
+            sortino_ratio=self.metrics.sortino_ratio,
+            max_drawdown=self.metrics.max_drawdown_pct,
+            volatility=self.metrics.volatility,
             total_trades=summary['total_trades']
         )
+        self._fill_trade_statistics(results, trades_df)
+        self._fill_benchmark_metrics(results, equity_df)
         
         return results
     
+    def _fill_benchmark_metrics(self, results: BacktestResults, equity_df: pd.DataFrame):
+        """Set benchmark-relative metrics on results (skipped if the benchmark cannot be loaded)."""
+        if not self.config.benchmark or equity_df.empty:
+            return
+        
+        try:
+            benchmark = self.data_manager.get_benchmark_series(
+                self.config.benchmark, results.start_date, results.end_date, self.config.data_interval
+            )
+        except Exception as e:
+            logger.warning(f"Benchmark {self.config.benchmark} unavailable, skipping relative metrics: {e}")
+            return
+        
+        relative = calculate_relative_metrics(equity_df['total_equity'], benchmark)
+        results.benchmark_return_pct = relative['benchmark_return_pct']
+        results.excess_return_pct = relative['excess_return_pct']
+        results.alpha = relative['alpha']
+        results.beta = relative['beta']
+        results.tracking_error = relative['tracking_error']
+        results.information_ratio = relative['information_ratio']
+    
+    @staticmethod
+    def _fill_trade_statistics(results: BacktestResults, trades_df: pd.DataFrame):
+        """Set win/loss statistics on results from FIFO-matched round trips."""
+        round_trips = round_trips_from_trades(trades_df)
+        if round_trips.empty:
+            return
+        
+        pnl = round_trips['pnl'].to_numpy()
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+        total_losses = abs(losses.sum())
+        
+        results.winning_trades = len(wins)
+        results.losing_trades = len(losses)
+        results.win_rate = len(wins) / len(pnl) * 100
+        results.profit_factor = wins.sum() / total_losses if total_losses > 0 else 0.0
+        results.avg_win = float(wins.mean()) if len(wins) else 0.0
+        results.avg_loss = float(abs(losses.mean())) if len(losses) else 0.0
+        results.avg_holding_days = float(np.average(round_trips['holding_days'], weights=round_trips['shares']))
+    
     def get_progress(self) -> Dict:
         if self.total_days == 0:
             return {'progress_pct': 0.0, 'status': 'Not started'}
@@ -174,5 +763,6 @@ class BacktestEngine:
             'completed_days': self.completed_days,
             'total_days': self.total_days,
             'current_date': self.current_date,
-            'status': 'Running' if progress_pct < 100 else 'Completed'
+            'status': 'Running' if progress_pct < 100 else 'Completed',
+            'metrics': self.metrics.snapshot()
         }
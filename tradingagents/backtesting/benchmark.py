@@ -0,0 +1,376 @@
+"""
+Backtest Benchmark Suite
+Offline throughput and memory benchmarks for the backtesting framework.
+
+Runs entirely on synthetic OHLCV data and a deterministic stub trading graph,
+so it needs no network access or LLM calls. Results are written as JSON and
+can be compared against a baseline run to catch regressions:
+
+    python -m tradingagents.backtesting.benchmark --bars 2520 --tickers 5 \\
+        --output benchmark.json --baseline previous.json
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pandas as pd
+from tradingagents.backtesting.config import BacktestConfig
+from tradingagents.backtesting.data_manager import HistoricalDataManager
+from tradingagents.backtesting.account import SimulatedAccount
+from tradingagents.backtesting.backtest_engine import BacktestEngine
+from tradingagents.backtesting.performance_analyzer import PerformanceAnalyzer
+from tradingagents.backtesting import visualizations
+
+logger = logging.getLogger(__name__)
+
+SYNTHETIC_ORIGIN = "2000-01-03"
+
+
+def generate_ohlcv(ticker: str, start_date: str, end_date: str, seed: int = 0,
+                   drift: float = 0.0003, volatility: float = 0.015) -> pd.DataFrame:
+    """
+    Generate a deterministic geometric random walk over business days.
+
+    The walk is anchored at SYNTHETIC_ORIGIN and seeded from the ticker, so
+    overlapping ranges return identical bars for the same dates.
+
+    Args:
+        ticker: Stock symbol (selects the random stream)
+        start_date: First date (inclusive)
+        end_date: Last date (exclusive, like HistoricalDataManager)
+        seed: Extra seed to vary the whole universe
+        drift: Mean daily return
+        volatility: Standard deviation of daily returns
+
+    Returns:
+        DataFrame with open, high, low, close, volume columns
+    """
+    origin = pd.Timestamp(SYNTHETIC_ORIGIN)
+    index = pd.bdate_range(start=max(pd.Timestamp(start_date), origin), end=end_date, inclusive='left')
+    if len(index) == 0:
+        return pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume'])
+
+    offset = len(pd.bdate_range(origin, index[0])) - 1
+    rng = np.random.default_rng([seed, sum(map(ord, ticker))])
+    n = offset + len(index)
+    returns = rng.normal(drift, volatility, n)
+    close = 100 * np.cumprod(1 + returns)[offset:]
+    spread = np.abs(rng.normal(0, 0.01, n))[offset:]
+    opens = np.r_[close[0], close[:-1]]
+    return pd.DataFrame({
+        'open': opens,
+        'high': np.maximum(opens, close) * (1 + spread),
+        'low': np.minimum(opens, close) * (1 - spread),
+        'close': close,
+        'volume': rng.integers(500_000, 5_000_000, n)[offset:]
+    }, index=index)
+
+
+def synthetic_date_range(bars: int) -> tuple:
+    """Start and (exclusive) end date covering the given number of business days."""
+    index = pd.bdate_range(start=SYNTHETIC_ORIGIN, periods=bars + 1)
+    return index[0].strftime('%Y-%m-%d'), index[-1].strftime('%Y-%m-%d')
+
+
+class SyntheticDataManager(HistoricalDataManager):
+    """HistoricalDataManager that serves generated bars instead of downloading them."""
+
+    def __init__(self, cache_dir: str = "backtest_data_cache", seed: int = 0):
+        super().__init__(cache_dir=cache_dir)
+        self.seed = seed
+
+    def _fetch_from_mcp(self, ticker: str, start_date: str, end_date: str, interval: str) -> pd.DataFrame:
+        return generate_ohlcv(ticker, start_date, end_date, self.seed)
+
+
+class StubTradingGraph:
+    """
+    Deterministic stand-in for TradingAgentsGraph.
+
+    Decides with a moving-average crossover on the history it is given, so
+    it trades regularly and costs next to nothing compared with the engine.
+    """
+
+    def __init__(self, fast: int = 5, slow: int = 20):
+        self.fast = fast
+        self.slow = slow
+        self.config = {'llm_provider': 'stub', 'deep_think_llm': 'stub', 'quick_think_llm': 'stub'}
+        self.selected_analysts = ['market']
+        self.calls = 0
+
+    def run_historical(self, ticker: str, trade_date: str, historical_data: pd.DataFrame) -> Dict:
+        self.calls += 1
+        close = historical_data['close'].to_numpy()
+        if len(close) < self.slow:
+            return {"final_decision": {"decision": "HOLD"}}
+
+        fast = close[-self.fast:].mean()
+        slow = close[-self.slow:].mean()
+        decision = "BUY" if fast > slow else "SELL"
+        return {"final_decision": {"decision": decision}}
+
+
+class BacktestBenchmark:
+    """
+    Times the main backtesting stages on synthetic data.
+
+    Each stage is timed over several repeats (best and mean wall time), then
+    run once more under tracemalloc to record peak Python memory.
+    """
+
+    def __init__(self, bars: int = 2520, tickers: int = 1, repeats: int = 3,
+                 include_visualizer: bool = True, seed: int = 0):
+        """
+        Initialize the benchmark.
+
+        Args:
+            bars: Number of daily bars per ticker
+            tickers: Number of synthetic tickers
+            repeats: Timed repetitions per stage
+            include_visualizer: Whether to render the dashboard (needs matplotlib)
+            seed: Seed for the synthetic universe
+        """
+        self.bars = bars
+        self.tickers = [f"SYN{i:03d}" for i in range(tickers)]
+        self.repeats = max(1, repeats)
+        self.include_visualizer = include_visualizer
+        self.seed = seed
+        self.start_date, self.end_date = synthetic_date_range(bars)
+        self.stages: Dict[str, Dict] = {}
+        self._tmp_dir = None
+
+    def _config(self) -> BacktestConfig:
+        return BacktestConfig(
+            initial_balance=100000,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            risk_per_trade_pct=10.0,
+            use_decision_cache=False,
+            checkpoint_interval=0
+        )
+
+    def _data_manager(self) -> SyntheticDataManager:
+        return SyntheticDataManager(cache_dir=os.path.join(self._tmp_dir, "data"), seed=self.seed)
+
+    def _measure(self, name: str, func: Callable[[], None], units: int):
+        """
+        Time a stage and record its peak memory.
+
+        Args:
+            name: Stage name
+            func: Stage body
+            units: Bars processed per call (for throughput)
+        """
+        timings = []
+        for _ in range(self.repeats):
+            gc.collect()
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        best = min(timings)
+        self.stages[name] = {
+            'seconds_best': best,
+            'seconds_mean': float(np.mean(timings)),
+            'bars': units,
+            'bars_per_sec': units / best if best > 0 else 0.0,
+            'peak_memory_mb': peak / 1024 ** 2,
+            'bytes_per_bar': peak / units if units else 0.0
+        }
+        logger.info(f"{name}: {best * 1000:.1f} ms best, {peak / 1024 ** 2:.1f} MB peak")
+
+    def run(self) -> Dict:
+        """
+        Run every stage.
+
+        Returns:
+            Benchmark report (see to_dict())
+        """
+        self._tmp_dir = tempfile.mkdtemp(prefix="backtest_benchmark_")
+        try:
+            self._run_stages()
+        finally:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
+        return self.to_dict()
+
+    def _run_stages(self):
+        ticker = self.tickers[0]
+
+        # Data loading: generate, write and re-read the canonical cache
+        def load():
+            data_manager = self._data_manager()
+            data_manager.clear_cache()
+            for t in self.tickers:
+                data_manager.get_historical_data(t, self.start_date, self.end_date)
+        self._measure('data_load', load, self.bars * len(self.tickers))
+
+        # Warm the cache shared by the remaining stages
+        data_manager = self._data_manager()
+        for t in self.tickers:
+            data_manager.get_historical_data(t, "1999-01-01", self.end_date)
+
+        # Single-ticker event loop driven by the stub graph
+        def loop():
+            BacktestEngine(self._config(), StubTradingGraph(), data_manager).run_backtest(ticker)
+        self._measure('backtest_loop', loop, self.bars)
+
+        if len(self.tickers) > 1:
+            def portfolio():
+                engine = BacktestEngine(self._config(), StubTradingGraph(), data_manager)
+                engine.run_portfolio_backtest(self.tickers)
+            self._measure('portfolio_loop', portfolio, self.bars * len(self.tickers))
+
+        # Account bookkeeping in isolation
+        prices = generate_ohlcv(ticker, self.start_date, self.end_date, self.seed)['close']
+        dates = prices.index.strftime('%Y-%m-%d').tolist()
+        closes = prices.to_numpy()
+
+        def account():
+            acct = SimulatedAccount(100000)
+            acct.reserve(len(dates))
+            for i, (date, price) in enumerate(zip(dates, closes)):
+                acct.record_equity(date, {ticker: price})
+                if i % 10 == 0:
+                    acct.buy(ticker, 10, price, date, commission=1.0)
+                elif i % 10 == 5:
+                    acct.sell(ticker, 10, price, date, commission=1.0)
+            acct.get_equity_curve()
+            acct.get_trade_history()
+        self._measure('account', account, self.bars)
+
+        results = BacktestEngine(self._config(), StubTradingGraph(), data_manager).run_backtest(ticker)
+
+        def analyze():
+            PerformanceAnalyzer(results).get_summary()
+        self._measure('performance_analyzer', analyze, self.bars)
+
+        if self.include_visualizer and visualizations.MATPLOTLIB_AVAILABLE:
+            analyzer = PerformanceAnalyzer(results)
+
+            chart_path = os.path.join(self._tmp_dir, "dashboard.png")
+
+            def render():
+                generator = visualizations.VisualizationGenerator(analyzer)
+                generator.create_dashboard(filepath=chart_path, show=False)
+            self._measure('visualizer', render, self.bars)
+
+    def to_dict(self) -> Dict:
+        """Machine-readable report with environment metadata."""
+        return {
+            'created_at': datetime.now().isoformat(),
+            'parameters': {
+                'bars': self.bars,
+                'tickers': len(self.tickers),
+                'repeats': self.repeats,
+                'seed': self.seed,
+                'start_date': self.start_date,
+                'end_date': self.end_date
+            },
+            'environment': {
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'numpy': np.__version__,
+                'pandas': pd.__version__
+            },
+            'stages': self.stages
+        }
+
+
+def compare_benchmarks(baseline: Dict, current: Dict, tolerance_pct: float = 20.0) -> List[Dict]:
+    """
+    Compare two benchmark reports stage by stage.
+
+    Args:
+        baseline: Earlier report
+        current: New report
+        tolerance_pct: Allowed slowdown or memory growth before flagging
+
+    Returns:
+        One entry per shared stage with time/memory change and a regression flag
+    """
+    comparison = []
+    for name, stage in current['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        if not base:
+            continue
+
+        time_change = (stage['seconds_best'] / base['seconds_best'] - 1) * 100 if base['seconds_best'] else 0.0
+        memory_change = (stage['peak_memory_mb'] / base['peak_memory_mb'] - 1) * 100 if base['peak_memory_mb'] else 0.0
+        comparison.append({
+            'stage': name,
+            'time_change_pct': time_change,
+            'memory_change_pct': memory_change,
+            'regression': time_change > tolerance_pct or memory_change > tolerance_pct
+        })
+    return comparison
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline backtest throughput benchmark")
+    parser.add_argument("--bars", type=int, default=2520, help="Daily bars per ticker")
+    parser.add_argument("--tickers", type=int, default=1, help="Number of synthetic tickers")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed repetitions per stage")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed")
+    parser.add_argument("--no-visualizer", action="store_true", help="Skip chart rendering")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against an earlier JSON report")
+    parser.add_argument("--tolerance", type=float, default=20.0, help="Regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    benchmark = BacktestBenchmark(
+        bars=args.bars,
+        tickers=args.tickers,
+        repeats=args.repeats,
+        include_visualizer=not args.no_visualizer,
+        seed=args.seed
+    )
+    report = benchmark.run()
+
+    print("=" * 70)
+    print(f"BACKTEST BENCHMARK ({args.bars} bars x {args.tickers} tickers)")
+    print("=" * 70)
+    for name, stage in report['stages'].items():
+        print(f"{name:<22} {stage['seconds_best'] * 1000:>10.1f} ms  "
+              f"{stage['bars_per_sec']:>12,.0f} bars/s  {stage['peak_memory_mb']:>8.1f} MB")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Report saved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        comparison = compare_benchmarks(baseline, report, args.tolerance)
+        regressions = [c for c in comparison if c['regression']]
+        print()
+        for c in comparison:
+            marker = "❌" if c['regression'] else "✅"
+            print(f"{marker} {c['stage']:<22} time {c['time_change_pct']:+.1f}%  memory {c['memory_change_pct']:+.1f}%")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Backtest Checkpoints
+
+Persists the progress of a running backtest (account, metrics, bar index and
+per-date decisions) so an interrupted agent-driven run can resume where it stopped.
+
+A checkpoint is a small header, rewritten on every save, plus an append-only
+journal of the rows (equity, trades, decisions) added since the previous save,
+so the cost of a save does not grow with the length of the run.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointStore:
+    """
+    On-disk store of backtest checkpoints.
+
+    Each run (ticker, date range, backtest config and graph fingerprint) owns a
+    gzip-compressed JSON header that is replaced atomically on every save and a
+    JSON-lines journal. The header records how many journal bytes it covers, so a
+    crash mid-write leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, checkpoint_dir: str = "backtest_checkpoints"):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            checkpoint_dir: Directory for checkpoint files
+        """
+        self.checkpoint_dir = checkpoint_dir
+        self._journal_offsets: Dict[str, int] = {}
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+
+    @staticmethod
+    def run_key(ticker: str, start_date: str, end_date: str,
+                config: Dict[str, Any], graph_fingerprint: Optional[str] = None) -> str:
+        """
+        Build a stable key for a backtest run.
+
+        Args:
+            ticker: Stock symbol
+            start_date: Backtest start date
+            end_date: Backtest end date
+            config: BacktestConfig as a dictionary
+            graph_fingerprint: DecisionCache.graph_fingerprint() of the trading graph
+
+        Returns:
+            Key used as the checkpoint file name
+        """
+        key_parts = {
+            'ticker': ticker,
+            'start_date': start_date,
+            'end_date': end_date,
+            'config': config,
+            'graph': graph_fingerprint,
+        }
+        key_json = json.dumps(key_parts, sort_keys=True, default=str)
+        digest = hashlib.sha256(key_json.encode()).hexdigest()[:16]
+        return f"{ticker}_{start_date}_{end_date}_{digest}"
+
+    def _path(self, run_key: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{run_key}.json.gz")
+
+    def _journal_path(self, run_key: str) -> str:
+        return os.path.join(self.checkpoint_dir, f"{run_key}.journal")
+
+    def save(self, run_key: str, state: Dict[str, Any], delta: Optional[Dict[str, Any]] = None):
+        """
+        Write a checkpoint, replacing any previous one for the run.
+
+        The first save of a run in this store (unless load() was called) starts a
+        new journal; later saves append to it.
+
+        Args:
+            run_key: Key from run_key()
+            state: JSON-serializable header (the fixed-size part of the engine state)
+            delta: JSON-serializable rows added since the previous save, appended to
+                the journal (returned by load() in order under 'deltas')
+        """
+        journal_bytes = self._journal_offsets.get(run_key, 0)
+        if delta is not None:
+            journal_path = self._journal_path(run_key)
+            mode = 'r+b' if run_key in self._journal_offsets and os.path.exists(journal_path) else 'wb'
+            with open(journal_path, mode) as f:
+                f.seek(journal_bytes)
+                f.truncate()
+                f.write(json.dumps(delta, separators=(',', ':')).encode('utf-8') + b'\n')
+                journal_bytes = f.tell()
+
+        path = self._path(run_key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+            json.dump({**state, 'journal_bytes': journal_bytes}, f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        self._journal_offsets[run_key] = journal_bytes
+        logger.debug(f"Checkpoint saved for {run_key} at bar {state.get('bar_index')}")
+
+    def load(self, run_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the checkpoint for a run.
+
+        Args:
+            run_key: Key from run_key()
+
+        Returns:
+            Saved header with the journaled deltas under 'deltas', or None if there
+            is no readable checkpoint
+        """
+        path = self._path(run_key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                state = json.load(f)
+            journal_bytes = state.pop('journal_bytes', 0)
+            journal = b''
+            if journal_bytes:
+                with open(self._journal_path(run_key), 'rb') as f:
+                    journal = f.read(journal_bytes)
+                if len(journal) != journal_bytes:
+                    raise ValueError("journal is shorter than the header records")
+            state['deltas'] = [json.loads(line) for line in journal.splitlines()]
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+            return None
+
+        # Saves after a resume continue the journal past the committed bytes
+        self._journal_offsets[run_key] = journal_bytes
+        return state
+
+    def delete(self, run_key: str):
+        """Remove the checkpoint for a run, if any."""
+        self._journal_offsets.pop(run_key, None)
+        for path in (self._path(run_key), self._journal_path(run_key)):
+            if os.path.exists(path):
+                os.remove(path)
@@ -3,10 +3,14 @@ Strategy Comparison Tools
 Compare multiple backtest results and identify best performers.
 """
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import as_completed
+from datetime import timedelta
+from typing import List, Dict, Any, Optional, Iterator, Tuple
 import pandas as pd
 from tradingagents.backtesting.config import BacktestResults, BacktestConfig
 from tradingagents.backtesting.backtest_engine import BacktestEngine
+from tradingagents.backtesting.monte_carlo import MonteCarloAnalyzer
+from tradingagents.backtesting.parallel import create_pool, run_backtest_in_worker
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,7 @@ class StrategyComparator:
         self.data_manager = data_manager or HistoricalDataManager()
         self.results: List[BacktestResults] = []
         self.configs: List[BacktestConfig] = []
+        self.result_indices: List[int] = []  # Config index of each entry in results
         
         logger.info("StrategyComparator initialized")
     
@@ -47,7 +52,8 @@ class StrategyComparator:
         ticker: str,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
-        trading_graph=None
+        trading_graph=None,
+        max_workers: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Run all strategies and compare results.
@@ -57,6 +63,8 @@ class StrategyComparator:
             start_date: Start date (uses config if None)
             end_date: End date (uses config if None)
             trading_graph: TradingAgentsGraph instance (optional)
+            max_workers: Evaluate configs concurrently on this many workers
+                (None or 1 runs them one by one)
         
         Returns:
             DataFrame with comparison results
@@ -69,31 +77,126 @@ class StrategyComparator:
         print(f"{'='*70}")
         print(f"Testing {len(self.configs)} configurations...\n")
         
+        for _ in self.iter_comparison(ticker, start_date, end_date, trading_graph, max_workers):
+            pass
+        
+        # Generate comparison report
+        return self.generate_comparison_report()
+    
+    def iter_comparison(
+        self,
+        ticker: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        trading_graph=None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[int, BacktestResults]]:
+        """
+        Run all strategies, yielding each result as soon as it finishes.
+        
+        self.results is kept in config order as results arrive, so
+        generate_comparison_report() can be rendered between yields.
+        
+        With max_workers > 1, configs run on a bounded pool after the price data
+        is loaded once: worker processes without a trading graph, threads with
+        one. Calls to the shared graph are serialized across configs unless it
+        sets thread_safe = True (see BacktestEngine).
+        
+        Args:
+            ticker: Stock symbol to test
+            start_date: Start date (uses config if None)
+            end_date: End date (uses config if None)
+            trading_graph: TradingAgentsGraph instance (optional)
+            max_workers: Number of concurrent workers (None or 1 runs sequentially)
+        
+        Yields:
+            Tuples of (config index, BacktestResults) in completion order
+        """
+        if not self.configs:
+            raise ValueError("No strategies added. Use add_strategy() first.")
+        
         self.results = []
+        self.result_indices = []
+        total = len(self.configs)
         
-        for i, config in enumerate(self.configs, 1):
-            print(f"[{i}/{len(self.configs)}] Testing configuration {i}...")
-            
-            try:
-                # Create engine
-                engine = BacktestEngine(
-                    config=config,
-                    trading_graph=trading_graph,
-                    data_manager=self.data_manager
-                )
+        if not max_workers or max_workers <= 1 or total == 1:
+            for i, config in enumerate(self.configs):
+                print(f"[{i + 1}/{total}] Testing configuration {i + 1}...")
                 
-                # Run backtest
-                result = engine.run_backtest(ticker, start_date, end_date)
-                self.results.append(result)
+                try:
+                    # Create engine
+                    engine = BacktestEngine(
+                        config=config,
+                        trading_graph=trading_graph,
+                        data_manager=self.data_manager
+                    )
+                    
+                    # Run backtest
+                    result = engine.run_backtest(ticker, start_date, end_date)
+                except Exception as e:
+                    logger.error(f"Strategy {i + 1} failed: {e}")
+                    print(f"  ❌ Failed: {e}")
+                    continue
                 
+                self._record_result(i, result)
                 print(f"  ✅ Complete - Return: {result.total_return_pct:.2f}%")
+                yield i, result
+            return
+        
+        self._preload_data(ticker, start_date, end_date)
+        
+        use_processes = trading_graph is None
+        with create_pool(min(max_workers, total), self.data_manager, use_processes) as pool:
+            futures = {}
+            for i, config in enumerate(self.configs):
+                if use_processes:
+                    future = pool.submit(run_backtest_in_worker, config, ticker, start_date, end_date)
+                else:
+                    engine = BacktestEngine(
+                        config=config,
+                        trading_graph=trading_graph,
+                        data_manager=self.data_manager
+                    )
+                    future = pool.submit(engine.run_backtest, ticker, start_date, end_date)
+                futures[future] = i
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Strategy {i + 1} failed: {e}")
+                    print(f"[{done}/{total}] Configuration {i + 1} ❌ Failed: {e}")
+                    continue
                 
-            except Exception as e:
-                logger.error(f"Strategy {i} failed: {e}")
-                print(f"  ❌ Failed: {e}")
+                self._record_result(i, result)
+                print(f"[{done}/{total}] Configuration {i + 1} ✅ Complete - Return: {result.total_return_pct:.2f}%")
+                yield i, result
+    
+    def _record_result(self, config_index: int, result: BacktestResults):
+        """Insert a result keeping self.results in config order."""
+        position = sum(1 for idx in self.result_indices if idx < config_index)
+        self.result_indices.insert(position, config_index)
+        self.results.insert(position, result)
+    
+    def _preload_data(self, ticker: str, start_date: Optional[str], end_date: Optional[str]):
+        """Load the union of all configs' date ranges once so workers only slice it."""
+        starts = [start_date or c.start_date for c in self.configs]
+        ends = [end_date or c.end_date for c in self.configs]
+        if not all(starts) or not all(ends):
+            return  # Let the individual backtests report the missing dates
         
-        # Generate comparison report
-        return self.generate_comparison_report()
+        # Benchmarks are loaded by every run as well, so share them too
+        symbols = [ticker] + sorted({c.benchmark for c in self.configs if c.benchmark} - {ticker})
+        
+        # Same lookback buffer and interval handling as BacktestEngine._load_data
+        buffer_start = (pd.to_datetime(min(starts)) - timedelta(days=100)).strftime('%Y-%m-%d')
+        for interval in {c.data_interval for c in self.configs}:
+            for symbol in symbols:
+                try:
+                    self.data_manager.get_historical_data(symbol, buffer_start, max(ends), interval)
+                except Exception as e:
+                    logger.warning(f"Failed to preload {interval} data for {symbol}: {e}")
     
     def generate_comparison_report(self) -> pd.DataFrame:
         """
@@ -107,11 +210,11 @@ class StrategyComparator:
         
         comparison_data = []
         
-        for i, result in enumerate(self.results, 1):
-            config = self.configs[i-1]
+        for config_index, result in zip(self.result_indices, self.results):
+            config = self.configs[config_index]
             
             comparison_data.append({
-                'Strategy': f'Config {i}',
+                'Strategy': f'Config {config_index + 1}',
                 'Initial Balance': result.initial_balance,
                 'Final Balance': result.final_balance,
                 'Total Return': result.total_return,
@@ -121,6 +224,9 @@ class StrategyComparator:
                 'Sortino Ratio': result.sortino_ratio,
                 'Max Drawdown %': result.max_drawdown,
                 'Volatility %': result.volatility,
+                'Alpha %': result.alpha,
+                'Beta': result.beta,
+                'Information Ratio': result.information_ratio,
                 'Total Trades': result.total_trades,
                 'Win Rate %': result.win_rate,
                 'Profit Factor': result.profit_factor,
@@ -194,7 +300,47 @@ class StrategyComparator:
         
         best_idx = max(range(len(self.results)), key=lambda i: metric_map[metric](self.results[i]))
         
-        return self.configs[best_idx], self.results[best_idx]
+        return self.configs[self.result_indices[best_idx]], self.results[best_idx]
+    
+    def generate_monte_carlo_report(
+        self,
+        num_simulations: int = 10000,
+        method: str = "returns",
+        confidence: float = 0.95,
+        block_size: int = 5,
+        seed: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Bootstrap every strategy's results and tabulate confidence intervals.
+        
+        Args:
+            num_simulations: Bootstrap paths per strategy
+            method: "returns" (daily returns) or "trades" (round-trip trades)
+            confidence: Two-sided confidence level of the reported intervals
+            block_size: Consecutive observations per bootstrap block
+            seed: Seed for reproducible paths
+        
+        Returns:
+            DataFrame with median and interval bounds per strategy
+        """
+        label = f"ci_{confidence * 100:g}"
+        pct = f"{confidence:.0%}"
+        rows = []
+        
+        for config_index, result in zip(self.result_indices, self.results):
+            analyzer = MonteCarloAnalyzer(result, num_simulations, block_size, seed=seed)
+            summary = analyzer.confidence_intervals(method, (confidence,))
+            
+            row = {'Strategy': f'Config {config_index + 1}'}
+            for metric, name in [('final_equity', 'Final Equity'), ('max_drawdown_pct', 'Max Drawdown %'),
+                                 ('sharpe_ratio', 'Sharpe Ratio')]:
+                row[f'{name} (median)'] = summary[metric]['median']
+                row[f'{name} {pct} Low'] = summary[metric][f'{label}_lower']
+                row[f'{name} {pct} High'] = summary[metric][f'{label}_upper']
+            row['Probability of Loss %'] = summary['probability_of_loss'] * 100
+            rows.append(row)
+        
+        return pd.DataFrame(rows)
     
     def export_comparison(self, filepath: str):
         """
@@ -213,7 +359,8 @@ def compare_risk_levels(
     risk_levels: List[float],
     base_config: BacktestConfig,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    max_workers: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Quick comparison of different risk levels.
@@ -224,6 +371,7 @@ def compare_risk_levels(
         base_config: Base configuration to modify
         start_date: Start date (optional)
         end_date: End date (optional)
+        max_workers: Number of concurrent workers (optional)
     
     Returns:
         DataFrame with comparison results
@@ -235,7 +383,7 @@ def compare_risk_levels(
         config.risk_per_trade_pct = risk
         comparator.add_strategy(config, name=f"{risk}% Risk")
     
-    results_df = comparator.run_comparison(ticker, start_date, end_date)
+    results_df = comparator.run_comparison(ticker, start_date, end_date, max_workers=max_workers)
     comparator.print_comparison()
     
     return results_df
@@ -245,7 +393,8 @@ def compare_position_sizing_methods(
     ticker: str,
     base_config: BacktestConfig,
     start_date: Optional[str] = None,
-    end_date: Optional[str] = None
+    end_date: Optional[str] = None,
+    max_workers: Optional[int] = None
 ) -> pd.DataFrame:
     """
     Compare different position sizing methods.
@@ -255,6 +404,7 @@ def compare_position_sizing_methods(
         base_config: Base configuration to modify
         start_date: Start date (optional)
         end_date: End date (optional)
+        max_workers: Number of concurrent workers (optional)
     
     Returns:
         DataFrame with comparison results
@@ -268,7 +418,7 @@ def compare_position_sizing_methods(
         config.position_sizing_method = method
         comparator.add_strategy(config, name=method)
     
-    results_df = comparator.run_comparison(ticker, start_date, end_date)
+    results_df = comparator.run_comparison(ticker, start_date, end_date, max_workers=max_workers)
     comparator.print_comparison()
     
     return results_df
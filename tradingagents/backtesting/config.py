@@ -9,6 +9,12 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
 
+# Settings that do not change a backtest's outcome (caching, concurrency, checkpoints, events)
+BOOKKEEPING_FIELDS = (
+    'use_decision_cache', 'decision_cache_dir', 'decision_workers', 'llm_rate_limits',
+    'checkpoint_interval', 'checkpoint_dir', 'event_interval'
+)
+
 
 @dataclass
 class BacktestConfig:
@@ -34,9 +40,13 @@ class BacktestConfig:
     # Backtest settings
     start_date: Optional[str] = None
     end_date: Optional[str] = None
-    benchmark: str = "SPY"
+    benchmark: Optional[str] = None  # e.g. "SPY" to compute benchmark-relative metrics (fetches its history)
     data_interval: str = "daily"  # daily, weekly, intraday
     
+    # Intraday settings (IntradayEngine)
+    regular_hours_only: bool = True  # Only trade bars inside the exchange's regular session
+    flatten_eod: bool = True  # Close any open position on each session's last tradable bar
+    
     # Walk-forward settings
     train_period_days: int = 252  # 1 year
     test_period_days: int = 63  # 3 months
@@ -46,6 +56,21 @@ class BacktestConfig:
     risk_per_trade_pct: float = 1.0  # 1% of account per trade
     max_position_size_pct: float = 20.0  # Max 20% of account per position
     
+    # Agent decision cache
+    use_decision_cache: bool = True  # Replay cached agent decisions on reruns
+    decision_cache_dir: str = "backtest_decision_cache"
+    
+    # Concurrent agent decisions
+    decision_workers: int = 1  # >1 generates all decisions on a thread pool before replaying trades (see BacktestEngine graph_factory)
+    llm_rate_limits: Optional[Dict[str, float]] = None  # Max requests per minute by llm_provider
+    
+    # Checkpointing of agent-driven runs
+    checkpoint_interval: int = 10  # Save progress every N bars (0 disables)
+    checkpoint_dir: str = "backtest_checkpoints"
+    
+    # Progress events for engine listeners
+    event_interval: int = 1  # Emit a progress event every N bars
+    
     def __post_init__(self):
         """Validate configuration after initialization."""
         self._validate()
@@ -67,6 +92,15 @@ class BacktestConfig:
         if self.max_position_size_pct <= 0 or self.max_position_size_pct > 100:
             raise ValueError("max_position_size_pct must be between 0 and 100")
         
+        if self.decision_workers < 1:
+            raise ValueError("decision_workers must be at least 1")
+        
+        if self.checkpoint_interval < 0:
+            raise ValueError("checkpoint_interval must be non-negative")
+        
+        if self.event_interval < 1:
+            raise ValueError("event_interval must be at least 1")
+        
         if self.data_interval not in ["daily", "weekly", "intraday"]:
             raise ValueError("data_interval must be 'daily', 'weekly', or 'intraday'")
     
@@ -82,6 +116,13 @@ class BacktestConfig:
     def copy(self) -> 'BacktestConfig':
         """Create a copy of this configuration."""
         return BacktestConfig.from_dict(self.to_dict())
+    
+    def simulation_dict(self) -> Dict[str, Any]:
+        """Configuration as a dictionary without BOOKKEEPING_FIELDS (identifies a run)."""
+        config_dict = self.to_dict()
+        for key in BOOKKEEPING_FIELDS:
+            config_dict.pop(key, None)
+        return config_dict
 
 
 @dataclass
@@ -125,6 +166,14 @@ class BacktestResults:
     avg_loss: float = 0.0
     avg_holding_days: float = 0.0
     
+    # Benchmark-relative metrics (vs config.benchmark)
+    benchmark_return_pct: float = 0.0
+    excess_return_pct: float = 0.0
+    alpha: float = 0.0
+    beta: float = 0.0
+    tracking_error: float = 0.0
+    information_ratio: float = 0.0
+    
     # Metadata
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     
@@ -178,6 +227,14 @@ Trade Statistics:
   Avg Win: ${self.avg_win:.2f}
   Avg Loss: ${self.avg_loss:.2f}
   Avg Holding Days: {self.avg_holding_days:.1f}
+
+Benchmark Comparison:
+  Benchmark Return: {self.benchmark_return_pct:.2f}%
+  Excess Return: {self.excess_return_pct:.2f}%
+  Alpha: {self.alpha:.2f}%
+  Beta: {self.beta:.2f}
+  Tracking Error: {self.tracking_error:.2f}%
+  Information Ratio: {self.information_ratio:.2f}
 """
     
     def analyze(self):
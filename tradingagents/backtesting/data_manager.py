@@ -9,8 +9,10 @@ import os
 import json
 import logging
 from typing import Tuple, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
+import numpy as np
 import pandas as pd
+from tradingagents.backtesting.trading_calendar import get_calendar, calendar_for_ticker
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,8 @@ class HistoricalDataManager:
         """
         self.cache_dir = cache_dir
         self.data_cache = {}  # In-memory cache
+        self.benchmark_cache = {}  # (ticker, interval, start, end) -> read-only close series
+        self.validation_cache = {}  # (ticker, interval, calendar, range, data shape) -> (is_valid, issues)
         
         # Create cache directory if it doesn't exist
         os.makedirs(self.cache_dir, exist_ok=True)
@@ -47,41 +51,165 @@ class HistoricalDataManager:
         """
         Retrieve historical data for a ticker.
         
-        Checks cache first, then fetches from Alpha Vantage MCP if needed.
+        Keeps one canonical store per (ticker, interval) together with the date
+        range it covers. Requests inside that range are served by slicing; requests
+        extending it fetch only the missing head and/or tail and merge them in.
         
         Args:
             ticker: Stock symbol
             start_date: Start date (YYYY-MM-DD)
-            end_date: End date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD, exclusive like yfinance)
             interval: Data frequency (daily, weekly, intraday)
             
         Returns:
             DataFrame with OHLCV data indexed by date
         """
-        cache_key = f"{ticker}_{start_date}_{end_date}_{interval}"
-        
-        # Check in-memory cache
-        if cache_key in self.data_cache:
-            logger.debug(f"Using in-memory cache for {cache_key}")
-            return self.data_cache[cache_key].copy()
-        
-        # Check file cache
-        cached_file = self._get_cache_file_path(cache_key)
-        if os.path.exists(cached_file):
-            logger.debug(f"Loading from file cache: {cached_file}")
-            data = self._load_from_cache(cached_file)
-            self.data_cache[cache_key] = data
+        cache_key = f"{ticker}_{interval}"
+        start = pd.Timestamp(start_date).normalize()
+        end = pd.Timestamp(end_date).normalize()
+        
+        # Check in-memory cache, then file cache
+        entry = self.data_cache.get(cache_key)
+        if entry is None:
+            entry = self._load_from_cache(cache_key)
+            if entry is not None:
+                logger.debug(f"Loaded {cache_key} from file cache")
+                self.data_cache[cache_key] = entry
+        
+        if entry is not None:
+            data, covered_start, covered_end = entry
+            if covered_start <= start and end <= covered_end:
+                logger.debug(f"Serving {ticker} {start_date}..{end_date} from cache")
+                return self._slice_range(data, start, end)
+        
+        # Fetch only what the store does not cover yet
+        if entry is None:
+            missing = [(start, end)]
+            data, covered_start, covered_end = None, start, end
+        else:
+            missing = []
+            if start < covered_start:
+                missing.append((start, covered_start))
+            if end > covered_end:
+                missing.append((covered_end, end))
+        
+        fetched = []
+        for fetch_start, fetch_end in missing:
+            logger.info(f"Fetching data from MCP for {ticker} ({fetch_start.date()} to {fetch_end.date()})")
+            fetched.append(self._fetch_from_mcp(
+                ticker, fetch_start.strftime('%Y-%m-%d'), fetch_end.strftime('%Y-%m-%d'), interval
+            ))
+        
+        frames = [f for f in ([data] if data is not None else []) + fetched if not f.empty]
+        if frames:
+            merged = pd.concat(frames)
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+        else:
+            merged = fetched[0] if fetched else data
+        
+        # Never mark today or the future as covered; those bars may still arrive
+        today = pd.Timestamp.now().normalize()
+        covered_start = min(start, covered_start)
+        covered_end = min(max(end, covered_end), today)
+        
+        entry = (merged, covered_start, covered_end)
+        self._save_to_cache(cache_key, entry)
+        self.data_cache[cache_key] = entry
+        
+        return self._slice_range(merged, start, end)
+    
+    def get_benchmark_series(
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        interval: str = "daily"
+    ) -> pd.Series:
+        """
+        Retrieve a benchmark close series, memoized per date range.
+        
+        Loads through get_historical_data() (so the usual caching applies) and
+        keeps the resulting read-only close series, so many backtests over the
+        same window share one array.
+        
+        Args:
+            ticker: Benchmark symbol (e.g. SPY)
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD, exclusive)
+            interval: Data frequency (daily, weekly, intraday)
+            
+        Returns:
+            Close prices indexed by (timezone-naive) date
+        """
+        key = (ticker, interval, start_date, end_date)
+        series = self.benchmark_cache.get(key)
+        if series is not None:
+            return series
+        
+        data = self.get_historical_data(ticker, start_date, end_date, interval)
+        close = data['close'].to_numpy(dtype=float, copy=True) if not data.empty else np.empty(0)
+        close.flags.writeable = False
+        index = data.index.tz_localize(None) if getattr(data.index, 'tz', None) is not None else data.index
+        series = pd.Series(close, index=index, name=ticker, copy=False)
+        
+        self.benchmark_cache[key] = series
+        return series
+    
+    @staticmethod
+    def _slice_range(data: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        """Return rows with start <= date < end as a copy."""
+        if data.empty:
             return data.copy()
+        if data.index.tz is not None:
+            start = start.tz_localize(data.index.tz)
+            end = end.tz_localize(data.index.tz)
+        lo = data.index.searchsorted(start, side='left')
+        hi = data.index.searchsorted(end, side='left')
+        return data.iloc[lo:hi].copy()
+    
+    def get_price_panel(
+        self,
+        tickers: List[str],
+        start_date: str,
+        end_date: str,
+        interval: str = "daily"
+    ) -> pd.DataFrame:
+        """
+        Retrieve historical data for several tickers as one aligned panel.
+        
+        Each ticker goes through get_historical_data(), so the usual caching applies.
+        Dates are the union of all tickers' dates; a ticker with no bar on a date
+        has NaN in that row.
         
-        # Fetch from MCP
-        logger.info(f"Fetching data from MCP for {ticker} ({start_date} to {end_date})")
-        data = self._fetch_from_mcp(ticker, start_date, end_date, interval)
+        Args:
+            tickers: Stock symbols
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            interval: Data frequency (daily, weekly, intraday)
+            
+        Returns:
+            DataFrame indexed by date with (ticker, field) MultiIndex columns
+        """
+        frames = {}
+        for ticker in tickers:
+            try:
+                data = self.get_historical_data(ticker, start_date, end_date, interval)
+            except Exception as e:
+                logger.warning(f"Skipping {ticker} in price panel: {e}")
+                continue
+            if data.empty:
+                logger.warning(f"Skipping {ticker} in price panel: no data")
+                continue
+            if data.index.tz is not None:
+                data.index = data.index.tz_localize(None)
+            frames[ticker] = data[['open', 'high', 'low', 'close', 'volume']]
         
-        # Cache it
-        self._save_to_cache(cached_file, data)
-        self.data_cache[cache_key] = data
+        if not frames:
+            return pd.DataFrame()
         
-        return data.copy()
+        panel = pd.concat(frames, axis=1).sort_index()
+        panel.columns.names = ['ticker', 'field']
+        return panel
     
     def _fetch_from_mcp(
         self,
@@ -131,39 +259,81 @@ class HistoricalDataManager:
         """Generate cache file path for a cache key."""
         return os.path.join(self.cache_dir, f"{cache_key}.parquet")
     
-    def _save_to_cache(self, filepath: str, data: pd.DataFrame):
-        """Save DataFrame to cache file."""
+    def _get_coverage_file_path(self, cache_key: str) -> str:
+        """Generate path of the sidecar file recording the covered date range."""
+        return os.path.join(self.cache_dir, f"{cache_key}.json")
+    
+    def _save_to_cache(self, cache_key: str, entry: Tuple[pd.DataFrame, pd.Timestamp, pd.Timestamp]):
+        """Save a canonical store and its coverage to the file cache."""
+        data, covered_start, covered_end = entry
+        filepath = self._get_cache_file_path(cache_key)
+        coverage_path = self._get_coverage_file_path(cache_key)
+        tmp_suffix = f".{os.getpid()}.tmp"
         try:
-            data.to_parquet(filepath)
+            data.to_parquet(filepath + tmp_suffix)
+            with open(coverage_path + tmp_suffix, 'w') as f:
+                json.dump({
+                    'start': covered_start.strftime('%Y-%m-%d'),
+                    'end': covered_end.strftime('%Y-%m-%d')
+                }, f)
+            os.replace(filepath + tmp_suffix, filepath)
+            os.replace(coverage_path + tmp_suffix, coverage_path)
             logger.debug(f"Saved to cache: {filepath}")
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
     
-    def _load_from_cache(self, filepath: str) -> pd.DataFrame:
-        """Load DataFrame from cache file."""
+    def _load_from_cache(self, cache_key: str) -> Optional[Tuple[pd.DataFrame, pd.Timestamp, pd.Timestamp]]:
+        """Load a canonical store and its coverage from the file cache, if present."""
+        filepath = self._get_cache_file_path(cache_key)
+        coverage_path = self._get_coverage_file_path(cache_key)
+        if not (os.path.exists(filepath) and os.path.exists(coverage_path)):
+            return None
         try:
-            return pd.read_parquet(filepath)
+            with open(coverage_path, 'r') as f:
+                coverage = json.load(f)
+            data = pd.read_parquet(filepath)
+            return data, pd.Timestamp(coverage['start']), pd.Timestamp(coverage['end'])
         except Exception as e:
             logger.warning(f"Failed to load cache: {e}")
-            raise
+            return None
     
     def validate_data(
         self,
         data: pd.DataFrame,
         start_date: str,
-        end_date: str
+        end_date: str,
+        ticker: Optional[str] = None,
+        interval: str = "daily",
+        calendar: Optional[str] = None
     ) -> Tuple[bool, List[str]]:
         """
         Validate data completeness and quality.
         
+        Missing bars are found exactly, as the trading sessions of the exchange
+        calendar that have no bar. With a ticker, results are memoized per
+        (ticker, interval, calendar, range) and the data's shape, so repeated
+        pre-flight checks over a universe cost a dictionary lookup.
+        
         Args:
             data: DataFrame to validate
             start_date: Expected start date
-            end_date: Expected end date
+            end_date: Expected end date (inclusive)
+            ticker: Stock symbol (enables memoization and picks the calendar)
+            interval: Data frequency (daily, weekly, intraday)
+            calendar: "NYSE" or "crypto" (default: guessed from ticker, else NYSE)
             
         Returns:
             Tuple of (is_valid, list_of_issues)
         """
+        calendar = calendar or (calendar_for_ticker(ticker) if ticker else "NYSE")
+        memo_key = None
+        if ticker is not None and not data.empty:
+            memo_key = (ticker, interval, calendar, start_date, end_date,
+                        len(data), data.index[0], data.index[-1])
+            cached = self.validation_cache.get(memo_key)
+            if cached is not None:
+                return cached[0], list(cached[1])
+        
         issues = []
         
         # Check if data is empty
@@ -178,7 +348,8 @@ class HistoricalDataManager:
             issues.append(f"Missing columns: {missing_cols}")
         
         # Check for NaN values
-        nan_counts = data[required_cols].isna().sum()
+        present_cols = [col for col in required_cols if col in data.columns]
+        nan_counts = data[present_cols].isna().sum()
         if nan_counts.any():
             issues.append(f"NaN values found: {nan_counts[nan_counts > 0].to_dict()}")
         
@@ -194,20 +365,48 @@ class HistoricalDataManager:
         if actual_end < expected_end:
             issues.append(f"Data ends earlier than expected: {actual_end} vs {expected_end}")
         
-        # Check for gaps (missing trading days)
-        date_diffs = data.index.to_series().diff()
-        large_gaps = date_diffs[date_diffs > timedelta(days=7)]  # More than a week
-        if len(large_gaps) > 0:
-            issues.append(f"Found {len(large_gaps)} large gaps in data")
+        # Check for missing trading sessions (never expect bars after today)
+        check_end = min(expected_end, pd.Timestamp.now().normalize())
+        missing = get_calendar(calendar).missing_sessions(data.index, expected_start, check_end, interval)
+        if len(missing) > 0:
+            examples = ", ".join(d.strftime('%Y-%m-%d') for d in missing[:5])
+            more = f" and {len(missing) - 5} more" if len(missing) > 5 else ""
+            issues.append(f"Missing {len(missing)} {calendar} trading sessions: {examples}{more}")
         
         is_valid = len(issues) == 0
+        if memo_key is not None:
+            self.validation_cache[memo_key] = (is_valid, tuple(issues))
         return is_valid, issues
     
+    def get_missing_sessions(
+        self,
+        data: pd.DataFrame,
+        start_date: str,
+        end_date: str,
+        interval: str = "daily",
+        calendar: str = "NYSE"
+    ) -> pd.DatetimeIndex:
+        """
+        Trading sessions in [start_date, end_date] without a bar in data.
+        
+        Args:
+            data: DataFrame indexed by date
+            start_date: First expected date
+            end_date: Last expected date (inclusive)
+            interval: Data frequency (daily, weekly, intraday)
+            calendar: "NYSE" or "crypto"
+            
+        Returns:
+            Missing session dates
+        """
+        return get_calendar(calendar).missing_sessions(data.index, start_date, end_date, interval)
+    
     def get_trading_dates(
         self,
         start_date: str,
         end_date: str,
-        data: Optional[pd.DataFrame] = None
+        data: Optional[pd.DataFrame] = None,
+        calendar: str = "NYSE"
     ) -> List[str]:
         """
         Get list of valid trading dates in range.
@@ -216,6 +415,7 @@ class HistoricalDataManager:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             data: Optional DataFrame to extract dates from
+            calendar: Exchange calendar used without data ("NYSE" or "crypto")
             
         Returns:
             List of trading dates as strings (YYYY-MM-DD)
@@ -226,9 +426,8 @@ class HistoricalDataManager:
             dates = dates[(dates >= start_date) & (dates <= end_date)]
             return [d.strftime('%Y-%m-%d') for d in dates]
         else:
-            # Generate business days (excluding weekends)
-            date_range = pd.bdate_range(start=start_date, end=end_date)
-            return [d.strftime('%Y-%m-%d') for d in date_range]
+            # Sessions of the exchange calendar (weekends and holidays excluded)
+            return list(get_calendar(calendar).sessions(start_date, end_date).strftime('%Y-%m-%d'))
     
     def clear_cache(self, ticker: Optional[str] = None):
         """
@@ -239,19 +438,25 @@ class HistoricalDataManager:
         """
         if ticker:
             # Clear specific ticker from memory
-            keys_to_remove = [k for k in self.data_cache.keys() if k.startswith(ticker)]
+            keys_to_remove = [k for k in self.data_cache.keys() if k.startswith(f"{ticker}_")]
             for key in keys_to_remove:
                 del self.data_cache[key]
+            for key in [k for k in self.benchmark_cache if k[0] == ticker]:
+                del self.benchmark_cache[key]
+            for key in [k for k in self.validation_cache if k[0] == ticker]:
+                del self.validation_cache[key]
             
             # Clear specific ticker from file cache
             for filename in os.listdir(self.cache_dir):
-                if filename.startswith(ticker):
+                if filename.startswith(f"{ticker}_"):
                     os.remove(os.path.join(self.cache_dir, filename))
             
             logger.info(f"Cleared cache for {ticker}")
         else:
             # Clear all cache
             self.data_cache.clear()
+            self.benchmark_cache.clear()
+            self.validation_cache.clear()
             
             for filename in os.listdir(self.cache_dir):
                 os.remove(os.path.join(self.cache_dir, filename))
@@ -0,0 +1,197 @@
+"""
+Agent Decision Cache
+
+Persists TradingAgentsGraph decisions to disk so repeated backtests over the same
+dates can replay them instead of re-running the multi-agent LLM graph.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DecisionCache:
+    """
+    On-disk store of agent decisions for backtesting.
+
+    Decisions are keyed by (ticker, trade_date) inside a namespace derived from the
+    graph fingerprint (analyst set, model names, a hash of the graph config and the
+    bar interval).
+    Each decision is written to its own JSON file so concurrent backtests never
+    clobber each other's entries.
+    """
+
+    def __init__(self, cache_dir: str = "backtest_decision_cache"):
+        """
+        Initialize the decision cache.
+
+        Args:
+            cache_dir: Directory for cached decisions
+        """
+        self.cache_dir = cache_dir
+        self.memory_cache: Dict[str, Dict[str, Any]] = {}  # In-memory cache
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        logger.info(f"DecisionCache initialized with cache_dir: {cache_dir}")
+
+    @staticmethod
+    def graph_fingerprint(trading_graph, data_interval: Optional[str] = None) -> str:
+        """
+        Build a stable fingerprint for a trading graph.
+
+        Combines the selected analysts, LLM provider and model names with a hash of
+        the full graph configuration, so any prompt or config change starts a fresh
+        namespace. The bar interval is part of it too: the graph sees daily and
+        weekly bars (or timeframes) for the same date and can decide differently.
+
+        Args:
+            trading_graph: TradingAgentsGraph (or compatible) instance
+            data_interval: Bar interval the graph is run on (daily, weekly, ...)
+
+        Returns:
+            Hex digest identifying the graph setup
+        """
+        graph_config = getattr(trading_graph, 'config', None) or {}
+        if not isinstance(graph_config, dict):
+            graph_config = {}
+
+        analysts = getattr(trading_graph, 'selected_analysts', None)
+        config_json = json.dumps(graph_config, sort_keys=True, default=str)
+
+        key_parts = {
+            'graph': type(trading_graph).__name__,
+            'analysts': sorted(analysts) if analysts else None,
+            'llm_provider': graph_config.get('llm_provider'),
+            'deep_think_llm': graph_config.get('deep_think_llm'),
+            'quick_think_llm': graph_config.get('quick_think_llm'),
+            'config_hash': hashlib.sha256(config_json.encode()).hexdigest(),
+        }
+        if data_interval is not None:
+            key_parts['data_interval'] = data_interval
+        key_json = json.dumps(key_parts, sort_keys=True)
+        return hashlib.sha256(key_json.encode()).hexdigest()[:16]
+
+    def get(self, fingerprint: str, ticker: str, trade_date: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached decision.
+
+        Args:
+            fingerprint: Graph fingerprint from graph_fingerprint()
+            ticker: Stock symbol
+            trade_date: Trade date (YYYY-MM-DD)
+
+        Returns:
+            Cached agent result, or None if not cached
+        """
+        cache_key = self._cache_key(fingerprint, ticker, trade_date)
+
+        if cache_key in self.memory_cache:
+            self.hits += 1
+            return self.memory_cache[cache_key]
+
+        cached_file = self._get_cache_file_path(fingerprint, ticker, trade_date)
+        if os.path.exists(cached_file):
+            try:
+                with open(cached_file, 'r') as f:
+                    decision = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to load cached decision {cached_file}: {e}")
+            else:
+                self.memory_cache[cache_key] = decision
+                self.hits += 1
+                return decision
+
+        self.misses += 1
+        return None
+
+    def put(self, fingerprint: str, ticker: str, trade_date: str, decision: Dict[str, Any]):
+        """
+        Store a decision.
+
+        Args:
+            fingerprint: Graph fingerprint from graph_fingerprint()
+            ticker: Stock symbol
+            trade_date: Trade date (YYYY-MM-DD)
+            decision: Agent result to cache
+        """
+        # Round-trip through JSON so memory and disk hits return identical objects
+        decision = json.loads(json.dumps(decision, default=str))
+        self.memory_cache[self._cache_key(fingerprint, ticker, trade_date)] = decision
+
+        cached_file = self._get_cache_file_path(fingerprint, ticker, trade_date)
+        tmp_file = f"{cached_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cached_file), exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(decision, f)
+            os.replace(tmp_file, cached_file)
+        except OSError as e:
+            logger.warning(f"Failed to save cached decision: {e}")
+
+    def get_cached_dates(self, fingerprint: str, ticker: str) -> List[str]:
+        """
+        List trade dates with a cached decision.
+
+        Args:
+            fingerprint: Graph fingerprint from graph_fingerprint()
+            ticker: Stock symbol
+
+        Returns:
+            Sorted list of trade dates (YYYY-MM-DD)
+        """
+        ticker_dir = os.path.join(self.cache_dir, fingerprint, ticker)
+        if not os.path.isdir(ticker_dir):
+            return []
+        return sorted(f[:-5] for f in os.listdir(ticker_dir) if f.endswith('.json'))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups) if lookups else 0.0
+        }
+
+    def clear(self, ticker: Optional[str] = None):
+        """
+        Clear cached decisions.
+
+        Args:
+            ticker: If provided, clear only this ticker's decisions. Otherwise clear all.
+        """
+        import shutil
+
+        if ticker:
+            keys_to_remove = [k for k in self.memory_cache if k.split('/')[1] == ticker]
+            for key in keys_to_remove:
+                del self.memory_cache[key]
+
+            for fingerprint in os.listdir(self.cache_dir):
+                ticker_dir = os.path.join(self.cache_dir, fingerprint, ticker)
+                if os.path.isdir(ticker_dir):
+                    shutil.rmtree(ticker_dir)
+
+            logger.info(f"Cleared decision cache for {ticker}")
+        else:
+            self.memory_cache.clear()
+
+            for entry in os.listdir(self.cache_dir):
+                shutil.rmtree(os.path.join(self.cache_dir, entry), ignore_errors=True)
+
+            logger.info("Cleared all decision cache")
+
+    @staticmethod
+    def _cache_key(fingerprint: str, ticker: str, trade_date: str) -> str:
+        return f"{fingerprint}/{ticker}/{trade_date}"
+
+    def _get_cache_file_path(self, fingerprint: str, ticker: str, trade_date: str) -> str:
+        """Generate cache file path for a decision."""
+        return os.path.join(self.cache_dir, fingerprint, ticker, f"{trade_date}.json")
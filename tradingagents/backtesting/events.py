@@ -0,0 +1,139 @@
+"""
+Backtest Events
+Push-based progress, trade fill and metric events from a running backtest, with
+adapters for Server-Sent Events and MCP progress notifications.
+"""
+import json
+import queue
+import logging
+import threading
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# started -> progress/trade ... -> completed | failed
+EVENT_TYPES = ('started', 'progress', 'trade', 'completed', 'failed')
+TERMINAL_EVENTS = ('completed', 'failed')
+
+BacktestListener = Callable[['BacktestEvent'], None]
+
+
+@dataclass
+class BacktestEvent:
+    """One event emitted by BacktestEngine to its listeners."""
+    type: str
+    ticker: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert event to dictionary."""
+        return asdict(self)
+
+
+class EventStream:
+    """
+    Runs a backtest on a background thread and yields its events as they arrive.
+
+    Bridges the engine's synchronous listener callbacks to an iterator, so a
+    web handler can forward events while the backtest is still running.
+    """
+
+    _DONE = object()
+
+    def __init__(self, engine):
+        """
+        Initialize the stream.
+
+        Args:
+            engine: BacktestEngine to listen to
+        """
+        self.engine = engine
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.Queue" = queue.Queue()
+
+    def __call__(self, event: BacktestEvent):
+        self._queue.put(event)
+
+    def run(self, method: str = "run_backtest", *args, **kwargs) -> Iterator[BacktestEvent]:
+        """
+        Start an engine run and yield its events until it finishes.
+
+        Args:
+            method: Engine method to call (e.g. "run_backtest")
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+
+        Yields:
+            BacktestEvent objects in emission order; afterwards self.result
+            holds the BacktestResults (or self.error the exception)
+        """
+        def worker():
+            try:
+                self.result = getattr(self.engine, method)(*args, **kwargs)
+            except BaseException as e:
+                self.error = e
+            finally:
+                self._queue.put(self._DONE)
+
+        self.engine.add_listener(self)
+        thread = threading.Thread(target=worker, name="backtest-events", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is self._DONE:
+                    break
+                yield item
+        finally:
+            self.engine.remove_listener(self)
+
+
+def format_sse(event: BacktestEvent) -> str:
+    """
+    Encode an event as a Server-Sent Events message.
+
+    Args:
+        event: Event to encode
+
+    Returns:
+        "event: <type>" and "data: <json>" lines terminated by a blank line
+    """
+    return f"event: {event.type}\ndata: {json.dumps(event.to_dict(), default=str)}\n\n"
+
+
+def mcp_progress_params(event: BacktestEvent) -> Dict[str, Any]:
+    """
+    Map an event to the params of an MCP notifications/progress message.
+
+    The caller adds the request's progressToken.
+
+    Args:
+        event: Event to map
+
+    Returns:
+        Dictionary with progress, total and a human-readable message
+    """
+    data = event.data
+    total = data.get('total_days') or 0
+    progress = data.get('completed_days', 0)
+
+    if event.type == 'started':
+        message = f"Backtesting {event.ticker} over {total} bars"
+    elif event.type == 'progress':
+        message = f"{data['date']}: equity ${data['equity']:,.2f}"
+    elif event.type == 'trade':
+        message = f"{data['date']}: {data['action']} {data['shares']:g} {data['ticker']} @ ${data['price']:,.2f}"
+    elif event.type == 'completed':
+        progress = total
+        message = f"Completed: {data.get('total_return_pct', 0.0):.2f}% return"
+    else:
+        message = f"Failed: {data.get('error', 'unknown error')}"
+
+    params = {'progress': progress, 'message': message}
+    if total:
+        params['total'] = total
+    return params
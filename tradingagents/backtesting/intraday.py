@@ -0,0 +1,390 @@
+"""
+Intraday Backtesting
+Backtests over memory-mapped bar arrays (int64 epoch timestamps and float64 OHLCV)
+iterated by integer index, with exchange session boundaries and end-of-day
+flattening.
+"""
+import os
+import logging
+from typing import Callable, Dict, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+from tradingagents.backtesting.config import BacktestConfig, BacktestResults
+from tradingagents.backtesting.data_manager import HistoricalDataManager
+from tradingagents.backtesting.backtest_engine import BacktestEngine
+from tradingagents.backtesting.trading_calendar import get_calendar, calendar_for_ticker
+from tradingagents.backtesting import vectorized
+
+logger = logging.getLogger(__name__)
+
+DAY_NS = 86_400 * 10**9
+BAR_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+# Calendar -> (exchange time zone, regular session open, regular session close)
+SESSION_HOURS = {
+    'NYSE': ('America/New_York', '09:30', '16:00'),
+    'crypto': ('UTC', None, None),
+}
+
+
+def _time_of_day_ns(hhmm: str) -> int:
+    hours, minutes = hhmm.split(':')
+    return (int(hours) * 60 + int(minutes)) * 60 * 10**9
+
+
+class BarArrays:
+    """
+    One ticker's bars as column arrays.
+
+    timestamp holds UTC epoch nanoseconds (int64, bar start); open, high, low,
+    close and volume are float64. Bars returned by load() are read-only memory
+    maps, so years of minute bars are paged in on demand instead of read up front.
+    """
+
+    def __init__(self, timestamp: np.ndarray, open: np.ndarray, high: np.ndarray,
+                 low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, tz: str = "UTC") -> "BarArrays":
+        """
+        Build bar arrays from an OHLCV DataFrame indexed by timestamp.
+
+        Args:
+            data: DataFrame with open/high/low/close/volume columns
+            tz: Time zone of a naive index (e.g. the exchange's)
+
+        Returns:
+            BarArrays sorted by timestamp
+        """
+        index = pd.DatetimeIndex(data.index)
+        index = index.tz_localize(tz) if index.tz is None else index
+        timestamp = index.tz_convert('UTC').tz_localize(None).to_numpy(dtype='datetime64[ns]').view(np.int64)
+        order = np.argsort(timestamp, kind='stable')
+        columns = {'timestamp': timestamp[order]}
+        for name in BAR_COLUMNS[1:]:
+            columns[name] = data[name].to_numpy(dtype=np.float64)[order]
+        return cls(**columns)
+
+    def save(self, directory: str):
+        """Write each column to <directory>/<column>.npy."""
+        os.makedirs(directory, exist_ok=True)
+        for name in BAR_COLUMNS:
+            path = os.path.join(directory, f"{name}.npy")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(getattr(self, name)))
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "BarArrays":
+        """
+        Load bars written by save().
+
+        Args:
+            directory: Directory holding the column files
+            mmap: Memory-map the columns read-only instead of reading them
+
+        Returns:
+            BarArrays
+        """
+        mode = 'r' if mmap else None
+        return cls(**{name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode)
+                      for name in BAR_COLUMNS})
+
+    @staticmethod
+    def exists(directory: str) -> bool:
+        return all(os.path.exists(os.path.join(directory, f"{name}.npy")) for name in BAR_COLUMNS)
+
+    def between(self, start, end) -> "BarArrays":
+        """
+        Bars with start <= timestamp < end (views, no copy).
+
+        Args:
+            start: First timestamp (naive values are taken as UTC)
+            end: End timestamp (exclusive)
+        """
+        lo, hi = np.searchsorted(self.timestamp, [pd.Timestamp(start).value, pd.Timestamp(end).value])
+        return BarArrays(*(getattr(self, name)[lo:hi] for name in BAR_COLUMNS))
+
+    def index(self, tz: Optional[str] = None) -> pd.DatetimeIndex:
+        """Timestamps as a DatetimeIndex in UTC, or as naive local time in tz."""
+        index = pd.DatetimeIndex(self.timestamp.astype('datetime64[ns]'), tz='UTC')
+        return index.tz_convert(tz).tz_localize(None) if tz is not None else index
+
+
+def session_layout(bars: BarArrays, calendar: str = "NYSE",
+                   regular_hours_only: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Locate trading sessions in a bar series.
+
+    A bar is tradable when its exchange-local date is a session of the calendar
+    and, with regular_hours_only, it starts inside the regular session hours.
+
+    Args:
+        bars: Bars to lay out
+        calendar: Trading calendar name ("NYSE" or "crypto")
+        regular_hours_only: Exclude pre- and post-market bars
+
+    Returns:
+        Dictionary with local_ns (exchange-local epoch ns), tradable (bool mask),
+        and session_first / session_last (indexes of each session's first and
+        last tradable bar)
+    """
+    tz, open_time, close_time = SESSION_HOURS[calendar]
+    local_ns = bars.index(tz).to_numpy(dtype='datetime64[ns]').view(np.int64)
+    days = local_ns // DAY_NS
+
+    unique_days, day_of_bar = np.unique(days, return_inverse=True)
+    tradable = get_calendar(calendar).is_session(unique_days.astype('datetime64[D]'))[day_of_bar]
+    if regular_hours_only and open_time is not None:
+        time_of_day = local_ns - days * DAY_NS
+        tradable &= (time_of_day >= _time_of_day_ns(open_time)) & (time_of_day < _time_of_day_ns(close_time))
+
+    idx = np.flatnonzero(tradable)
+    session = days[idx]
+    boundary = session[1:] != session[:-1]
+    return {
+        'local_ns': local_ns,
+        'tradable': tradable,
+        'session_first': idx[np.concatenate([[True], boundary])] if len(idx) else idx,
+        'session_last': idx[np.concatenate([boundary, [True]])] if len(idx) else idx,
+    }
+
+
+class IntradayStrategy:
+    """
+    Base class for event-driven intraday strategies.
+
+    The engine walks the bars by integer index. It calls on_session_start() at
+    each session's first tradable bar, on_bar() for every tradable bar, and
+    on_session_end() after the session's last tradable bar. Read prices from the
+    bar arrays, e.g. bars.close[i].
+    """
+
+    def on_session_start(self, i: int, bars: BarArrays):
+        """Called before on_bar() for the first tradable bar of a session."""
+
+    def on_bar(self, i: int, bars: BarArrays, position: float) -> int:
+        """
+        Decide on bar i.
+
+        Args:
+            i: Bar index
+            bars: All bars of the run
+            position: Shares currently held
+
+        Returns:
+            1 to BUY, -1 to SELL, 0 to HOLD
+        """
+        return 0
+
+    def on_session_end(self, i: int, bars: BarArrays):
+        """Called after the last tradable bar of a session (after any flattening)."""
+
+
+class IntradayEngine(BacktestEngine):
+    """
+    Backtest engine for intraday bars.
+
+    Strategies are either rule-based signal generators (a callable returning one
+    BUY/SELL/HOLD code per bar, or a precomputed array) simulated in one
+    vectorized pass, or IntradayStrategy objects driven bar by bar. Both use the
+    same fill rules as run_signal_backtest(). Metrics are computed on
+    session-close equity; the per-bar equity of the last run is kept in
+    self.bar_equity.
+    """
+
+    def __init__(self, config: BacktestConfig,
+                 data_manager: Optional[HistoricalDataManager] = None,
+                 bar_store_dir: str = "backtest_bar_store",
+                 calendar: Optional[str] = None):
+        """
+        Initialize the intraday engine.
+
+        Args:
+            config: Backtest configuration (regular_hours_only and flatten_eod apply)
+            data_manager: Source of intraday bars
+            bar_store_dir: Directory of memory-mapped bar arrays
+            calendar: Trading calendar (default: guessed from the ticker)
+        """
+        super().__init__(config, data_manager=data_manager)
+        self.bar_store_dir = bar_store_dir
+        self.calendar = calendar
+        self.bar_equity: Optional[np.ndarray] = None
+
+    def load_bars(self, ticker: str, start_date: str, end_date: str) -> BarArrays:
+        """
+        Memory-mapped intraday bars for a ticker and period.
+
+        Bars are fetched once through the data manager and stored under
+        bar_store_dir; later runs map the stored arrays directly.
+
+        Args:
+            ticker: Stock symbol
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD, exclusive)
+
+        Returns:
+            Read-only memory-mapped BarArrays
+        """
+        directory = os.path.join(self.bar_store_dir, f"{ticker}_{start_date}_{end_date}")
+        if not BarArrays.exists(directory):
+            data = self.data_manager.get_historical_data(ticker, start_date, end_date, "intraday")
+            if data.empty:
+                raise ValueError(f"No intraday data available for {ticker}")
+            tz = SESSION_HOURS[self.calendar or calendar_for_ticker(ticker)][0]
+            BarArrays.from_frame(data, tz=tz).save(directory)
+            logger.info(f"Stored {len(data)} intraday bars for {ticker} in {directory}")
+        return BarArrays.load(directory)
+
+    def run_intraday_backtest(self, ticker: str,
+                              strategy: Union[IntradayStrategy, Callable[[BarArrays], np.ndarray],
+                                              Sequence, np.ndarray],
+                              start_date: Optional[str] = None,
+                              end_date: Optional[str] = None,
+                              bars: Optional[BarArrays] = None) -> BacktestResults:
+        """
+        Run an intraday backtest.
+
+        Signals on bars outside a session are ignored. With config.flatten_eod
+        the last tradable bar of every session is forced to SELL, so no position
+        is carried overnight.
+
+        Args:
+            ticker: Stock symbol
+            strategy: IntradayStrategy (event-driven), callable mapping
+                BarArrays to per-bar codes, or a precomputed signal array
+            start_date: Start date (uses config if None)
+            end_date: End date (uses config if None)
+            bars: Bars to use instead of load_bars()
+
+        Returns:
+            BacktestResults with timestamped trades and session-close equity
+        """
+        start_date = start_date or self.config.start_date
+        end_date = end_date or self.config.end_date
+        if bars is None and (not start_date or not end_date):
+            raise ValueError("Start and end dates must be provided")
+
+        calendar = self.calendar or calendar_for_ticker(ticker)
+
+        try:
+            if bars is None:
+                bars = self.load_bars(ticker, start_date, end_date)
+            if len(bars) == 0:
+                raise ValueError(f"No intraday data available for {ticker}")
+
+            layout = session_layout(bars, calendar, self.config.regular_hours_only)
+            self.total_days = len(bars)
+            self._emit_started(ticker, start_date, end_date)
+            logger.info(f"Processing {len(bars)} bars over {len(layout['session_last'])} {calendar} sessions...")
+
+            if isinstance(strategy, IntradayStrategy):
+                sim = self._run_bar_loop(bars, strategy, layout)
+            else:
+                signals = strategy(bars) if callable(strategy) else strategy
+                codes = vectorized.encode_signals(signals, bars.index())
+                codes[~layout['tradable']] = 0
+                if self.config.flatten_eod:
+                    codes[layout['session_last']] = -1
+                sim = vectorized.simulate_signals(
+                    bars.close, codes,
+                    self.config.initial_balance, self.config.commission_rate, self.config.slippage,
+                    self.config.risk_per_trade_pct, self.config.max_position_size_pct
+                )
+
+            self.completed_days = len(bars)
+            self.bar_equity = sim['equity']
+            results = self._intraday_results(ticker, start_date, end_date, bars, layout, sim)
+            logger.info(f"Intraday backtest completed. Final equity: ${results.final_balance:,.2f}")
+            self._emit_finished(ticker, results)
+            return results
+
+        except Exception as e:
+            logger.error(f"Intraday backtest failed: {e}")
+            self._emit_finished(ticker, error=e)
+            raise
+
+    def _run_bar_loop(self, bars: BarArrays, strategy: IntradayStrategy,
+                      layout: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Drive an IntradayStrategy bar by bar and return simulate_signals()-style arrays."""
+        size_frac = min(self.config.risk_per_trade_pct, self.config.max_position_size_pct) / 100.0
+        commission_rate, slippage = self.config.commission_rate, self.config.slippage
+        flatten_eod = self.config.flatten_eod
+        close = bars.close
+        tradable = layout['tradable'].tolist()
+        session_first = set(layout['session_first'].tolist())
+        session_last = set(layout['session_last'].tolist())
+
+        cash = float(self.config.initial_balance)
+        shares = 0.0
+        trade_idx, trade_side, trade_shares, trade_comm, trade_slip = [], [], [], [], []
+        change_idx, cash_after, shares_after = [], [], []
+
+        for i in range(len(bars)):
+            if not tradable[i]:
+                continue
+            if i in session_first:
+                strategy.on_session_start(i, bars)
+
+            code = strategy.on_bar(i, bars, shares)
+            is_last = i in session_last
+            if is_last and flatten_eod:
+                code = -1
+            if code:
+                fill = vectorized.fill_signal(code, float(close[i]), cash, shares, size_frac,
+                                              commission_rate, slippage)
+                if fill is not None:
+                    cash, shares, qty, commission, slip = fill
+                    trade_idx.append(i)
+                    trade_side.append(1 if code > 0 else -1)
+                    trade_shares.append(qty)
+                    trade_comm.append(commission)
+                    trade_slip.append(slip)
+                    change_idx.append(i)
+                    cash_after.append(cash)
+                    shares_after.append(shares)
+
+            if is_last:
+                strategy.on_session_end(i, bars)
+
+        return vectorized._finalize_simulation(
+            np.asarray(close), self.config.initial_balance, trade_idx, trade_side, trade_shares,
+            trade_comm, trade_slip, change_idx, cash_after, shares_after
+        )
+
+    def _intraday_results(self, ticker: str, start_date: Optional[str], end_date: Optional[str],
+                          bars: BarArrays, layout: Dict[str, np.ndarray],
+                          sim: Dict[str, np.ndarray]) -> BacktestResults:
+        """Build results with timestamped trades and one equity row per session close."""
+        local_index = pd.DatetimeIndex(layout['local_ns'].astype('datetime64[ns]'))
+        trades_df, _ = vectorized.simulation_to_frames(sim, ticker, local_index, np.asarray(bars.close),
+                                                       keep_time=True)
+
+        closes = layout['session_last'] if len(layout['session_last']) else np.array([len(bars) - 1])
+        session_equity = sim['equity'][closes]
+        session_return = np.zeros(len(session_equity))
+        if len(session_equity) > 1:
+            prev = session_equity[:-1]
+            np.divide(session_equity[1:] - prev, prev, out=session_return[1:], where=prev > 0)
+        equity_df = pd.DataFrame({
+            'cash_balance': sim['cash'][closes],
+            'total_equity': session_equity,
+            'daily_return': session_return,
+        }, index=pd.DatetimeIndex(local_index[closes].normalize(), name='date'))
+
+        self.current_date = equity_df.index[-1].strftime('%Y-%m-%d')
+        self.metrics.update_batch(session_equity)
+
+        start_date = start_date or equity_df.index[0].strftime('%Y-%m-%d')
+        end_date = end_date or self.current_date
+        return self._build_results(ticker, start_date, end_date, trades_df, equity_df)
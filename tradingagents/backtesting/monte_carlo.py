@@ -0,0 +1,222 @@
+"""
+Monte Carlo Analysis
+Block-bootstrap resampling of backtest returns and trades for confidence intervals.
+"""
+import logging
+from typing import Dict, Optional, Sequence
+import numpy as np
+import pandas as pd
+from tradingagents.backtesting.config import BacktestResults
+from tradingagents.backtesting.trade_matching import round_trips_from_trades
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+METRICS = ['final_equity', 'total_return_pct', 'max_drawdown_pct', 'sharpe_ratio']
+
+
+def block_bootstrap_indices(rng: np.random.Generator, n: int, num_paths: int, block_size: int) -> np.ndarray:
+    """
+    Draw moving-block bootstrap indices.
+
+    Each path is built from randomly placed blocks of consecutive observations,
+    which keeps short-range autocorrelation (volatility clustering, streaks)
+    that an i.i.d. bootstrap would destroy.
+
+    Args:
+        rng: NumPy random generator
+        n: Number of observations per path
+        num_paths: Number of paths
+        block_size: Length of each block (1 = i.i.d. bootstrap)
+
+    Returns:
+        (num_paths, n) array of indices into the observations
+    """
+    block_size = max(1, min(block_size, n))
+    num_blocks = -(-n // block_size)
+    starts = rng.integers(0, n - block_size + 1, size=(num_paths, num_blocks))
+    offsets = np.arange(block_size)
+    return (starts[:, :, None] + offsets).reshape(num_paths, -1)[:, :n]
+
+
+def simulate_paths(returns: np.ndarray, initial_balance: float, periods_per_year: float) -> Dict[str, np.ndarray]:
+    """
+    Compute path metrics for a (paths x periods) matrix of period returns.
+
+    Everything is a matrix operation along axis 1; the input array is
+    overwritten with the equity paths to avoid another allocation.
+
+    Args:
+        returns: Period returns, one row per path (modified in place)
+        initial_balance: Starting equity of every path
+        periods_per_year: Periods per year for annualizing Sharpe
+
+    Returns:
+        Per-path arrays keyed by METRICS
+    """
+    mean = returns.mean(axis=1)
+    std = returns.std(axis=1, ddof=1) if returns.shape[1] > 1 else np.zeros(len(returns))
+    sharpe = np.divide(mean, std, out=np.zeros_like(mean), where=std > 0) * np.sqrt(periods_per_year)
+
+    equity = returns
+    equity += 1
+    np.cumprod(equity, axis=1, out=equity)
+    equity *= initial_balance
+
+    # Peak includes the starting balance, like a live account would
+    peaks = np.maximum.accumulate(equity, axis=1)
+    np.maximum(peaks, initial_balance, out=peaks)
+    drawdown_pct = ((equity - peaks) / peaks).min(axis=1) * 100
+
+    final_equity = equity[:, -1].copy()
+    return {
+        'final_equity': final_equity,
+        'total_return_pct': (final_equity / initial_balance - 1) * 100,
+        'max_drawdown_pct': drawdown_pct,
+        'sharpe_ratio': sharpe,
+    }
+
+
+class MonteCarloAnalyzer:
+    """
+    Block-bootstrap Monte Carlo analysis of a backtest.
+
+    Resamples either the daily returns of the equity curve or the returns of
+    FIFO-matched round-trip trades into many synthetic paths and reports
+    confidence intervals for final equity, total return, max drawdown and
+    Sharpe ratio.
+    """
+
+    def __init__(self, results: BacktestResults, num_simulations: int = 10000,
+                 block_size: int = 5, chunk_size: Optional[int] = 1000,
+                 seed: Optional[int] = None):
+        """
+        Initialize the Monte Carlo analyzer.
+
+        Args:
+            results: BacktestResults to resample
+            num_simulations: Number of bootstrap paths
+            block_size: Consecutive observations per bootstrap block
+            chunk_size: Simulate at most this many paths at once to bound
+                memory (None simulates all paths in one matrix)
+            seed: Seed for reproducible paths
+        """
+        if num_simulations < 1:
+            raise ValueError("num_simulations must be positive")
+        self.results = results
+        self.num_simulations = num_simulations
+        self.block_size = block_size
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.simulations: Dict[str, Dict[str, np.ndarray]] = {}
+
+    def _daily_returns(self) -> np.ndarray:
+        equity = np.fromiter(
+            (row['total_equity'] for row in self.results.equity_history), dtype=np.float64
+        )
+        if len(equity) < 2:
+            return np.empty(0)
+        return equity[1:] / equity[:-1] - 1
+
+    def _trade_returns(self) -> np.ndarray:
+        trades_df = pd.DataFrame(self.results.trades)
+        round_trips = round_trips_from_trades(trades_df)
+        if round_trips.empty:
+            return np.empty(0)
+        # Dollar P&L relative to the starting balance, so trades compound like the account
+        return round_trips['pnl'].to_numpy() / self.results.initial_balance
+
+    def run(self, method: str = "returns") -> Dict[str, np.ndarray]:
+        """
+        Simulate bootstrap paths.
+
+        Args:
+            method: "returns" to resample daily returns, "trades" to resample
+                round-trip trade returns
+
+        Returns:
+            Per-path arrays keyed by METRICS
+        """
+        if method == "returns":
+            observations = self._daily_returns()
+            periods_per_year = TRADING_DAYS_PER_YEAR
+        elif method == "trades":
+            observations = self._trade_returns()
+            days = max(len(self.results.equity_history), 1)
+            periods_per_year = len(observations) / days * TRADING_DAYS_PER_YEAR
+        else:
+            raise ValueError("method must be 'returns' or 'trades'")
+
+        if len(observations) == 0:
+            logger.warning(f"No {method} to resample for {self.results.ticker}")
+            empty = {metric: np.full(self.num_simulations, np.nan) for metric in METRICS}
+            self.simulations[method] = empty
+            return empty
+
+        rng = np.random.default_rng(self.seed)
+        chunk = self.chunk_size or self.num_simulations
+        parts = []
+        for start in range(0, self.num_simulations, chunk):
+            num_paths = min(chunk, self.num_simulations - start)
+            indices = block_bootstrap_indices(rng, len(observations), num_paths, self.block_size)
+            parts.append(simulate_paths(observations[indices], self.results.initial_balance, periods_per_year))
+
+        simulations = {metric: np.concatenate([p[metric] for p in parts]) for metric in METRICS}
+        self.simulations[method] = simulations
+        logger.info(f"Simulated {self.num_simulations} {method} paths for {self.results.ticker}")
+        return simulations
+
+    def confidence_intervals(self, method: str = "returns",
+                             confidence_levels: Sequence[float] = (0.90, 0.95)) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize simulated paths with confidence intervals.
+
+        Args:
+            method: "returns" or "trades" (simulated on first use)
+            confidence_levels: Two-sided confidence levels, e.g. 0.95 gives the
+                2.5th and 97.5th percentiles
+
+        Returns:
+            Per metric: mean, median, std and lower/upper bounds per level
+            (keys like 'ci_95_lower'), plus probability_of_loss
+        """
+        simulations = self.simulations.get(method)
+        if simulations is None:
+            simulations = self.run(method)
+
+        tails = np.array([(1 - level) / 2 for level in confidence_levels])
+        percentiles = np.concatenate([tails, 1 - tails]) * 100
+
+        summary = {}
+        for metric in METRICS:
+            values = simulations[metric]
+            bounds = np.percentile(values, percentiles)
+            stats = {
+                'mean': float(np.mean(values)),
+                'median': float(np.median(values)),
+                'std': float(np.std(values)),
+            }
+            for i, level in enumerate(confidence_levels):
+                label = f"ci_{level * 100:g}"
+                stats[f"{label}_lower"] = float(bounds[i])
+                stats[f"{label}_upper"] = float(bounds[i + len(confidence_levels)])
+            summary[metric] = stats
+
+        summary['probability_of_loss'] = float(np.mean(simulations['final_equity'] < self.results.initial_balance))
+        return summary
+
+    def print_summary(self, method: str = "returns", confidence: float = 0.95):
+        """Print formatted confidence intervals."""
+        summary = self.confidence_intervals(method, (confidence,))
+        label = f"ci_{confidence * 100:g}"
+
+        print("=" * 60)
+        print(f"MONTE CARLO ANALYSIS ({self.num_simulations:,} paths, {method})")
+        print("=" * 60)
+        print(f"{'Metric':<20} {'Median':>12} {f'{confidence:.0%} CI':>26}")
+        for metric in METRICS:
+            stats = summary[metric]
+            print(f"{metric:<20} {stats['median']:>12,.2f} "
+                  f"{stats[f'{label}_lower']:>12,.2f} - {stats[f'{label}_upper']:<12,.2f}")
+        print(f"\nProbability of loss: {summary['probability_of_loss'] * 100:.1f}%")
+        print("=" * 60)
@@ -0,0 +1,365 @@
+"""
+Parameter Optimizer
+Grid and random search over BacktestConfig fields with successive halving and a
+return vs. drawdown Pareto front.
+"""
+import math
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+import pandas as pd
+from tradingagents.backtesting.config import BacktestConfig
+from tradingagents.backtesting.backtest_engine import BacktestEngine
+from tradingagents.backtesting.streaming_metrics import StreamingMetrics
+from tradingagents.backtesting import vectorized
+
+logger = logging.getLogger(__name__)
+
+# Config fields that change the outcome of a fixed signal series
+TUNABLE_FIELDS = ['initial_balance', 'commission_rate', 'slippage', 'risk_per_trade_pct', 'max_position_size_pct']
+METRIC_COLUMNS = ['total_return_pct', 'cagr', 'sharpe_ratio', 'sortino_ratio',
+                  'max_drawdown_pct', 'volatility', 'total_trades']
+
+# Per-process signal arrays seeded by _init_worker
+_worker_arrays: Dict[str, np.ndarray] = {}
+
+
+def _init_worker(close: np.ndarray, codes: np.ndarray):
+    """Seed a worker process with the price and signal arrays."""
+    _worker_arrays['close'] = close
+    _worker_arrays['codes'] = codes
+
+
+def evaluate_params(close: np.ndarray, codes: np.ndarray, params: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Simulate one parameter set over fixed signals.
+
+    Args:
+        close: Close prices, one per bar
+        codes: Signal codes from vectorized.encode_signals()
+        params: Complete values for TUNABLE_FIELDS
+
+    Returns:
+        Metrics keyed by METRIC_COLUMNS
+    """
+    sim = vectorized.simulate_signals(
+        close, codes, params['initial_balance'], params['commission_rate'], params['slippage'],
+        params['risk_per_trade_pct'], params['max_position_size_pct']
+    )
+    metrics = StreamingMetrics(params['initial_balance'])
+    metrics.update_batch(sim['equity'])
+    return {
+        'total_return_pct': metrics.total_return_pct,
+        'cagr': metrics.cagr,
+        'sharpe_ratio': metrics.sharpe_ratio,
+        'sortino_ratio': metrics.sortino_ratio,
+        'max_drawdown_pct': metrics.max_drawdown_pct,
+        'volatility': metrics.volatility,
+        'total_trades': len(sim['trade_idx']),
+    }
+
+
+def _evaluate_batch(param_sets: List[Dict[str, Any]], bars: int) -> List[Dict[str, float]]:
+    """Evaluate parameter sets on the first `bars` bars inside a worker process."""
+    close = _worker_arrays['close'][:bars]
+    codes = _worker_arrays['codes'][:bars]
+    return [evaluate_params(close, codes, params) for params in param_sets]
+
+
+def pareto_front_mask(returns: np.ndarray, drawdowns: np.ndarray) -> np.ndarray:
+    """
+    Flag points not dominated in (higher return, shallower drawdown).
+
+    Sorting by return (best first) turns the check into a running maximum of
+    drawdown, so the front is found in O(n log n).
+
+    Args:
+        returns: Return per point (higher is better)
+        drawdowns: Drawdown per point as a non-positive percent (closer to 0 is better)
+
+    Returns:
+        Boolean mask of Pareto-optimal points
+    """
+    returns = np.asarray(returns, dtype=np.float64)
+    drawdowns = np.asarray(drawdowns, dtype=np.float64)
+    order = np.lexsort((-drawdowns, -returns))
+    sorted_dd = drawdowns[order]
+    best_before = np.maximum.accumulate(np.concatenate([[-np.inf], sorted_dd[:-1]]))
+    mask = np.zeros(len(returns), dtype=bool)
+    mask[order] = sorted_dd > best_before
+    return mask
+
+
+class ParameterOptimizer:
+    """
+    Search BacktestConfig parameters against one fixed signal series.
+
+    Signals are generated once (from a trading graph through the decision cache,
+    or supplied directly) and every candidate is simulated with the vectorized
+    engine. Successive halving scores all candidates on a short leading
+    sub-period first and only extends the survivors to longer ones, so clearly
+    weak or dominated regions are dropped before the full-period runs.
+    """
+
+    def __init__(self, base_config: BacktestConfig, data_manager=None):
+        """
+        Initialize the optimizer.
+
+        Args:
+            base_config: Config supplying dates and all non-searched fields
+            data_manager: HistoricalDataManager instance (optional)
+        """
+        from tradingagents.backtesting.data_manager import HistoricalDataManager
+        self.base_config = base_config
+        self.data_manager = data_manager or HistoricalDataManager()
+        self.results = pd.DataFrame()
+
+        logger.info("ParameterOptimizer initialized")
+
+    def generate_signals(self, ticker: str, trading_graph, start_date: Optional[str] = None,
+                         end_date: Optional[str] = None) -> pd.Series:
+        """
+        Run the trading graph once and collect its BUY/SELL/HOLD signal per date.
+
+        With config.use_decision_cache, later calls replay cached decisions
+        instead of calling the graph again.
+
+        Args:
+            ticker: Stock symbol
+            trading_graph: TradingAgentsGraph instance
+            start_date: Start date (uses config if None)
+            end_date: End date (uses config if None)
+
+        Returns:
+            Signals indexed like the price data
+        """
+        engine = BacktestEngine(self.base_config, trading_graph=trading_graph, data_manager=self.data_manager)
+        engine.run_backtest(ticker, start_date, end_date)
+        index = engine._load_data(ticker, start_date or self.base_config.start_date,
+                                  end_date or self.base_config.end_date).index
+        return pd.Series([engine.decisions.get(d, "HOLD") for d in index.strftime('%Y-%m-%d')], index=index)
+
+    def grid_search(self, ticker: str, param_grid: Dict[str, Sequence], signals=None,
+                    trading_graph=None, **kwargs) -> pd.DataFrame:
+        """
+        Evaluate every combination of the given parameter values.
+
+        Args:
+            ticker: Stock symbol
+            param_grid: Values to try keyed by BacktestConfig field
+            signals: Precomputed signals (see BacktestEngine.run_signal_backtest)
+            trading_graph: Graph to generate signals from when signals is None
+            **kwargs: Passed to optimize()
+
+        Returns:
+            Ranked results (see optimize())
+        """
+        self._check_fields(param_grid)
+        names = list(param_grid)
+        grids = np.meshgrid(*[np.asarray(param_grid[name]) for name in names], indexing='ij')
+        candidates = [
+            {name: grid.flat[i].item() for name, grid in zip(names, grids)}
+            for i in range(grids[0].size if grids else 0)
+        ]
+        return self.optimize(ticker, candidates, signals, trading_graph, **kwargs)
+
+    def random_search(self, ticker: str, param_distributions: Dict[str, Union[tuple, Sequence]],
+                      n_iter: int = 100, seed: Optional[int] = None, signals=None,
+                      trading_graph=None, **kwargs) -> pd.DataFrame:
+        """
+        Evaluate randomly drawn parameter sets.
+
+        Args:
+            ticker: Stock symbol
+            param_distributions: Per BacktestConfig field, a (low, high) tuple
+                sampled uniformly or a list of values sampled with equal weight
+            n_iter: Number of parameter sets
+            seed: Seed for reproducible draws
+            signals: Precomputed signals (see BacktestEngine.run_signal_backtest)
+            trading_graph: Graph to generate signals from when signals is None
+            **kwargs: Passed to optimize()
+
+        Returns:
+            Ranked results (see optimize())
+        """
+        self._check_fields(param_distributions)
+        rng = np.random.default_rng(seed)
+        draws = {}
+        for name, spec in param_distributions.items():
+            if isinstance(spec, tuple) and len(spec) == 2:
+                draws[name] = rng.uniform(spec[0], spec[1], n_iter)
+            else:
+                draws[name] = np.asarray(spec)[rng.integers(0, len(spec), n_iter)]
+        candidates = [{name: values[i].item() for name, values in draws.items()} for i in range(n_iter)]
+        return self.optimize(ticker, candidates, signals, trading_graph, **kwargs)
+
+    def optimize(self, ticker: str, candidates: List[Dict[str, Any]], signals=None,
+                 trading_graph=None, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 objective: str = "sharpe_ratio", rungs: int = 3, eta: float = 3.0,
+                 max_workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        Evaluate parameter sets with successive halving.
+
+        Rung r scores the surviving candidates on the first
+        n_bars / eta ** (rungs - 1 - r) bars. After each rung except the last,
+        the best 1 / eta by objective plus every candidate on that rung's
+        return vs. drawdown Pareto front move on.
+
+        Args:
+            ticker: Stock symbol
+            candidates: Parameter overrides of the base config
+            signals: Precomputed signals (see BacktestEngine.run_signal_backtest)
+            trading_graph: Graph to generate signals from when signals is None
+            start_date: Start date (uses config if None)
+            end_date: End date (uses config if None)
+            objective: Metric to rank by (one of METRIC_COLUMNS, higher is better)
+            rungs: Number of sub-periods (1 evaluates everything on the full period)
+            eta: Reduction factor between rungs
+            max_workers: Evaluate in this many processes (None or 1 runs in this process)
+
+        Returns:
+            One row per candidate with its parameters, the metrics of the longest
+            period it reached, the bars evaluated, and an on_pareto_front flag
+            (full-period candidates only), ranked by period reached then objective
+        """
+        if objective not in METRIC_COLUMNS:
+            raise ValueError(f"objective must be one of {METRIC_COLUMNS}")
+        if rungs < 1 or eta <= 1:
+            raise ValueError("rungs must be at least 1 and eta greater than 1")
+        if signals is None and trading_graph is None:
+            raise ValueError("Provide signals or a trading_graph")
+
+        start_date = start_date or self.base_config.start_date
+        end_date = end_date or self.base_config.end_date
+        if signals is None:
+            signals = self.generate_signals(ticker, trading_graph, start_date, end_date)
+
+        engine = BacktestEngine(self.base_config, data_manager=self.data_manager)
+        data = engine._load_data(ticker, start_date, end_date)
+        if data.empty:
+            raise ValueError(f"No data available for {ticker}")
+        close = data['close'].to_numpy(dtype=float)
+        codes = vectorized.encode_signals(signals, data.index)
+
+        param_sets = self._complete_params(candidates)
+        n_bars = len(close)
+        budgets = [max(2, math.ceil(n_bars / eta ** (rungs - 1 - r))) for r in range(rungs)]
+
+        print(f"\n{'='*70}")
+        print(f"Optimizing {len(param_sets)} configurations for {ticker}")
+        print(f"{'='*70}")
+
+        records: List[Dict[str, Any]] = [dict(params) for params in param_sets]
+        alive = np.arange(len(param_sets))
+        pool = None
+        if max_workers and max_workers > 1 and len(param_sets) > 1:
+            pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(close, codes))
+        else:
+            _init_worker(close, codes)
+
+        try:
+            for rung, bars in enumerate(budgets):
+                metrics = self._evaluate(pool, [param_sets[i] for i in alive], bars, max_workers)
+                for i, row in zip(alive, metrics):
+                    records[i].update(row, bars=bars)
+                print(f"Rung {rung + 1}/{rungs}: {len(alive)} configurations on {bars} bars")
+
+                if rung == rungs - 1 or len(alive) <= 1:
+                    break
+                alive = self._survivors(alive, metrics, objective, eta)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        df = pd.DataFrame(records)
+        full = df['bars'] == df['bars'].max()
+        df['on_pareto_front'] = False
+        df.loc[full, 'on_pareto_front'] = pareto_front_mask(
+            df.loc[full, 'total_return_pct'], df.loc[full, 'max_drawdown_pct']
+        )
+        df = df.sort_values(['bars', objective], ascending=False, kind='stable').reset_index(drop=True)
+        df.insert(0, 'rank', np.arange(1, len(df) + 1))
+
+        self.results = df
+        print(f"✅ Best {objective}: {df[objective].iloc[0]:.2f} "
+              f"({int(full.sum())} evaluated on the full period, {int(df['on_pareto_front'].sum())} on the Pareto front)")
+        return df
+
+    def pareto_front(self) -> pd.DataFrame:
+        """Full-period results not dominated in return vs. drawdown, by return."""
+        if self.results.empty:
+            return pd.DataFrame()
+        front = self.results[self.results['on_pareto_front']]
+        return front.sort_values('total_return_pct', ascending=False).reset_index(drop=True)
+
+    def best_config(self) -> BacktestConfig:
+        """Base config with the top-ranked parameters applied."""
+        if self.results.empty:
+            raise ValueError("No results. Run grid_search(), random_search() or optimize() first.")
+        config = self.base_config.copy()
+        for name in TUNABLE_FIELDS:
+            setattr(config, name, self.results[name].iloc[0].item())
+        return config
+
+    @staticmethod
+    def _check_fields(space: Dict[str, Any]):
+        config_fields = {f.name for f in fields(BacktestConfig)}
+        for name in space:
+            if name not in config_fields:
+                raise ValueError(f"Unknown BacktestConfig field: {name}")
+            if name not in TUNABLE_FIELDS:
+                raise ValueError(f"{name} does not affect signal simulation; tunable fields are {TUNABLE_FIELDS}")
+
+    def _complete_params(self, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Fill in base values and drop candidates the config validation rejects."""
+        base = {name: getattr(self.base_config, name) for name in TUNABLE_FIELDS}
+        valid = []
+        for overrides in candidates:
+            params = {**base, **overrides}
+            try:
+                BacktestConfig(**params)
+            except ValueError as e:
+                logger.warning(f"Skipping invalid parameters {overrides}: {e}")
+                continue
+            valid.append(params)
+        if not valid:
+            raise ValueError("No valid parameter sets to evaluate")
+        return valid
+
+    @staticmethod
+    def _evaluate(pool: Optional[ProcessPoolExecutor], param_sets: List[Dict[str, Any]],
+                  bars: int, max_workers: Optional[int]) -> List[Dict[str, float]]:
+        if pool is None:
+            return _evaluate_batch(param_sets, bars)
+
+        # A few chunks per worker balance load without per-config task overhead
+        chunk = max(1, math.ceil(len(param_sets) / (max_workers * 4)))
+        futures = [pool.submit(_evaluate_batch, param_sets[i:i + chunk], bars)
+                   for i in range(0, len(param_sets), chunk)]
+        return [row for future in futures for row in future.result()]
+
+    @staticmethod
+    def _survivors(alive: np.ndarray, metrics: List[Dict[str, float]], objective: str, eta: float) -> np.ndarray:
+        scores = np.array([row[objective] for row in metrics])
+        keep = np.zeros(len(alive), dtype=bool)
+        keep[np.argsort(-scores, kind='stable')[:math.ceil(len(alive) / eta)]] = True
+        keep |= pareto_front_mask([row['total_return_pct'] for row in metrics],
+                                  [row['max_drawdown_pct'] for row in metrics])
+        return alive[keep]
+
+    def print_summary(self, top_n: int = 10):
+        """Print the top-ranked configurations and the Pareto front."""
+        if self.results.empty:
+            print("No optimization results")
+            return
+
+        columns = ['rank'] + TUNABLE_FIELDS + ['total_return_pct', 'max_drawdown_pct', 'sharpe_ratio']
+        print(f"\n{'='*70}")
+        print("OPTIMIZATION RESULTS")
+        print(f"{'='*70}")
+        print(self.results[columns].head(top_n).to_string(index=False))
+        print("\nPareto front (return vs. drawdown):")
+        print(self.pareto_front()[columns].to_string(index=False))
+        print(f"{'='*70}\n")
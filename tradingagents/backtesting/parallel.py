@@ -0,0 +1,107 @@
+"""
+Parallel Execution Helpers
+Worker pools for running many backtests over one preloaded price store, and
+request pacing for concurrent agent calls.
+"""
+import os
+import time
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Optional
+from tradingagents.backtesting.config import BacktestConfig, BacktestResults
+from tradingagents.backtesting.data_manager import HistoricalDataManager
+
+logger = logging.getLogger(__name__)
+
+# Per-process data manager seeded by _init_worker
+_worker_data_manager: Optional[HistoricalDataManager] = None
+
+
+def _init_worker(cache_dir: str, data_cache: Dict):
+    """Seed a worker process with the preloaded price data."""
+    global _worker_data_manager
+    _worker_data_manager = HistoricalDataManager(cache_dir)
+    _worker_data_manager.data_cache.update(data_cache)
+
+
+def get_worker_data_manager() -> HistoricalDataManager:
+    """Data manager of the current worker process (seeded by create_pool)."""
+    global _worker_data_manager
+    if _worker_data_manager is None:
+        _worker_data_manager = HistoricalDataManager()
+    return _worker_data_manager
+
+
+def create_pool(max_workers: int, data_manager: HistoricalDataManager,
+                use_processes: bool) -> Executor:
+    """
+    Create a bounded worker pool.
+
+    Process workers each receive one copy of data_manager's in-memory store when
+    they start, so tasks only slice already-loaded data. Thread workers share
+    data_manager directly.
+
+    Args:
+        max_workers: Upper bound on workers (also capped at the CPU count for processes)
+        data_manager: Preloaded HistoricalDataManager
+        use_processes: Use processes (CPU-bound work) instead of threads
+
+    Returns:
+        ProcessPoolExecutor or ThreadPoolExecutor
+    """
+    if use_processes:
+        workers = max(1, min(max_workers, os.cpu_count() or 1))
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(data_manager.cache_dir, dict(data_manager.data_cache))
+        )
+    return ThreadPoolExecutor(max_workers=max(1, max_workers))
+
+
+def run_backtest_in_worker(config: BacktestConfig, ticker: str,
+                           start_date: Optional[str], end_date: Optional[str]) -> BacktestResults:
+    """Run a graph-less backtest inside a worker process."""
+    from tradingagents.backtesting.backtest_engine import BacktestEngine
+
+    engine = BacktestEngine(config=config, data_manager=get_worker_data_manager())
+    return engine.run_backtest(ticker, start_date, end_date)
+
+
+class ProviderRateLimiter:
+    """
+    Thread-safe request pacing per LLM provider.
+
+    Spaces calls to each provider evenly so that no more than the configured
+    number of requests per minute are started; providers without a limit are
+    not throttled.
+    """
+
+    def __init__(self, requests_per_minute: Dict[str, float]):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum request rate keyed by provider name
+        """
+        self.intervals = {
+            provider: 60.0 / rate for provider, rate in requests_per_minute.items() if rate and rate > 0
+        }
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, provider: str):
+        """Block until a request to provider may start."""
+        interval = self.intervals.get(provider)
+        if interval is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(provider, now))
+            self._next_slot[provider] = slot + interval
+
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
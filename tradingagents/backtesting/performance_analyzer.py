@@ -7,6 +7,8 @@ from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from tradingagents.backtesting.config import BacktestResults
+from tradingagents.backtesting.trade_matching import round_trips_from_trades
+from tradingagents.backtesting.relative_performance import EMPTY_RELATIVE_METRICS, calculate_relative_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,7 @@ class PerformanceAnalyzer:
         # Convert to DataFrames for analysis
         self.trades_df = self._prepare_trades_df()
         self.equity_df = self._prepare_equity_df()
+        self._round_trips = None
         
         logger.info("PerformanceAnalyzer initialized")
     
@@ -78,12 +81,7 @@ class PerformanceAnalyzer:
         total_return_pct = (total_return / initial_balance) * 100
         
         # CAGR (Compound Annual Growth Rate)
-        days = len(self.equity_df)
-        years = days / 252  # Trading days per year
-        if years > 0 and final_balance > 0:
-            cagr = (((final_balance / initial_balance) ** (1 / years)) - 1) * 100
-        else:
-            cagr = 0.0
+        cagr = self._calculate_cagr()
         
         # Daily returns statistics
         if 'daily_return' in self.equity_df.columns:
@@ -102,6 +100,17 @@ class PerformanceAnalyzer:
             'daily_return_std': daily_return_std
         }
     
+    def _calculate_cagr(self) -> float:
+        """Compound annual growth rate in percent."""
+        initial_balance = self.results.initial_balance
+        final_balance = self.results.final_balance
+        
+        days = len(self.equity_df)
+        years = days / 252  # Trading days per year
+        if years > 0 and final_balance > 0:
+            return (((final_balance / initial_balance) ** (1 / years)) - 1) * 100
+        return 0.0
+    
     def calculate_risk_metrics(self) -> Dict:
         """
         Calculate risk metrics.
@@ -153,8 +162,7 @@ class PerformanceAnalyzer:
         volatility = daily_returns.std() * np.sqrt(252) * 100
         
         # Calmar Ratio (CAGR / Max Drawdown)
-        returns = self.calculate_returns()
-        cagr = returns['cagr']
+        cagr = self._calculate_cagr()
         if abs(max_drawdown_pct) > 0:
             calmar_ratio = cagr / abs(max_drawdown_pct)
         else:
@@ -192,13 +200,9 @@ class PerformanceAnalyzer:
                 'avg_holding_period': 0.0
             }
         
-        # Separate buy and sell trades
-        buy_trades = self.trades_df[self.trades_df['action'] == 'BUY']
-        sell_trades = self.trades_df[self.trades_df['action'] == 'SELL']
-        
-        # Calculate P&L for each sell (match with previous buy)
-        # This is simplified - assumes FIFO matching
-        total_trades = len(sell_trades)
+        # FIFO-match sells against earlier buy lots
+        round_trips = self.get_round_trips()
+        total_trades = len(round_trips)
         
         if total_trades == 0:
             return {
@@ -216,13 +220,13 @@ class PerformanceAnalyzer:
                 'avg_holding_period': 0.0
             }
         
-        # Calculate P&L from net amounts
-        # For simplicity, we'll use the net_amount field
-        # Positive net_amount on SELL = profit, negative = loss
-        sell_pnl = sell_trades['net_amount'].values
+        pnl = round_trips['pnl'].to_numpy()
+        pnl_pct = round_trips['return_pct'].to_numpy()
+        wins = pnl > 0
+        losses = pnl < 0
         
-        winning_trades = sell_pnl[sell_pnl > 0]
-        losing_trades = sell_pnl[sell_pnl < 0]
+        winning_trades = pnl[wins]
+        losing_trades = pnl[losses]
         
         num_wins = len(winning_trades)
         num_losses = len(losing_trades)
@@ -243,14 +247,12 @@ class PerformanceAnalyzer:
         largest_win = winning_trades.max() if num_wins > 0 else 0.0
         largest_loss = abs(losing_trades.min()) if num_losses > 0 else 0.0
         
-        # Calculate percentage returns (simplified)
-        # This would require matching buy/sell pairs for accurate calculation
-        avg_win_pct = 0.0  # Placeholder
-        avg_loss_pct = 0.0  # Placeholder
+        # Percentage returns on the cost basis of each round trip
+        avg_win_pct = pnl_pct[wins].mean() if num_wins > 0 else 0.0
+        avg_loss_pct = abs(pnl_pct[losses].mean()) if num_losses > 0 else 0.0
         
-        # Average holding period (days)
-        # This would require matching buy/sell pairs
-        avg_holding_period = 0.0  # Placeholder
+        # Average holding period (days), weighted by shares in each round trip
+        avg_holding_period = float(np.average(round_trips['holding_days'], weights=round_trips['shares']))
         
         return {
             'total_trades': total_trades,
@@ -267,6 +269,45 @@ class PerformanceAnalyzer:
             'avg_holding_period': avg_holding_period
         }
     
+    def calculate_benchmark_metrics(self, benchmark_close: Optional[pd.Series] = None) -> Dict:
+        """
+        Calculate benchmark-relative metrics.
+        
+        Args:
+            benchmark_close: Benchmark close prices indexed by date. If None, the
+                metrics the engine stored on the results are returned.
+        
+        Returns:
+            Dictionary with benchmark return, excess return, alpha, beta,
+            tracking error and information ratio
+        """
+        if benchmark_close is not None:
+            if self.equity_df.empty:
+                return dict(EMPTY_RELATIVE_METRICS)
+            return calculate_relative_metrics(self.equity_df['total_equity'], benchmark_close)
+        
+        return {
+            'benchmark': self.results.config.benchmark if self.results.config else None,
+            'benchmark_return_pct': self.results.benchmark_return_pct,
+            'excess_return_pct': self.results.excess_return_pct,
+            'alpha': self.results.alpha,
+            'beta': self.results.beta,
+            'tracking_error': self.results.tracking_error,
+            'information_ratio': self.results.information_ratio
+        }
+    
+    def get_round_trips(self) -> pd.DataFrame:
+        """
+        Get FIFO-matched round trips (one row per buy lot portion closed by a sell).
+        
+        Returns:
+            DataFrame with entry/exit dates and prices, shares, costs, P&L,
+            return % and holding days per round trip
+        """
+        if self._round_trips is None:
+            self._round_trips = round_trips_from_trades(self.trades_df)
+        return self._round_trips
+    
     def generate_equity_curve(self) -> pd.DataFrame:
         """
         Generate equity curve DataFrame.
@@ -334,6 +375,7 @@ class PerformanceAnalyzer:
         returns = self.calculate_returns()
         risk = self.calculate_risk_metrics()
         trades = self.calculate_trade_statistics()
+        benchmark = self.calculate_benchmark_metrics()
         
         summary = {
             'period': {
@@ -344,6 +386,7 @@ class PerformanceAnalyzer:
             'returns': returns,
             'risk': risk,
             'trades': trades,
+            'benchmark': benchmark,
             'account': {
                 'initial_balance': self.results.initial_balance,
                 'final_balance': self.results.final_balance
@@ -395,7 +438,21 @@ class PerformanceAnalyzer:
         print(f"Profit Factor: {trades['profit_factor']:.2f}")
         print(f"Average Win: ${trades['avg_win']:,.2f}")
         print(f"Average Loss: ${trades['avg_loss']:,.2f}")
+        print(f"Average Win %: {trades['avg_win_pct']:.2f}%")
+        print(f"Average Loss %: {trades['avg_loss_pct']:.2f}%")
         print(f"Largest Win: ${trades['largest_win']:,.2f}")
         print(f"Largest Loss: ${trades['largest_loss']:,.2f}")
+        print(f"Avg Holding Period: {trades['avg_holding_period']:.1f} days")
+        
+        # Benchmark
+        benchmark = summary['benchmark']
+        if benchmark['benchmark']:
+            print(f"\n--- Benchmark ({benchmark['benchmark']}) ---")
+            print(f"Benchmark Return: {benchmark['benchmark_return_pct']:.2f}%")
+            print(f"Excess Return: {benchmark['excess_return_pct']:.2f}%")
+            print(f"Alpha (annualized): {benchmark['alpha']:.2f}%")
+            print(f"Beta: {benchmark['beta']:.2f}")
+            print(f"Tracking Error: {benchmark['tracking_error']:.2f}%")
+            print(f"Information Ratio: {benchmark['information_ratio']:.2f}")
         
         print("=" * 60)
@@ -0,0 +1,94 @@
+"""
+Relative Performance
+Benchmark-relative metrics (excess return, beta, alpha, tracking error, information ratio).
+"""
+import logging
+from typing import Dict
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+
+EMPTY_RELATIVE_METRICS = {
+    'benchmark_return_pct': 0.0,
+    'excess_return_pct': 0.0,
+    'alpha': 0.0,
+    'beta': 0.0,
+    'correlation': 0.0,
+    'tracking_error': 0.0,
+    'information_ratio': 0.0,
+}
+
+
+def align_benchmark(equity: pd.Series, benchmark_close: pd.Series) -> np.ndarray:
+    """
+    Align benchmark closes to the dates of an equity curve.
+
+    Dates without a benchmark bar carry the previous close forward; dates
+    before the first benchmark bar are NaN.
+
+    Args:
+        equity: Strategy equity indexed by date
+        benchmark_close: Benchmark close prices indexed by date
+
+    Returns:
+        Benchmark close per equity date
+    """
+    index = benchmark_close.index
+    if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+        benchmark_close = benchmark_close.tz_localize(None)
+    return benchmark_close.sort_index().reindex(equity.index, method='ffill').to_numpy(dtype=np.float64)
+
+
+def calculate_relative_metrics(equity: pd.Series, benchmark_close: pd.Series) -> Dict[str, float]:
+    """
+    Compare a strategy equity curve with a benchmark in one vectorized pass.
+
+    Daily returns of strategy and benchmark are computed together as an (n, 2)
+    array; beta comes from their covariance matrix, alpha is the annualized
+    Jensen's alpha (0% risk-free rate, in percent), tracking error is the
+    annualized volatility of the active return and the information ratio is the
+    annualized mean active return over tracking error.
+
+    Args:
+        equity: Strategy equity indexed by date
+        benchmark_close: Benchmark close prices indexed by date
+
+    Returns:
+        Dictionary with benchmark_return_pct, excess_return_pct, alpha, beta,
+        correlation, tracking_error and information_ratio
+    """
+    if equity.empty or benchmark_close.empty:
+        return dict(EMPTY_RELATIVE_METRICS)
+
+    values = np.column_stack([equity.to_numpy(dtype=np.float64), align_benchmark(equity, benchmark_close)])
+    values = values[~np.isnan(values).any(axis=1)]
+    if len(values) < 3 or (values[:-1] <= 0).any():
+        return dict(EMPTY_RELATIVE_METRICS)
+
+    returns = values[1:] / values[:-1] - 1
+    total_returns = (values[-1] / values[0] - 1) * 100
+    mean = returns.mean(axis=0)
+    cov = np.cov(returns, rowvar=False)
+
+    beta = cov[0, 1] / cov[1, 1] if cov[1, 1] > 0 else 0.0
+    denom = np.sqrt(cov[0, 0] * cov[1, 1])
+    correlation = cov[0, 1] / denom if denom > 0 else 0.0
+    alpha = (mean[0] - beta * mean[1]) * TRADING_DAYS_PER_YEAR * 100
+
+    active = returns[:, 0] - returns[:, 1]
+    active_std = active.std(ddof=1)
+    tracking_error = active_std * np.sqrt(TRADING_DAYS_PER_YEAR) * 100
+    information_ratio = active.mean() / active_std * np.sqrt(TRADING_DAYS_PER_YEAR) if active_std > 0 else 0.0
+
+    return {
+        'benchmark_return_pct': float(total_returns[1]),
+        'excess_return_pct': float(total_returns[0] - total_returns[1]),
+        'alpha': float(alpha),
+        'beta': float(beta),
+        'correlation': float(correlation),
+        'tracking_error': float(tracking_error),
+        'information_ratio': float(information_ratio),
+    }
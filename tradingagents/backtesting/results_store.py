@@ -0,0 +1,321 @@
+"""
+Backtest Results Store
+
+Keeps backtest results as columnar parquet partitions (equity curve and trades
+per run, partitioned by ticker) plus a small SQLite index of run metadata and
+headline metrics, so runs can be queried without reading every result file.
+"""
+
+import os
+import json
+import hashlib
+import sqlite3
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+import pandas as pd
+from tradingagents.backtesting.config import BacktestConfig, BacktestResults
+
+logger = logging.getLogger(__name__)
+
+# Parquet needs an engine: pyarrow (the "results" extra) or fastparquet
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    try:
+        import fastparquet  # noqa: F401
+        PARQUET_AVAILABLE = True
+    except ImportError:
+        PARQUET_AVAILABLE = False
+
+# Scalar BacktestResults fields copied into the index
+METRIC_FIELDS = [
+    'initial_balance', 'final_balance', 'total_return', 'total_return_pct', 'cagr',
+    'sharpe_ratio', 'sortino_ratio', 'max_drawdown', 'volatility',
+    'total_trades', 'winning_trades', 'losing_trades', 'win_rate', 'profit_factor',
+    'avg_win', 'avg_loss', 'avg_holding_days',
+    'benchmark_return_pct', 'excess_return_pct', 'alpha', 'beta', 'tracking_error', 'information_ratio',
+]
+
+
+class ResultsStore:
+    """
+    Columnar store of backtest results with an indexed metadata table.
+
+    A run is keyed by ticker, period and config hash; saving the same run again
+    replaces it. Layout under store_dir:
+
+        index.db                               run metadata and metrics
+        equity/ticker=<T>/<run_id>.parquet     equity history
+        trades/ticker=<T>/<run_id>.parquet     trades
+    """
+
+    def __init__(self, store_dir: str = "backtest_results_store"):
+        """
+        Initialize the results store.
+
+        Args:
+            store_dir: Directory for the index and parquet partitions
+        """
+        if not PARQUET_AVAILABLE:
+            raise ImportError("ResultsStore needs pyarrow to write parquet files. "
+                              "Install with: pip install 'tradingagents[results]' (or pip install pyarrow)")
+        self.store_dir = store_dir
+        os.makedirs(self.store_dir, exist_ok=True)
+        self.index_path = os.path.join(self.store_dir, "index.db")
+        self._initialize_index()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _initialize_index(self):
+        metric_columns = ",\n".join(f"{name} REAL" for name in METRIC_FIELDS)
+        with self._connect() as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    ticker TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    config_hash TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    config TEXT,
+                    {metric_columns}
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_ticker_created ON runs (ticker, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_ticker_sharpe ON runs (ticker, sharpe_ratio)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_config ON runs (config_hash)")
+
+    @staticmethod
+    def config_hash(config: Optional[BacktestConfig]) -> str:
+        """
+        Stable hash of the settings that affect a run's outcome.
+
+        Args:
+            config: BacktestConfig of the run (None hashes as an empty config)
+
+        Returns:
+            16-character hex digest
+        """
+        config_dict = config.simulation_dict() if config is not None else {}
+        config_json = json.dumps(config_dict, sort_keys=True, default=str)
+        return hashlib.sha256(config_json.encode()).hexdigest()[:16]
+
+    @classmethod
+    def run_id(cls, results: BacktestResults) -> str:
+        """Key of a run: ticker, period and config hash."""
+        return f"{results.ticker}_{results.start_date}_{results.end_date}_{cls.config_hash(results.config)}"
+
+    def _partition_path(self, table: str, ticker: str, run_id: str) -> str:
+        return os.path.join(self.store_dir, table, f"ticker={ticker}", f"{run_id}.parquet")
+
+    @staticmethod
+    def _write_parquet(df: pd.DataFrame, path: str):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def save(self, results: BacktestResults) -> str:
+        """
+        Store a backtest result, replacing an earlier save of the same run.
+
+        Args:
+            results: BacktestResults to store
+
+        Returns:
+            run_id of the stored run
+        """
+        run_id = self.run_id(results)
+
+        equity_df = pd.DataFrame(results.equity_history)
+        if 'date' in equity_df.columns:
+            equity_df['date'] = pd.to_datetime(equity_df['date'])
+        self._write_parquet(equity_df, self._partition_path("equity", results.ticker, run_id))
+
+        trades_path = self._partition_path("trades", results.ticker, run_id)
+        if results.trades:
+            trades_df = pd.DataFrame(results.trades)
+            if 'date' in trades_df.columns:
+                trades_df['date'] = pd.to_datetime(trades_df['date'])
+            self._write_parquet(trades_df, trades_path)
+        elif os.path.exists(trades_path):
+            os.remove(trades_path)
+
+        row = {
+            'run_id': run_id,
+            'ticker': results.ticker,
+            'start_date': results.start_date,
+            'end_date': results.end_date,
+            'config_hash': self.config_hash(results.config),
+            'created_at': results.created_at,
+            'config': json.dumps(results.config.to_dict(), default=str) if results.config else None,
+        }
+        for name in METRIC_FIELDS:
+            value = getattr(results, name)
+            row[name] = value.item() if hasattr(value, 'item') else value  # NumPy scalars
+
+        columns = ", ".join(row)
+        placeholders = ", ".join("?" for _ in row)
+        with self._connect() as conn:
+            conn.execute(f"INSERT OR REPLACE INTO runs ({columns}) VALUES ({placeholders})", list(row.values()))
+
+        logger.info(f"Stored backtest run {run_id}")
+        return run_id
+
+    def query(self, ticker: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None, config_hash: Optional[str] = None,
+              order_by: Optional[str] = None, ascending: bool = False,
+              limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Query the run index.
+
+        Args:
+            ticker: Only runs for this ticker
+            since: Only runs created at or after this ISO date/time
+            until: Only runs created before this ISO date/time
+            config_hash: Only runs with this config hash
+            order_by: Metric to sort by (one of METRIC_FIELDS or 'created_at')
+            ascending: Sort direction for order_by
+            limit: Maximum number of rows
+
+        Returns:
+            One row per run with metadata and metrics (config omitted)
+        """
+        clauses, params = [], []
+        for column, op, value in (('ticker', '=', ticker), ('created_at', '>=', since),
+                                  ('created_at', '<', until), ('config_hash', '=', config_hash)):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+
+        columns = ['run_id', 'ticker', 'start_date', 'end_date', 'config_hash', 'created_at'] + METRIC_FIELDS
+        sql = f"SELECT {', '.join(columns)} FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if order_by is not None:
+            if order_by not in METRIC_FIELDS and order_by != 'created_at':
+                raise ValueError(f"Cannot order by {order_by}")
+            sql += f" ORDER BY {order_by} {'ASC' if ascending else 'DESC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return pd.DataFrame([dict(r) for r in rows], columns=columns)
+
+    def best(self, ticker: Optional[str] = None, metric: str = 'sharpe_ratio',
+             since: Optional[str] = None, until: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Run with the highest value of a metric.
+
+        Args:
+            ticker: Only runs for this ticker
+            metric: Metric to maximize (one of METRIC_FIELDS)
+            since: Only runs created at or after this ISO date/time
+            until: Only runs created before this ISO date/time
+
+        Returns:
+            Index row of the best run, or None if no run matches
+        """
+        df = self.query(ticker=ticker, since=since, until=until, order_by=metric, limit=1)
+        return df.iloc[0].to_dict() if not df.empty else None
+
+    def load_equity(self, run_id: str, ticker: Optional[str] = None) -> pd.DataFrame:
+        """Equity history of a run as a DataFrame."""
+        return self._read_partition("equity", run_id, ticker)
+
+    def load_trades(self, run_id: str, ticker: Optional[str] = None) -> pd.DataFrame:
+        """Trades of a run as a DataFrame (empty if the run made no trades)."""
+        return self._read_partition("trades", run_id, ticker)
+
+    def _read_partition(self, table: str, run_id: str, ticker: Optional[str]) -> pd.DataFrame:
+        ticker = ticker or self._ticker_of(run_id)
+        path = self._partition_path(table, ticker, run_id)
+        if not os.path.exists(path):
+            return pd.DataFrame()
+        return pd.read_parquet(path)
+
+    def _ticker_of(self, run_id: str) -> str:
+        with self._connect() as conn:
+            row = conn.execute("SELECT ticker FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown run: {run_id}")
+        return row['ticker']
+
+    def load(self, run_id: str) -> BacktestResults:
+        """
+        Rebuild the full BacktestResults of a run.
+
+        Args:
+            run_id: Key from save() or query()
+
+        Returns:
+            BacktestResults with trades and equity history
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown run: {run_id}")
+
+        row = dict(row)
+        config = BacktestConfig.from_dict(json.loads(row['config'])) if row['config'] else None
+        equity_df = self.load_equity(run_id, row['ticker'])
+        trades_df = self.load_trades(run_id, row['ticker'])
+
+        metrics = {name: row[name] for name in METRIC_FIELDS}
+        for name in ('total_trades', 'winning_trades', 'losing_trades'):
+            metrics[name] = int(metrics[name])
+
+        return BacktestResults(
+            ticker=row['ticker'],
+            start_date=row['start_date'],
+            end_date=row['end_date'],
+            trades=trades_df.to_dict('records'),
+            equity_history=equity_df.to_dict('records'),
+            config=config,
+            created_at=row['created_at'],
+            **metrics
+        )
+
+    def delete(self, run_id: str):
+        """Remove a run and its partitions, if present."""
+        try:
+            ticker = self._ticker_of(run_id)
+        except KeyError:
+            return
+        for table in ("equity", "trades"):
+            path = self._partition_path(table, ticker, run_id)
+            if os.path.exists(path):
+                os.remove(path)
+        with self._connect() as conn:
+            conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+
+    def import_json(self, filepaths: List[str]) -> List[str]:
+        """
+        Import results saved with BacktestResults.save().
+
+        Args:
+            filepaths: JSON result files
+
+        Returns:
+            run_ids of the imported runs
+        """
+        run_ids = []
+        for filepath in filepaths:
+            try:
+                run_ids.append(self.save(BacktestResults.load(filepath)))
+            except Exception as e:
+                logger.warning(f"Failed to import {filepath}: {e}")
+        return run_ids
@@ -0,0 +1,201 @@
+"""
+Streaming Performance Metrics
+Incrementally maintained return and risk metrics for a running backtest.
+"""
+import logging
+from typing import Dict
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+class StreamingMetrics:
+    """
+    Online accumulator for backtest performance metrics.
+
+    Keeps running mean/variance of daily returns (Welford), the same for
+    negative returns (downside deviation), and the running peak and drawdown
+    of equity. Every metric is available in O(1) at any point of the run and
+    matches what PerformanceAnalyzer computes from the full equity curve.
+    """
+
+    def __init__(self, initial_balance: float):
+        """
+        Initialize the accumulator.
+
+        Args:
+            initial_balance: Starting account balance
+        """
+        self.initial_balance = initial_balance
+        self.last_equity = initial_balance
+        self._prev_equity = None
+
+        # Daily returns
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        # Negative daily returns only
+        self._down_count = 0
+        self._down_mean = 0.0
+        self._down_m2 = 0.0
+
+        # Drawdown
+        self.peak = -np.inf
+        self.max_drawdown = 0.0
+
+    def update(self, equity: float) -> float:
+        """
+        Add one bar's equity.
+
+        Args:
+            equity: Total account equity at the bar
+
+        Returns:
+            The bar's daily return
+        """
+        daily_return = 0.0
+        if self._prev_equity is not None and self._prev_equity > 0:
+            daily_return = (equity - self._prev_equity) / self._prev_equity
+        self._prev_equity = equity
+        self.last_equity = equity
+
+        self.count += 1
+        delta = daily_return - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (daily_return - self._mean)
+
+        if daily_return < 0:
+            self._down_count += 1
+            delta = daily_return - self._down_mean
+            self._down_mean += delta / self._down_count
+            self._down_m2 += delta * (daily_return - self._down_mean)
+
+        if equity > self.peak:
+            self.peak = equity
+        drawdown = equity - self.peak
+        if drawdown < self.max_drawdown:
+            self.max_drawdown = drawdown
+
+        return daily_return
+
+    def update_batch(self, equity: np.ndarray):
+        """
+        Add many bars' equity at once (vectorized, same result as repeated update()).
+
+        Args:
+            equity: Total account equity per bar, in order
+        """
+        equity = np.asarray(equity, dtype=np.float64)
+        if len(equity) == 0:
+            return
+
+        prev = np.empty_like(equity)
+        prev[0] = self._prev_equity if self._prev_equity is not None else np.nan
+        prev[1:] = equity[:-1]
+        returns = np.zeros_like(equity)
+        np.divide(equity - prev, prev, out=returns, where=prev > 0)
+
+        self.count, self._mean, self._m2 = self._merge(self.count, self._mean, self._m2, returns)
+        self._down_count, self._down_mean, self._down_m2 = self._merge(
+            self._down_count, self._down_mean, self._down_m2, returns[returns < 0]
+        )
+
+        peaks = np.maximum.accumulate(np.maximum(equity, self.peak))
+        self.max_drawdown = min(self.max_drawdown, float((equity - peaks).min()))
+        self.peak = float(peaks[-1])
+        self._prev_equity = float(equity[-1])
+        self.last_equity = float(equity[-1])
+
+    @staticmethod
+    def _merge(count: int, mean: float, m2: float, values: np.ndarray):
+        """Combine running moments with a batch of values (Chan et al.)."""
+        n = len(values)
+        if n == 0:
+            return count, mean, m2
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        total = count + n
+        delta = batch_mean - mean
+        return total, mean + delta * n / total, m2 + batch_m2 + delta ** 2 * count * n / total
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation of daily returns."""
+        return float(np.sqrt(self._m2 / (self.count - 1))) if self.count > 1 else 0.0
+
+    @property
+    def downside_std(self) -> float:
+        """Sample standard deviation of negative daily returns."""
+        return float(np.sqrt(self._down_m2 / (self._down_count - 1))) if self._down_count > 1 else 0.0
+
+    @property
+    def sharpe_ratio(self) -> float:
+        """Annualized Sharpe ratio (0% risk-free rate)."""
+        std = self.std
+        return self._mean / std * np.sqrt(TRADING_DAYS_PER_YEAR) if std > 0 else 0.0
+
+    @property
+    def sortino_ratio(self) -> float:
+        """Annualized Sortino ratio; equals Sharpe when there are no down days."""
+        if self._down_count == 0:
+            return self.sharpe_ratio
+        downside_std = self.downside_std
+        return self._mean / downside_std * np.sqrt(TRADING_DAYS_PER_YEAR) if downside_std > 0 else 0.0
+
+    @property
+    def volatility(self) -> float:
+        """Annualized volatility in percent."""
+        return self.std * np.sqrt(TRADING_DAYS_PER_YEAR) * 100
+
+    @property
+    def total_return_pct(self) -> float:
+        return (self.last_equity - self.initial_balance) / self.initial_balance * 100
+
+    @property
+    def cagr(self) -> float:
+        """Compound annual growth rate in percent."""
+        years = self.count / TRADING_DAYS_PER_YEAR
+        if years > 0 and self.last_equity > 0:
+            return ((self.last_equity / self.initial_balance) ** (1 / years) - 1) * 100
+        return 0.0
+
+    @property
+    def max_drawdown_pct(self) -> float:
+        """Maximum drawdown as a percent of the highest equity seen."""
+        return self.max_drawdown / self.peak * 100 if self.peak > 0 else 0.0
+
+    @property
+    def current_drawdown_pct(self) -> float:
+        """Drawdown of the latest bar from the running peak, in percent."""
+        return (self.last_equity - self.peak) / self.peak * 100 if self.peak > 0 else 0.0
+
+    @property
+    def calmar_ratio(self) -> float:
+        max_drawdown_pct = abs(self.max_drawdown_pct)
+        return self.cagr / max_drawdown_pct if max_drawdown_pct > 0 else 0.0
+
+    def get_state(self) -> Dict[str, float]:
+        """Raw accumulator state, restorable with restore_state()."""
+        return dict(vars(self))
+
+    def restore_state(self, state: Dict[str, float]):
+        """Continue accumulating from a get_state() snapshot."""
+        vars(self).update(state)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Current values of all metrics."""
+        return {
+            'current_equity': self.last_equity,
+            'total_return_pct': self.total_return_pct,
+            'cagr': self.cagr,
+            'sharpe_ratio': self.sharpe_ratio,
+            'sortino_ratio': self.sortino_ratio,
+            'volatility': self.volatility,
+            'max_drawdown': self.max_drawdown,
+            'max_drawdown_pct': self.max_drawdown_pct,
+            'current_drawdown_pct': self.current_drawdown_pct,
+            'calmar_ratio': self.calmar_ratio,
+        }
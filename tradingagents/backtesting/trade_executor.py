@@ -48,6 +48,19 @@ class TradeExecutor:
         
         return False
     
+    def execute_order(self, ticker: str, signal: TradeSignal, shares: float,
+                      price: float, date: str) -> bool:
+        """Fill an order of a fixed size, charging the configured commission and slippage."""
+        commission = self._calculate_commission(shares, price)
+        slippage = self._calculate_slippage(shares, price)
+        
+        if signal == TradeSignal.BUY:
+            return self.account.buy(ticker, shares, price, date, commission, slippage)
+        elif signal == TradeSignal.SELL:
+            return self.account.sell(ticker, shares, price, date, commission, slippage)
+        
+        return False
+    
     def _calculate_position_size(self, ticker: str, signal: TradeSignal,
                                  price: float, confidence: float) -> float:
         if signal == TradeSignal.SELL:
@@ -0,0 +1,159 @@
+"""
+FIFO Trade Matching
+Matches SELL fills against earlier BUY lots to produce round-trip trades.
+"""
+import logging
+from typing import Dict
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+ROUND_TRIP_COLUMNS = [
+    'ticker', 'entry_date', 'exit_date', 'shares', 'entry_price', 'exit_price',
+    'costs', 'pnl', 'return_pct', 'holding_days'
+]
+
+
+def match_fifo(tickers: np.ndarray, actions: np.ndarray, shares: np.ndarray,
+               prices: np.ndarray, costs: np.ndarray, dates: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Match fills first-in-first-out without a per-lot Python loop.
+
+    Per ticker, BUY lots and SELL fills each cover consecutive intervals on a
+    cumulative-share axis. Cutting that axis at every interval boundary yields
+    segments that belong to exactly one buy lot and at most one sell; each
+    segment with both is a round trip. Tickers are laid side by side on the
+    axis, so all of them are matched in one pass.
+
+    Args:
+        tickers: Ticker per fill
+        actions: "BUY" or "SELL" per fill
+        shares: Share quantity per fill
+        prices: Fill price per fill
+        costs: Commission plus slippage per fill
+        dates: Fill date per fill (datetime64)
+
+    Returns:
+        Dictionary of per-round-trip arrays keyed by ROUND_TRIP_COLUMNS
+    """
+    tickers = np.asarray(tickers).astype(str)
+    is_buy = np.asarray(actions).astype(str) == "BUY"
+    shares = np.asarray(shares, dtype=np.float64)
+    prices = np.asarray(prices, dtype=np.float64)
+    costs = np.asarray(costs, dtype=np.float64)
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+
+    keep = shares > 0
+    if not keep.all():
+        tickers, is_buy, shares, prices, costs, dates = (
+            a[keep] for a in (tickers, is_buy, shares, prices, costs, dates)
+        )
+    if len(shares) == 0:
+        return _empty_round_trips()
+
+    # Group by ticker, keeping log (chronological) order inside each group
+    order = np.lexsort((np.arange(len(tickers)), tickers))
+    tickers, is_buy, shares, prices, costs, dates = (
+        a[order] for a in (tickers, is_buy, shares, prices, costs, dates)
+    )
+    unique_tickers, group = np.unique(tickers, return_inverse=True)
+
+    buy_qty = np.where(is_buy, shares, 0.0)
+    sell_qty = np.where(is_buy, 0.0, shares)
+    total_buy = np.bincount(group, buy_qty, minlength=len(unique_tickers))
+    total_sell = np.bincount(group, sell_qty, minlength=len(unique_tickers))
+
+    # Each ticker owns its own stretch of the share axis
+    span = np.maximum(total_buy, total_sell)
+    group_offset = np.concatenate([[0.0], np.cumsum(span)[:-1]])
+    prior_buy = np.concatenate([[0.0], np.cumsum(total_buy)[:-1]])
+    prior_sell = np.concatenate([[0.0], np.cumsum(total_sell)[:-1]])
+
+    buy_end = (np.cumsum(buy_qty) - prior_buy[group] + group_offset[group])[is_buy]
+    sell_end = (np.cumsum(sell_qty) - prior_sell[group] + group_offset[group])[~is_buy]
+    buy_start = buy_end - shares[is_buy]
+    sell_start = sell_end - shares[~is_buy]
+    if len(sell_end) == 0:
+        return _empty_round_trips()
+
+    bounds = np.union1d(np.concatenate([buy_start, buy_end]), np.concatenate([sell_start, sell_end]))
+    seg_start = bounds[:-1]
+    seg_qty = np.diff(bounds)
+
+    buy_idx = np.searchsorted(buy_end, seg_start, side='right')
+    sell_idx = np.searchsorted(sell_end, seg_start, side='right')
+    in_buy = buy_idx < len(buy_end)
+    in_sell = sell_idx < len(sell_end)
+    buy_idx = np.minimum(buy_idx, len(buy_end) - 1)
+    sell_idx = np.minimum(sell_idx, len(sell_end) - 1)
+    matched = (in_buy & in_sell & (buy_start[buy_idx] <= seg_start) & (sell_start[sell_idx] <= seg_start)
+               & (seg_qty > 1e-12))
+    # A segment can only pair fills of the same ticker
+    matched &= group[is_buy][buy_idx] == group[~is_buy][sell_idx]
+
+    buy_idx, sell_idx, qty = buy_idx[matched], sell_idx[matched], seg_qty[matched]
+
+    buy_shares, sell_shares = shares[is_buy], shares[~is_buy]
+    entry_price = prices[is_buy][buy_idx]
+    exit_price = prices[~is_buy][sell_idx]
+    # Fill costs are split pro rata over the shares each segment takes from the fill
+    entry_costs = costs[is_buy][buy_idx] * qty / buy_shares[buy_idx]
+    exit_costs = costs[~is_buy][sell_idx] * qty / sell_shares[sell_idx]
+    trip_costs = entry_costs + exit_costs
+
+    pnl = qty * (exit_price - entry_price) - trip_costs
+    invested = qty * entry_price + entry_costs
+    return_pct = np.divide(pnl, invested, out=np.zeros_like(pnl), where=invested > 0) * 100
+
+    entry_date = dates[is_buy][buy_idx]
+    exit_date = dates[~is_buy][sell_idx]
+    holding_days = (exit_date - entry_date) / np.timedelta64(1, 'D')
+
+    return {
+        'ticker': tickers[is_buy][buy_idx],
+        'entry_date': entry_date,
+        'exit_date': exit_date,
+        'shares': qty,
+        'entry_price': entry_price,
+        'exit_price': exit_price,
+        'costs': trip_costs,
+        'pnl': pnl,
+        'return_pct': return_pct,
+        'holding_days': holding_days,
+    }
+
+
+def round_trips_from_trades(trades_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Build a round-trip table from a trade log.
+
+    Args:
+        trades_df: Trade log with date, ticker, action, shares, price,
+            commission and slippage (date may be a column or the index)
+
+    Returns:
+        DataFrame with one row per FIFO-matched round trip (ROUND_TRIP_COLUMNS)
+    """
+    if trades_df.empty:
+        return pd.DataFrame(columns=ROUND_TRIP_COLUMNS)
+
+    dates = trades_df['date'] if 'date' in trades_df.columns else trades_df.index
+    round_trips = match_fifo(
+        trades_df['ticker'].to_numpy(),
+        trades_df['action'].to_numpy(),
+        trades_df['shares'].to_numpy(),
+        trades_df['price'].to_numpy(),
+        (trades_df['commission'] + trades_df['slippage']).to_numpy(),
+        pd.to_datetime(np.asarray(dates)).to_numpy(dtype='datetime64[ns]'),
+    )
+    return pd.DataFrame(round_trips, columns=ROUND_TRIP_COLUMNS)
+
+
+def _empty_round_trips() -> Dict[str, np.ndarray]:
+    return {
+        'ticker': np.empty(0, dtype=str),
+        'entry_date': np.empty(0, dtype='datetime64[ns]'),
+        'exit_date': np.empty(0, dtype='datetime64[ns]'),
+        **{col: np.empty(0) for col in ROUND_TRIP_COLUMNS[3:]},
+    }
@@ -0,0 +1,206 @@
+"""
+Trading Calendars
+Precomputed exchange session indexes (NYSE and 24/7 crypto) for vectorized
+session lookups and data validation.
+"""
+import re
+import logging
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar, Holiday, GoodFriday, USPresidentsDay, USMemorialDay,
+    USLaborDay, USThanksgivingDay, nearest_workday, sunday_to_monday
+)
+from pandas.tseries.offsets import DateOffset
+from dateutil.relativedelta import MO
+
+logger = logging.getLogger(__name__)
+
+# Span of the precomputed session arrays
+CALENDAR_START = "1970-01-01"
+CALENDAR_END = "2060-12-31"
+
+# Unscheduled full-day NYSE closures
+NYSE_SPECIAL_CLOSURES = [
+    "1985-09-27",  # Hurricane Gloria
+    "1994-04-27",  # President Nixon's funeral
+    "2001-09-11", "2001-09-12", "2001-09-13", "2001-09-14",  # September 11
+    "2004-06-11",  # President Reagan's funeral
+    "2007-01-02",  # President Ford's funeral
+    "2012-10-29", "2012-10-30",  # Hurricane Sandy
+    "2018-12-05",  # President G.H.W. Bush's funeral
+    "2025-01-09",  # President Carter's funeral
+]
+
+CRYPTO_QUOTES = ('USD', 'USDT', 'USDC', 'BUSD', 'EUR', 'BTC', 'ETH')
+CRYPTO_SYMBOLS = {'BTC', 'ETH', 'SOL', 'XRP', 'ADA', 'DOGE', 'DOT', 'AVAX', 'LTC', 'BNB', 'MATIC', 'LINK'}
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """Regular NYSE full-day holidays."""
+
+    rules = [
+        # A Saturday New Year's Day is not observed on the preceding Friday
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        Holiday("Martin Luther King Jr. Day", month=1, day=1, start_date="1998-01-01",
+                offset=DateOffset(weekday=MO(3))),
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-01-01", observance=nearest_workday),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas Day", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+def _to_days(dates) -> np.ndarray:
+    """Dates (anything pandas can parse) as int64 days since the epoch."""
+    index = pd.DatetimeIndex(pd.to_datetime(dates))
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.values.astype('datetime64[D]').astype(np.int64)
+
+
+def _day(date) -> int:
+    return int(_to_days([date])[0])
+
+
+class TradingCalendar:
+    """
+    Sorted int64 array of session days (days since 1970-01-01) for one market.
+
+    Built once per calendar name (see get_calendar()); every lookup is a
+    binary search or set operation on that array.
+    """
+
+    def __init__(self, name: str):
+        """
+        Build a calendar.
+
+        Args:
+            name: "NYSE" or "crypto"
+        """
+        self.name = name
+        days = pd.date_range(CALENDAR_START, CALENDAR_END, freq='D')
+        if name == "crypto":
+            sessions = days
+        elif name == "NYSE":
+            holidays = NYSEHolidayCalendar().holidays(CALENDAR_START, CALENDAR_END)
+            closed = holidays.union(pd.DatetimeIndex(NYSE_SPECIAL_CLOSURES))
+            sessions = days[(days.dayofweek < 5) & ~days.isin(closed)]
+        else:
+            raise ValueError(f"Unknown trading calendar: {name}")
+
+        self.session_days = _to_days(sessions)
+        self.session_days.flags.writeable = False
+        self._first, self._last = int(self.session_days[0]), int(self.session_days[-1])
+
+    def _check_range(self, start: int, end: int):
+        if start < self._first - 7 or end > self._last + 7:
+            raise ValueError(f"Dates outside the {self.name} calendar span {CALENDAR_START}..{CALENDAR_END}")
+
+    def session_range(self, start_date, end_date) -> np.ndarray:
+        """
+        Session days in [start_date, end_date] (a view into the calendar array).
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+
+        Returns:
+            int64 days since the epoch
+        """
+        start, end = _day(start_date), _day(end_date)
+        self._check_range(start, end)
+        lo = np.searchsorted(self.session_days, start, side='left')
+        hi = np.searchsorted(self.session_days, end, side='right')
+        return self.session_days[lo:hi]
+
+    def sessions(self, start_date, end_date) -> pd.DatetimeIndex:
+        """Session dates in [start_date, end_date]."""
+        return pd.DatetimeIndex(self.session_range(start_date, end_date).astype('datetime64[D]'))
+
+    def is_session(self, dates) -> np.ndarray:
+        """
+        Flag which dates are trading sessions (time of day is ignored).
+
+        Args:
+            dates: Dates or timestamps
+
+        Returns:
+            Boolean array, one entry per date
+        """
+        days = _to_days(dates)
+        if len(days) == 0:
+            return np.zeros(0, dtype=bool)
+        self._check_range(int(days.min()), int(days.max()))
+        positions = np.searchsorted(self.session_days, days)
+        positions = np.minimum(positions, len(self.session_days) - 1)
+        return self.session_days[positions] == days
+
+    def missing_sessions(self, dates, start_date, end_date, interval: str = "daily") -> pd.DatetimeIndex:
+        """
+        Sessions in [start_date, end_date] with no bar in dates.
+
+        Intraday bars count for the session of their date. For weekly data a
+        week is missing when none of its sessions has a bar, and the week's
+        first session is reported.
+
+        Args:
+            dates: Bar timestamps (e.g. a DataFrame index)
+            start_date: First expected date (inclusive)
+            end_date: Last expected date (inclusive)
+            interval: Data frequency (daily, weekly, intraday)
+
+        Returns:
+            Missing session dates, sorted
+        """
+        expected = self.session_range(start_date, end_date)
+        observed = np.unique(_to_days(dates))
+
+        if interval == "weekly":
+            # 1970-01-01 was a Thursday; shift so weeks start on Monday
+            expected_weeks = (expected + 3) // 7
+            observed_weeks = np.unique((observed + 3) // 7)
+            missing_weeks = ~np.isin(expected_weeks, observed_weeks)
+            first_of_week = np.concatenate([[True], np.diff(expected_weeks) > 0])
+            missing = expected[missing_weeks & first_of_week]
+        else:
+            missing = np.setdiff1d(expected, observed, assume_unique=True)
+
+        return pd.DatetimeIndex(missing.astype('datetime64[D]'))
+
+
+@lru_cache(maxsize=None)
+def get_calendar(name: str = "NYSE") -> TradingCalendar:
+    """Shared, precomputed calendar by name ("NYSE" or "crypto")."""
+    logger.debug(f"Building {name} trading calendar")
+    return TradingCalendar(name)
+
+
+def calendar_for_ticker(ticker: str) -> str:
+    """
+    Guess the calendar of a ticker.
+
+    Only pairs with a quote currency ("BTC-USD", "ETH/USDT", "ETHUSDT") count
+    as crypto: bare symbols such as "SOL" or "LINK" are also listed US
+    equities. Pass calendar="crypto" explicitly for bare crypto symbols.
+
+    Args:
+        ticker: Symbol such as "AAPL", "BTC-USD" or "ETHUSDT"
+
+    Returns:
+        "crypto" for crypto pairs, otherwise "NYSE"
+    """
+    parts = re.split(r'[-/]', ticker.upper())
+    if len(parts) == 2:
+        base, quote = parts
+        return "crypto" if base in CRYPTO_SYMBOLS and quote in CRYPTO_QUOTES else "NYSE"
+    symbol = parts[0]
+    for quote in CRYPTO_QUOTES:
+        if symbol.endswith(quote) and symbol[:-len(quote)] in CRYPTO_SYMBOLS:
+            return "crypto"
+    return "NYSE"
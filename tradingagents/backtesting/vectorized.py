@@ -0,0 +1,311 @@
+"""
+Vectorized Backtest Simulation
+Simulates positions, cash and equity from precomputed signal arrays with NumPy.
+"""
+import logging
+from typing import Dict, Union, Sequence
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_CODES = {'BUY': 1, 'SELL': -1, 'HOLD': 0}
+
+
+def encode_signals(signals: Union[pd.Series, Sequence, np.ndarray],
+                   index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Convert BUY/SELL/HOLD signals into an int8 array aligned to the price index.
+
+    Args:
+        signals: Series indexed by date, or array/list with one entry per bar.
+            Entries may be "BUY"/"SELL"/"HOLD" strings or 1/-1/0 codes.
+        index: Price index to align to (dates missing from a Series are HOLD)
+
+    Returns:
+        Array of signal codes (1 = BUY, -1 = SELL, 0 = HOLD)
+    """
+    if isinstance(signals, pd.Series):
+        signals = signals.reindex(index)
+        values = signals.to_numpy()
+    else:
+        values = np.asarray(signals)
+        if len(values) != len(index):
+            raise ValueError(f"Signal array length {len(values)} does not match {len(index)} bars")
+
+    if values.dtype.kind in 'iuf':
+        codes = np.sign(np.nan_to_num(values.astype(float)))
+    else:
+        lookup = np.vectorize(lambda s: SIGNAL_CODES.get(str(s).upper(), 0), otypes=[np.int8])
+        codes = lookup(values) if len(values) else np.empty(0, dtype=np.int8)
+
+    return codes.astype(np.int8)
+
+
+def align_weights(weights: Union[pd.Series, Sequence, np.ndarray],
+                  index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    Convert target weights into a float array aligned to the price index.
+
+    NaN entries (and dates missing from a Series) keep the previous target.
+
+    Args:
+        weights: Series indexed by date, or array/list with one entry per bar
+        index: Price index to align to
+
+    Returns:
+        Array of target weights in [0, 1]
+    """
+    if isinstance(weights, pd.Series):
+        values = weights.reindex(index).ffill().fillna(0.0).to_numpy(dtype=float)
+    else:
+        values = pd.Series(np.asarray(weights, dtype=float)).ffill().fillna(0.0).to_numpy()
+        if len(values) != len(index):
+            raise ValueError(f"Weight array length {len(values)} does not match {len(index)} bars")
+
+    if (values < 0).any() or (values > 1).any():
+        raise ValueError("Target weights must be between 0 and 1 (long-only)")
+    return values
+
+
+def simulate_signals(close: np.ndarray, codes: np.ndarray, initial_balance: float,
+                     commission_rate: float, slippage: float,
+                     risk_per_trade_pct: float, max_position_size_pct: float) -> Dict[str, np.ndarray]:
+    """
+    Simulate BUY/SELL/HOLD codes with the same sizing rules as TradeExecutor.
+
+    Only bars carrying a BUY or SELL code are visited; cash and share holdings are
+    step functions between them, so equity for every bar is filled in with array
+    operations afterwards.
+
+    Args:
+        close: Close prices, one per bar
+        codes: Signal codes from encode_signals()
+        initial_balance: Starting cash
+        commission_rate: Commission as a fraction of trade value
+        slippage: Slippage as a fraction of trade value
+        risk_per_trade_pct: Percent of cash committed per BUY
+        max_position_size_pct: Cap on a single BUY as percent of cash
+
+    Returns:
+        Dictionary of per-bar and per-trade arrays (see _finalize_simulation)
+    """
+    size_frac = min(risk_per_trade_pct, max_position_size_pct) / 100.0
+    cash = float(initial_balance)
+    shares = 0.0
+
+    trade_idx, trade_side, trade_shares, trade_comm, trade_slip = [], [], [], [], []
+    change_idx, cash_after, shares_after = [], [], []
+
+    for i in np.flatnonzero(codes):
+        fill = fill_signal(codes[i], close[i], cash, shares, size_frac, commission_rate, slippage)
+        if fill is None:
+            continue
+        cash, shares, qty, commission, slip = fill
+
+        trade_idx.append(i)
+        trade_side.append(int(codes[i]))
+        trade_shares.append(qty)
+        trade_comm.append(commission)
+        trade_slip.append(slip)
+        change_idx.append(i)
+        cash_after.append(cash)
+        shares_after.append(shares)
+
+    return _finalize_simulation(close, initial_balance, trade_idx, trade_side, trade_shares,
+                                trade_comm, trade_slip, change_idx, cash_after, shares_after)
+
+
+def fill_signal(code: int, price: float, cash: float, shares: float, size_frac: float,
+                commission_rate: float, slippage: float):
+    """
+    Apply one BUY (code > 0) or SELL (code < 0) with the sizing rules of TradeExecutor.
+
+    Args:
+        code: Signal code
+        price: Fill price
+        cash: Cash before the fill
+        shares: Shares held before the fill
+        size_frac: Fraction of cash committed per BUY
+        commission_rate: Commission as a fraction of trade value
+        slippage: Slippage as a fraction of trade value
+
+    Returns:
+        Tuple of (cash, shares, qty, commission, slippage) after the fill, or
+        None if nothing fills
+    """
+    if code > 0:
+        # Sizing mirrors TradeExecutor: cost on the fractional size, fill on whole shares
+        size = cash * size_frac / price
+        qty = int(size)
+        if qty <= 0:
+            return None
+        commission = size * price * commission_rate
+        slip = size * price * slippage
+        cost = qty * price + commission + slip
+        if cash < cost:
+            return None
+        return cash - cost, shares + qty, qty, commission, slip
+
+    if shares <= 0:
+        return None
+    qty = shares
+    commission = qty * price * commission_rate
+    slip = qty * price * slippage
+    return cash + qty * price - commission - slip, 0.0, qty, commission, slip
+
+
+def simulate_target_weights(close: np.ndarray, weights: np.ndarray, initial_balance: float,
+                            commission_rate: float, slippage: float) -> Dict[str, np.ndarray]:
+    """
+    Simulate rebalancing to a target portfolio weight.
+
+    The position is rebalanced to floor(weight * equity / price) whole shares on
+    every bar where the target weight changes. Buys are trimmed to what cash can
+    cover after costs.
+
+    Args:
+        close: Close prices, one per bar
+        weights: Target weights from align_weights()
+        initial_balance: Starting cash
+        commission_rate: Commission as a fraction of trade value
+        slippage: Slippage as a fraction of trade value
+
+    Returns:
+        Dictionary of per-bar and per-trade arrays (see _finalize_simulation)
+    """
+    cost_rate = commission_rate + slippage
+    cash = float(initial_balance)
+    shares = 0.0
+
+    trade_idx, trade_side, trade_shares, trade_comm, trade_slip = [], [], [], [], []
+    change_idx, cash_after, shares_after = [], [], []
+
+    rebalance_bars = np.flatnonzero(np.diff(weights, prepend=0.0) != 0)
+    for i in rebalance_bars:
+        price = close[i]
+        equity = cash + shares * price
+        delta = int(weights[i] * equity / price) - shares
+        if delta > 0:
+            delta = min(delta, int(cash / (price * (1 + cost_rate))))
+        if delta == 0:
+            continue
+
+        qty = abs(delta)
+        commission = qty * price * commission_rate
+        slip = qty * price * slippage
+        if delta > 0:
+            cash -= qty * price + commission + slip
+        else:
+            cash += qty * price - commission - slip
+        shares += delta
+
+        trade_idx.append(i)
+        trade_side.append(1 if delta > 0 else -1)
+        trade_shares.append(qty)
+        trade_comm.append(commission)
+        trade_slip.append(slip)
+        change_idx.append(i)
+        cash_after.append(cash)
+        shares_after.append(shares)
+
+    return _finalize_simulation(close, initial_balance, trade_idx, trade_side, trade_shares,
+                                trade_comm, trade_slip, change_idx, cash_after, shares_after)
+
+
+def _finalize_simulation(close, initial_balance, trade_idx, trade_side, trade_shares,
+                         trade_comm, trade_slip, change_idx, cash_after, shares_after) -> Dict[str, np.ndarray]:
+    """
+    Expand trade-time state changes into per-bar arrays.
+
+    Equity is marked at each bar's close before that bar's trade executes, matching
+    the order of record_equity() and execute_signal() in the event loop.
+    """
+    n = len(close)
+
+    # Index of the most recent state change at or before each bar (0 = initial state)
+    marker = np.zeros(n, dtype=np.int64)
+    marker[np.asarray(change_idx, dtype=np.int64)] = np.arange(1, len(change_idx) + 1)
+    latest = np.maximum.accumulate(marker) if n else marker
+
+    cash_post = np.concatenate([[initial_balance], np.asarray(cash_after, dtype=float)])[latest]
+    shares_post = np.concatenate([[0.0], np.asarray(shares_after, dtype=float)])[latest]
+
+    cash_pre = np.concatenate([[initial_balance], cash_post[:-1]]) if n else cash_post
+    shares_pre = np.concatenate([[0.0], shares_post[:-1]]) if n else shares_post
+    equity = cash_pre + shares_pre * close
+
+    daily_return = np.zeros(n)
+    if n > 1:
+        prev = equity[:-1]
+        np.divide(equity[1:] - prev, prev, out=daily_return[1:], where=prev > 0)
+
+    return {
+        'cash': cash_pre,
+        'shares': shares_pre,
+        'equity': equity,
+        'daily_return': daily_return,
+        'final_cash': cash_post[-1] if n else float(initial_balance),
+        'final_shares': shares_post[-1] if n else 0.0,
+        'trade_idx': np.asarray(trade_idx, dtype=np.int64),
+        'trade_side': np.asarray(trade_side, dtype=np.int8),
+        'trade_shares': np.asarray(trade_shares, dtype=float),
+        'trade_commission': np.asarray(trade_comm, dtype=float),
+        'trade_slippage': np.asarray(trade_slip, dtype=float),
+    }
+
+
+def simulation_to_frames(sim: Dict[str, np.ndarray], ticker: str, index: pd.DatetimeIndex,
+                         close: np.ndarray, keep_time: bool = False):
+    """
+    Convert simulation arrays to trade and equity DataFrames.
+
+    The frames have the same columns as SimulatedAccount.get_trade_history() and
+    SimulatedAccount.get_equity_curve().
+
+    Args:
+        sim: Result of simulate_signals() or simulate_target_weights()
+        ticker: Symbol recorded on each trade
+        index: Bar timestamps
+        close: Close prices, one per bar
+        keep_time: Keep the time of day (intraday bars) instead of the session date
+
+    Returns:
+        Tuple of (trades_df, equity_df)
+    """
+    dates = _session_dates(index) if not keep_time else index
+    equity_df = pd.DataFrame({
+        'cash_balance': sim['cash'],
+        'total_equity': sim['equity'],
+        'daily_return': sim['daily_return'],
+    }, index=pd.DatetimeIndex(dates, name='date'))
+
+    if len(sim['trade_idx']) == 0:
+        return pd.DataFrame(), equity_df
+
+    idx = sim['trade_idx']
+    price = close[idx]
+    shares = sim['trade_shares']
+    gross = shares * price
+    buys = sim['trade_side'] > 0
+    costs = sim['trade_commission'] + sim['trade_slippage']
+
+    trades_df = pd.DataFrame({
+        'date': dates[idx],
+        'ticker': ticker,
+        'action': np.where(buys, 'BUY', 'SELL'),
+        'shares': shares,
+        'price': price,
+        'gross_amount': gross,
+        'commission': sim['trade_commission'],
+        'slippage': sim['trade_slippage'],
+        'net_amount': np.where(buys, -(gross + costs), gross - costs),
+    })
+    return trades_df, equity_df
+
+
+def _session_dates(index: pd.DatetimeIndex) -> pd.DatetimeIndex:
+    """Strip timezone and time of day, as the event loop's strftime('%Y-%m-%d') does."""
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
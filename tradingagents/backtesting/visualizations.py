@@ -2,8 +2,10 @@
 Visualization Generator
 Creates charts and plots for backtest results.
 """
+import os
 import logging
-from typing import Optional, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, List
 import pandas as pd
 import numpy as np
 
@@ -11,39 +13,353 @@ logger = logging.getLogger(__name__)
 
 # Try to import matplotlib, but make it optional
 try:
-    import matplotlib.pyplot as plt
     import matplotlib.dates as mdates
     from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.ticker import FuncFormatter
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
     logger.warning("matplotlib not available. Install with: pip install matplotlib")
 
+DEFAULT_DPI = 300
+FAST_DPI = 150  # Opt-in draft quality (VisualizationGenerator(fast=True))
+CHART_KINDS = ['equity_curve', 'drawdown', 'monthly_returns', 'trade_distribution', 'dashboard']
+CHART_SIZES = {
+    'equity_curve': (12, 6),
+    'drawdown': (12, 6),
+    'monthly_returns': (14, 6),
+    'trade_distribution': (12, 6),
+    'dashboard': (16, 12),
+}
+
+
+def lttb_downsample(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    
+    Keeps the first and last points and, from each of threshold - 2 equal
+    buckets in between, the point forming the largest triangle with the point
+    kept from the previous bucket and the mean of the next bucket. Peaks and
+    troughs survive, unlike with plain striding.
+    
+    Args:
+        x: Monotonic x values (e.g. matplotlib date numbers)
+        y: y values
+        threshold: Number of points to keep
+    
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+    # Running sums give every bucket's mean in O(1)
+    x_sums = np.concatenate([[0.0], np.cumsum(x)])
+    y_sums = np.concatenate([[0.0], np.cumsum(y)])
+    next_starts = np.append(ends[:-1], n - 1)
+    next_ends = np.append(ends[1:], n)
+    counts = next_ends - next_starts
+    next_x = (x_sums[next_ends] - x_sums[next_starts]) / counts
+    next_y = (y_sums[next_ends] - y_sums[next_starts]) / counts
+    
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i, (lo, hi) in enumerate(zip(starts, ends)):
+        bx, by = x[lo:hi], y[lo:hi]
+        area = np.abs((x[a] - next_x[i]) * (by - y[a]) - (x[a] - bx) * (next_y[i] - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def _downsample_series(index: pd.DatetimeIndex, values: np.ndarray, max_points: int):
+    """Convert dates to matplotlib numbers and downsample to max_points."""
+    x = mdates.date2num(index.to_numpy())
+    y = np.asarray(values, dtype=np.float64)
+    keep = lttb_downsample(x, y, max_points)
+    return x[keep], y[keep]
+
+
+def _style_axes(ax):
+    """Dark-grid look set per axes, so no global style state is touched."""
+    ax.set_facecolor('#EAEAF2')
+    ax.grid(True, color='white', alpha=0.8)
+    ax.set_axisbelow(True)
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+
+def _currency_formatter():
+    return FuncFormatter(lambda x, p: f'${x:,.0f}')
+
+
+def _draw_equity(ax, data: Dict, title_size: int = 14, detailed: bool = True):
+    _style_axes(ax)
+    if detailed:
+        ax.plot(data['equity_x'], data['equity_y'], label='Portfolio Value', linewidth=2, color='#2E86AB')
+        ax.axhline(y=data['initial_balance'], color='gray', linestyle='--', alpha=0.5, label='Initial Balance')
+        ax.set_title(f"Equity Curve - {data['ticker']}", fontsize=title_size, fontweight='bold')
+        ax.set_xlabel('Date', fontsize=12)
+        ax.set_ylabel('Portfolio Value ($)', fontsize=12)
+        ax.legend(loc='best')
+    else:
+        ax.plot(data['equity_x'], data['equity_y'], linewidth=2, color='#2E86AB')
+        ax.axhline(y=data['initial_balance'], color='gray', linestyle='--', alpha=0.5)
+        ax.set_title('Equity Curve', fontsize=title_size, fontweight='bold')
+        ax.set_ylabel('Portfolio Value ($)')
+    ax.yaxis.set_major_formatter(_currency_formatter())
+    ax.xaxis_date()
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+
+
+def _draw_drawdown(ax, data: Dict, title_size: int = 14, detailed: bool = True):
+    _style_axes(ax)
+    ax.fill_between(data['drawdown_x'], data['drawdown_y'], 0, color='#A23B72', alpha=0.3, label='Drawdown')
+    ax.plot(data['drawdown_x'], data['drawdown_y'], color='#A23B72', linewidth=1.5)
+    ax.set_ylabel('Drawdown (%)', fontsize=12 if detailed else None)
+    ax.xaxis_date()
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    if detailed:
+        ax.set_title(f"Drawdown - {data['ticker']}", fontsize=title_size, fontweight='bold')
+        ax.set_xlabel('Date', fontsize=12)
+        ax.legend(loc='best')
+    else:
+        ax.set_title('Drawdown', fontsize=title_size, fontweight='bold')
+
+
+def _draw_monthly(ax, data: Dict, title_size: int = 14, detailed: bool = True):
+    _style_axes(ax)
+    returns = data['monthly_returns']
+    colors = np.where(returns > 0, '#06A77D', '#D62246')
+    if detailed:
+        ax.bar(data['monthly_x'], returns, width=20, color=colors, alpha=0.7)
+        ax.set_title(f"Monthly Returns - {data['ticker']}", fontsize=title_size, fontweight='bold')
+        ax.set_xlabel('Month', fontsize=12)
+        ax.xaxis_date()
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    else:
+        ax.bar(np.arange(len(returns)), returns, color=colors, alpha=0.7)
+        ax.set_title('Monthly Returns', fontsize=title_size, fontweight='bold')
+    ax.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
+    ax.set_ylabel('Return (%)', fontsize=12 if detailed else None)
+
+
+def _draw_trades(ax, data: Dict, title_size: int = 14, detailed: bool = True):
+    _style_axes(ax)
+    pnl = data['trade_pnl']
+    ax.hist(pnl, bins=30 if detailed else 20, color='#2E86AB', alpha=0.7, edgecolor='black')
+    ax.axvline(x=0, color='red', linestyle='--', linewidth=2, label='Break-even')
+    if detailed:
+        mean_pnl = float(pnl.mean())
+        ax.axvline(x=mean_pnl, color='green', linestyle='--', linewidth=2, label=f'Mean: ${mean_pnl:.2f}')
+        ax.set_title(f"Trade P&L Distribution - {data['ticker']}", fontsize=title_size, fontweight='bold')
+        ax.set_ylabel('Number of Trades', fontsize=12)
+        ax.legend(loc='best')
+    else:
+        ax.set_title('Trade P&L Distribution', fontsize=title_size, fontweight='bold')
+        ax.set_ylabel('Count')
+    ax.set_xlabel('Profit/Loss ($)', fontsize=12 if detailed else None)
+    ax.xaxis.set_major_formatter(_currency_formatter())
+
+
+def _draw_metrics(ax, data: Dict):
+    ax.axis('off')
+    metrics = data['metrics']
+    metrics_text = f"""
+        PERFORMANCE METRICS
+        
+        Returns:
+          Total Return: {metrics['total_return_pct']:.2f}%
+          CAGR: {metrics['cagr']:.2f}%
+        
+        Risk:
+          Sharpe Ratio: {metrics['sharpe_ratio']:.2f}
+          Max Drawdown: {metrics['max_drawdown_pct']:.2f}%
+          Volatility: {metrics['volatility']:.2f}%
+        
+        Trades:
+          Total: {metrics['total_trades']}
+          Win Rate: {metrics['win_rate']:.2f}%
+          Profit Factor: {metrics['profit_factor']:.2f}
+        """
+    ax.text(0.1, 0.5, metrics_text, fontsize=10, family='monospace', verticalalignment='center')
+
+
+def _draw_chart(fig, kind: str, data: Dict) -> bool:
+    """Draw one chart kind onto an empty figure. Returns False if there is nothing to draw."""
+    if kind == 'dashboard':
+        gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
+        if len(data['equity_x']):
+            _draw_equity(fig.add_subplot(gs[0, :]), data, title_size=12, detailed=False)
+        if len(data['drawdown_x']):
+            _draw_drawdown(fig.add_subplot(gs[1, 0]), data, title_size=12, detailed=False)
+        if len(data['monthly_returns']):
+            _draw_monthly(fig.add_subplot(gs[1, 1]), data, title_size=12, detailed=False)
+        if len(data['trade_pnl']):
+            _draw_trades(fig.add_subplot(gs[2, 0]), data, title_size=12, detailed=False)
+        _draw_metrics(fig.add_subplot(gs[2, 1]), data)
+        fig.suptitle(f"Backtest Dashboard - {data['ticker']}", fontsize=16, fontweight='bold', y=0.98)
+        return True
+    
+    series, draw = {
+        'equity_curve': ('equity_x', _draw_equity),
+        'drawdown': ('drawdown_x', _draw_drawdown),
+        'monthly_returns': ('monthly_returns', _draw_monthly),
+        'trade_distribution': ('trade_pnl', _draw_trades),
+    }[kind]
+    if not len(data[series]):
+        return False
+    
+    ax = fig.add_subplot()
+    draw(ax, data)
+    for label in ax.get_xticklabels():
+        label.set_rotation(45 if kind != 'trade_distribution' else 0)
+    fig.tight_layout()
+    return True
+
+
+def render_chart(kind: str, data: Dict, filepath: str, dpi: int = DEFAULT_DPI,
+                 figsize: Optional[tuple] = None, bbox_inches: Optional[str] = 'tight') -> Optional[str]:
+    """
+    Render one chart to a file with a private Agg canvas.
+    
+    Uses only the object-oriented API (no pyplot state), so it is safe from
+    worker threads and processes.
+    
+    Args:
+        kind: One of CHART_KINDS
+        data: Chart data from VisualizationGenerator.chart_data()
+        filepath: Output image path
+        dpi: Output resolution
+        figsize: Figure size (defaults per kind)
+        bbox_inches: Passed to savefig; None keeps the full figure and skips
+            the extra layout pass of 'tight'
+    
+    Returns:
+        filepath, or None if there was nothing to draw
+    """
+    fig = Figure(figsize=figsize or CHART_SIZES[kind])
+    FigureCanvasAgg(fig)
+    if not _draw_chart(fig, kind, data):
+        return None
+    fig.savefig(filepath, dpi=dpi, bbox_inches=bbox_inches)
+    return filepath
+
 
 class VisualizationGenerator:
     """
     Generates visualizations for backtest results.
     Creates equity curves, drawdown charts, and other performance plots.
+    
+    Charts are drawn headlessly on Agg canvases through the object-oriented
+    matplotlib API. Long series are reduced with LTTB to about one point per
+    output pixel before drawing. fast=True trades image quality for speed:
+    150 dpi and no tight bounding box.
     """
     
-    def __init__(self, analyzer):
+    def __init__(self, analyzer, dpi: Optional[int] = None, max_points: Optional[int] = None,
+                 fast: bool = False):
         """
         Initialize visualization generator.
         
         Args:
             analyzer: PerformanceAnalyzer instance
+            dpi: Resolution of saved charts (default: DEFAULT_DPI, or FAST_DPI if fast)
+            max_points: Points kept per line series (default: pixel width of
+                the widest chart at dpi)
+            fast: Save at FAST_DPI without bbox_inches='tight'
         """
         if not MATPLOTLIB_AVAILABLE:
             raise ImportError("matplotlib is required for visualizations. Install with: pip install matplotlib")
         
         self.analyzer = analyzer
         self.results = analyzer.results
-        
-        # Set default style
-        plt.style.use('seaborn-v0_8-darkgrid' if 'seaborn-v0_8-darkgrid' in plt.style.available else 'default')
+        self.dpi = dpi or (FAST_DPI if fast else DEFAULT_DPI)
+        self.bbox_inches = None if fast else 'tight'
+        self.max_points = max_points or int(max(w for w, _ in CHART_SIZES.values()) * self.dpi)
+        self._chart_data = None
         
         logger.info("VisualizationGenerator initialized")
     
+    def chart_data(self) -> Dict:
+        """
+        Downsampled, picklable inputs for every chart (computed once).
+        
+        Returns:
+            Dictionary of NumPy arrays and scalars used by render_chart()
+        """
+        if self._chart_data is not None:
+            return self._chart_data
+        
+        equity_df = self.analyzer.equity_df
+        empty = np.empty(0)
+        data = {
+            'ticker': self.results.ticker,
+            'initial_balance': self.results.initial_balance,
+            'equity_x': empty, 'equity_y': empty,
+            'drawdown_x': empty, 'drawdown_y': empty,
+            'monthly_x': empty, 'monthly_returns': empty,
+        }
+        
+        if not equity_df.empty:
+            equity = equity_df['total_equity'].to_numpy(dtype=np.float64)
+            running_max = np.maximum.accumulate(equity)
+            drawdown_pct = (equity - running_max) / running_max * 100
+            data['equity_x'], data['equity_y'] = _downsample_series(equity_df.index, equity, self.max_points)
+            data['drawdown_x'], data['drawdown_y'] = _downsample_series(equity_df.index, drawdown_pct, self.max_points)
+            
+            monthly_df = self.analyzer.get_monthly_returns().dropna()
+            data['monthly_x'] = mdates.date2num(monthly_df['month'].to_numpy())
+            data['monthly_returns'] = monthly_df['return_pct'].to_numpy(dtype=np.float64)
+        
+        # Realized P&L per FIFO round trip
+        data['trade_pnl'] = self.analyzer.get_round_trips()['pnl'].to_numpy(dtype=np.float64)
+        
+        returns = self.analyzer.calculate_returns()
+        risk = self.analyzer.calculate_risk_metrics()
+        trades = self.analyzer.calculate_trade_statistics()
+        data['metrics'] = {
+            'total_return_pct': returns['total_return_pct'],
+            'cagr': returns['cagr'],
+            'sharpe_ratio': risk['sharpe_ratio'],
+            'max_drawdown_pct': risk['max_drawdown_pct'],
+            'volatility': risk['volatility'],
+            'total_trades': trades['total_trades'],
+            'win_rate': trades['win_rate'],
+            'profit_factor': trades['profit_factor'],
+        }
+        
+        self._chart_data = data
+        return data
+    
+    def _plot(self, kind: str, filepath: Optional[str], show: bool, figsize: tuple) -> Optional[Figure]:
+        data = self.chart_data()
+        if show:
+            # Interactive display is the only path that touches pyplot
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=figsize)
+        else:
+            fig = Figure(figsize=figsize)
+            FigureCanvasAgg(fig)
+        
+        if not _draw_chart(fig, kind, data):
+            logger.warning(f"No data to plot for {kind.replace('_', ' ')}")
+            return None
+        
+        if filepath:
+            fig.savefig(filepath, dpi=self.dpi, bbox_inches=self.bbox_inches)
+            logger.info(f"{kind.replace('_', ' ').capitalize()} saved to {filepath}")
+        
+        if show:
+            plt.show()
+        
+        return fig
+    
     def plot_equity_curve(
         self,
         filepath: Optional[str] = None,
@@ -55,53 +371,13 @@ class VisualizationGenerator:
         
         Args:
             filepath: Path to save figure (optional)
-            show: Whether to display the plot
+            show: Whether to display the plot (uses pyplot; leave False on servers)
             figsize: Figure size (width, height)
         
         Returns:
             matplotlib Figure object
         """
-        equity_df = self.analyzer.generate_equity_curve()
-        
-        if equity_df.empty:
-            logger.warning("No equity data to plot")
-            return None
-        
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        # Plot equity curve
-        ax.plot(equity_df.index, equity_df['total_equity'], 
-                label='Portfolio Value', linewidth=2, color='#2E86AB')
-        
-        # Add initial balance reference line
-        ax.axhline(y=self.results.initial_balance, 
-                   color='gray', linestyle='--', alpha=0.5, 
-                   label='Initial Balance')
-        
-        # Formatting
-        ax.set_title(f'Equity Curve - {self.results.ticker}', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Date', fontsize=12)
-        ax.set_ylabel('Portfolio Value ($)', fontsize=12)
-        ax.legend(loc='best')
-        ax.grid(True, alpha=0.3)
-        
-        # Format y-axis as currency
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        
-        # Format x-axis dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        plt.xticks(rotation=45)
-        
-        plt.tight_layout()
-        
-        if filepath:
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            logger.info(f"Equity curve saved to {filepath}")
-        
-        if show:
-            plt.show()
-        
-        return fig
+        return self._plot('equity_curve', filepath, show, figsize)
     
     def plot_drawdown(
         self,
@@ -114,53 +390,13 @@ class VisualizationGenerator:
         
         Args:
             filepath: Path to save figure (optional)
-            show: Whether to display the plot
+            show: Whether to display the plot (uses pyplot; leave False on servers)
             figsize: Figure size (width, height)
         
         Returns:
             matplotlib Figure object
         """
-        drawdown_df = self.analyzer.generate_drawdown_series()
-        
-        if drawdown_df.empty:
-            logger.warning("No drawdown data to plot")
-            return None
-        
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        # Plot drawdown
-        ax.fill_between(drawdown_df.index, 
-                        drawdown_df['drawdown_pct'], 
-                        0, 
-                        color='#A23B72', 
-                        alpha=0.3, 
-                        label='Drawdown')
-        ax.plot(drawdown_df.index, 
-                drawdown_df['drawdown_pct'], 
-                color='#A23B72', 
-                linewidth=1.5)
-        
-        # Formatting
-        ax.set_title(f'Drawdown - {self.results.ticker}', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Date', fontsize=12)
-        ax.set_ylabel('Drawdown (%)', fontsize=12)
-        ax.legend(loc='best')
-        ax.grid(True, alpha=0.3)
-        
-        # Format x-axis dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        plt.xticks(rotation=45)
-        
-        plt.tight_layout()
-        
-        if filepath:
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            logger.info(f"Drawdown chart saved to {filepath}")
-        
-        if show:
-            plt.show()
-        
-        return fig
+        return self._plot('drawdown', filepath, show, figsize)
     
     def plot_monthly_returns(
         self,
@@ -173,48 +409,13 @@ class VisualizationGenerator:
         
         Args:
             filepath: Path to save figure (optional)
-            show: Whether to display the plot
+            show: Whether to display the plot (uses pyplot; leave False on servers)
             figsize: Figure size (width, height)
         
         Returns:
             matplotlib Figure object
         """
-        monthly_df = self.analyzer.get_monthly_returns()
-        
-        if monthly_df.empty:
-            logger.warning("No monthly returns data to plot")
-            return None
-        
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        # Create bar chart with colors based on positive/negative
-        colors = ['#06A77D' if x > 0 else '#D62246' for x in monthly_df['return_pct']]
-        
-        ax.bar(monthly_df['month'], monthly_df['return_pct'], color=colors, alpha=0.7)
-        
-        # Add zero line
-        ax.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
-        
-        # Formatting
-        ax.set_title(f'Monthly Returns - {self.results.ticker}', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Month', fontsize=12)
-        ax.set_ylabel('Return (%)', fontsize=12)
-        ax.grid(True, alpha=0.3, axis='y')
-        
-        # Format x-axis dates
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        plt.xticks(rotation=45)
-        
-        plt.tight_layout()
-        
-        if filepath:
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            logger.info(f"Monthly returns chart saved to {filepath}")
-        
-        if show:
-            plt.show()
-        
-        return fig
+        return self._plot('monthly_returns', filepath, show, figsize)
     
     def plot_trade_distribution(
         self,
@@ -223,62 +424,17 @@ class VisualizationGenerator:
         figsize: tuple = (12, 6)
     ) -> Optional[Figure]:
         """
-        Plot distribution of trade P&L.
+        Plot distribution of realized round-trip P&L.
         
         Args:
             filepath: Path to save figure (optional)
-            show: Whether to display the plot
+            show: Whether to display the plot (uses pyplot; leave False on servers)
             figsize: Figure size (width, height)
         
         Returns:
             matplotlib Figure object
         """
-        if self.analyzer.trades_df.empty:
-            logger.warning("No trade data to plot")
-            return None
-        
-        # Get sell trades (which have P&L)
-        sell_trades = self.analyzer.trades_df[self.analyzer.trades_df['action'] == 'SELL']
-        
-        if sell_trades.empty:
-            logger.warning("No completed trades to plot")
-            return None
-        
-        fig, ax = plt.subplots(figsize=figsize)
-        
-        # Plot histogram of P&L
-        pnl = sell_trades['net_amount']
-        ax.hist(pnl, bins=30, color='#2E86AB', alpha=0.7, edgecolor='black')
-        
-        # Add vertical line at zero
-        ax.axvline(x=0, color='red', linestyle='--', linewidth=2, label='Break-even')
-        
-        # Add mean line
-        mean_pnl = pnl.mean()
-        ax.axvline(x=mean_pnl, color='green', linestyle='--', linewidth=2, 
-                   label=f'Mean: ${mean_pnl:.2f}')
-        
-        # Formatting
-        ax.set_title(f'Trade P&L Distribution - {self.results.ticker}', 
-                     fontsize=14, fontweight='bold')
-        ax.set_xlabel('Profit/Loss ($)', fontsize=12)
-        ax.set_ylabel('Number of Trades', fontsize=12)
-        ax.legend(loc='best')
-        ax.grid(True, alpha=0.3, axis='y')
-        
-        # Format x-axis as currency
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        
-        plt.tight_layout()
-        
-        if filepath:
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            logger.info(f"Trade distribution chart saved to {filepath}")
-        
-        if show:
-            plt.show()
-        
-        return fig
+        return self._plot('trade_distribution', filepath, show, figsize)
     
     def create_dashboard(
         self,
@@ -291,151 +447,41 @@ class VisualizationGenerator:
         
         Args:
             filepath: Path to save figure (optional)
-            show: Whether to display the plot
+            show: Whether to display the plot (uses pyplot; leave False on servers)
             figsize: Figure size (width, height)
         
         Returns:
             matplotlib Figure object
         """
-        fig = plt.figure(figsize=figsize)
-        gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
-        
-        # 1. Equity Curve (top, full width)
-        ax1 = fig.add_subplot(gs[0, :])
-        equity_df = self.analyzer.generate_equity_curve()
-        if not equity_df.empty:
-            ax1.plot(equity_df.index, equity_df['total_equity'], 
-                    linewidth=2, color='#2E86AB')
-            ax1.axhline(y=self.results.initial_balance, 
-                       color='gray', linestyle='--', alpha=0.5)
-            ax1.set_title('Equity Curve', fontsize=12, fontweight='bold')
-            ax1.set_ylabel('Portfolio Value ($)')
-            ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-            ax1.grid(True, alpha=0.3)
-        
-        # 2. Drawdown (middle left)
-        ax2 = fig.add_subplot(gs[1, 0])
-        drawdown_df = self.analyzer.generate_drawdown_series()
-        if not drawdown_df.empty:
-            ax2.fill_between(drawdown_df.index, 
-                            drawdown_df['drawdown_pct'], 
-                            0, 
-                            color='#A23B72', 
-                            alpha=0.3)
-            ax2.plot(drawdown_df.index, 
-                    drawdown_df['drawdown_pct'], 
-                    color='#A23B72', 
-                    linewidth=1.5)
-            ax2.set_title('Drawdown', fontsize=12, fontweight='bold')
-            ax2.set_ylabel('Drawdown (%)')
-            ax2.grid(True, alpha=0.3)
-        
-        # 3. Monthly Returns (middle right)
-        ax3 = fig.add_subplot(gs[1, 1])
-        monthly_df = self.analyzer.get_monthly_returns()
-        if not monthly_df.empty:
-            colors = ['#06A77D' if x > 0 else '#D62246' for x in monthly_df['return_pct']]
-            ax3.bar(range(len(monthly_df)), monthly_df['return_pct'], color=colors, alpha=0.7)
-            ax3.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
-            ax3.set_title('Monthly Returns', fontsize=12, fontweight='bold')
-            ax3.set_ylabel('Return (%)')
-            ax3.grid(True, alpha=0.3, axis='y')
-        
-        # 4. Trade Distribution (bottom left)
-        ax4 = fig.add_subplot(gs[2, 0])
-        if not self.analyzer.trades_df.empty:
-            sell_trades = self.analyzer.trades_df[self.analyzer.trades_df['action'] == 'SELL']
-            if not sell_trades.empty:
-                pnl = sell_trades['net_amount']
-                ax4.hist(pnl, bins=20, color='#2E86AB', alpha=0.7, edgecolor='black')
-                ax4.axvline(x=0, color='red', linestyle='--', linewidth=2)
-                ax4.set_title('Trade P&L Distribution', fontsize=12, fontweight='bold')
-                ax4.set_xlabel('Profit/Loss ($)')
-                ax4.set_ylabel('Count')
-                ax4.grid(True, alpha=0.3, axis='y')
-        
-        # 5. Performance Metrics (bottom right)
-        ax5 = fig.add_subplot(gs[2, 1])
-        ax5.axis('off')
-        
-        # Get metrics
-        summary = self.analyzer.get_summary()
-        returns = summary['returns']
-        risk = summary['risk']
-        trades = summary['trades']
-        
-        # Create text summary
-        metrics_text = f"""
-        PERFORMANCE METRICS
-        
-        Returns:
-          Total Return: {returns['total_return_pct']:.2f}%
-          CAGR: {returns['cagr']:.2f}%
-        
-        Risk:
-          Sharpe Ratio: {risk['sharpe_ratio']:.2f}
-          Max Drawdown: {risk['max_drawdown_pct']:.2f}%
-          Volatility: {risk['volatility']:.2f}%
-        
-        Trades:
-          Total: {trades['total_trades']}
-          Win Rate: {trades['win_rate']:.2f}%
-          Profit Factor: {trades['profit_factor']:.2f}
-        """
-        
-        ax5.text(0.1, 0.5, metrics_text, fontsize=10, family='monospace',
-                verticalalignment='center')
-        
-        # Overall title
-        fig.suptitle(f'Backtest Dashboard - {self.results.ticker}', 
-                    fontsize=16, fontweight='bold', y=0.98)
-        
-        if filepath:
-            plt.savefig(filepath, dpi=300, bbox_inches='tight')
-            logger.info(f"Dashboard saved to {filepath}")
-        
-        if show:
-            plt.show()
-        
-        return fig
+        return self._plot('dashboard', filepath, show, figsize)
     
-    def save_all_charts(self, output_dir: str = "backtest_charts"):
+    def save_all_charts(self, output_dir: str = "backtest_charts",
+                        max_workers: Optional[int] = None) -> List[str]:
         """
         Save all charts to a directory.
         
         Args:
             output_dir: Directory to save charts
+            max_workers: Render charts in this many processes (None or 1 renders
+                them one after another in this process)
+        
+        Returns:
+            Paths of the charts written
         """
-        import os
         os.makedirs(output_dir, exist_ok=True)
         
         ticker = self.results.ticker
+        data = self.chart_data()
+        jobs = [(kind, os.path.join(output_dir, f"{ticker}_{kind}.png")) for kind in CHART_KINDS]
         
-        # Save individual charts
-        self.plot_equity_curve(
-            filepath=f"{output_dir}/{ticker}_equity_curve.png",
-            show=False
-        )
-        
-        self.plot_drawdown(
-            filepath=f"{output_dir}/{ticker}_drawdown.png",
-            show=False
-        )
-        
-        self.plot_monthly_returns(
-            filepath=f"{output_dir}/{ticker}_monthly_returns.png",
-            show=False
-        )
-        
-        self.plot_trade_distribution(
-            filepath=f"{output_dir}/{ticker}_trade_distribution.png",
-            show=False
-        )
-        
-        self.create_dashboard(
-            filepath=f"{output_dir}/{ticker}_dashboard.png",
-            show=False
-        )
+        if max_workers and max_workers > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+                futures = [pool.submit(render_chart, kind, data, path, self.dpi, None, self.bbox_inches) for kind, path in jobs]
+                written = [f.result() for f in futures]
+        else:
+            written = [render_chart(kind, data, path, self.dpi, bbox_inches=self.bbox_inches) for kind, path in jobs]
         
+        written = [path for path in written if path]
         logger.info(f"All charts saved to {output_dir}/")
         print(f"✅ All charts saved to {output_dir}/")
+        return written
@@ -3,15 +3,49 @@ Walk-Forward Analysis
 Tests strategy robustness by splitting data into training and testing periods.
 Helps detect overfitting and validates strategy performance.
 """
+import os
 import logging
-from typing import List, Dict, Any, Optional
+from concurrent.futures import as_completed
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import timedelta
 import pandas as pd
 from tradingagents.backtesting.config import BacktestConfig, BacktestResults, WalkForwardResults
 from tradingagents.backtesting.backtest_engine import BacktestEngine
+from tradingagents.backtesting.data_manager import HistoricalDataManager
+from tradingagents.backtesting.parallel import create_pool, get_worker_data_manager
 
 logger = logging.getLogger(__name__)
 
+# (train_start, train_end, test_start, test_end)
+Window = Tuple[pd.Timestamp, pd.Timestamp, pd.Timestamp, pd.Timestamp]
+
+
+def _run_window(config: BacktestConfig, trading_graph, data_manager: HistoricalDataManager,
+                ticker: str, window: Window) -> Tuple[BacktestResults, BacktestResults]:
+    """Run the in-sample and out-of-sample backtests for one window."""
+    train_start, train_end, test_start, test_end = window
+    
+    engine_train = BacktestEngine(config=config, trading_graph=trading_graph, data_manager=data_manager)
+    in_sample = engine_train.run_backtest(
+        ticker,
+        train_start.strftime('%Y-%m-%d'),
+        train_end.strftime('%Y-%m-%d')
+    )
+    
+    engine_test = BacktestEngine(config=config, trading_graph=trading_graph, data_manager=data_manager)
+    out_of_sample = engine_test.run_backtest(
+        ticker,
+        test_start.strftime('%Y-%m-%d'),
+        test_end.strftime('%Y-%m-%d')
+    )
+    
+    return in_sample, out_of_sample
+
+
+def _run_window_in_worker(config: BacktestConfig, ticker: str,
+                          window: Window) -> Tuple[BacktestResults, BacktestResults]:
+    return _run_window(config, None, get_worker_data_manager(), ticker, window)
+
 
 class WalkForwardAnalyzer:
     """
@@ -24,16 +58,18 @@ class WalkForwardAnalyzer:
     This helps detect overfitting and ensures strategy works on unseen data.
     """
     
-    def __init__(self, config: BacktestConfig, trading_graph=None):
+    def __init__(self, config: BacktestConfig, trading_graph=None, data_manager=None):
         """
         Initialize walk-forward analyzer.
         
         Args:
             config: Base backtest configuration
             trading_graph: TradingAgentsGraph instance (optional)
+            data_manager: HistoricalDataManager instance shared by all windows (optional)
         """
         self.config = config
         self.trading_graph = trading_graph
+        self.data_manager = data_manager or HistoricalDataManager()
         
         logger.info("WalkForwardAnalyzer initialized")
     
@@ -44,7 +80,8 @@ class WalkForwardAnalyzer:
         end_date: str,
         train_days: int = 180,
         test_days: int = 60,
-        step_days: Optional[int] = None
+        step_days: Optional[int] = None,
+        max_workers: Optional[int] = None
     ) -> WalkForwardResults:
         """
         Run walk-forward analysis.
@@ -56,6 +93,11 @@ class WalkForwardAnalyzer:
             train_days: Training period length in days
             test_days: Testing period length in days
             step_days: Step size between windows (defaults to test_days)
+            max_workers: Run windows in parallel on this many workers. None or 1
+                runs them back to back. Without a trading graph, windows run in
+                worker processes; with one, in threads. Calls to a shared graph
+                are serialized across windows unless it sets thread_safe = True
+                (see BacktestEngine).
         
         Returns:
             WalkForwardResults with in-sample and out-of-sample results
@@ -71,66 +113,15 @@ class WalkForwardAnalyzer:
         print(f"Step: {step_days} days")
         
         # Calculate periods
-        start_dt = pd.to_datetime(start_date)
-        end_dt = pd.to_datetime(end_date)
+        windows = self._build_windows(start_date, end_date, train_days, test_days, step_days)
         
-        in_sample_results = []
-        out_of_sample_results = []
-        
-        current_start = start_dt
-        period_num = 0
+        if max_workers and max_workers > 1 and len(windows) > 1:
+            window_results = self._run_windows_parallel(ticker, start_date, end_date, windows, max_workers)
+        else:
+            window_results = self._run_windows_sequential(ticker, windows)
         
-        while current_start + timedelta(days=train_days + test_days) <= end_dt:
-            period_num += 1
-            
-            # Define periods
-            train_end = current_start + timedelta(days=train_days)
-            test_start = train_end + timedelta(days=1)
-            test_end = test_start + timedelta(days=test_days)
-            
-            print(f"\n{'='*70}")
-            print(f"Period {period_num}")
-            print(f"{'='*70}")
-            print(f"Training: {current_start.date()} to {train_end.date()}")
-            print(f"Testing:  {test_start.date()} to {test_end.date()}")
-            
-            try:
-                # In-sample (training) backtest
-                print("\n  Running in-sample backtest...")
-                engine_train = BacktestEngine(
-                    config=self.config,
-                    trading_graph=self.trading_graph
-                )
-                
-                in_sample = engine_train.run_backtest(
-                    ticker,
-                    current_start.strftime('%Y-%m-%d'),
-                    train_end.strftime('%Y-%m-%d')
-                )
-                in_sample_results.append(in_sample)
-                print(f"  ✅ In-sample return: {in_sample.total_return_pct:.2f}%")
-                
-                # Out-of-sample (testing) backtest
-                print("  Running out-of-sample backtest...")
-                engine_test = BacktestEngine(
-                    config=self.config,
-                    trading_graph=self.trading_graph
-                )
-                
-                out_of_sample = engine_test.run_backtest(
-                    ticker,
-                    test_start.strftime('%Y-%m-%d'),
-                    test_end.strftime('%Y-%m-%d')
-                )
-                out_of_sample_results.append(out_of_sample)
-                print(f"  ✅ Out-of-sample return: {out_of_sample.total_return_pct:.2f}%")
-                
-            except Exception as e:
-                logger.warning(f"Period {period_num} failed: {e}")
-                print(f"  ❌ Period failed: {e}")
-            
-            # Move to next period
-            current_start += timedelta(days=step_days)
+        in_sample_results = [r[0] for r in window_results if r is not None]
+        out_of_sample_results = [r[1] for r in window_results if r is not None]
         
         # Calculate metrics
         print(f"\n{'='*70}")
@@ -202,6 +193,100 @@ class WalkForwardAnalyzer:
         
         return results
     
+    @staticmethod
+    def _build_windows(start_date: str, end_date: str, train_days: int,
+                       test_days: int, step_days: int) -> List[Window]:
+        """Split the overall period into (train_start, train_end, test_start, test_end) windows."""
+        start_dt = pd.to_datetime(start_date)
+        end_dt = pd.to_datetime(end_date)
+        
+        windows = []
+        current_start = start_dt
+        while current_start + timedelta(days=train_days + test_days) <= end_dt:
+            train_end = current_start + timedelta(days=train_days)
+            test_start = train_end + timedelta(days=1)
+            test_end = test_start + timedelta(days=test_days)
+            windows.append((current_start, train_end, test_start, test_end))
+            current_start += timedelta(days=step_days)
+        
+        return windows
+    
+    def _run_windows_sequential(self, ticker: str,
+                                windows: List[Window]) -> List[Optional[Tuple[BacktestResults, BacktestResults]]]:
+        window_results = []
+        
+        for period_num, window in enumerate(windows, 1):
+            train_start, train_end, test_start, test_end = window
+            
+            print(f"\n{'='*70}")
+            print(f"Period {period_num}")
+            print(f"{'='*70}")
+            print(f"Training: {train_start.date()} to {train_end.date()}")
+            print(f"Testing:  {test_start.date()} to {test_end.date()}")
+            
+            try:
+                in_sample, out_of_sample = _run_window(
+                    self.config, self.trading_graph, self.data_manager, ticker, window
+                )
+                print(f"  ✅ In-sample return: {in_sample.total_return_pct:.2f}%")
+                print(f"  ✅ Out-of-sample return: {out_of_sample.total_return_pct:.2f}%")
+                window_results.append((in_sample, out_of_sample))
+            except Exception as e:
+                logger.warning(f"Period {period_num} failed: {e}")
+                print(f"  ❌ Period failed: {e}")
+                window_results.append(None)
+        
+        return window_results
+    
+    def _run_windows_parallel(self, ticker: str, start_date: str, end_date: str,
+                              windows: List[Window],
+                              max_workers: int) -> List[Optional[Tuple[BacktestResults, BacktestResults]]]:
+        # Load the full span (plus the engine's lookback buffer) once; workers only slice it
+        buffer_start = (pd.to_datetime(start_date) - timedelta(days=100)).strftime('%Y-%m-%d')
+        self.data_manager.get_historical_data(ticker, buffer_start, end_date, self.config.data_interval)
+        if self.config.benchmark and self.config.benchmark != ticker:
+            try:
+                self.data_manager.get_historical_data(
+                    self.config.benchmark, buffer_start, end_date, self.config.data_interval
+                )
+            except Exception as e:
+                logger.warning(f"Failed to preload benchmark {self.config.benchmark}: {e}")
+        
+        use_processes = self.trading_graph is None
+        workers = min(max_workers, len(windows))
+        if use_processes:
+            workers = min(workers, os.cpu_count() or 1)
+        print(f"\nRunning {len(windows)} periods on {workers} workers...")
+        pool = create_pool(workers, self.data_manager, use_processes)
+        
+        window_results: List[Optional[Tuple[BacktestResults, BacktestResults]]] = [None] * len(windows)
+        with pool:
+            if use_processes:
+                futures = {
+                    pool.submit(_run_window_in_worker, self.config, ticker, window): i
+                    for i, window in enumerate(windows)
+                }
+            else:
+                futures = {
+                    pool.submit(_run_window, self.config, self.trading_graph,
+                                self.data_manager, ticker, window): i
+                    for i, window in enumerate(windows)
+                }
+            for future in as_completed(futures):
+                i = futures[future]
+                train_start, _, test_start, test_end = windows[i]
+                try:
+                    window_results[i] = future.result()
+                    in_sample, out_of_sample = window_results[i]
+                    print(f"  ✅ Period {i + 1} ({train_start.date()} → {test_end.date()}): "
+                          f"in-sample {in_sample.total_return_pct:.2f}%, "
+                          f"out-of-sample {out_of_sample.total_return_pct:.2f}%")
+                except Exception as e:
+                    logger.warning(f"Period {i + 1} failed: {e}")
+                    print(f"  ❌ Period {i + 1} failed: {e}")
+        
+        return window_results
+    
     def compare_walk_forward(
         self,
         ticker: str,
@@ -236,7 +321,7 @@ class WalkForwardAnalyzer:
             print(f"\n[{i}/{len(configs)}] Testing configuration {i}...")
             
             try:
-                analyzer = WalkForwardAnalyzer(config, self.trading_graph)
+                analyzer = WalkForwardAnalyzer(config, self.trading_graph, self.data_manager)
                 results = analyzer.run_walk_forward(
                     ticker, start_date, end_date, train_days, test_days
                 )
@@ -322,7 +407,8 @@ def quick_walk_forward(
     start_date: str,
     end_date: str,
     train_days: int = 180,
-    test_days: int = 60
+    test_days: int = 60,
+    max_workers: Optional[int] = None
 ) -> WalkForwardResults:
     """
     Quick walk-forward analysis helper function.
@@ -334,9 +420,11 @@ def quick_walk_forward(
         end_date: End date
         train_days: Training period length
         test_days: Testing period length
+        max_workers: Number of parallel workers (None runs sequentially)
     
     Returns:
         WalkForwardResults
     """
     analyzer = WalkForwardAnalyzer(config)
-    return analyzer.run_walk_forward(ticker, start_date, end_date, train_days, test_days)
+    return analyzer.run_walk_forward(ticker, start_date, end_date, train_days, test_days,
+                                     max_workers=max_workers)
@@ -8,6 +8,7 @@ import os
 import requests
 from typing import Annotated
 import json
+from . import http_client
 
 
 def get_fmp_fundamentals(
@@ -34,19 +35,19 @@ def get_fmp_fundamentals(
     try:
         # Get company profile
         profile_url = f"https://financialmodelingprep.com/api/v3/profile/{ticker}"
-        profile_response = requests.get(profile_url, params={"apikey": api_key}, timeout=10)
+        profile_response = http_client.get(profile_url, params={"apikey": api_key})
         profile_response.raise_for_status()
         profile = profile_response.json()[0] if profile_response.json() else {}
         
         # Get key metrics
         metrics_url = f"https://financialmodelingprep.com/api/v3/key-metrics/{ticker}"
-        metrics_response = requests.get(metrics_url, params={"apikey": api_key, "limit": 1}, timeout=10)
+        metrics_response = http_client.get(metrics_url, params={"apikey": api_key, "limit": 1})
         metrics_response.raise_for_status()
         metrics = metrics_response.json()[0] if metrics_response.json() else {}
         
         # Get financial ratios
         ratios_url = f"https://financialmodelingprep.com/api/v3/ratios/{ticker}"
-        ratios_response = requests.get(ratios_url, params={"apikey": api_key, "limit": 1}, timeout=10)
+        ratios_response = http_client.get(ratios_url, params={"apikey": api_key, "limit": 1})
         ratios_response.raise_for_status()
         ratios = ratios_response.json()[0] if ratios_response.json() else {}
         
@@ -96,7 +97,7 @@ def get_fmp_income_statement(
     url = f"https://financialmodelingprep.com/api/v3/income-statement/{ticker.upper()}"
     
     try:
-        response = requests.get(url, params={"apikey": api_key, "period": period, "limit": 5}, timeout=10)
+        response = http_client.get(url, params={"apikey": api_key, "period": period, "limit": 5})
         response.raise_for_status()
         return json.dumps(response.json(), indent=2)
     except Exception as e:
@@ -117,7 +118,7 @@ def get_fmp_balance_sheet(
     url = f"https://financialmodelingprep.com/api/v3/balance-sheet-statement/{ticker.upper()}"
     
     try:
-        response = requests.get(url, params={"apikey": api_key, "period": period, "limit": 5}, timeout=10)
+        response = http_client.get(url, params={"apikey": api_key, "period": period, "limit": 5})
         response.raise_for_status()
         return json.dumps(response.json(), indent=2)
     except Exception as e:
@@ -138,7 +139,7 @@ def get_fmp_cash_flow(
     url = f"https://financialmodelingprep.com/api/v3/cash-flow-statement/{ticker.upper()}"
     
     try:
-        response = requests.get(url, params={"apikey": api_key, "period": period, "limit": 5}, timeout=10)
+        response = http_client.get(url, params={"apikey": api_key, "period": period, "limit": 5})
         response.raise_for_status()
         return json.dumps(response.json(), indent=2)
     except Exception as e:
@@ -157,7 +158,7 @@ def get_fmp_earnings(
     url = f"https://financialmodelingprep.com/api/v3/historical/earning_calendar/{ticker.upper()}"
     
     try:
-        response = requests.get(url, params={"apikey": api_key, "limit": 10}, timeout=10)
+        response = http_client.get(url, params={"apikey": api_key, "limit": 10})
         response.raise_for_status()
         return json.dumps(response.json(), indent=2)
     except Exception as e:
@@ -1,5 +1,4 @@
 import json
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import time
@@ -11,6 +10,7 @@ from tenacity import (
     retry_if_exception_type,
     retry_if_result,
 )
+from . import http_client
 
 
 def is_rate_limited(response):
@@ -27,7 +27,7 @@ def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
     # Random delay before each request to avoid detection
     time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    response = http_client.get(url, headers=headers)
     return response
 
 
@@ -0,0 +1,185 @@
+"""
+Pooled HTTP clients for the dataflow vendors.
+
+Every vendor module sends its requests through one keep-alive session per
+host, so repeated calls to FMP, NewsAPI, MarketData.app and the rest reuse
+open TCP/TLS connections instead of paying DNS, connect and handshake costs on
+each call. Sessions share default timeouts and retry idempotent requests on
+connection errors and 5xx responses (never on 429, which would spend quota).
+
+async_request() is the asyncio counterpart. It uses an httpx.AsyncClient (with
+HTTP/2 when the h2 package is installed) per event loop, or the pooled
+synchronous sessions on a worker thread when httpx is not available.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import get_config
+
+# Try to import httpx for the async client, but make it optional
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = HTTPX_AVAILABLE
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_SETTINGS = {
+    "pool_maxsize": 20,        # Keep-alive connections per host
+    "connect_timeout": 5.0,
+    "read_timeout": 15.0,
+    "retries": 2,              # Retries of idempotent requests on connection errors and 5xx
+    "backoff_factor": 0.3,
+    "http2": True,             # Async client only (requires httpx and h2)
+}
+
+RETRY_STATUSES = (500, 502, 503, 504)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def _settings() -> Dict[str, Any]:
+    return {**DEFAULT_SETTINGS, **get_config().get("http", {})}
+
+
+def _host(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _new_session(settings: Dict[str, Any]) -> requests.Session:
+    retry = Retry(
+        total=settings["retries"],
+        backoff_factor=settings["backoff_factor"],
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings["pool_maxsize"], max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Shared keep-alive session for the host of a URL.
+
+    Args:
+        url: Any URL on the host
+
+    Returns:
+        requests.Session with a connection pool and retry policy for that host
+    """
+    host = _host(url)
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = _sessions[host] = _new_session(_settings())
+        return session
+
+
+def default_timeout() -> tuple:
+    """(connect, read) timeout applied when a caller passes none."""
+    settings = _settings()
+    return (settings["connect_timeout"], settings["read_timeout"])
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    Send a request through the host's pooled session.
+
+    Takes the same arguments as requests.request; timeout defaults to
+    default_timeout(). Errors are the usual requests exceptions.
+    """
+    kwargs.setdefault("timeout", default_timeout())
+    return get_session(url).request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """Pooled equivalent of requests.get."""
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    """Pooled equivalent of requests.post."""
+    return request("POST", url, **kwargs)
+
+
+def _async_client():
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        settings = _settings()
+        timeout = httpx.Timeout(settings["read_timeout"], connect=settings["connect_timeout"])
+        limits = httpx.Limits(max_keepalive_connections=settings["pool_maxsize"],
+                              max_connections=settings["pool_maxsize"] * 4)
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_AVAILABLE and settings["http2"],
+            limits=limits,
+            retries=settings["retries"],  # Connection failures only
+        )
+        client = httpx.AsyncClient(transport=transport, timeout=timeout)
+        _async_clients[loop] = client
+    return client
+
+
+async def async_request(method: str, url: str, **kwargs):
+    """
+    Send a request from asyncio code without blocking the event loop.
+
+    Accepts params, headers, json, data and timeout. Returns an httpx.Response
+    when httpx is installed, otherwise a requests.Response; both provide
+    status_code, text, json() and raise_for_status().
+    """
+    if not HTTPX_AVAILABLE:
+        return await asyncio.to_thread(request, method, url, **kwargs)
+    timeout = kwargs.pop("timeout", None)
+    if isinstance(timeout, tuple):
+        timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    return await _async_client().request(method, url, **kwargs)
+
+
+async def async_get(url: str, **kwargs):
+    """Async equivalent of get()."""
+    return await async_request("GET", url, **kwargs)
+
+
+async def async_post(url: str, **kwargs):
+    """Async equivalent of post()."""
+    return await async_request("POST", url, **kwargs)
+
+
+async def aclose():
+    """Close the async client of the running event loop (call on service shutdown)."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def close_sessions():
+    """Close every pooled session; the next request opens new ones with current settings."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
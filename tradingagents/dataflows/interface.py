@@ -15,7 +15,6 @@ from .alpha_vantage import (
     get_insider_transactions as get_alpha_vantage_insider_transactions,
     get_news as get_alpha_vantage_news
 )
-from .alpha_vantage_common import AlphaVantageRateLimitError
 from .marketdata import get_marketdata_stock
 from .fmp import get_fmp_fundamentals, get_fmp_income_statement, get_fmp_balance_sheet, get_fmp_cash_flow, get_fmp_earnings
 from .newsdata import get_newsdata_news, get_newsdata_sentiment
@@ -23,6 +22,10 @@ from .newsapi import get_newsapi_news, get_newsapi_headlines
 
 # Configuration and routing logic
 from .config import get_config
+from .result_cache import get_result_cache
+from .vendor_health import get_health_registry
+from .rate_limiter import get_rate_limiter
+from .vendor_calls import call_vendor, race_vendors
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -149,6 +152,65 @@ def get_vendor(category: str, method: str = None) -> str:
     # Fall back to category-level configuration
     return config.get("data_vendors", {}).get(category, "default")
 
+def get_vendor_cache_stats() -> dict:
+    """Hit/miss statistics of the vendor result cache (empty if caching is disabled)."""
+    cache = get_result_cache()
+    return cache.stats() if cache is not None else {}
+
+def get_vendor_health() -> dict:
+    """Per-vendor circuit state, error rate and latency percentiles (empty if tracking is disabled)."""
+    health = get_health_registry()
+    return health.snapshot() if health is not None else {}
+
+def get_vendor_rate_limits() -> dict:
+    """Remaining tokens per vendor and window plus queueing counters (empty if limiting is disabled)."""
+    limiter = get_rate_limiter()
+    return limiter.stats() if limiter is not None else {}
+
+def _call_vendor(method: str, vendor: str, args: tuple, kwargs: dict, cache) -> list:
+    """Run every implementation of one vendor (serving cached results first) and return their results."""
+    return call_vendor(method, vendor, VENDOR_METHODS[method][vendor], args, kwargs, cache)
+
+def _route_sequential(method: str, vendors: list, primary_vendors: list, args: tuple, kwargs: dict, cache):
+    """Try vendors one after another. Returns (last successful vendor, results, attempts)."""
+    results = []
+    vendor_attempt_count = 0
+    successful_vendor = None
+
+    for vendor in vendors:
+        is_primary_vendor = vendor in primary_vendors
+        vendor_attempt_count += 1
+
+        # Debug: Print current attempt
+        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
+        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
+
+        vendor_results = _call_vendor(method, vendor, args, kwargs, cache)
+
+        # Add this vendor's results
+        if vendor_results:
+            results.extend(vendor_results)
+            successful_vendor = vendor
+            result_summary = f"Got {len(vendor_results)} result(s)"
+            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
+            
+            # Stopping logic: Stop after first successful vendor for single-vendor configs
+            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
+            if len(primary_vendors) == 1:
+                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
+                break
+        else:
+            print(f"FAILED: Vendor '{vendor}' produced no results")
+
+    return successful_vendor, results, vendor_attempt_count
+
+def _route_hedged(method: str, vendors: list, args: tuple, kwargs: dict, cache, settings: dict):
+    """Race vendors for one call (see vendor_calls.race_vendors). Returns (winning vendor, results, attempts)."""
+    return race_vendors(
+        method, vendors, lambda vendor: _call_vendor(method, vendor, args, kwargs, cache),
+        settings, get_rate_limiter()
+    )
+
 def route_to_vendor(method: str, *args, **kwargs):
     """Route method calls to appropriate vendor implementation with fallback support."""
     category = get_category_for_method(method)
@@ -180,71 +242,37 @@ def route_to_vendor(method: str, *args, **kwargs):
     fallback_str = " → ".join(fallback_vendors)
     print(f"DEBUG: {method} - Primary: [{primary_str}] | Full fallback order: [{fallback_str}]")
 
-    # Track results and execution state
-    results = []
-    vendor_attempt_count = 0
-    any_primary_vendor_attempted = False
-    successful_vendor = None
+    # Results are cached per (method, vendor, normalized args)
+    cache = get_result_cache()
 
+    supported_vendors = []
     for vendor in fallback_vendors:
-        if vendor not in VENDOR_METHODS[method]:
-            if vendor in primary_vendors:
-                print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
-            continue
-
-        vendor_impl = VENDOR_METHODS[method][vendor]
-        is_primary_vendor = vendor in primary_vendors
-        vendor_attempt_count += 1
-
-        # Track if we attempted any primary vendor
-        if is_primary_vendor:
-            any_primary_vendor_attempted = True
-
-        # Debug: Print current attempt
-        vendor_type = "PRIMARY" if is_primary_vendor else "FALLBACK"
-        print(f"DEBUG: Attempting {vendor_type} vendor '{vendor}' for {method} (attempt #{vendor_attempt_count})")
-
-        # Handle list of methods for a vendor
-        if isinstance(vendor_impl, list):
-            vendor_methods = [(impl, vendor) for impl in vendor_impl]
-            print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
-        else:
-            vendor_methods = [(vendor_impl, vendor)]
+        if vendor in VENDOR_METHODS[method]:
+            supported_vendors.append(vendor)
+        elif vendor in primary_vendors:
+            print(f"INFO: Vendor '{vendor}' not supported for method '{method}', falling back to next vendor")
 
-        # Run methods for this vendor
-        vendor_results = []
-        for impl_func, vendor_name in vendor_methods:
-            try:
-                print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
-                result = impl_func(*args, **kwargs)
-                vendor_results.append(result)
-                print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
-                    
-            except AlphaVantageRateLimitError as e:
-                if vendor == "alpha_vantage":
-                    print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
-                    print(f"DEBUG: Rate limit details: {e}")
-                # Continue to next vendor for fallback
-                continue
-            except Exception as e:
-                # Log error but continue with other implementations
-                print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
-                continue
+    # Skip vendors with open circuits and try healthier fallbacks first
+    health = get_health_registry()
+    if health is not None:
+        healthy_vendors = health.order(supported_vendors, primary_vendors)
+        skipped = [v for v in supported_vendors if v not in healthy_vendors]
+        if skipped:
+            print(f"CIRCUIT: Skipping vendors with open circuits for {method}: {', '.join(skipped)}")
+        if healthy_vendors != supported_vendors:
+            print(f"DEBUG: {method} - Health-adjusted order: [{' → '.join(healthy_vendors)}]")
+        supported_vendors = healthy_vendors
 
-        # Add this vendor's results
-        if vendor_results:
-            results.extend(vendor_results)
-            successful_vendor = vendor
-            result_summary = f"Got {len(vendor_results)} result(s)"
-            print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
-            
-            # Stopping logic: Stop after first successful vendor for single-vendor configs
-            # Multiple vendor configs (comma-separated) may want to collect from multiple sources
-            if len(primary_vendors) == 1:
-                print(f"DEBUG: Stopping after successful vendor '{vendor}' (single-vendor config)")
-                break
-        else:
-            print(f"FAILED: Vendor '{vendor}' produced no results")
+    # Hedged mode races single-vendor configs; multi-vendor configs collect sequentially
+    hedging = get_config().get("vendor_hedging", {})
+    if hedging.get("enabled", False) and len(primary_vendors) == 1:
+        successful_vendor, results, vendor_attempt_count = _route_hedged(
+            method, supported_vendors, args, kwargs, cache, hedging
+        )
+    else:
+        successful_vendor, results, vendor_attempt_count = _route_sequential(
+            method, supported_vendors, primary_vendors, args, kwargs, cache
+        )
 
     # Final result summary
     if not results:
@@ -9,6 +9,7 @@ import requests
 from typing import Annotated
 from datetime import datetime, timedelta
 import pandas as pd
+from . import http_client
 
 
 def get_marketdata_stock(
@@ -46,7 +47,7 @@ def get_marketdata_stock(
     }
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = http_client.get(url, params=params, headers=headers)
         response.raise_for_status()
         
         data = response.json()
@@ -122,7 +123,7 @@ def get_marketdata_quote(
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.get(url, headers=headers)
         response.raise_for_status()
         
         data = response.json()
@@ -184,7 +185,7 @@ def get_marketdata_earnings(
     }
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.get(url, headers=headers)
         response.raise_for_status()
         
         data = response.json()
@@ -255,7 +256,7 @@ def get_marketdata_index_quote(
     params = {"feed": "live"}
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = http_client.get(url, headers=headers, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -317,7 +318,7 @@ def get_marketdata_bulk_quotes(
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = http_client.get(url, headers=headers, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -9,6 +9,7 @@ import requests
 from typing import Annotated
 from datetime import datetime
 import json
+from . import http_client
 
 
 def get_newsapi_news(
@@ -45,7 +46,7 @@ def get_newsapi_news(
     }
     
     try:
-        response = requests.get(url, params=params, timeout=15)
+        response = http_client.get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -115,7 +116,7 @@ def get_newsapi_headlines(
     }
     
     try:
-        response = requests.get(url, params=params, timeout=15)
+        response = http_client.get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -9,6 +9,7 @@ import requests
 from typing import Annotated
 from datetime import datetime, timedelta
 import json
+from . import http_client
 
 
 def get_newsdata_news(
@@ -44,7 +45,7 @@ def get_newsdata_news(
     }
     
     try:
-        response = requests.get(url, params=params, timeout=15)
+        response = http_client.get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
@@ -121,7 +122,7 @@ def get_newsdata_sentiment(
     }
     
     try:
-        response = requests.get(url, params=params, timeout=15)
+        response = http_client.get(url, params=params)
         response.raise_for_status()
         
         data = response.json()
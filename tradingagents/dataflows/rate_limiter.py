@@ -0,0 +1,293 @@
+"""
+Per-vendor token-bucket rate limiter for route_to_vendor.
+
+Each vendor has up to three buckets (per second, per minute, per day). A call
+takes one token from every bucket of its vendor; an empty bucket means the
+call would be rejected by the vendor, so the caller either waits briefly for a
+refill or is sent to the next vendor straight away. Bucket levels live in a
+SQLite table next to the data cache, so limits hold across restarts and are
+shared by every thread and worker process using the same data_cache_dir.
+"""
+
+import os
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .config import get_config
+
+# Seconds over which each bucket's limit refills
+WINDOWS = {
+    "per_second": 1.0,
+    "per_minute": 60.0,
+    "per_day": 86400.0,
+}
+
+# Free-tier quotas. The per-minute limits on daily-quota vendors are pacing,
+# not vendor rules: they stop a batch run from spending a day's quota at once.
+DEFAULT_LIMITS = {
+    "alpha_vantage": {"per_minute": 5, "per_day": 25},
+    "fmp": {"per_minute": 30, "per_day": 250},
+    "newsdata": {"per_minute": 30, "per_day": 200},
+    "newsapi": {"per_minute": 20, "per_day": 100},
+    "marketdata": {"per_minute": 20, "per_day": 100},
+}
+
+# HTTP requests made by one call of a vendor function (default 1)
+REQUEST_COSTS = {
+    "get_fmp_fundamentals": 3,
+}
+
+
+class VendorRateLimiter:
+    """
+    Token buckets for every rate-limited vendor.
+
+    A bucket holds at most `limit` tokens and refills continuously at
+    limit / window seconds. Acquiring is atomic across threads (a lock) and
+    across processes (an IMMEDIATE SQLite transaction around the
+    read-refill-take-write cycle).
+    """
+
+    def __init__(self, state_dir: Optional[str] = None,
+                 limits: Optional[Dict[str, Dict[str, Optional[float]]]] = None,
+                 max_wait_seconds: float = 5.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            state_dir: Directory of the shared bucket table (None keeps buckets
+                in memory, for this process only)
+            limits: Per-vendor overrides of DEFAULT_LIMITS, e.g.
+                {"fmp": {"per_day": 750}}; a limit of None or 0 removes that bucket
+            max_wait_seconds: Default time acquire() queues for a refill before
+                giving up
+        """
+        self.max_wait_seconds = max_wait_seconds
+        self.limits: Dict[str, Dict[str, float]] = {}
+        for vendor in set(DEFAULT_LIMITS) | set(limits or {}):
+            merged = {**DEFAULT_LIMITS.get(vendor, {}), **(limits or {}).get(vendor, {})}
+            unknown = set(merged) - set(WINDOWS)
+            if unknown:
+                raise ValueError(f"Unknown rate limit window(s) for {vendor}: {', '.join(sorted(unknown))}")
+            merged = {window: float(limit) for window, limit in merged.items() if limit}
+            if merged:
+                self.limits[vendor] = merged
+
+        self._lock = threading.Lock()
+        self._memory: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._stats = {"acquired": 0, "queued": 0, "rejected": 0, "wait_seconds": 0.0}
+
+        self.db_path = None
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+            self.db_path = os.path.join(state_dir, "rate_limits.db")
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS buckets (
+                        vendor TEXT NOT NULL,
+                        window TEXT NOT NULL,
+                        tokens REAL NOT NULL,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (vendor, window)
+                    )
+                """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _buckets(self, vendor: str) -> Iterator[Dict[str, Tuple[float, float]]]:
+        """Stored (tokens, updated_at) per window of a vendor, written back on exit."""
+        with self._lock:
+            if self.db_path is None:
+                buckets = {w: self._memory[(vendor, w)] for w in WINDOWS if (vendor, w) in self._memory}
+                yield buckets
+                for window, level in buckets.items():
+                    self._memory[(vendor, window)] = level
+                return
+
+            with self._connect() as conn:
+                rows = conn.execute("SELECT window, tokens, updated_at FROM buckets WHERE vendor = ?",
+                                    (vendor,)).fetchall()
+                buckets = {window: (tokens, updated_at) for window, tokens, updated_at in rows}
+                yield buckets
+                conn.executemany(
+                    "INSERT OR REPLACE INTO buckets (vendor, window, tokens, updated_at) VALUES (?, ?, ?, ?)",
+                    [(vendor, window, tokens, updated_at) for window, (tokens, updated_at) in buckets.items()]
+                )
+
+    @staticmethod
+    def _level(stored: Optional[Tuple[float, float]], limit: float, window: str, now: float) -> float:
+        """Tokens in a bucket at `now`, refilled since its stored (tokens, updated_at)."""
+        if stored is None:
+            return limit
+        return min(limit, stored[0] + max(0.0, now - stored[1]) * limit / WINDOWS[window])
+
+    def _take(self, vendor: str, tokens: float, consume: bool = True) -> float:
+        """
+        Refill a vendor's buckets and take tokens if every bucket has enough.
+
+        Returns:
+            0.0 if the tokens were available (and taken, when consume is set),
+            otherwise the seconds until they will be
+        """
+        limits = self.limits.get(vendor)
+        if not limits:
+            return 0.0
+
+        now = time.time()
+        with self._buckets(vendor) as buckets:
+            levels, wait = {}, 0.0
+            for window, limit in limits.items():
+                rate = limit / WINDOWS[window]
+                level = self._level(buckets.get(window), limit, window, now)
+                levels[window] = level
+                needed = min(tokens, limit)
+                if level < needed:
+                    wait = max(wait, (needed - level) / rate)
+
+            if consume and wait == 0.0:
+                levels = {window: level - min(tokens, limits[window]) for window, level in levels.items()}
+            for window, level in levels.items():
+                buckets[window] = (level, now)
+        return wait
+
+    def acquire(self, vendor: str, tokens: float = 1, max_wait: Optional[float] = None) -> bool:
+        """
+        Take tokens for a call, queueing up to max_wait seconds for a refill.
+
+        Args:
+            vendor: Vendor name (vendors without limits always succeed)
+            tokens: Requests the call will make
+            max_wait: Seconds to queue (None uses the limiter default, 0 never waits)
+
+        Returns:
+            True if the call may go ahead, False if the caller should use another vendor
+        """
+        max_wait = self.max_wait_seconds if max_wait is None else max_wait
+        deadline = time.monotonic() + max_wait
+        queued = False
+        while True:
+            wait = self._take(vendor, tokens)
+            if wait == 0.0:
+                with self._lock:
+                    self._stats["acquired"] += 1
+                return True
+            remaining = deadline - time.monotonic()
+            if wait > remaining:
+                with self._lock:
+                    self._stats["rejected"] += 1
+                return False
+            with self._lock:
+                self._stats["wait_seconds"] += wait
+                if not queued:
+                    self._stats["queued"] += 1
+            queued = True
+            time.sleep(wait)
+
+    def available_in(self, vendor: str, tokens: float = 1) -> float:
+        """Seconds until a call of `tokens` requests could be made (0.0 if now)."""
+        return self._take(vendor, tokens, consume=False)
+
+    def headroom(self, vendor: str) -> float:
+        """
+        Fraction of the vendor's tightest bucket still available (1.0 without limits).
+
+        Hedged routing only makes speculative calls to vendors with enough headroom,
+        so racing never spends the last of a daily quota.
+        """
+        limits = self.limits.get(vendor)
+        if not limits:
+            return 1.0
+        now = time.time()
+        with self._buckets(vendor) as buckets:
+            return min(self._level(buckets.get(window), limit, window, now) / limit
+                       for window, limit in limits.items())
+
+    def drain(self, vendor: str, window: Optional[str] = None):
+        """
+        Empty a vendor's buckets after the vendor rejected a call anyway
+        (e.g. the quota was spent outside this process).
+
+        Args:
+            vendor: Vendor name
+            window: Bucket to empty (None empties all of them)
+        """
+        limits = self.limits.get(vendor)
+        if not limits:
+            return
+        now = time.time()
+        with self._buckets(vendor) as buckets:
+            for name in limits:
+                if window is None or name == window:
+                    buckets[name] = (0.0, now)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Queueing counters and current bucket levels.
+
+        Returns:
+            Dictionary with acquired/queued/rejected counts, total wait_seconds and
+            buckets: vendor -> window -> {"limit", "tokens"}
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["buckets"] = {}
+        for vendor, limits in sorted(self.limits.items()):
+            now = time.time()
+            with self._buckets(vendor) as buckets:
+                levels = {}
+                for window, limit in limits.items():
+                    tokens = self._level(buckets.get(window), limit, window, now)
+                    levels[window] = {"limit": limit, "tokens": round(tokens, 3)}
+            stats["buckets"][vendor] = levels
+        return stats
+
+
+_limiter: Optional[VendorRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[VendorRateLimiter]:
+    """
+    Shared limiter configured from config["vendor_rate_limits"].
+
+    Returns:
+        VendorRateLimiter, or None when rate limiting is disabled
+    """
+    global _limiter
+    settings = get_config().get("vendor_rate_limits", {})
+    if not settings.get("enabled", True):
+        return None
+    with _limiter_lock:
+        if _limiter is None:
+            state_dir = None
+            if settings.get("shared", True):
+                state_dir = os.path.join(get_config()["data_cache_dir"], "rate_limits")
+            _limiter = VendorRateLimiter(
+                state_dir=state_dir,
+                limits=settings.get("limits"),
+                max_wait_seconds=settings.get("max_wait_seconds", 5.0),
+            )
+        return _limiter
+
+
+def reset_rate_limiter():
+    """Forget the shared limiter so the next get_rate_limiter() applies new settings."""
+    global _limiter
+    with _limiter_lock:
+        _limiter = None
@@ -0,0 +1,368 @@
+"""
+Vendor result cache for route_to_vendor.
+
+Results are keyed by (method, vendor, normalized arguments) and kept in an
+in-memory LRU tier backed by a SQLite disk tier shared by all processes using
+the same data_cache_dir. Each method has its own time-to-live: quotes expire in
+seconds, fundamentals after a day, and OHLCV or indicators for windows that
+ended before today never expire.
+"""
+
+import os
+import re
+import json
+import time
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .config import get_config
+
+# Seconds a result stays valid, by method. None means immutable once the
+# requested window lies entirely in the past (see _as_of_date).
+DEFAULT_TTLS = {
+    "get_stock_data": 60,
+    "get_indicators": 300,
+    "get_fundamentals": 86400,
+    "get_balance_sheet": 86400,
+    "get_cashflow": 86400,
+    "get_income_statement": 86400,
+    "get_news": 900,
+    "get_global_news": 900,
+    "get_insider_sentiment": 21600,
+    "get_insider_transactions": 21600,
+}
+
+# Methods whose first argument is a ticker symbol (normalized to upper case)
+TICKER_METHODS = {
+    "get_stock_data", "get_indicators", "get_fundamentals", "get_balance_sheet",
+    "get_cashflow", "get_income_statement", "get_news", "get_insider_sentiment",
+    "get_insider_transactions",
+}
+
+# Methods whose result is fixed once the window ends before today:
+# method -> (positional index, keyword name) of the window's end date
+IMMUTABLE_WINDOWS = {
+    "get_stock_data": (2, "end_date"),
+    "get_indicators": (2, "curr_date"),
+}
+
+# Vendor messages for an empty answer, e.g. "No news found for 'AAPL' between ..."
+# or "No balance sheet data found for symbol 'AAPL'"
+NO_DATA_PATTERN = re.compile(r"^No\b[^\n]{0,60}?\b(found|available|returned)\b", re.IGNORECASE)
+
+_MISSING = object()
+
+
+def is_error_result(value: Any) -> bool:
+    """Vendors report failures as strings starting with "Error"; those are never cached."""
+    return value is None or (isinstance(value, str) and value.lstrip().startswith("Error"))
+
+
+def is_empty_result(value: Any) -> bool:
+    """
+    True for answers without data: empty strings, containers and DataFrames, and
+    "No ... found" messages. They are never cached (the data may appear later, or
+    another vendor may have it) and never win a hedged race.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        return not text or bool(NO_DATA_PATTERN.match(text))
+    if isinstance(value, (list, tuple, dict, set)):
+        return not value
+    return getattr(value, "empty", False) is True
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items())}
+    return value
+
+
+def _as_of_date(method: str, args: tuple, kwargs: dict) -> Optional[date]:
+    """End date of the requested window for IMMUTABLE_WINDOWS methods, if parseable."""
+    position, name = IMMUTABLE_WINDOWS[method]
+    value = kwargs.get(name, args[position] if len(args) > position else None)
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value).strip()[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+class VendorResultCache:
+    """
+    Two-tier TTL cache of vendor results.
+
+    The memory tier is an LRU of at most max_entries results; the disk tier is a
+    SQLite table so results survive restarts and are shared across worker
+    processes. Lookups fall through memory, then disk; disk hits are promoted.
+    All methods are thread-safe.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = 1024,
+                 ttls: Optional[Dict[str, Optional[float]]] = None, disk: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory of the disk tier (None disables it)
+            max_entries: Capacity of the in-memory LRU tier
+            ttls: Per-method TTL overrides in seconds (0 disables caching for a
+                method, None makes it immutable)
+            disk: Use the disk tier
+        """
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._memory: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._method_stats: Dict[str, Dict[str, int]] = {}
+
+        self.db_path = None
+        if disk and cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.db_path = os.path.join(cache_dir, "vendor_results.db")
+            with self._connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS results (
+                        key TEXT PRIMARY KEY,
+                        method TEXT NOT NULL,
+                        vendor TEXT NOT NULL,
+                        expires_at REAL,
+                        created_at REAL NOT NULL,
+                        value BLOB NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_results_method ON results (method, vendor)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(method: str, vendor: str, args: tuple, kwargs: dict) -> str:
+        """
+        Cache key of a vendor call.
+
+        Strings are stripped, dates become ISO strings and the ticker argument is
+        upper-cased, so equivalent calls from different agents share an entry.
+        """
+        args = [_normalize(a) for a in args]
+        if method in TICKER_METHODS and args and isinstance(args[0], str):
+            args[0] = args[0].upper()
+        kwargs = {k: _normalize(v) for k, v in kwargs.items()}
+        for name in ("ticker", "symbol"):
+            if method in TICKER_METHODS and isinstance(kwargs.get(name), str):
+                kwargs[name] = kwargs[name].upper()
+        payload = json.dumps([args, kwargs], sort_keys=True, default=str)
+        return f"{method}|{vendor}|{payload}"
+
+    def ttl_for(self, method: str, args: tuple, kwargs: dict) -> Optional[float]:
+        """
+        Lifetime of a result in seconds.
+
+        Returns:
+            Seconds until expiry, None if the result never expires, or 0 if it
+            must not be cached
+        """
+        ttl = self.ttls.get(method, 0)
+        if method in IMMUTABLE_WINDOWS:
+            as_of = _as_of_date(method, args, kwargs)
+            if as_of is not None and as_of < date.today():
+                return None
+        return ttl
+
+    def _count(self, method: str, outcome: str):
+        self._stats[outcome] += 1
+        counts = self._method_stats.setdefault(method, {"hits": 0, "misses": 0})
+        counts["misses" if outcome == "misses" else "hits"] += 1
+
+    def get(self, method: str, vendor: str, args: tuple, kwargs: dict) -> Tuple[bool, Any]:
+        """
+        Look up a vendor call.
+
+        Returns:
+            Tuple of (hit, value); value is None on a miss
+        """
+        key = self.make_key(method, vendor, args, kwargs)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._count(method, "memory_hits")
+                    return True, value
+                del self._memory[key]
+
+        value = self._disk_get(key, now)
+        with self._lock:
+            if value is _MISSING:
+                self._count(method, "misses")
+                return False, None
+            self._count(method, "disk_hits")
+        return True, value
+
+    def _disk_get(self, key: str, now: float) -> Any:
+        if self.db_path is None:
+            return _MISSING
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT expires_at, value FROM results WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"WARNING: Vendor result cache read failed: {e}")
+            return _MISSING
+        if row is None or (row[0] is not None and row[0] <= now):
+            return _MISSING
+        value = pickle.loads(row[1])
+        self._memory_put(key, row[0], value)
+        return value
+
+    def _memory_put(self, key: str, expires_at: Optional[float], value: Any):
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def put(self, method: str, vendor: str, args: tuple, kwargs: dict, value: Any) -> bool:
+        """
+        Store a vendor result (error and empty results and uncacheable methods are skipped).
+
+        Returns:
+            True if the result was stored
+        """
+        ttl = self.ttl_for(method, args, kwargs)
+        if ttl == 0 or is_error_result(value) or is_empty_result(value):
+            return False
+
+        key = self.make_key(method, vendor, args, kwargs)
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        self._memory_put(key, expires_at, value)
+        with self._lock:
+            self._stats["stores"] += 1
+
+        if self.db_path is not None:
+            try:
+                blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO results (key, method, vendor, expires_at, created_at, value) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, method, vendor, expires_at, now, blob)
+                    )
+            except (sqlite3.Error, pickle.PicklingError, TypeError) as e:
+                print(f"WARNING: Vendor result cache write failed: {e}")
+        return True
+
+    def invalidate(self, method: Optional[str] = None, vendor: Optional[str] = None):
+        """Drop entries for a method and/or vendor (everything if both are None)."""
+        prefix = "|".join(p for p in (method, vendor) if p is not None)
+        with self._lock:
+            for key in [k for k in self._memory
+                        if (method is None or k.startswith(f"{method}|"))
+                        and (vendor is None or k.split("|", 2)[1] == vendor)]:
+                del self._memory[key]
+
+        if self.db_path is not None:
+            clauses, params = [], []
+            for column, value in (("method", method), ("vendor", vendor)):
+                if value is not None:
+                    clauses.append(f"{column} = ?")
+                    params.append(value)
+            sql = "DELETE FROM results" + (" WHERE " + " AND ".join(clauses) if clauses else "")
+            with self._connect() as conn:
+                conn.execute(sql, params)
+        print(f"INFO: Vendor result cache invalidated ({prefix or 'all'})")
+
+    def purge_expired(self) -> int:
+        """Delete expired disk entries; returns how many were removed."""
+        if self.db_path is None:
+            return 0
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM results WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                                  (time.time(),))
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hit/miss statistics since the cache was created.
+
+        Returns:
+            Dictionary with totals, hit_rate, memory tier size and per-method counts
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            hits = stats["memory_hits"] + stats["disk_hits"]
+            lookups = hits + stats["misses"]
+            stats["hits"] = hits
+            stats["hit_rate"] = hits / lookups if lookups else 0.0
+            stats["memory_entries"] = len(self._memory)
+            stats["by_method"] = {m: dict(c) for m, c in self._method_stats.items()}
+        if self.db_path is not None:
+            try:
+                with self._connect() as conn:
+                    stats["disk_entries"] = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            except sqlite3.Error:
+                stats["disk_entries"] = None
+        return stats
+
+
+_cache: Optional[VendorResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> Optional[VendorResultCache]:
+    """
+    Shared cache configured from config["vendor_cache"].
+
+    Returns:
+        VendorResultCache, or None when caching is disabled
+    """
+    global _cache
+    settings = get_config().get("vendor_cache", {})
+    if not settings.get("enabled", True):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            cache_dir = None
+            if settings.get("disk", True):
+                cache_dir = os.path.join(get_config()["data_cache_dir"], "vendor_results")
+            _cache = VendorResultCache(
+                cache_dir=cache_dir,
+                max_entries=settings.get("memory_entries", 1024),
+                ttls=settings.get("ttl_seconds"),
+            )
+        return _cache
+
+
+def reset_result_cache():
+    """Forget the shared cache so the next get_result_cache() applies new settings."""
+    global _cache
+    with _cache_lock:
+        _cache = None
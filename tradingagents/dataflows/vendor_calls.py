@@ -0,0 +1,211 @@
+"""
+Vendor call execution for route_to_vendor.
+
+call_vendor() runs one vendor's implementations behind the result cache, the
+rate limiter and the health registry. race_vendors() is the hedged routing
+mode: it starts the primary vendor, launches a backup when the primary is
+slower than the latency budget, and returns the first result with data.
+Speculative backups go through the vendor's token buckets, so a vendor is only
+raced while it has quota to spare.
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .alpha_vantage_common import AlphaVantageRateLimitError
+from .result_cache import is_error_result, is_empty_result
+from .vendor_health import get_health_registry
+from .rate_limiter import get_rate_limiter, REQUEST_COSTS
+
+DEFAULT_HEDGING = {
+    "latency_budget_seconds": 2.0,
+    "max_parallel": 2,
+    "speculative_min_headroom": 0.5,  # Rate-limited vendors are raced only while buckets are this full
+    "never_speculative": ["openai"],  # Paid per call
+}
+
+
+def cache_vendor_name(vendor: str, impl_func, multiple: bool) -> str:
+    """Cache label of one implementation (vendors with several implementations cache each separately)."""
+    return f"{vendor}.{impl_func.__name__}" if multiple else vendor
+
+
+def call_vendor(method: str, vendor: str, vendor_impl, args: tuple, kwargs: dict, cache) -> list:
+    """
+    Run every implementation of one vendor (serving cached results first).
+
+    Args:
+        method: Routed method name, e.g. "get_news"
+        vendor: Vendor name
+        vendor_impl: The vendor's function, or a list of functions
+        args: Positional arguments of the call
+        kwargs: Keyword arguments of the call
+        cache: VendorResultCache, or None
+
+    Returns:
+        Results of the implementations that were called (or served from cache)
+    """
+    health = get_health_registry()
+    limiter = get_rate_limiter()
+
+    # Handle list of methods for a vendor
+    if isinstance(vendor_impl, list):
+        vendor_methods = [(impl, vendor) for impl in vendor_impl]
+        print(f"DEBUG: Vendor '{vendor}' has multiple implementations: {len(vendor_methods)} functions")
+    else:
+        vendor_methods = [(vendor_impl, vendor)]
+
+    vendor_results = []
+    for impl_func, vendor_name in vendor_methods:
+        cache_vendor = cache_vendor_name(vendor_name, impl_func, len(vendor_methods) > 1)
+        if cache is not None:
+            hit, result = cache.get(method, cache_vendor, args, kwargs)
+            if hit:
+                vendor_results.append(result)
+                print(f"CACHE HIT: {impl_func.__name__} from vendor '{vendor_name}'")
+                continue
+        if limiter is not None and not limiter.acquire(vendor, REQUEST_COSTS.get(impl_func.__name__, 1)):
+            print(f"RATE_LIMIT: Vendor '{vendor}' is out of quota, skipping {impl_func.__name__} and falling back to next vendor")
+            continue
+        started = time.perf_counter()
+        try:
+            print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
+            result = impl_func(*args, **kwargs)
+            vendor_results.append(result)
+            if cache is not None:
+                cache.put(method, cache_vendor, args, kwargs, result)
+            if health is not None:
+                if is_error_result(result):
+                    health.record_failure(vendor, time.perf_counter() - started, error=str(result)[:200])
+                else:
+                    health.record_success(vendor, time.perf_counter() - started)
+            print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
+
+        except AlphaVantageRateLimitError as e:
+            if vendor == "alpha_vantage":
+                print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
+                print(f"DEBUG: Rate limit details: {e}")
+            # The vendor's quota was spent elsewhere; stop spending tokens until it refills
+            reset_at = None
+            if limiter is not None:
+                limiter.drain(vendor, "per_day" if "day" in str(e).lower() else "per_minute")
+                reset_at = time.time() + limiter.available_in(vendor)
+            if health is not None:
+                health.record_failure(vendor, time.perf_counter() - started, error=str(e),
+                                      rate_limited=True, reset_at=reset_at)
+            # Continue to next vendor for fallback
+            continue
+        except Exception as e:
+            # Log error but continue with other implementations
+            print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
+            if health is not None:
+                health.record_failure(vendor, time.perf_counter() - started, error=str(e))
+            continue
+
+    return vendor_results
+
+
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+_hedge_executor_lock = threading.Lock()
+
+
+def get_hedge_executor() -> ThreadPoolExecutor:
+    """Shared worker pool for hedged vendor calls."""
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="vendor-hedge")
+        return _hedge_executor
+
+
+def may_speculate(vendor: str, settings: Dict[str, Any], limiter=None) -> bool:
+    """
+    Whether a vendor may be started as a speculative backup.
+
+    Vendors in never_speculative (e.g. pay-per-call ones) never are. Rate-limited
+    vendors are while every bucket is at least speculative_min_headroom full; below
+    that their remaining quota is kept for primary and failure-fallback calls.
+    """
+    settings = {**DEFAULT_HEDGING, **settings}
+    if vendor in settings["never_speculative"]:
+        return False
+    return limiter is None or limiter.headroom(vendor) >= settings["speculative_min_headroom"]
+
+
+def race_vendors(method: str, vendors: Sequence[str], call: Callable[[str], list],
+                 settings: Dict[str, Any], limiter=None) -> Tuple[Optional[str], List[Any], int]:
+    """
+    Race vendors in fallback order and return the first result with data.
+
+    The primary starts alone. If it has not answered within the latency budget,
+    the next vendor that may_speculate() is started alongside it, up to
+    max_parallel calls in flight. A failed call (no results or only error
+    strings) immediately starts the next vendor in order, speculative or not.
+    Once a result with data arrives, calls not yet started are cancelled; calls
+    already running finish in the background and only populate the cache. An
+    empty answer ("No news found ...") does not win; it is returned only if no
+    vendor has data.
+
+    Args:
+        method: Routed method name (for logging)
+        vendors: Vendors in fallback order, primary first
+        call: Runs one vendor and returns its results (see call_vendor)
+        settings: config["vendor_hedging"]
+        limiter: VendorRateLimiter used to decide speculative launches (None: no limits)
+
+    Returns:
+        (winning vendor, results, attempts); (None, [], attempts) if every vendor failed
+    """
+    settings = {**DEFAULT_HEDGING, **settings}
+    budget = settings["latency_budget_seconds"]
+    max_parallel = max(1, settings["max_parallel"])
+    executor = get_hedge_executor()
+
+    queue = list(vendors)
+    pending = {}
+    attempts = 0
+    empty_answer = (None, [])
+
+    def launch(vendor: str, reason: str):
+        nonlocal attempts
+        queue.remove(vendor)
+        attempts += 1
+        print(f"DEBUG: Hedged {reason} vendor '{vendor}' for {method} (attempt #{attempts})")
+        pending[executor.submit(call, vendor)] = vendor
+
+    if queue:
+        launch(queue[0], "PRIMARY")
+
+    while pending:
+        backup = None
+        if len(pending) < max_parallel:
+            backup = next((v for v in queue if may_speculate(v, settings, limiter)), None)
+        done, _ = wait(pending, timeout=budget if backup else None, return_when=FIRST_COMPLETED)
+
+        if not done:
+            print(f"HEDGE: No answer for {method} within {budget:.1f}s")
+            launch(backup, "BACKUP")
+            continue
+
+        for future in done:
+            vendor = pending.pop(future)
+            vendor_results = future.result()
+            valid = [r for r in vendor_results if not is_error_result(r)]
+            if any(not is_empty_result(r) for r in valid):
+                for other in pending:
+                    other.cancel()
+                print(f"SUCCESS: Vendor '{vendor}' won the hedged race for {method}")
+                return vendor, vendor_results, attempts
+            if valid:
+                if empty_answer[0] is None:
+                    empty_answer = (vendor, valid)
+                print(f"INFO: Vendor '{vendor}' has no data for {method}, trying next vendor")
+            else:
+                print(f"FAILED: Vendor '{vendor}' produced no valid results")
+            # Each failed or empty answer is replaced by the next vendor in order
+            if queue:
+                launch(queue[0], "FALLBACK")
+
+    return empty_answer[0], empty_answer[1], attempts
@@ -0,0 +1,248 @@
+"""
+Vendor health registry for route_to_vendor.
+
+Every vendor call records its latency and outcome. A vendor whose calls keep
+failing, or which reported a rate limit, has its circuit opened and is skipped
+until a cooldown (or the rate-limit reset time) passes; the next call after
+that decides whether the circuit closes again. Fallback vendors are ordered by
+observed health so known-slow or flaky vendors are tried last.
+"""
+
+import time
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .config import get_config
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class _VendorState:
+    """Rolling call window and circuit state of one vendor."""
+
+    def __init__(self, window: int):
+        self.calls: Deque[Tuple[float, bool]] = deque(maxlen=window)  # (latency, ok)
+        self.total_calls = 0
+        self.total_failures = 0
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.open_until = 0.0
+        self.rate_limited_until = 0.0
+        self.last_error: Optional[str] = None
+        self.last_success_at: Optional[float] = None
+        self.last_failure_at: Optional[float] = None
+
+
+class VendorHealthRegistry:
+    """
+    Per-vendor latency, error-rate and circuit-breaker bookkeeping.
+
+    A circuit opens after failure_threshold consecutive failures, or right away
+    on a rate limit, and stays open for cooldown_seconds (rate limits: until
+    their reset time). After that it is half-open: calls are let through again
+    and the next outcome closes or re-opens the circuit. All methods are
+    thread-safe.
+    """
+
+    def __init__(self, window: int = 100, failure_threshold: int = 5,
+                 cooldown_seconds: float = 60.0, rate_limit_seconds: float = 60.0):
+        """
+        Initialize the registry.
+
+        Args:
+            window: Number of recent calls per vendor used for latency and error rate
+            failure_threshold: Consecutive failures that open a circuit
+            cooldown_seconds: How long an opened circuit stays open
+            rate_limit_seconds: Default cooldown after a rate limit without a reset time
+        """
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.rate_limit_seconds = rate_limit_seconds
+        self._vendors: Dict[str, _VendorState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, vendor: str) -> _VendorState:
+        if vendor not in self._vendors:
+            self._vendors[vendor] = _VendorState(self.window)
+        return self._vendors[vendor]
+
+    def _refresh(self, state: _VendorState, now: float):
+        if state.state == OPEN and now >= state.open_until:
+            state.state = HALF_OPEN
+
+    def record_success(self, vendor: str, latency: float):
+        """Record a successful call and close the vendor's circuit."""
+        with self._lock:
+            state = self._state(vendor)
+            state.calls.append((latency, True))
+            state.total_calls += 1
+            state.consecutive_failures = 0
+            state.state = CLOSED
+            state.last_success_at = time.time()
+
+    def record_failure(self, vendor: str, latency: float, error: Optional[str] = None,
+                       rate_limited: bool = False, reset_at: Optional[float] = None):
+        """
+        Record a failed call, opening the circuit if needed.
+
+        Args:
+            vendor: Vendor name
+            latency: Seconds the call took
+            error: Error message shown in snapshots
+            rate_limited: The vendor rejected the call because of its quota
+            reset_at: Epoch seconds at which the quota resets, if the vendor said
+        """
+        now = time.time()
+        with self._lock:
+            state = self._state(vendor)
+            state.calls.append((latency, False))
+            state.total_calls += 1
+            state.total_failures += 1
+            state.consecutive_failures += 1
+            state.last_error = error
+            state.last_failure_at = now
+            self._refresh(state, now)
+
+            opened = None
+            if rate_limited:
+                state.rate_limited_until = reset_at if reset_at is not None else now + self.rate_limit_seconds
+                opened = max(state.open_until, state.rate_limited_until)
+            elif state.state == HALF_OPEN or (state.state == CLOSED and
+                                              state.consecutive_failures >= self.failure_threshold):
+                opened = now + self.cooldown_seconds
+            if opened is not None:
+                state.state = OPEN
+                state.open_until = opened
+
+        if opened is not None:
+            print(f"CIRCUIT: Vendor '{vendor}' circuit open until {time.strftime('%H:%M:%S', time.localtime(opened))}")
+
+    def is_open(self, vendor: str) -> bool:
+        """Whether the vendor's circuit is currently open."""
+        now = time.time()
+        with self._lock:
+            state = self._vendors.get(vendor)
+            if state is None:
+                return False
+            self._refresh(state, now)
+            return state.state == OPEN
+
+    def score(self, vendor: str) -> Tuple[float, float]:
+        """Sort key of a vendor: (error rate over the window, median latency); lower is healthier."""
+        with self._lock:
+            state = self._vendors.get(vendor)
+            if state is None or not state.calls:
+                return (0.0, 0.0)
+            failures = sum(1 for _, ok in state.calls if not ok)
+            latencies = sorted(latency for latency, _ in state.calls)
+            return (failures / len(state.calls), _percentile(latencies, 50))
+
+    def order(self, vendors: List[str], primary_vendors: List[str]) -> List[str]:
+        """
+        Order vendors for a call.
+
+        Configured primaries keep their order; the remaining fallbacks are sorted
+        by health. Vendors with an open circuit are left out, unless every
+        candidate is open, in which case all are returned, soonest-to-reopen
+        first.
+
+        Args:
+            vendors: Candidate vendors in configured fallback order
+            primary_vendors: Vendors configured for the method
+
+        Returns:
+            Vendors in the order they should be tried
+        """
+        primaries = [v for v in vendors if v in primary_vendors]
+        fallbacks = sorted((v for v in vendors if v not in primary_vendors), key=self.score)
+        ordered = primaries + fallbacks
+        healthy = [v for v in ordered if not self.is_open(v)]
+        if healthy or not ordered:
+            return healthy
+        print(f"WARNING: All vendors have open circuits ({', '.join(ordered)}), trying them anyway")
+        with self._lock:
+            return sorted(ordered, key=lambda v: self._vendors[v].open_until)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Current health of every vendor seen so far, for dashboards.
+
+        Returns:
+            Dictionary of vendor -> state, call counts, error_rate, latency
+            percentiles (seconds), consecutive failures and reset times
+        """
+        now = time.time()
+        snapshot = {}
+        with self._lock:
+            for vendor, state in sorted(self._vendors.items()):
+                self._refresh(state, now)
+                latencies = sorted(latency for latency, _ in state.calls)
+                failures = sum(1 for _, ok in state.calls if not ok)
+                snapshot[vendor] = {
+                    "state": state.state,
+                    "total_calls": state.total_calls,
+                    "total_failures": state.total_failures,
+                    "error_rate": failures / len(state.calls) if state.calls else 0.0,
+                    "latency_p50": _percentile(latencies, 50),
+                    "latency_p95": _percentile(latencies, 95),
+                    "latency_p99": _percentile(latencies, 99),
+                    "consecutive_failures": state.consecutive_failures,
+                    "open_until": state.open_until if state.state == OPEN else None,
+                    "rate_limited_until": state.rate_limited_until if state.rate_limited_until > now else None,
+                    "last_error": state.last_error,
+                    "last_success_at": state.last_success_at,
+                    "last_failure_at": state.last_failure_at,
+                }
+        return snapshot
+
+    def reset(self, vendor: Optional[str] = None):
+        """Forget recorded health for one vendor (everything if None)."""
+        with self._lock:
+            if vendor is None:
+                self._vendors.clear()
+            else:
+                self._vendors.pop(vendor, None)
+
+
+_registry: Optional[VendorHealthRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_health_registry() -> Optional[VendorHealthRegistry]:
+    """
+    Shared registry configured from config["vendor_health"].
+
+    Returns:
+        VendorHealthRegistry, or None when health tracking is disabled
+    """
+    global _registry
+    settings = get_config().get("vendor_health", {})
+    if not settings.get("enabled", True):
+        return None
+    with _registry_lock:
+        if _registry is None:
+            _registry = VendorHealthRegistry(
+                window=settings.get("window", 100),
+                failure_threshold=settings.get("failure_threshold", 5),
+                cooldown_seconds=settings.get("cooldown_seconds", 60.0),
+                rate_limit_seconds=settings.get("rate_limit_seconds", 60.0),
+            )
+        return _registry
+
+
+def reset_health_registry():
+    """Forget the shared registry so the next get_health_registry() applies new settings."""
+    global _registry
+    with _registry_lock:
+        _registry = None
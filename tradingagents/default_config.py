@@ -30,6 +30,50 @@ DEFAULT_CONFIG = {
         # Example: "get_stock_data": "alpha_vantage",  # Override category default
         # Example: "get_news": "openai",               # Override category default
     },
+    # Vendor result cache in front of route_to_vendor (memory LRU + disk tier in data_cache_dir)
+    "vendor_cache": {
+        "enabled": True,
+        "memory_entries": 1024,  # Results kept in the in-memory LRU tier
+        "disk": True,            # Share results across restarts and worker processes
+        "ttl_seconds": {
+            # Per-method overrides of result_cache.DEFAULT_TTLS (0 disables caching)
+            # Example: "get_news": 300,
+        },
+    },
+    "vendor_health": {
+        "enabled": True,
+        "window": 100,                # Recent calls per vendor used for error rate and latency
+        "failure_threshold": 5,       # Consecutive failures that open a vendor's circuit
+        "cooldown_seconds": 60,       # How long an open circuit skips the vendor
+        "rate_limit_seconds": 60,     # Cooldown after a rate limit that gave no reset time
+    },
+    "vendor_rate_limits": {
+        "enabled": True,
+        "shared": True,               # Persist buckets so restarts and worker processes share quotas
+        "max_wait_seconds": 5,        # Queue this long for a token before falling back to another vendor
+        "limits": {
+            # Per-vendor overrides of rate_limiter.DEFAULT_LIMITS (None removes a bucket)
+            # Example: "fmp": {"per_minute": 300, "per_day": None},
+        },
+    },
+    "http": {
+        # Pooled vendor HTTP clients (see dataflows/http_client.py)
+        "pool_maxsize": 20,           # Keep-alive connections per host
+        "connect_timeout": 5,
+        "read_timeout": 15,
+        "retries": 2,                 # Idempotent requests only, on connection errors and 5xx
+        "backoff_factor": 0.3,
+        "http2": True,                # Async client, when httpx and h2 are installed
+    },
+    "vendor_hedging": {
+        "enabled": False,                # Race single-vendor configs against fallbacks
+        "latency_budget_seconds": 2.0,   # Start a backup vendor if the primary is slower than this
+        "max_parallel": 2,               # Vendor calls in flight per request
+        # Backups draw on the vendor_rate_limits buckets: a rate-limited vendor is only
+        # raced while each of its buckets is at least this full
+        "speculative_min_headroom": 0.5,
+        "never_speculative": ["openai"], # Paid per call: only used when earlier vendors fail
+    },
     # Discord webhook configuration for coach daily plans
     "discord_webhooks": {
         "coach_d": os.getenv("DISCORD_COACH_D_WEBHOOK", ""),
@@ -3,6 +3,8 @@ import json
 from typing import Dict, Optional
 from datetime import datetime
 
+from tradingagents.dataflows import http_client
+
 
 class DiscordWebhookClient:
     """Client for fetching coach daily plans from Discord webhooks."""
@@ -88,10 +90,9 @@ class DiscordWebhookClient:
             # Convert webhook URL to a GET endpoint
             # Example: https://your-server.com/api/coach-plans?coach=coach_d&date=2024-05-10
             base_url = webhook_url.replace("/webhooks/", "/api/coach-plans/")
-            response = requests.get(
+            response = http_client.get(
                 base_url,
-                params={"coach": coach_name, "date": date},
-                timeout=10
+                params={"coach": coach_name, "date": date}
             )
             
             if response.status_code == 200:
@@ -168,7 +169,7 @@ class DiscordWebhookClient:
                 "embeds": [embed]
             }
             
-            response = requests.post(webhook_url, json=payload, timeout=10)
+            response = http_client.post(webhook_url, json=payload)
             return response.status_code == 204
             
         except Exception as e: